@@ -16,6 +16,9 @@ import cv2
 import numpy as np
 import yaml
 
+# Saved alignment presets (relative to the working directory)
+PRESETS_DIR = Path("alignment_checks/presets")
+
 
 @dataclass
 class AlignmentResults:
@@ -738,7 +741,8 @@ def generate_html_report(results: AlignmentResults, left_serial: str, right_seri
 
 
 def save_alignment_preset(results: AlignmentResults, preset_name: str,
-                          left_serial: str, right_serial: str) -> None:
+                          left_serial: str, right_serial: str,
+                          presets_dir: Path = PRESETS_DIR) -> None:
     """Save current alignment as a preset/profile.
 
     Args:
@@ -746,11 +750,12 @@ def save_alignment_preset(results: AlignmentResults, preset_name: str,
         preset_name: Name for this preset (e.g., "baseline_2026-01-20")
         left_serial: Left camera serial
         right_serial: Right camera serial
+        presets_dir: Directory holding presets
     """
     import json
     from datetime import datetime
 
-    presets_dir = Path("alignment_checks/presets")
+    presets_dir = Path(presets_dir)
     presets_dir.mkdir(parents=True, exist_ok=True)
 
     preset_data = {
@@ -783,18 +788,19 @@ def save_alignment_preset(results: AlignmentResults, preset_name: str,
     preset_file.write_text(json.dumps(preset_data, indent=2))
 
 
-def load_alignment_preset(preset_name: str) -> Optional[dict]:
+def load_alignment_preset(preset_name: str, presets_dir: Path = PRESETS_DIR) -> Optional[dict]:
     """Load a saved alignment preset.
 
     Args:
         preset_name: Name of preset to load
+        presets_dir: Directory holding presets
 
     Returns:
         Preset data dict or None if not found
     """
     import json
 
-    preset_file = Path("alignment_checks/presets") / f"{preset_name}.json"
+    preset_file = Path(presets_dir) / f"{preset_name}.json"
     if not preset_file.exists():
         return None
 
@@ -804,15 +810,18 @@ def load_alignment_preset(preset_name: str) -> Optional[dict]:
         return None
 
 
-def list_alignment_presets() -> List[dict]:
+def list_alignment_presets(presets_dir: Path = PRESETS_DIR) -> List[dict]:
     """List all saved alignment presets.
 
+    Args:
+        presets_dir: Directory holding presets
+
     Returns:
         List of preset metadata dicts
     """
     import json
 
-    presets_dir = Path("alignment_checks/presets")
+    presets_dir = Path(presets_dir)
     if not presets_dir.exists():
         return []
 
@@ -0,0 +1,11 @@
+"""Inter-process transport between the UI and a headless engine process."""
+
+from app.ipc.engine import EngineClient, run_engine
+from app.ipc.frame_ring import RingFrame, SharedFrameRing
+
+__all__ = [
+    "EngineClient",
+    "RingFrame",
+    "SharedFrameRing",
+    "run_engine",
+]
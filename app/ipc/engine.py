@@ -0,0 +1,330 @@
+"""Headless engine process and the UI-side client that drives it.
+
+With ``ui.engine_process`` enabled, capture, detection, recording and pitch
+analysis run in a separate process around a PipelineOrchestrator, so GUI
+painting and exports no longer compete with detection for the GIL and a
+stalled GUI cannot back up capture.
+
+Channels between the two processes:
+
+- Frames: one SharedFrameRing per camera, written by the engine's capture
+  threads and mapped by the UI, which copies each preview frame out of the
+  shared slot (one memcpy, no pickling).
+- Commands: a duplex pipe carrying ``(method, args, kwargs)`` calls into
+  the orchestrator and their results or exceptions.
+- Events: a queue carrying periodic state snapshots (detections, stats,
+  strike result, plate metrics) and pitch start/end events. Snapshots are
+  dropped rather than queued when the UI falls behind.
+"""
+
+from __future__ import annotations
+
+import logging
+import multiprocessing
+import queue
+import threading
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple, Type
+
+from app.events.event_bus import EventBus, EventHandler
+from app.events.event_types import FrameCapturedEvent, PitchEndEvent, PitchStartEvent
+from app.ipc.frame_ring import SharedFrameRing
+from configs.settings import AppConfig
+from contracts import Frame
+from metrics.simple_metrics import PlateMetricsStub
+from metrics.strike_zone import StrikeResult
+
+logger = logging.getLogger(__name__)
+
+CAMERAS = ("left", "right")
+
+# Largest pixel format the engine publishes (BGR)
+MAX_CHANNELS = 3
+
+_ATTACH_RINGS = "_attach_rings"
+_SHUTDOWN = "_shutdown"
+
+
+def _post(events, message: Tuple[str, Any], block: bool) -> None:
+    try:
+        events.put(message, block=block, timeout=0.1 if block else None)
+    except queue.Full:
+        pass
+
+
+def _snapshot(service) -> Dict[str, Any]:
+    """Cheap read-only state the UI polls every refresh."""
+    state: Dict[str, Any] = {"time": time.monotonic()}
+    for key, getter in (
+        ("capturing", service.is_capturing),
+        ("stats", service.get_stats),
+        ("detections", service.get_latest_detections),
+        ("gated", service.get_latest_gated_detections),
+        ("strike", service.get_strike_result),
+        ("plate_metrics", service.get_plate_metrics),
+        ("pitch_paths", service.get_recent_pitch_paths),
+    ):
+        try:
+            state[key] = getter()
+        except Exception:
+            pass
+    return state
+
+
+def run_engine(backend: str, conn, events, state_hz: float = 30.0) -> None:
+    """Engine process entry point: serve commands until shutdown or EOF.
+
+    Args:
+        backend: Camera backend ("uvc", "opencv", "sim")
+        conn: Child end of the command pipe
+        events: Queue for state snapshots and pitch events
+        state_hz: State snapshot rate
+    """
+    from app.services.orchestrator import PipelineOrchestrator
+
+    service = PipelineOrchestrator(backend=backend)
+    rings: Dict[str, SharedFrameRing] = {}
+    # One lock per camera's ring, so the two capture threads copy frames
+    # into their rings concurrently
+    ring_locks: Dict[str, threading.Lock] = {camera: threading.Lock() for camera in CAMERAS}
+
+    def on_frame(event: FrameCapturedEvent) -> None:
+        lock = ring_locks.get(event.camera_id)
+        if lock is None:
+            return
+        with lock:
+            ring = rings.get(event.camera_id)
+            if ring is None:
+                return
+            try:
+                ring.write(event.frame)
+            except ValueError as exc:
+                logger.warning(f"Cannot publish {event.camera_id} frame: {exc}")
+
+    def replace_ring(camera: str, ring: Optional[SharedFrameRing]) -> None:
+        with ring_locks[camera]:
+            old = rings.pop(camera, None)
+            if ring is not None:
+                rings[camera] = ring
+        if old is not None:
+            old.close()
+
+    service.subscribe(FrameCapturedEvent, on_frame)
+    service.subscribe(PitchStartEvent, lambda event: _post(events, ("event", event), block=True))
+    service.subscribe(PitchEndEvent, lambda event: _post(events, ("event", event), block=True))
+
+    period = 1.0 / max(state_hz, 1.0)
+    next_state = 0.0
+    try:
+        while True:
+            if conn.poll(max(0.0, next_state - time.monotonic())):
+                try:
+                    method, args, kwargs = conn.recv()
+                except EOFError:
+                    break  # UI process went away
+                if method == _SHUTDOWN:
+                    conn.send(("ok", None))
+                    break
+                try:
+                    if method == _ATTACH_RINGS:
+                        attached = {camera: SharedFrameRing.attach(name) for camera, name in args[0].items()}
+                        for camera in ring_locks:
+                            replace_ring(camera, attached.pop(camera, None))
+                        for ring in attached.values():  # Not a camera we publish
+                            ring.close()
+                        result = None
+                    elif method.startswith("_"):
+                        raise AttributeError(f"Engine does not expose {method}")
+                    else:
+                        result = getattr(service, method)(*args, **kwargs)
+                    reply = ("ok", result)
+                except Exception as exc:
+                    reply = ("error", exc)
+                try:
+                    conn.send(reply)
+                except Exception as exc:  # Result or exception not picklable
+                    conn.send(("error", RuntimeError(f"{method} failed: {reply[1]!r} ({exc})")))
+            if time.monotonic() >= next_state:
+                _post(events, ("state", _snapshot(service)), block=False)
+                next_state = time.monotonic() + period
+    finally:
+        try:
+            service.stop_capture()
+        except Exception:
+            logger.exception("Engine failed to stop capture")
+        for camera in ring_locks:
+            replace_ring(camera, None)
+
+
+class EngineClient:
+    """UI-side stand-in for the pipeline service, backed by an engine process.
+
+    Frequently polled getters (preview frames, detections, stats, strike
+    result) are answered locally from the frame rings and the latest state
+    snapshot; every other public service method is forwarded to the engine
+    as a blocking call. Pitch events are republished on a local EventBus, so
+    QtPipelineService can subscribe exactly as it does to an orchestrator.
+    """
+
+    def __init__(
+        self,
+        backend: str = "uvc",
+        ring_slots: int = 8,
+        state_hz: float = 30.0,
+        call_timeout_s: float = 60.0,
+    ) -> None:
+        self._backend = backend
+        self._ring_slots = ring_slots
+        self._call_timeout_s = call_timeout_s
+        self._event_bus = EventBus()
+        self._rings: Dict[str, SharedFrameRing] = {}
+        self._state: Dict[str, Any] = {}
+        self._state_lock = threading.Lock()
+        self._call_lock = threading.Lock()
+
+        context = multiprocessing.get_context("spawn")
+        self._conn, child_conn = context.Pipe()
+        self._events = context.Queue(maxsize=64)
+        self._process = context.Process(
+            target=run_engine,
+            args=(backend, child_conn, self._events, state_hz),
+            name="PitchTrackerEngine",
+            daemon=True,
+        )
+        self._process.start()
+        child_conn.close()
+
+        self._running = True
+        self._event_thread = threading.Thread(target=self._drain_events, name="EngineEvents", daemon=True)
+        self._event_thread.start()
+        logger.info(f"Engine process started (pid {self._process.pid})")
+
+    # Commands that need the rings
+
+    def start_capture(
+        self,
+        config: AppConfig,
+        left_serial: str,
+        right_serial: str,
+        config_path: Optional[Path] = None,
+    ) -> None:
+        """Size the frame rings for the configured resolution, then start capture."""
+        slot_bytes = config.camera.width * config.camera.height * MAX_CHANNELS
+        if not self._rings or any(ring.slot_bytes < slot_bytes for ring in self._rings.values()):
+            rings = {camera: SharedFrameRing.create(camera, self._ring_slots, slot_bytes) for camera in CAMERAS}
+            self._call(_ATTACH_RINGS, {camera: ring.name for camera, ring in rings.items()})
+            old, self._rings = self._rings, rings
+            for ring in old.values():
+                ring.close()
+        self._call("start_capture", config, left_serial, right_serial, config_path)
+
+    def get_preview_frames(self) -> Tuple[Frame, Frame]:
+        """Latest frame per camera, copied out of the frame rings.
+
+        Previews are rendered on another thread for longer than the engine
+        takes to lap a ring, so a zero-copy view could be overwritten
+        mid-render; read() re-checks the slot after copying and drops torn
+        copies.
+
+        Raises:
+            RuntimeError: If capture is not running or no frames arrived yet
+        """
+        latest = [self._rings[camera].latest(copy=True) if camera in self._rings else None for camera in CAMERAS]
+        if latest[0] is None or latest[1] is None:
+            raise RuntimeError("Waiting for frames from engine")
+        return latest[0].frame, latest[1].frame
+
+    # Getters served from the latest state snapshot
+
+    def is_capturing(self) -> bool:
+        return bool(self._latest("capturing", False))
+
+    def get_stats(self) -> Dict[str, Dict[str, float]]:
+        return self._latest("stats", {})
+
+    def get_latest_detections(self) -> Dict[str, list]:
+        return self._latest("detections", {})
+
+    def get_latest_gated_detections(self) -> Dict[str, Dict[str, list]]:
+        return self._latest("gated", {})
+
+    def get_strike_result(self) -> StrikeResult:
+        return self._latest("strike", StrikeResult(is_strike=False, sample_count=0))
+
+    def get_plate_metrics(self) -> PlateMetricsStub:
+        return self._latest("plate_metrics", PlateMetricsStub(run_in=0.0, rise_in=0.0, sample_count=0))
+
+    def get_recent_pitch_paths(self) -> List[list]:
+        return self._latest("pitch_paths", [])
+
+    # Pitch events republished from the engine
+
+    def subscribe(self, event_type: Type, handler: EventHandler) -> None:
+        """Register handler for PitchStartEvent or PitchEndEvent.
+
+        Handlers run on the client's event thread.
+        """
+        self._event_bus.subscribe(event_type, handler)
+
+    def unsubscribe(self, event_type: Type, handler: EventHandler) -> bool:
+        """Unregister a handler added with subscribe()."""
+        return self._event_bus.unsubscribe(event_type, handler)
+
+    def __getattr__(self, name: str) -> Callable[..., Any]:
+        if name.startswith("_"):
+            raise AttributeError(name)
+        return lambda *args, **kwargs: self._call(name, *args, **kwargs)
+
+    def close(self) -> None:
+        """Stop the engine process and release the frame rings."""
+        if not self._running:
+            return
+        self._running = False
+        if self._process.is_alive():
+            try:
+                self._call(_SHUTDOWN, timeout_s=15.0)
+            except Exception as exc:
+                logger.warning(f"Engine did not shut down cleanly: {exc}")
+        self._process.join(timeout=5.0)
+        if self._process.is_alive():
+            self._process.terminate()
+            self._process.join(timeout=1.0)
+        self._event_thread.join(timeout=1.0)
+        for ring in self._rings.values():
+            ring.close()
+        self._rings.clear()
+        self._conn.close()
+        logger.info("Engine process stopped")
+
+    def _call(self, method: str, *args: Any, timeout_s: Optional[float] = None, **kwargs: Any) -> Any:
+        with self._call_lock:
+            if not self._process.is_alive():
+                raise RuntimeError("Engine process is not running")
+            self._conn.send((method, args, kwargs))
+            if not self._conn.poll(timeout_s or self._call_timeout_s):
+                raise RuntimeError(f"Engine did not answer {method}")
+            status, value = self._conn.recv()
+        if status == "error":
+            raise value
+        return value
+
+    def _latest(self, key: str, default: Any) -> Any:
+        with self._state_lock:
+            return self._state.get(key, default)
+
+    def _drain_events(self) -> None:
+        while self._running:
+            try:
+                kind, payload = self._events.get(timeout=0.2)
+            except queue.Empty:
+                if not self._process.is_alive():
+                    break
+                continue
+            except (EOFError, OSError):
+                break
+            if kind == "state":
+                with self._state_lock:
+                    self._state = payload
+            else:
+                self._event_bus.publish(payload)
@@ -0,0 +1,272 @@
+"""Shared-memory frame ring for handing frames between processes.
+
+One writer process publishes frames into a fixed number of slots in a
+``multiprocessing.shared_memory`` segment; any number of reader processes
+attach by name and map those slots as NumPy arrays without copying.
+
+Every slot carries a guard word that is set to -1 while the writer is
+filling it and to the frame's sequence number once it is complete, plus a
+ring-wide head holding the last completed sequence number. Readers check the
+guard before and after using a slot: a zero-copy view stays valid until the
+writer laps the ring (``slots`` frames later), and ``is_valid(seq)`` tells
+whether it has.
+
+Layout (int64 words unless noted)::
+
+    [magic, slots, slot_bytes, head]
+    per slot: [guard, frame_index, t_capture_ns, width, height, channels, nbytes, reserved]
+    per slot: pixfmt (16 bytes ASCII)
+    camera_id (32 bytes ASCII)
+    slot data, each slot_bytes long and 64-byte aligned
+"""
+
+from __future__ import annotations
+
+import logging
+from dataclasses import dataclass
+from multiprocessing import shared_memory
+from typing import Optional
+
+import numpy as np
+
+from contracts import Frame
+
+logger = logging.getLogger(__name__)
+
+RING_MAGIC = 0x50545246524D0001  # "PTRFRM" v1
+
+_HEADER_WORDS = 4
+_SLOT_WORDS = 8
+_PIXFMT_BYTES = 16
+_CAMERA_BYTES = 32
+_ALIGN = 64
+
+# Slot word offsets
+_GUARD, _FRAME_INDEX, _T_CAPTURE, _WIDTH, _HEIGHT, _CHANNELS, _NBYTES = range(7)
+
+
+def _align(value: int) -> int:
+    return (value + _ALIGN - 1) // _ALIGN * _ALIGN
+
+
+def _layout(slots: int) -> tuple[int, int, int]:
+    """Byte offsets of the pixfmt table, camera id and slot data."""
+    pixfmt_offset = (_HEADER_WORDS + slots * _SLOT_WORDS) * 8
+    camera_offset = pixfmt_offset + slots * _PIXFMT_BYTES
+    data_offset = _align(camera_offset + _CAMERA_BYTES)
+    return pixfmt_offset, camera_offset, data_offset
+
+
+def _attach_segment(name: str) -> shared_memory.SharedMemory:
+    """Open an existing segment; the creator owns its lifetime.
+
+    Before Python 3.13 attaching also registers the segment with the
+    resource tracker. Readers are multiprocessing children of the creator
+    and share its tracker, so that registration is a harmless duplicate.
+    """
+    try:
+        return shared_memory.SharedMemory(name=name, track=False)
+    except TypeError:  # Python < 3.13
+        return shared_memory.SharedMemory(name=name)
+
+
+@dataclass(frozen=True)
+class RingFrame:
+    """A frame read from the ring together with its sequence number."""
+
+    seq: int
+    frame: Frame
+
+
+class SharedFrameRing:
+    """Single-writer, multi-reader frame ring in shared memory.
+
+    Example:
+        >>> ring = SharedFrameRing.create("left", slots=8, slot_bytes=1920 * 1080 * 3)
+        >>> ring.write(frame)                      # engine process
+        >>> reader = SharedFrameRing.attach(ring.name)
+        >>> latest = reader.latest()               # UI process, zero-copy view
+        >>> reader.is_valid(latest.seq)            # still not overwritten?
+    """
+
+    def __init__(self, segment: shared_memory.SharedMemory, owner: bool) -> None:
+        self._segment = segment
+        self._owner = owner
+        header = np.ndarray((_HEADER_WORDS,), dtype=np.int64, buffer=segment.buf)
+        if int(header[0]) != RING_MAGIC:
+            raise ValueError(f"Shared memory segment {segment.name} is not a frame ring")
+        self._slots = int(header[1])
+        self._slot_bytes = int(header[2])
+        pixfmt_offset, camera_offset, data_offset = _layout(self._slots)
+        self._words = np.ndarray((_HEADER_WORDS + self._slots * _SLOT_WORDS,), dtype=np.int64, buffer=segment.buf)
+        self._pixfmt = np.ndarray(
+            (self._slots, _PIXFMT_BYTES), dtype=np.uint8, buffer=segment.buf, offset=pixfmt_offset
+        )
+        self._data_offset = data_offset
+        self._slot_stride = _align(self._slot_bytes)
+        camera = bytes(segment.buf[camera_offset:camera_offset + _CAMERA_BYTES])
+        self._camera_id = camera.rstrip(b"\0").decode("ascii")
+
+    @classmethod
+    def create(
+        cls,
+        camera_id: str,
+        slots: int,
+        slot_bytes: int,
+        name: Optional[str] = None,
+    ) -> "SharedFrameRing":
+        """Allocate a new ring; the creator unlinks it in close().
+
+        Args:
+            camera_id: Camera label stamped on frames read back
+            slots: Number of frame slots
+            slot_bytes: Largest frame size in bytes (width * height * channels)
+            name: Segment name (generated if None)
+        """
+        if slots < 2 or slot_bytes <= 0:
+            raise ValueError("Frame ring needs at least 2 slots and a positive slot size")
+        pixfmt_offset, camera_offset, data_offset = _layout(slots)
+        size = data_offset + slots * _align(slot_bytes)
+        segment = shared_memory.SharedMemory(name=name, create=True, size=size)
+        words = np.ndarray((_HEADER_WORDS + slots * _SLOT_WORDS,), dtype=np.int64, buffer=segment.buf)
+        words[:] = 0
+        words[1] = slots
+        words[2] = slot_bytes
+        words[3] = -1
+        words[_HEADER_WORDS + _GUARD::_SLOT_WORDS] = -1
+        encoded = camera_id.encode("ascii")[:_CAMERA_BYTES]
+        segment.buf[camera_offset:camera_offset + _CAMERA_BYTES] = encoded.ljust(_CAMERA_BYTES, b"\0")
+        words[0] = RING_MAGIC  # Written last: attach() refuses half-built rings
+        return cls(segment, owner=True)
+
+    @classmethod
+    def attach(cls, name: str) -> "SharedFrameRing":
+        """Attach to a ring created by another process."""
+        return cls(_attach_segment(name), owner=False)
+
+    @property
+    def name(self) -> str:
+        return self._segment.name
+
+    @property
+    def camera_id(self) -> str:
+        return self._camera_id
+
+    @property
+    def slots(self) -> int:
+        return self._slots
+
+    @property
+    def slot_bytes(self) -> int:
+        return self._slot_bytes
+
+    @property
+    def head(self) -> int:
+        """Sequence number of the newest complete frame (-1 if none)."""
+        return int(self._words[3])
+
+    def write(self, frame: Frame) -> int:
+        """Copy a frame into the next slot and publish it.
+
+        Only one process may write to a ring.
+
+        Returns:
+            Sequence number of the frame
+
+        Raises:
+            ValueError: If the frame does not fit in a slot
+        """
+        image = np.ascontiguousarray(frame.image)
+        if image.dtype != np.uint8:
+            raise ValueError(f"Frame ring stores uint8 images, got {image.dtype}")
+        if image.nbytes > self._slot_bytes:
+            raise ValueError(f"Frame of {image.nbytes} bytes exceeds ring slot of {self._slot_bytes} bytes")
+        seq = self.head + 1
+        slot = seq % self._slots
+        base = _HEADER_WORDS + slot * _SLOT_WORDS
+        words = self._words
+        words[base + _GUARD] = -1
+        offset = self._data_offset + slot * self._slot_stride
+        target = np.ndarray((image.nbytes,), dtype=np.uint8, buffer=self._segment.buf, offset=offset)
+        target[:] = image.reshape(-1)
+        height, width = image.shape[:2]
+        words[base + _FRAME_INDEX] = frame.frame_index
+        words[base + _T_CAPTURE] = frame.t_capture_monotonic_ns
+        words[base + _WIDTH] = width
+        words[base + _HEIGHT] = height
+        words[base + _CHANNELS] = image.shape[2] if image.ndim == 3 else 1
+        words[base + _NBYTES] = image.nbytes
+        pixfmt = frame.pixfmt.encode("ascii")[:_PIXFMT_BYTES].ljust(_PIXFMT_BYTES, b"\0")
+        self._pixfmt[slot] = np.frombuffer(pixfmt, dtype=np.uint8)
+        words[base + _GUARD] = seq
+        words[3] = seq
+        return seq
+
+    def read(self, seq: int, copy: bool = False) -> Optional[RingFrame]:
+        """Frame with sequence number ``seq`` if it is still in the ring.
+
+        Args:
+            seq: Sequence number
+            copy: Return an independent copy instead of a view into the ring
+
+        Returns:
+            RingFrame, or None if the slot was overwritten or is being written
+        """
+        if seq < 0:
+            return None
+        slot = seq % self._slots
+        base = _HEADER_WORDS + slot * _SLOT_WORDS
+        words = self._words
+        if int(words[base + _GUARD]) != seq:
+            return None
+        width = int(words[base + _WIDTH])
+        height = int(words[base + _HEIGHT])
+        channels = int(words[base + _CHANNELS])
+        shape = (height, width) if channels == 1 else (height, width, channels)
+        offset = self._data_offset + slot * self._slot_stride
+        image = np.ndarray(shape, dtype=np.uint8, buffer=self._segment.buf, offset=offset)
+        if copy:
+            image = image.copy()
+        frame = Frame(
+            camera_id=self._camera_id,
+            frame_index=int(words[base + _FRAME_INDEX]),
+            t_capture_monotonic_ns=int(words[base + _T_CAPTURE]),
+            image=image,
+            width=width,
+            height=height,
+            pixfmt=bytes(self._pixfmt[slot]).rstrip(b"\0").decode("ascii"),
+        )
+        if int(words[base + _GUARD]) != seq:  # Overwritten while reading
+            return None
+        return RingFrame(seq=seq, frame=frame)
+
+    def latest(self, copy: bool = False) -> Optional[RingFrame]:
+        """Newest complete frame, or None if nothing was written yet."""
+        for _ in range(3):
+            ring_frame = self.read(self.head, copy=copy)
+            if ring_frame is not None or self.head < 0:
+                return ring_frame
+        return None
+
+    def is_valid(self, seq: int) -> bool:
+        """True if the slot for ``seq`` has not been overwritten since."""
+        slot = seq % self._slots
+        return int(self._words[_HEADER_WORDS + slot * _SLOT_WORDS + _GUARD]) == seq
+
+    def close(self) -> None:
+        """Detach (and unlink, for the creator).
+
+        Views handed out by read() must be dropped first.
+        """
+        self._words = None
+        self._pixfmt = None
+        try:
+            self._segment.close()
+        except BufferError:
+            logger.warning(f"Frame ring {self.name} still has live views; leaving it mapped")
+            return
+        if self._owner:
+            try:
+                self._segment.unlink()
+            except FileNotFoundError:
+                pass
@@ -12,6 +12,7 @@ from capture import CameraDevice, SimulatedCamera, UvcCamera
 from capture.opencv_backend import OpenCVCamera
 from configs.settings import AppConfig
 from contracts import Frame
+from telemetry import get_tracer
 from exceptions import (
     CameraConfigurationError,
     CameraConnectionError,
@@ -502,11 +503,13 @@ class CameraManager:
         self._left_thread = threading.Thread(
             target=self._capture_loop,
             args=("left", self._left),
+            name="Capture-left",
             daemon=True,
         )
         self._right_thread = threading.Thread(
             target=self._capture_loop,
             args=("right", self._right),
+            name="Capture-right",
             daemon=True,
         )
         self._left_thread.start()
@@ -533,6 +536,7 @@ class CameraManager:
         consecutive_failures = 0
         last_frame_time = time.monotonic()
         total_frames = 0
+        tracer = get_tracer()
 
         logger.info(f"Camera {label}: Capture loop started")
 
@@ -549,6 +553,7 @@ class CameraManager:
                 if not self._validate_frame(label, frame):
                     logger.warning(f"Camera {label}: Invalid frame received (frame {total_frames})")
                     continue
+                tracer.mark(label, frame.frame_index, "captured")
 
                 # Update latest frame for preview
                 with self._latest_lock:
@@ -0,0 +1,259 @@
+"""Detector running in a child process, fed through a shared-memory frame ring.
+
+ClassicalDetector's mask logic, component loop and filters are mostly Python
+and NumPy glue that holds the GIL, so detector threads for two cameras in one
+interpreter serialize. ProcessDetector moves one camera's detector into its
+own process:
+
+- Frames are copied into a SharedFrameRing owned by the parent; only the
+  sequence number crosses the pipe. The child copies the slot out before
+  detecting, so nothing it keeps (such as the detector's previous frame)
+  points into ring memory the parent will overwrite.
+- Detections come back as one float64 array of ``(u, v, radius_px,
+  confidence)`` rows; frame metadata is filled in from the parent's frame.
+- Detector exceptions are sent back and re-raised in the parent, so the
+  caller's error accounting sees them exactly as for an in-thread detector.
+- A frame that is not answered in time restarts the child: it may still be
+  reading its slot, so the parent must not write further frames to it.
+
+The detector instance is pickled into the child when the process starts, so
+later changes to the parent's copy need a restart (see
+DetectionThreadPool.set_detectors).
+"""
+
+from __future__ import annotations
+
+import logging
+import multiprocessing
+import threading
+import time
+from typing import List, Optional
+
+import numpy as np
+
+from app.ipc.frame_ring import SharedFrameRing
+from contracts import Detection, Frame
+
+logger = logging.getLogger(__name__)
+
+# u, v, radius_px, confidence
+DETECTION_FIELDS = 4
+
+# Minimum frame ring size
+DEFAULT_SLOTS = 3
+
+_FRAME = "frame"
+_RING = "ring"
+_STOP = "stop"
+
+
+def pack_detections(detections: List[Detection]) -> np.ndarray:
+    """Detections as an (n, 4) float64 array of (u, v, radius_px, confidence)."""
+    packed = np.empty((len(detections), DETECTION_FIELDS), dtype=np.float64)
+    for row, detection in enumerate(detections):
+        packed[row] = (detection.u, detection.v, detection.radius_px, detection.confidence)
+    return packed
+
+
+def unpack_detections(packed: np.ndarray, frame: Frame) -> List[Detection]:
+    """Rebuild Detection objects for ``frame`` from pack_detections() output."""
+    return [
+        Detection(
+            camera_id=frame.camera_id,
+            frame_index=frame.frame_index,
+            t_capture_monotonic_ns=frame.t_capture_monotonic_ns,
+            u=float(u),
+            v=float(v),
+            radius_px=float(radius_px),
+            confidence=float(confidence),
+        )
+        for u, v, radius_px, confidence in packed.tolist()
+    ]
+
+
+def run_detector(detector, conn) -> None:
+    """Child process entry point: detect frames named by sequence number.
+
+    Messages are ``("ring", name)`` to (re)attach the frame ring,
+    ``("frame", seq)`` to detect a frame, answered with ``("ok", seq, array)``
+    or ``("error", seq, exception)``, and ``("stop", None)``.
+
+    Args:
+        detector: Detector instance (pickled from the parent)
+        conn: Child end of the pipe
+    """
+    ring: Optional[SharedFrameRing] = None
+    try:
+        while True:
+            try:
+                kind, value = conn.recv()
+            except EOFError:
+                break  # Parent went away
+            if kind == _STOP:
+                break
+            if kind == _RING:
+                if ring is not None:
+                    ring.close()
+                ring = SharedFrameRing.attach(value)
+                continue
+            try:
+                ring_frame = ring.read(value, copy=True) if ring is not None else None
+                if ring_frame is None:
+                    raise RuntimeError(f"Frame {value} was overwritten before detection")
+                reply = ("ok", value, pack_detections(detector.detect(ring_frame.frame)))
+            except Exception as exc:
+                reply = ("error", value, exc)
+            try:
+                conn.send(reply)
+            except Exception as exc:  # Exception not picklable
+                conn.send(("error", value, RuntimeError(f"{reply[2]!r} ({exc})")))
+    finally:
+        # Drop the detector's references to ring memory before detaching
+        detector = None
+        if ring is not None:
+            ring.close()
+
+
+class ProcessDetector:
+    """Runs a detector for one camera in a child process.
+
+    Has the same ``detect(frame)`` interface as the detectors it wraps, and
+    is safe to call from one thread at a time per instance. A detect() that
+    times out restarts the child process, which loses the detector's state
+    (e.g. its previous frame).
+
+    Example:
+        >>> worker = ProcessDetector("left", ClassicalDetector(config))
+        >>> worker.start()
+        >>> detections = worker.detect(frame)
+        >>> worker.stop()
+    """
+
+    def __init__(
+        self,
+        label: str,
+        detector,
+        slots: int = DEFAULT_SLOTS,
+        timeout_s: float = 5.0,
+    ) -> None:
+        """Initialize process detector.
+
+        Args:
+            label: Camera label, used to name the process
+            detector: Picklable detector with a detect(frame) method
+            slots: Frame ring slots (at least 3)
+            timeout_s: Longest wait for one frame's detections
+        """
+        if slots < DEFAULT_SLOTS:
+            raise ValueError(f"Process detector needs at least {DEFAULT_SLOTS} ring slots")
+        self._label = label
+        self._detector = detector
+        self._slots = slots
+        self._timeout_s = timeout_s
+        self._ring: Optional[SharedFrameRing] = None
+        self._ring_camera: Optional[str] = None
+        self._process = None
+        self._conn = None
+        self._lock = threading.Lock()
+
+    @property
+    def label(self) -> str:
+        return self._label
+
+    def is_alive(self) -> bool:
+        return self._process is not None and self._process.is_alive()
+
+    def start(self) -> None:
+        """Spawn the detector process.
+
+        Raises:
+            Exception: If the detector cannot be pickled or the process fails to start
+        """
+        with self._lock:
+            if self.is_alive():
+                return
+            self._start_process()
+
+    def detect(self, frame: Frame) -> List[Detection]:
+        """Detect ``frame`` in the child process.
+
+        Raises:
+            RuntimeError: If the process is not running or does not answer in time
+            Exception: Whatever the detector raised in the child
+        """
+        with self._lock:
+            if not self.is_alive():
+                raise RuntimeError(f"Detector process for {self._label} camera is not running")
+            ring = self._ring_for(frame)
+            seq = ring.write(frame)
+            self._conn.send((_FRAME, seq))
+            deadline = time.monotonic() + self._timeout_s
+            while True:
+                if not self._conn.poll(max(0.0, deadline - time.monotonic())):
+                    # The child may still be reading the slot; never write
+                    # to this ring again
+                    logger.warning(f"Detector process for {self._label} camera did not answer; restarting")
+                    self._stop_process(timeout_s=0.0)
+                    self._start_process()
+                    raise RuntimeError(f"Detector process for {self._label} camera did not answer")
+                status, reply_seq, value = self._conn.recv()
+                if reply_seq == seq:
+                    break
+        if status == "error":
+            raise value
+        return unpack_detections(value, frame)
+
+    def stop(self, timeout_s: float = 2.0) -> None:
+        """Stop the detector process and release the frame ring."""
+        with self._lock:
+            self._stop_process(timeout_s)
+
+    def _start_process(self) -> None:
+        context = multiprocessing.get_context("spawn")
+        self._conn, child_conn = context.Pipe()
+        self._process = context.Process(
+            target=run_detector,
+            args=(self._detector, child_conn),
+            name=f"Detector-{self._label}",
+            daemon=True,
+        )
+        try:
+            self._process.start()
+        finally:
+            child_conn.close()
+        logger.info(f"Detector process for {self._label} camera started (pid {self._process.pid})")
+
+    def _stop_process(self, timeout_s: float) -> None:
+        if self._process is None:
+            return
+        if self._process.is_alive() and timeout_s > 0:
+            try:
+                self._conn.send((_STOP, None))
+            except (BrokenPipeError, OSError):
+                pass
+            self._process.join(timeout=timeout_s)
+        if self._process.is_alive():
+            if timeout_s > 0:
+                logger.warning(f"Detector process for {self._label} camera did not exit; terminating")
+            self._process.terminate()
+            self._process.join(timeout=1.0)
+        self._conn.close()
+        self._process = None
+        self._conn = None
+        if self._ring is not None:
+            self._ring.close()
+            self._ring = None
+            self._ring_camera = None
+
+    def _ring_for(self, frame: Frame) -> SharedFrameRing:
+        """Frame ring that fits ``frame``, (re)created when size or camera changes."""
+        ring = self._ring
+        nbytes = frame.image.nbytes
+        if ring is None or ring.slot_bytes < nbytes or self._ring_camera != frame.camera_id:
+            ring = SharedFrameRing.create(frame.camera_id, self._slots, nbytes)
+            self._conn.send((_RING, ring.name))
+            if self._ring is not None:
+                self._ring.close()
+            self._ring = ring
+            self._ring_camera = frame.camera_id
+        return ring
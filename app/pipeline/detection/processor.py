@@ -11,13 +11,14 @@ from configs.settings import AppConfig
 from contracts import Detection, Frame, StereoObservation
 from detect.lane import LaneGate
 from metrics.simple_metrics import (
+    PlateMetricsAccumulator,
     PlateMetricsStub,
-    compute_plate_from_observations,
     compute_plate_stub,
 )
-from metrics.strike_zone import StrikeResult, build_strike_zone, is_strike
+from metrics.strike_zone import StrikeResult, StrikeZoneEvaluator, build_strike_zone
 from stereo import StereoLaneGate
 from stereo.simple_stereo import SimpleStereoMatcher
+from telemetry import WindowedHistogram, get_tracer
 from track.simple_tracker import SimpleTracker
 
 from app.pipeline.utils import build_stereo_matches, gate_detections
@@ -68,18 +69,21 @@ class DetectionProcessor:
 
         # Tracking
         self._tracker = SimpleTracker()
-        self._plate_observations = deque(maxlen=12)
+        self._plate_observations = PlateMetricsAccumulator(maxlen=12)
 
         # Stereo buffering
         self._left_buffer: deque[Tuple[Frame, list[Detection]]] = deque(maxlen=6)
         self._right_buffer: deque[Tuple[Frame, list[Detection]]] = deque(maxlen=6)
 
         # Timestamp synchronization monitoring
-        self._frame_deltas_ns: deque[int] = deque(maxlen=100)  # Track last 100 frame pairs
+        self._frame_deltas_ns = WindowedHistogram(window_s=10.0, slices=10)  # Last 10 s of frame pairs
         self._total_paired_frames = 0
         self._dropped_frames_sync = 0
         self._last_sync_warning_time = 0.0
 
+        # Stage tracing (no-op when disabled)
+        self._tracer = get_tracer()
+
         # State (thread-safe)
         self._detect_lock = threading.Lock()
         self._last_detections: Dict[str, list[Detection]] = {}
@@ -106,6 +110,8 @@ class DetectionProcessor:
         # Cached strike zone (rebuilt only when config changes)
         self._cached_strike_zone = None
         self._cached_strike_zone_config_hash = None
+        # Incremental strike evaluator over _plate_observations (rebuilt with the zone or ball radius)
+        self._strike_evaluator: Optional[StrikeZoneEvaluator] = None
 
     def set_stereo_pair_callback(
         self,
@@ -240,21 +246,44 @@ class DetectionProcessor:
 
         return self._cached_strike_zone
 
+    def _update_strike_result(self, zone, new_observations: List[StereoObservation]) -> StrikeResult:
+        """Feed newly tracked plate observations to the strike evaluator.
+
+        Only observations added since the last stereo pair are tested; the
+        evaluator is rebuilt from the current window when the zone or ball
+        radius changes.
+
+        Args:
+            zone: Strike zone from _get_or_build_strike_zone()
+            new_observations: Observations appended to _plate_observations for this pair
+
+        Returns:
+            Strike result for the current observation window
+        """
+        radius_in = self._get_ball_radius_fn()
+        evaluator = self._strike_evaluator
+        if evaluator is None or evaluator.zone is not zone or evaluator.ball_radius_in != radius_in:
+            evaluator = StrikeZoneEvaluator(zone, radius_in, maxlen=self._plate_observations.maxlen)
+            evaluator.extend(self._plate_observations)
+            self._strike_evaluator = evaluator
+        else:
+            evaluator.extend(new_observations)
+        return evaluator.result()
+
     def _check_sync_quality(self) -> None:
         """Check timestamp synchronization quality and log warnings if poor.
 
         Analyzes recent frame deltas and warns if cameras are poorly synchronized.
         """
         import time
-        import numpy as np
 
-        if not self._frame_deltas_ns:
+        deltas = self._frame_deltas_ns.snapshot()
+        if not deltas.count:
             return
 
-        deltas_ms = np.array(self._frame_deltas_ns) / 1e6
-        mean_delta = np.mean(deltas_ms)
-        max_delta = np.max(deltas_ms)
-        p95_delta = np.percentile(deltas_ms, 95)
+        mean_delta = deltas.mean_ns / 1e6
+        max_delta = deltas.max_ns / 1e6
+        p95_delta = deltas.quantile(0.95) / 1e6
 
         # Thresholds for warnings
         WARN_MEAN_MS = 10.0  # Mean delta > 10ms is concerning
@@ -284,7 +313,7 @@ class DetectionProcessor:
         """Get timestamp synchronization statistics.
 
         Returns:
-            Dictionary with sync quality metrics:
+            Dictionary with sync quality metrics (deltas over the last 10 s):
             - mean_delta_ms: Average timestamp delta
             - p95_delta_ms: 95th percentile delta
             - max_delta_ms: Maximum delta
@@ -292,9 +321,8 @@ class DetectionProcessor:
             - dropped_sync: Frames dropped due to sync issues
             - drop_rate_pct: Percentage of frames dropped
         """
-        import numpy as np
-
-        if not self._frame_deltas_ns:
+        deltas = self._frame_deltas_ns.snapshot()
+        if not deltas.count:
             return {
                 "mean_delta_ms": 0.0,
                 "p95_delta_ms": 0.0,
@@ -304,14 +332,13 @@ class DetectionProcessor:
                 "drop_rate_pct": 0.0,
             }
 
-        deltas_ms = np.array(self._frame_deltas_ns) / 1e6
         total = self._total_paired_frames + self._dropped_frames_sync
         drop_rate = (self._dropped_frames_sync / max(total, 1)) * 100
 
         return {
-            "mean_delta_ms": float(np.mean(deltas_ms)),
-            "p95_delta_ms": float(np.percentile(deltas_ms, 95)),
-            "max_delta_ms": float(np.max(deltas_ms)),
+            "mean_delta_ms": deltas.mean_ns / 1e6,
+            "p95_delta_ms": deltas.quantile(0.95) / 1e6,
+            "max_delta_ms": deltas.max_ns / 1e6,
             "total_paired": self._total_paired_frames,
             "dropped_sync": self._dropped_frames_sync,
             "drop_rate_pct": float(drop_rate),
@@ -368,7 +395,7 @@ class DetectionProcessor:
 
             # Frames matched by index - still track timestamp delta for monitoring
             delta = abs(left_frame.t_capture_monotonic_ns - right_frame.t_capture_monotonic_ns)
-            self._frame_deltas_ns.append(delta)
+            self._frame_deltas_ns.record(delta)
             self._total_paired_frames += 1
 
             # Warn if timestamps are very different (indicates drift)
@@ -418,7 +445,7 @@ class DetectionProcessor:
                 continue
 
             # Frames are paired - track sync quality
-            self._frame_deltas_ns.append(delta)
+            self._frame_deltas_ns.record(delta)
             self._total_paired_frames += 1
 
             # Periodic sync quality check
@@ -447,6 +474,8 @@ class DetectionProcessor:
             left_detections: Left camera detections
             right_detections: Right camera detections
         """
+        self._tracer.mark_pair(left_frame.frame_index, right_frame.frame_index, "paired")
+
         # Get camera IDs
         left_id = left_frame.camera_id
         right_id = right_frame.camera_id
@@ -493,6 +522,7 @@ class DetectionProcessor:
                 with self._detect_lock:
                     self._last_plate_metrics = compute_plate_stub([])
                     self._strike_result = StrikeResult(is_strike=False, sample_count=0)
+                self._tracer.mark_pair(left_frame.frame_index, right_frame.frame_index, "triangulated")
                 # Still notify callback with zero observations
                 if self._on_stereo_pair:
                     lane_count = len(left_gated) + len(right_gated)
@@ -519,29 +549,33 @@ class DetectionProcessor:
             observations.append(self._stereo.triangulate(match))
 
         # Track observations
+        new_plate_observations: List[StereoObservation] = []
         for obs in observations:
             state = self._tracker.update(obs)
             if state.samples:
                 self._plate_observations.append(obs)
+                new_plate_observations.append(obs)
 
-        # Compute plate metrics
+        # Compute plate metrics (O(1): cached until the observation window changes)
         if self._plate_observations:
-            metrics = compute_plate_from_observations(self._plate_observations)
+            metrics = self._plate_observations.metrics()
         else:
             metrics = compute_plate_stub(plate_matches)
 
         # Compute strike zone (use cached zone for 10-20% latency reduction)
         zone = self._get_or_build_strike_zone()
         if zone is not None:
-            radius_in = self._get_ball_radius_fn()
-            strike = is_strike(self._plate_observations, zone, radius_in)
+            strike = self._update_strike_result(zone, new_plate_observations)
         else:
             strike = StrikeResult(is_strike=False, sample_count=0)
 
-        # Update state
-        with self._detect_lock:
-            self._last_plate_metrics = metrics
-            self._strike_result = strike
+        # Update state only when something changed, so pollers keep reading the same objects
+        if metrics is not self._last_plate_metrics or strike is not self._strike_result:
+            with self._detect_lock:
+                self._last_plate_metrics = metrics
+                self._strike_result = strike
+
+        self._tracer.mark_pair(left_frame.frame_index, right_frame.frame_index, "triangulated")
 
         # Notify callback
         if self._on_stereo_pair:
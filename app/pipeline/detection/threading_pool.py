@@ -10,7 +10,9 @@ from collections import deque
 from typing import Callable, Dict, List, Optional, Tuple
 
 from app.events import ErrorCategory, ErrorSeverity, publish_error
+from app.pipeline.detection.process_worker import ProcessDetector
 from contracts import Detection, Frame
+from telemetry import get_tracer
 
 logger = logging.getLogger(__name__)
 
@@ -18,9 +20,13 @@ logger = logging.getLogger(__name__)
 class DetectionThreadPool:
     """Manages detection threading with configurable worker modes.
 
-    Supports two threading modes:
+    Supports three threading modes:
     - per_camera: One dedicated thread per camera
     - worker_pool: Shared pool of workers processing both cameras
+    - process_per_camera: One thread per camera, with each camera's detector
+      running in its own process (see process_worker), so the cameras no
+      longer share one GIL. The detect callback fetches the process-backed
+      detector with get_detector().
 
     Handles:
     - Frame queuing for detection
@@ -33,7 +39,7 @@ class DetectionThreadPool:
         """Initialize detection thread pool.
 
         Args:
-            mode: Threading mode ("per_camera" or "worker_pool")
+            mode: Threading mode ("per_camera", "worker_pool" or "process_per_camera")
             worker_count: Number of worker threads for worker_pool mode
         """
         self._mode = mode
@@ -55,6 +61,13 @@ class DetectionThreadPool:
         self._detector_busy: Dict[str, bool] = {"left": False, "right": False}
         self._detector_busy_lock = threading.Lock()
 
+        # Stage tracing (no-op when disabled)
+        self._tracer = get_tracer()
+
+        # Detectors for process_per_camera mode
+        self._detectors: Dict[str, object] = {}
+        self._process_detectors: Dict[str, ProcessDetector] = {}
+
         # Callbacks
         self._detect_callback: Optional[Callable[[str, Frame], list[Detection]]] = None
         self._stereo_callback: Optional[Callable[[str, Frame, list[Detection]], None]] = None
@@ -87,6 +100,24 @@ class DetectionThreadPool:
         """
         self._detect_callback = callback
 
+    def set_detectors(self, detectors: Dict[str, object]) -> None:
+        """Set the per-camera detectors run in process_per_camera mode.
+
+        Each detector is pickled into its own process on start(). If the pool
+        is already running in that mode, the processes are replaced so that
+        rebuilt detectors take effect. Cameras without a detector, or whose
+        detector cannot be started in a process, detect in-thread.
+
+        Args:
+            detectors: Detector per camera label ("left", "right")
+        """
+        self._detectors = dict(detectors)
+        if self._detection_running and self._mode == "process_per_camera":
+            old = self._process_detectors
+            self._process_detectors = self._start_process_detectors()
+            for worker in old.values():
+                worker.stop()
+
     def set_stereo_callback(self, callback: Callable[[str, Frame, list[Detection]], None]) -> None:
         """Set callback for stereo processing.
 
@@ -125,20 +156,25 @@ class DetectionThreadPool:
             self._last_error_log_time = {"left": 0.0, "right": 0.0}
 
         # Start stereo matching thread
-        self._stereo_thread = threading.Thread(target=self._stereo_loop, daemon=True)
+        self._stereo_thread = threading.Thread(target=self._stereo_loop, name="StereoLoop", daemon=True)
         self._stereo_thread.start()
 
+        if self._mode == "process_per_camera":
+            self._process_detectors = self._start_process_detectors()
+
         # Start detection threads based on mode
-        if self._mode == "per_camera":
+        if self._mode in ("per_camera", "process_per_camera"):
             self._detector_threads = [
                 threading.Thread(
                     target=self._detection_loop_per_camera,
                     args=("left", self._left_detect_queue),
+                    name="Detect-left",
                     daemon=True,
                 ),
                 threading.Thread(
                     target=self._detection_loop_per_camera,
                     args=("right", self._right_detect_queue),
+                    name="Detect-right",
                     daemon=True,
                 ),
             ]
@@ -146,8 +182,12 @@ class DetectionThreadPool:
                 thread.start()
         else:
             # worker_pool mode
-            for _ in range(max(1, self._worker_count)):
-                thread = threading.Thread(target=self._detection_loop_pool, daemon=True)
+            for index in range(max(1, self._worker_count)):
+                thread = threading.Thread(
+                    target=self._detection_loop_pool,
+                    name=f"DetectWorker-{index}",
+                    daemon=True,
+                )
                 self._worker_threads.append(thread)
                 thread.start()
 
@@ -166,6 +206,10 @@ class DetectionThreadPool:
         self._worker_threads = []
         self._stereo_thread = None
 
+        workers, self._process_detectors = self._process_detectors, {}
+        for worker in workers.values():
+            worker.stop()
+
     def enqueue_frame(self, label: str, frame: Frame) -> None:
         """Enqueue frame for detection.
 
@@ -177,20 +221,33 @@ class DetectionThreadPool:
             return
 
         target = self._left_detect_queue if label == "left" else self._right_detect_queue
+        self._tracer.mark(label, frame.frame_index, "enqueued")
         self._queue_put_drop_oldest(target, frame, queue_name=label)
 
     def set_mode(self, mode: str, worker_count: int) -> None:
         """Update threading mode (requires restart to take effect).
 
         Args:
-            mode: Threading mode ("per_camera" or "worker_pool")
+            mode: Threading mode ("per_camera", "worker_pool" or "process_per_camera")
             worker_count: Number of worker threads for worker_pool mode
         """
-        if mode not in ("per_camera", "worker_pool"):
+        if mode not in ("per_camera", "worker_pool", "process_per_camera"):
             raise ValueError(f"Unknown detection threading mode: {mode}")
         self._mode = mode
         self._worker_count = max(1, int(worker_count))
 
+    def get_detector(self, label: str, default=None):
+        """Detector the detect callback should use for a camera.
+
+        Args:
+            label: Camera label ("left" or "right")
+            default: The caller's in-process detector
+
+        Returns:
+            The camera's ProcessDetector in process_per_camera mode, else ``default``
+        """
+        return self._process_detectors.get(label, default)
+
     def is_running(self) -> bool:
         """Check if detection threads are running.
 
@@ -208,6 +265,27 @@ class DetectionThreadPool:
         with self._detection_error_lock:
             return self._detection_errors.copy()
 
+    def _start_process_detectors(self) -> Dict[str, ProcessDetector]:
+        """Start one detector process per camera that has a detector."""
+        workers: Dict[str, ProcessDetector] = {}
+        for label in ("left", "right"):
+            detector = self._detectors.get(label)
+            if detector is None:
+                logger.warning(f"No detector set for {label} camera; detecting in-thread")
+                continue
+            worker = ProcessDetector(label, detector)
+            try:
+                worker.start()
+            except Exception as e:
+                logger.warning(
+                    f"Cannot run {label} detector in a process ({e.__class__.__name__}: {e}); "
+                    f"detecting in-thread"
+                )
+                worker.stop()
+                continue
+            workers[label] = worker
+        return workers
+
     def _check_adaptive_queue_sizing(self) -> None:
         """Check and adjust queue sizes based on drop patterns.
 
@@ -432,7 +510,7 @@ class DetectionThreadPool:
             return []
 
     def _detection_loop_per_camera(self, label: str, source: queue.Queue) -> None:
-        """Detection loop for per-camera mode (one thread per camera).
+        """Detection loop for per-camera modes (one thread per camera).
 
         Args:
             label: Camera label ("left" or "right")
@@ -444,7 +522,9 @@ class DetectionThreadPool:
             except queue.Empty:
                 continue
 
+            self._tracer.mark(label, frame.frame_index, "detect_start")
             detections = self._detect_frame(label, frame)
+            self._tracer.mark(label, frame.frame_index, "detect_end")
             self._queue_put_drop_oldest(self._detect_result_queue, (label, frame, detections), queue_name="results")
 
     def _detection_loop_pool(self) -> None:
@@ -470,7 +550,9 @@ class DetectionThreadPool:
                     self._detector_busy[label] = True
 
                 # Process frame
+                self._tracer.mark(label, frame.frame_index, "detect_start")
                 detections = self._detect_frame(label, frame)
+                self._tracer.mark(label, frame.frame_index, "detect_end")
                 self._queue_put_drop_oldest(self._detect_result_queue, (label, frame, detections), queue_name="results")
 
                 with self._detector_busy_lock:
@@ -497,6 +579,7 @@ class DetectionThreadPool:
                 self._check_adaptive_queue_sizing()
                 continue
 
+            self._tracer.mark(label, frame.frame_index, "stereo_start")
             if label == "left":
                 left_buffer.append((frame, detections))
             else:
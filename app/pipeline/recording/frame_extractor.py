@@ -1,26 +1,163 @@
 """Extract key frames from pitch video for ML training."""
 
+import logging
+import queue
+import threading
 from pathlib import Path
-from typing import Dict
+from typing import Callable, Dict, List, Optional, Tuple
+
 import cv2
+import numpy as np
+
 from contracts import Frame
 
+logger = logging.getLogger(__name__)
+
+# File extension and OpenCV encoder parameter for each supported format.
+# The compression value means: PNG zlib level (0-9), WebP quality (1-100,
+# above 100 is lossless) or JPEG quality (0-100).
+_FORMATS: Dict[str, Tuple[str, int]] = {
+    "png": (".png", cv2.IMWRITE_PNG_COMPRESSION),
+    "webp": (".webp", cv2.IMWRITE_WEBP_QUALITY),
+    "jpg": (".jpg", cv2.IMWRITE_JPEG_QUALITY),
+}
+
+DEFAULT_COMPRESSION: Dict[str, int] = {"png": 1, "webp": 101, "jpg": 95}
+COMPRESSION_RANGE: Dict[str, Tuple[int, int]] = {"png": (0, 9), "webp": (1, 101), "jpg": (0, 100)}
+
+_WriteCallback = Callable[[bool], None]
+
+
+class FrameWriterPool:
+    """Background threads that encode and write frames from a bounded queue.
+
+    Submitting never blocks: when the queue is full the frame is rejected and
+    the caller accounts for the drop, so a slow disk or encoder cannot stall
+    the detection path.
+    """
+
+    def __init__(self, workers: int = 2, max_queue: int = 64):
+        """Initialize writer pool.
+
+        Args:
+            workers: Number of encoder threads
+            max_queue: Frames that may wait for a writer before new frames are dropped
+        """
+        self._queue: "queue.Queue[Optional[Tuple[Path, np.ndarray, List[int], _WriteCallback]]]" = (
+            queue.Queue(maxsize=max(1, max_queue))
+        )
+        self._threads = [
+            threading.Thread(target=self._run, name=f"FrameWriter-{i}", daemon=True)
+            for i in range(max(1, workers))
+        ]
+        for thread in self._threads:
+            thread.start()
+
+    def submit(self, path: Path, image: np.ndarray, params: List[int], on_done: _WriteCallback) -> bool:
+        """Queue a frame for writing.
+
+        Returns:
+            False if the queue is full and the frame was not queued
+        """
+        try:
+            self._queue.put_nowait((path, image, params, on_done))
+        except queue.Full:
+            return False
+        return True
+
+    def pending(self) -> int:
+        """Frames queued but not yet picked up by a writer."""
+        return self._queue.qsize()
+
+    def shutdown(self, timeout: float = 5.0) -> None:
+        """Stop the writer threads after the queued frames are written."""
+        for _ in self._threads:
+            self._queue.put(None)
+        for thread in self._threads:
+            thread.join(timeout=timeout)
+            if thread.is_alive():
+                logger.warning(f"Frame writer {thread.name} did not stop within {timeout}s")
+
+    def _run(self) -> None:
+        while True:
+            item = self._queue.get()
+            if item is None:
+                return
+            path, image, params, on_done = item
+            try:
+                ok = bool(cv2.imwrite(str(path), image, params))
+            except Exception as exc:  # noqa: BLE001 - a failed frame must not kill the writer
+                logger.warning(f"Failed to write training frame {path}: {exc}")
+                ok = False
+            on_done(ok)
+
+
+_shared_pool: Optional[FrameWriterPool] = None
+_shared_pool_lock = threading.Lock()
+
+
+def get_frame_writer_pool() -> FrameWriterPool:
+    """Writer pool shared by all pitch frame extractors."""
+    global _shared_pool
+    with _shared_pool_lock:
+        if _shared_pool is None:
+            _shared_pool = FrameWriterPool()
+        return _shared_pool
+
+
+def shutdown_frame_writer_pool(timeout: float = 5.0) -> None:
+    """Write out the shared pool's queued frames and stop its threads.
+
+    Called when a session ends; the next extractor starts a new pool.
+    """
+    global _shared_pool
+    with _shared_pool_lock:
+        pool, _shared_pool = _shared_pool, None
+    if pool is not None:
+        pool.shutdown(timeout=timeout)
+
 
 class FrameExtractor:
-    """Extracts and saves key frames during pitch recording."""
+    """Extracts and saves key frames during pitch recording.
 
-    def __init__(self, pitch_dir: Path, enabled: bool = True):
+    Frames are encoded and written by a background FrameWriterPool; frames
+    that arrive while its queue is full are dropped and counted.
+    """
+
+    def __init__(
+        self,
+        pitch_dir: Path,
+        enabled: bool = True,
+        image_format: str = "png",
+        compression: Optional[int] = None,
+        writer_pool: Optional[FrameWriterPool] = None,
+    ):
         """Initialize frame extractor.
 
         Args:
             pitch_dir: Directory to save frames
             enabled: Whether frame extraction is enabled
+            image_format: "png", "webp" or "jpg"
+            compression: PNG level, WebP quality (>100 lossless) or JPEG quality;
+                defaults to fast PNG, lossless WebP or JPEG 95 (DEFAULT_COMPRESSION)
+            writer_pool: Writer pool (defaults to the shared pool)
         """
         self._pitch_dir = pitch_dir
         self._enabled = enabled
         self._frames_dir = pitch_dir / "frames"
+        self._extension = ".png"
+        self._params: List[int] = []
+        self._writer_pool = writer_pool
 
         if self._enabled:
+            if image_format not in _FORMATS:
+                raise ValueError(f"Unsupported frame format: {image_format}")
+            self._extension, param = _FORMATS[image_format]
+            level = DEFAULT_COMPRESSION[image_format] if compression is None else int(compression)
+            low, high = COMPRESSION_RANGE[image_format]
+            if not low <= level <= high:
+                raise ValueError(f"{image_format} compression must be {low}-{high}, got {level}")
+            self._params = [param, int(level)]
             self._frames_dir.mkdir(exist_ok=True)
             (self._frames_dir / "left").mkdir(exist_ok=True)
             (self._frames_dir / "right").mkdir(exist_ok=True)
@@ -39,6 +176,10 @@ class FrameExtractor:
         # Frame counters
         self._frame_count: Dict[str, int] = {"left": 0, "right": 0}
 
+        # Write accounting
+        self._stats_cond = threading.Condition()
+        self._stats: Dict[str, int] = {"queued": 0, "written": 0, "failed": 0, "dropped": 0}
+
     def save_pre_roll_first(self, label: str, frame: Frame):
         """Save first pre-roll frame."""
         if self._enabled and not self._saved_frames["pre_roll_first"]:
@@ -81,8 +222,25 @@ class FrameExtractor:
                     label, frame, f"uniform_{self._frame_count[label]:05d}"
                 )
 
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """Wait until every queued frame of this extractor has been written.
+
+        Returns:
+            True if all queued frames finished within the timeout
+        """
+        with self._stats_cond:
+            return self._stats_cond.wait_for(
+                lambda: self._stats["written"] + self._stats["failed"] >= self._stats["queued"],
+                timeout=timeout,
+            )
+
+    def stats(self) -> Dict[str, int]:
+        """Get write accounting (queued, written, failed, dropped)."""
+        with self._stats_cond:
+            return dict(self._stats)
+
     def _save_frame(self, label: str, frame: Frame, name: str):
-        """Save frame as PNG.
+        """Queue frame for writing.
 
         Args:
             label: Camera label
@@ -92,5 +250,19 @@ class FrameExtractor:
         if frame.image is None:
             return
 
-        frame_path = self._frames_dir / label / f"{name}.png"
-        cv2.imwrite(str(frame_path), frame.image)
+        frame_path = self._frames_dir / label / f"{name}{self._extension}"
+        pool = self._writer_pool or get_frame_writer_pool()
+        with self._stats_cond:
+            self._stats["queued"] += 1
+        if not pool.submit(frame_path, frame.image, self._params, self._on_written):
+            with self._stats_cond:
+                self._stats["queued"] -= 1
+                self._stats["dropped"] += 1
+                if self._stats["dropped"] == 1:
+                    logger.warning("Training frame writer saturated; dropping frames")
+                self._stats_cond.notify_all()
+
+    def _on_written(self, ok: bool) -> None:
+        with self._stats_cond:
+            self._stats["written" if ok else "failed"] += 1
+            self._stats_cond.notify_all()
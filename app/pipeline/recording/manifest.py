@@ -7,6 +7,10 @@ from typing import Dict, Any, Optional
 
 from contracts.versioning import APP_VERSION, SCHEMA_VERSION
 
+# Manifest file names written by the session and pitch recorders
+SESSION_MANIFEST_FILENAME = "manifest.json"
+PITCH_MANIFEST_FILENAME = "manifest.json"
+
 
 def create_base_manifest() -> Dict[str, Any]:
     """Create base manifest with common fields.
@@ -55,6 +59,8 @@ def create_session_manifest(
         "session_right_video": "session_right.avi",
         "session_left_timestamps": "session_left_timestamps.csv",
         "session_right_timestamps": "session_right_timestamps.csv",
+        "session_left_seek_index": "session_left.seekidx",
+        "session_right_seek_index": "session_right.seekidx",
     })
     return manifest
 
@@ -15,11 +15,21 @@ import cv2
 from configs.settings import AppConfig
 from contracts import Frame, Detection, StereoObservation
 
-from app.pipeline.recording.manifest import create_pitch_manifest
+from app.pipeline.recording.manifest import PITCH_MANIFEST_FILENAME, create_pitch_manifest
 from app.pipeline.recording.frame_extractor import FrameExtractor
+from app.pipeline.recording.session_index import update_session_index
+from app.pipeline.recording.telemetry_store import (
+    TelemetryTable,
+    detections_path,
+    observations_path,
+    write_table,
+)
 
 logger = logging.getLogger(__name__)
 
+# Upper bound on waiting for queued training frames when a pitch ends
+FRAME_FLUSH_TIMEOUT_S = 10.0
+
 
 class PitchRecorder:
     """Manages pitch-level video recording with pre-roll and post-roll.
@@ -72,10 +82,16 @@ class PitchRecorder:
         # ML training data: Observation storage
         self._save_observations = getattr(config.recording, "save_observations", False)
         self._observations: List[Dict] = []
+        self._telemetry_format = getattr(config.recording, "telemetry_format", "npz")
 
         # ML training data: Frame extraction
         self._save_frames = getattr(config.recording, "save_training_frames", False)
-        self._frame_extractor = FrameExtractor(self._pitch_dir, enabled=self._save_frames)
+        self._frame_extractor = FrameExtractor(
+            self._pitch_dir,
+            enabled=self._save_frames,
+            image_format=getattr(config.recording, "frame_format", "png"),
+            compression=getattr(config.recording, "frame_compression", None),
+        )
         self._frame_interval = getattr(config.recording, "frame_save_interval", 5)
 
         # Track pitch phase for keypoint extraction
@@ -260,6 +276,19 @@ class PitchRecorder:
         if self._save_observations and self._observations:
             self._export_observations()
 
+        if self._save_frames and not self._frame_extractor.flush(timeout=FRAME_FLUSH_TIMEOUT_S):
+            logger.warning(f"Training frames for {self._pitch_id} still pending after {FRAME_FLUSH_TIMEOUT_S}s")
+
+        self._update_session_index()
+
+        if self._save_frames:
+            stats = self._frame_extractor.stats()
+            if stats["dropped"]:
+                logger.warning(
+                    f"Dropped {stats['dropped']} of {stats['dropped'] + stats['queued']} training frames "
+                    f"for {self._pitch_id} (frame writer saturated)"
+                )
+
     def write_manifest(
         self, summary, config_path: Optional[str], performance_metrics: Optional[Dict] = None
     ) -> None:
@@ -270,8 +299,21 @@ class PitchRecorder:
             config_path: Path to config file used
             performance_metrics: Optional performance metrics dict
         """
+        # Queued training frames land before the manifest that indexes them
+        if self._save_frames:
+            self._frame_extractor.flush(timeout=FRAME_FLUSH_TIMEOUT_S)
         manifest = create_pitch_manifest(summary, config_path, performance_metrics)
-        (self._pitch_dir / "manifest.json").write_text(json.dumps(manifest, indent=2))
+        (self._pitch_dir / PITCH_MANIFEST_FILENAME).write_text(json.dumps(manifest, indent=2))
+        self._update_session_index()
+
+    def _update_session_index(self) -> None:
+        """Refresh this pitch's session index entry once its manifest exists.
+
+        Called after the manifest is written and again after close() exports
+        telemetry, whichever happens last, so the entry's counts are final.
+        """
+        if (self._pitch_dir / PITCH_MANIFEST_FILENAME).exists():
+            update_session_index(self._session_dir, self._pitch_dir)
 
     def is_active(self) -> bool:
         """Check if pitch recording is active.
@@ -378,34 +420,43 @@ class PitchRecorder:
             self.write_frame("right", frame)
 
     def _export_detections(self) -> None:
-        """Export detection data to JSON files."""
+        """Export detection data as columnar tables (or legacy JSON)."""
         detections_dir = self._pitch_dir / "detections"
         detections_dir.mkdir(exist_ok=True)
 
         for camera in ["left", "right"]:
             if self._detections[camera]:
-                detection_file = detections_dir / f"{camera}_detections.json"
-                data = {
-                    "pitch_id": self._pitch_id,
-                    "camera": camera,
-                    "detection_count": self._detection_count[camera],
-                    "detections": self._detections[camera],
-                }
-                detection_file.write_text(json.dumps(data, indent=2))
+                detection_file = detections_path(self._pitch_dir, camera, self._telemetry_format)
+                if self._telemetry_format == "json":
+                    data = {
+                        "pitch_id": self._pitch_id,
+                        "camera": camera,
+                        "detection_count": self._detection_count[camera],
+                        "detections": self._detections[camera],
+                    }
+                    detection_file.write_text(json.dumps(data, indent=2))
+                else:
+                    table = TelemetryTable.from_detections(
+                        self._detections[camera], pitch_id=self._pitch_id, camera=camera
+                    )
+                    write_table(detection_file, table)
                 logger.info(
                     f"Exported {self._detection_count[camera]} detections to {detection_file}"
                 )
 
     def _export_observations(self) -> None:
-        """Export stereo observations to JSON file."""
+        """Export stereo observations as a columnar table (or legacy JSON)."""
         obs_dir = self._pitch_dir / "observations"
         obs_dir.mkdir(exist_ok=True)
 
-        obs_file = obs_dir / "stereo_observations.json"
-        data = {
-            "pitch_id": self._pitch_id,
-            "observation_count": len(self._observations),
-            "observations": self._observations,
-        }
-        obs_file.write_text(json.dumps(data, indent=2))
+        obs_file = observations_path(self._pitch_dir, self._telemetry_format)
+        if self._telemetry_format == "json":
+            data = {
+                "pitch_id": self._pitch_id,
+                "observation_count": len(self._observations),
+                "observations": self._observations,
+            }
+            obs_file.write_text(json.dumps(data, indent=2))
+        else:
+            write_table(obs_file, TelemetryTable.from_observations(self._observations, pitch_id=self._pitch_id))
         logger.info(f"Exported {len(self._observations)} observations to {obs_file}")
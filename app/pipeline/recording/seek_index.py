@@ -0,0 +1,228 @@
+"""Binary seek-index sidecar for session videos.
+
+One sidecar is written per camera next to the session video. Row ``i`` of the
+index describes video frame ``i``: the camera's own frame index, its
+``t_capture_monotonic_ns`` and the nearest keyframe at or before it. The file
+is a fixed-size header followed by fixed-size little-endian records, so review
+mode can memory-map it and binary search timestamps without parsing CSVs.
+"""
+
+from __future__ import annotations
+
+import csv
+import struct
+from pathlib import Path
+from typing import BinaryIO, Optional
+
+import numpy as np
+
+SEEK_INDEX_MAGIC = b"PTSI"
+SEEK_INDEX_VERSION = 1
+
+# magic, version, key_interval, fps
+_HEADER = struct.Struct("<4sHHd")
+_RECORD = struct.Struct("<qqq")
+
+RECORD_DTYPE = np.dtype(
+    [
+        ("frame_index", "<i8"),
+        ("t_capture_monotonic_ns", "<i8"),
+        ("keyframe", "<i8"),
+    ]
+)
+
+# OpenCV's FFmpeg writer emits an intra frame every 12 frames (gop_size=12);
+# MJPG frames are all intra coded.
+_DEFAULT_GOP = 12
+_INTRA_ONLY_CODECS = {"MJPG"}
+
+
+def key_interval_for_codec(codec: str) -> int:
+    """Keyframe interval used by OpenCV's writer for a FourCC code.
+
+    Args:
+        codec: FourCC code the writer was opened with (e.g. "MJPG", "XVID")
+
+    Returns:
+        Frames between keyframes
+    """
+    return 1 if codec.upper() in _INTRA_ONLY_CODECS else _DEFAULT_GOP
+
+
+def seek_index_path(video_path: Path) -> Path:
+    """Sidecar path for a video file (``session_left.avi`` -> ``session_left.seekidx``)."""
+    return video_path.with_suffix(".seekidx")
+
+
+class SeekIndexWriter:
+    """Appends one record per written video frame.
+
+    Example:
+        >>> writer = SeekIndexWriter(Path("session_left.seekidx"), key_interval=12, fps=60.0)
+        >>> writer.append(frame.frame_index, frame.t_capture_monotonic_ns)
+        >>> writer.close()
+    """
+
+    def __init__(self, path: Path, key_interval: int = 1, fps: float = 0.0):
+        """Open sidecar for writing.
+
+        Args:
+            path: Sidecar file path
+            key_interval: Frames between keyframes in the video
+            fps: Nominal video frame rate
+        """
+        self._path = path
+        self._key_interval = max(1, int(key_interval))
+        self._handle: Optional[BinaryIO] = path.open("wb")
+        self._handle.write(_HEADER.pack(SEEK_INDEX_MAGIC, SEEK_INDEX_VERSION, self._key_interval, float(fps)))
+        self._count = 0
+
+    def append(self, frame_index: int, t_capture_monotonic_ns: int) -> int:
+        """Record the next video frame.
+
+        Args:
+            frame_index: Camera frame index
+            t_capture_monotonic_ns: Capture timestamp
+
+        Returns:
+            Video frame index of the recorded frame
+        """
+        video_frame = self._count
+        keyframe = video_frame - video_frame % self._key_interval
+        if self._handle is not None:
+            self._handle.write(_RECORD.pack(int(frame_index), int(t_capture_monotonic_ns), keyframe))
+        self._count += 1
+        return video_frame
+
+    @property
+    def count(self) -> int:
+        """Number of records written."""
+        return self._count
+
+    @property
+    def path(self) -> Path:
+        return self._path
+
+    def close(self) -> None:
+        """Flush and close the sidecar."""
+        if self._handle is not None:
+            self._handle.close()
+            self._handle = None
+
+
+class SeekIndex:
+    """Read-only, memory-mapped view of a seek-index sidecar.
+
+    Example:
+        >>> index = SeekIndex.open(Path("session_left.seekidx"))
+        >>> frame = index.frame_at_or_after(pitch_t_start_ns)
+        >>> keyframe = index.keyframe_for(frame)
+    """
+
+    def __init__(self, records: np.ndarray, key_interval: int = 1, fps: float = 0.0):
+        """Wrap index records.
+
+        Args:
+            records: Array with RECORD_DTYPE, one row per video frame
+            key_interval: Frames between keyframes
+            fps: Nominal video frame rate
+        """
+        self._records = records
+        self._t_ns = records["t_capture_monotonic_ns"]
+        self.key_interval = key_interval
+        self.fps = fps
+
+    @classmethod
+    def open(cls, path: Path) -> "SeekIndex":
+        """Memory-map a sidecar written by SeekIndexWriter.
+
+        Raises:
+            FileNotFoundError: If the sidecar does not exist
+            ValueError: If the file is not a seek index
+        """
+        if not path.exists():
+            raise FileNotFoundError(f"Seek index not found: {path}")
+        with path.open("rb") as handle:
+            header = handle.read(_HEADER.size)
+        if len(header) < _HEADER.size:
+            raise ValueError(f"Seek index header truncated: {path}")
+        magic, version, key_interval, fps = _HEADER.unpack(header)
+        if magic != SEEK_INDEX_MAGIC or version != SEEK_INDEX_VERSION:
+            raise ValueError(f"Unsupported seek index: {path}")
+
+        # A recording that stopped mid-write may leave a partial trailing record
+        count = (path.stat().st_size - _HEADER.size) // RECORD_DTYPE.itemsize
+        if count == 0:
+            records = np.zeros(0, dtype=RECORD_DTYPE)
+        else:
+            records = np.memmap(path, dtype=RECORD_DTYPE, mode="r", offset=_HEADER.size, shape=(count,))
+        return cls(records, key_interval=key_interval, fps=fps)
+
+    @classmethod
+    def from_timestamps_csv(cls, path: Path) -> "SeekIndex":
+        """Build an in-memory index from a recorder timestamps CSV.
+
+        Used for sessions recorded before sidecars existed. Keyframes are
+        unknown, so every frame is treated as one.
+        """
+        frame_indices = []
+        timestamps = []
+        with path.open("r", newline="") as handle:
+            for row in csv.DictReader(handle):
+                frame_indices.append(int(row["frame_index"]))
+                timestamps.append(int(row["t_capture_monotonic_ns"]))
+        records = np.zeros(len(timestamps), dtype=RECORD_DTYPE)
+        records["frame_index"] = frame_indices
+        records["t_capture_monotonic_ns"] = timestamps
+        records["keyframe"] = np.arange(len(timestamps))
+        return cls(records)
+
+    def __len__(self) -> int:
+        return len(self._records)
+
+    @property
+    def timestamps_ns(self) -> np.ndarray:
+        """Capture timestamps indexed by video frame."""
+        return self._t_ns
+
+    @property
+    def camera_frame_indices(self) -> np.ndarray:
+        """Camera frame indices indexed by video frame."""
+        return self._records["frame_index"]
+
+    def timestamp_ns(self, video_frame: int) -> int:
+        return int(self._t_ns[video_frame])
+
+    def frame_at_or_after(self, t_ns: int) -> int:
+        """First video frame captured at or after ``t_ns`` (clamped to the last frame)."""
+        if len(self) == 0:
+            return 0
+        frame = int(np.searchsorted(self._t_ns, t_ns, side="left"))
+        return min(frame, len(self) - 1)
+
+    def nearest_frame(self, t_ns: int) -> int:
+        """Video frame with the capture timestamp closest to ``t_ns``."""
+        return int(self.nearest_frames(np.asarray([t_ns], dtype=np.int64))[0])
+
+    def nearest_frames(self, t_ns: np.ndarray) -> np.ndarray:
+        """Vectorized nearest_frame for an array of timestamps."""
+        count = len(self)
+        if count == 0:
+            return np.zeros(len(t_ns), dtype=np.int64)
+        after = np.clip(np.searchsorted(self._t_ns, t_ns, side="left"), 0, count - 1)
+        before = np.clip(after - 1, 0, count - 1)
+        use_before = np.abs(t_ns - self._t_ns[before]) <= np.abs(self._t_ns[after] - t_ns)
+        return np.where(use_before, before, after).astype(np.int64)
+
+    def keyframe_for(self, video_frame: int) -> int:
+        """Nearest keyframe at or before ``video_frame``."""
+        return int(self._records["keyframe"][video_frame])
+
+    def align_to(self, other: "SeekIndex") -> np.ndarray:
+        """Map each of this index's video frames to the closest-in-time frame of ``other``."""
+        return other.nearest_frames(np.asarray(self._t_ns, dtype=np.int64))
+
+    def close(self) -> None:
+        """Drop the memory map (the file is unmapped once no views remain)."""
+        self._records = np.zeros(0, dtype=RECORD_DTYPE)
+        self._t_ns = self._records["t_capture_monotonic_ns"]
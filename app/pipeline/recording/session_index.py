@@ -0,0 +1,317 @@
+"""Compact on-disk indexes for recorded sessions and recording libraries.
+
+A session index (``session_index.json`` in the session directory) holds one
+small entry per pitch - ID, time range, headline metrics and payload counts -
+so a session can be opened without parsing every pitch's manifest and
+detection files. A library index (``library_index.json`` in the recordings
+directory) lists the sessions, so review mode can list hundreds of sessions
+without walking the directory tree.
+
+Both indexes are updated incrementally: only pitches or sessions missing from
+the index are scanned, and writes are atomic.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import os
+import threading
+from pathlib import Path
+from typing import Optional
+
+from app.pipeline.recording.manifest import PITCH_MANIFEST_FILENAME, SESSION_MANIFEST_FILENAME
+from app.pipeline.recording.telemetry_store import detections_path, observations_path, read_table_meta
+
+logger = logging.getLogger(__name__)
+
+SESSION_INDEX_FILENAME = "session_index.json"
+LIBRARY_INDEX_FILENAME = "library_index.json"
+INDEX_VERSION = 1
+
+# Recorder manifests first, then the names used by sessions laid out for review mode
+SESSION_MANIFEST_FILENAMES = (SESSION_MANIFEST_FILENAME, "session_manifest.json")
+PITCH_MANIFEST_FILENAMES = (PITCH_MANIFEST_FILENAME, "pitch_manifest.json")
+
+# Manifest fields copied into each pitch entry
+_PITCH_SUMMARY_FIELDS = (
+    "pitch_id",
+    "t_start_ns",
+    "t_end_ns",
+    "is_strike",
+    "zone_row",
+    "zone_col",
+    "measured_speed_mph",
+    "left_video",
+    "right_video",
+    "left_timestamps",
+    "right_timestamps",
+)
+
+_write_lock = threading.Lock()
+
+
+def is_session_dir(path: Path) -> bool:
+    """Check whether a directory looks like a recorded session."""
+    return path.is_dir() and find_manifest(path, SESSION_MANIFEST_FILENAMES) is not None
+
+
+def is_pitch_dir(path: Path) -> bool:
+    """Check whether a session subdirectory holds a pitch."""
+    return path.is_dir() and (
+        path.name.startswith("pitch-") or find_manifest(path, PITCH_MANIFEST_FILENAMES) is not None
+    )
+
+
+def summarize_pitch(pitch_dir: Path) -> dict:
+    """Build the index entry for one pitch directory.
+
+    Raises:
+        FileNotFoundError: If the pitch manifest does not exist
+        ValueError: If the pitch manifest cannot be parsed
+    """
+    manifest_path = find_manifest(pitch_dir, PITCH_MANIFEST_FILENAMES)
+    if manifest_path is None:
+        raise FileNotFoundError(f"Pitch manifest not found in {pitch_dir}")
+    try:
+        with open(manifest_path, "r") as f:
+            manifest = json.load(f)
+    except json.JSONDecodeError as e:
+        raise ValueError(f"Failed to parse pitch manifest: {e}")
+
+    entry = {key: manifest[key] for key in _PITCH_SUMMARY_FIELDS if key in manifest}
+    entry["dir"] = pitch_dir.name
+    entry["detection_count_left"] = _detection_count(pitch_dir / "detections_left.json") or _table_count(
+        detections_path(pitch_dir, "left")
+    )
+    entry["detection_count_right"] = _detection_count(pitch_dir / "detections_right.json") or _table_count(
+        detections_path(pitch_dir, "right")
+    )
+    entry["observation_count"] = _observation_count(pitch_dir / "observations.json") or _table_count(
+        observations_path(pitch_dir)
+    )
+    frames_dir = pitch_dir / "frames"
+    entry["frame_count"] = (
+        sum(1 for name in os.listdir(frames_dir) if name.endswith(".png")) if frames_dir.is_dir() else 0
+    )
+    return entry
+
+
+def load_session_index(session_dir: Path) -> list[dict]:
+    """Read a session's pitch index, indexing any pitches not yet in it.
+
+    Args:
+        session_dir: Session directory
+
+    Returns:
+        Pitch entries sorted by pitch directory name
+    """
+    index_path = session_dir / SESSION_INDEX_FILENAME
+    data = _read_index(index_path)
+    entries = {entry["dir"]: entry for entry in data.get("pitches", [])} if data else {}
+
+    pitch_dirs = {
+        item.name
+        for item in os.scandir(session_dir)
+        if is_pitch_dir(Path(item.path))
+    }
+    changed = data is None
+    for name in entries.keys() - pitch_dirs:
+        del entries[name]
+        changed = True
+    for name in sorted(pitch_dirs - entries.keys()):
+        try:
+            entries[name] = summarize_pitch(session_dir / name)
+            changed = True
+        except Exception as e:
+            logger.warning(f"Failed to index pitch {name}: {e}")
+
+    pitches = [entries[name] for name in sorted(entries)]
+    if changed:
+        _write_index(index_path, {"version": INDEX_VERSION, "pitches": pitches})
+    return pitches
+
+
+def update_session_index(session_dir: Path, pitch_dir: Path) -> None:
+    """Add or refresh one pitch in its session index (called after a pitch manifest is written)."""
+    index_path = session_dir / SESSION_INDEX_FILENAME
+    try:
+        entry = summarize_pitch(pitch_dir)
+    except Exception as e:
+        logger.warning(f"Failed to index pitch {pitch_dir.name}: {e}")
+        return
+    with _write_lock:
+        data = _read_index(index_path) or {"version": INDEX_VERSION, "pitches": []}
+        pitches = [p for p in data.get("pitches", []) if p.get("dir") != pitch_dir.name]
+        pitches.append(entry)
+        pitches.sort(key=lambda p: p["dir"])
+        _write_index(index_path, {"version": INDEX_VERSION, "pitches": pitches})
+
+
+class LibraryIndex:
+    """Index of the sessions in a recordings directory.
+
+    The recordings directory's mtime is stored with the index. It changes
+    whenever a session directory is added or removed, so while it matches the
+    index is trusted without listing the directory.
+
+    Example:
+        >>> library = LibraryIndex(Path("recordings"))
+        >>> sessions = library.sessions()  # newest first
+        >>> library.update_session(Path("recordings/session-2026-01-19_001"))
+    """
+
+    def __init__(self, recordings_dir: Path):
+        """Initialize library index.
+
+        Args:
+            recordings_dir: Base recordings directory
+        """
+        self._recordings_dir = recordings_dir
+        self._index_path = recordings_dir / LIBRARY_INDEX_FILENAME
+
+    def sessions(self) -> list[Path]:
+        """Session directories sorted by name, newest first."""
+        return [self._recordings_dir / name for name in sorted(self.entries(), reverse=True)]
+
+    def entries(self) -> dict[str, dict]:
+        """Session summaries (created_utc, session, pitch_count) keyed by directory name."""
+        if not self._recordings_dir.exists():
+            return {}
+        data = _read_index(self._index_path)
+        if data is None or data.get("dir_mtime_ns") != self._dir_mtime_ns():
+            data = self.refresh()
+        return data["sessions"]
+
+    def refresh(self) -> dict:
+        """List the recordings directory and index sessions added since the last scan."""
+        with _write_lock:
+            data = _read_index(self._index_path)
+            sessions: dict[str, dict] = data["sessions"] if data else {}
+            names = {item.name for item in os.scandir(self._recordings_dir) if item.is_dir()}
+            for name in sessions.keys() - names:
+                del sessions[name]
+            for name in names - sessions.keys():
+                if is_session_dir(self._recordings_dir / name):
+                    sessions[name] = _summarize_session(self._recordings_dir / name)
+            logger.debug(f"Library index refreshed: {len(sessions)} sessions in {self._recordings_dir}")
+            return self._save(sessions, complete=True)
+
+    def update_session(self, session_dir: Path) -> None:
+        """Add or refresh one session (called after a session is written)."""
+        if not self._recordings_dir.exists() or not is_session_dir(session_dir):
+            return
+        with _write_lock:
+            data = _read_index(self._index_path)
+            sessions: dict[str, dict] = data["sessions"] if data else {}
+            sessions[session_dir.name] = _summarize_session(session_dir)
+            # The index stays trusted only if no other session appeared meanwhile
+            complete = data is not None and all(
+                item.name in sessions or not is_session_dir(Path(item.path))
+                for item in os.scandir(self._recordings_dir)
+                if item.is_dir()
+            )
+            self._save(sessions, complete=complete)
+
+    def _save(self, sessions: dict[str, dict], complete: bool) -> dict:
+        data = {"version": INDEX_VERSION, "sessions": sessions, "dir_mtime_ns": None}
+        _write_index(self._index_path, data)
+        if complete:
+            # Replacing the index file touches the directory mtime, so stamp it
+            # afterwards with an in-place rewrite that leaves the mtime alone
+            data["dir_mtime_ns"] = self._dir_mtime_ns()
+            _write_index(self._index_path, data, atomic=False)
+        return data
+
+    def _dir_mtime_ns(self) -> int:
+        return self._recordings_dir.stat().st_mtime_ns
+
+
+def _summarize_session(session_dir: Path) -> dict:
+    entry: dict = {"created_utc": None, "session": None, "pitch_count": None}
+    try:
+        with open(find_manifest(session_dir, SESSION_MANIFEST_FILENAMES), "r") as f:
+            manifest = json.load(f)
+        entry["created_utc"] = manifest.get("created_utc")
+        entry["session"] = manifest.get("session")
+    except Exception as e:
+        logger.debug(f"Failed to read session manifest in {session_dir}: {e}")
+    index = _read_index(session_dir / SESSION_INDEX_FILENAME)
+    if index is not None:
+        entry["pitch_count"] = len(index.get("pitches", []))
+    return entry
+
+
+def find_manifest(directory: Path, names: tuple[str, ...]) -> Optional[Path]:
+    """Return the first of ``names`` present in ``directory``, or None."""
+    for name in names:
+        path = directory / name
+        if path.is_file():
+            return path
+    return None
+
+
+def _read_index(path: Path) -> Optional[dict]:
+    try:
+        with open(path, "r") as f:
+            data = json.load(f)
+    except FileNotFoundError:
+        return None
+    except (OSError, json.JSONDecodeError) as e:
+        logger.warning(f"Ignoring unreadable index {path}: {e}")
+        return None
+    if not isinstance(data, dict) or data.get("version") != INDEX_VERSION:
+        return None
+    return data
+
+
+def _write_index(path: Path, data: dict, atomic: bool = True) -> None:
+    try:
+        if atomic:
+            tmp_path = path.with_suffix(".tmp")
+            tmp_path.write_text(json.dumps(data, indent=2))
+            os.replace(tmp_path, path)
+        else:
+            with open(path, "r+") as f:
+                f.seek(0)
+                f.write(json.dumps(data, indent=2))
+                f.truncate()
+    except OSError as e:
+        logger.warning(f"Failed to write index {path}: {e}")
+
+
+def _detection_count(path: Path) -> int:
+    payload = _peek_json(path)
+    if not payload:
+        return 0
+    if "detection_count" in payload:
+        return int(payload["detection_count"])
+    return len(payload.get("detections", []))
+
+
+def _observation_count(path: Path) -> int:
+    payload = _peek_json(path)
+    if isinstance(payload, list):
+        return len(payload)
+    if isinstance(payload, dict):
+        return int(payload.get("observation_count", len(payload.get("observations", []))))
+    return 0
+
+
+def _table_count(path: Path) -> int:
+    if not path.exists():
+        return 0
+    try:
+        return int(read_table_meta(path)["count"])
+    except Exception:
+        return 0
+
+
+def _peek_json(path: Path):
+    if not path.exists():
+        return None
+    try:
+        with open(path, "r") as f:
+            return json.load(f)
+    except Exception:
+        return None
@@ -15,7 +15,10 @@ from typing import Optional, Tuple
 import cv2
 
 from app.events import ErrorCategory, ErrorSeverity, publish_error
-from app.pipeline.recording.manifest import create_session_manifest
+from app.pipeline.recording.frame_extractor import shutdown_frame_writer_pool
+from app.pipeline.recording.manifest import SESSION_MANIFEST_FILENAME, create_session_manifest
+from app.pipeline.recording.seek_index import SeekIndexWriter, key_interval_for_codec, seek_index_path
+from app.pipeline.recording.session_index import LibraryIndex
 from configs.settings import AppConfig
 from contracts import Frame
 from contracts.versioning import APP_VERSION, SCHEMA_VERSION
@@ -49,6 +52,11 @@ class SessionRecorder:
         self._left_csv: Optional[Tuple] = None
         self._right_csv: Optional[Tuple] = None
 
+        # Seek-index sidecars and the codec each video writer ended up with
+        self._left_index: Optional[SeekIndexWriter] = None
+        self._right_index: Optional[SeekIndexWriter] = None
+        self._writer_codecs: dict[Path, str] = {}
+
         # Thread safety
         self._lock = threading.Lock()
 
@@ -244,6 +252,8 @@ class SessionRecorder:
             self._disk_monitor_thread = None
 
         self._close_writers()
+        # Write out training frames still queued by this session's pitches
+        shutdown_frame_writer_pool()
 
         if self._session_dir is None:
             return
@@ -256,7 +266,13 @@ class SessionRecorder:
             measured_speed_mph=measured_speed_mph,
             config_path=config_path,
         )
-        (self._session_dir / "manifest.json").write_text(json.dumps(manifest, indent=2))
+        (self._session_dir / SESSION_MANIFEST_FILENAME).write_text(json.dumps(manifest, indent=2))
+
+        # Keep the recordings library index current for review mode
+        try:
+            LibraryIndex(self._record_dir).update_session(self._session_dir)
+        except Exception as e:
+            logger.warning(f"Failed to update library index: {e}")
 
     def write_frame(self, label: str, frame: Frame) -> None:
         """Write frame to session recording with error detection.
@@ -307,6 +323,8 @@ class SessionRecorder:
                     self._left_csv[1].writerow(
                         [frame.camera_id, frame.frame_index, frame.t_capture_monotonic_ns]
                     )
+                if self._left_index is not None:
+                    self._left_index.append(frame.frame_index, frame.t_capture_monotonic_ns)
 
             elif label == "right" and self._right_writer is not None:
                 # Write frame and check for failure
@@ -340,6 +358,8 @@ class SessionRecorder:
                     self._right_csv[1].writerow(
                         [frame.camera_id, frame.frame_index, frame.t_capture_monotonic_ns]
                     )
+                if self._right_index is not None:
+                    self._right_index.append(frame.frame_index, frame.t_capture_monotonic_ns)
 
     def write_session_summary(self, summary) -> None:
         """Write session summary to JSON and CSV files.
@@ -406,6 +426,7 @@ class SessionRecorder:
 
             if writer.isOpened():
                 logger.info(f"Video writer opened successfully: {path.name} with {codec_name} codec")
+                self._writer_codecs[path] = codec_name
                 return writer
             else:
                 # Clean up failed attempt
@@ -470,6 +491,18 @@ class SessionRecorder:
         self._left_csv[1].writerow(["camera_id", "frame_index", "t_capture_monotonic_ns"])
         self._right_csv[1].writerow(["camera_id", "frame_index", "t_capture_monotonic_ns"])
 
+        # Open seek-index sidecars (frame -> timestamp/keyframe, memory-mapped by review mode)
+        self._left_index = SeekIndexWriter(
+            seek_index_path(left_path),
+            key_interval=key_interval_for_codec(self._writer_codecs.get(left_path, "")),
+            fps=fps,
+        )
+        self._right_index = SeekIndexWriter(
+            seek_index_path(right_path),
+            key_interval=key_interval_for_codec(self._writer_codecs.get(right_path, "")),
+            fps=fps,
+        )
+
     def _close_writers(self) -> None:
         """Close video writers and CSV files."""
         with self._lock:
@@ -485,6 +518,12 @@ class SessionRecorder:
             if self._right_csv is not None:
                 self._right_csv[0].close()
                 self._right_csv = None
+            if self._left_index is not None:
+                self._left_index.close()
+                self._left_index = None
+            if self._right_index is not None:
+                self._right_index.close()
+                self._right_index = None
 
     def _write_session_summary_csv(self, summary) -> None:
         """Write session summary to CSV file.
@@ -0,0 +1,288 @@
+"""Columnar storage for per-pitch detections and stereo observations.
+
+Each table is an uncompressed ``.npz`` archive with one fixed-dtype array per
+column plus a small JSON ``meta`` member (pitch ID, camera, row count).
+Because members are stored uncompressed, columns can be memory-mapped
+straight out of the archive, so loading a pitch's telemetry is a handful of
+array reads instead of parsing one JSON object per detection.
+
+The legacy JSON layout written by earlier versions is still readable, and
+tables can be exported back to it for tools that expect JSON.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import struct
+import zipfile
+from pathlib import Path
+from typing import Iterable, Optional
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+DETECTION_COLUMNS: dict[str, np.dtype] = {
+    "frame_index": np.dtype("<i8"),
+    "t_ns": np.dtype("<i8"),
+    "u": np.dtype("<f4"),
+    "v": np.dtype("<f4"),
+    "radius": np.dtype("<f4"),
+    "confidence": np.dtype("<f4"),
+}
+
+OBSERVATION_COLUMNS: dict[str, np.dtype] = {
+    "t_ns": np.dtype("<i8"),
+    "left_u": np.dtype("<f4"),
+    "left_v": np.dtype("<f4"),
+    "right_u": np.dtype("<f4"),
+    "right_v": np.dtype("<f4"),
+    "X_ft": np.dtype("<f8"),
+    "Y_ft": np.dtype("<f8"),
+    "Z_ft": np.dtype("<f8"),
+    "quality": np.dtype("<f4"),
+    "confidence": np.dtype("<f4"),
+}
+
+TELEMETRY_FORMATS = ("npz", "json")
+
+_META_MEMBER = "meta"
+_LOCAL_HEADER = struct.Struct("<4s5H3L2H")
+
+
+def detections_path(pitch_dir: Path, camera: str, fmt: str = "npz") -> Path:
+    """Detection table path for a camera (``detections/left_detections.npz``)."""
+    return pitch_dir / "detections" / f"{camera}_detections.{fmt}"
+
+
+def observations_path(pitch_dir: Path, fmt: str = "npz") -> Path:
+    """Stereo observation table path (``observations/stereo_observations.npz``)."""
+    return pitch_dir / "observations" / f"stereo_observations.{fmt}"
+
+
+class TelemetryTable:
+    """Fixed-dtype columns for one detection or observation table.
+
+    Example:
+        >>> table = read_table(detections_path(pitch_dir, "left"))
+        >>> mask = table["confidence"] > 0.5
+        >>> frames = table["frame_index"][mask]
+    """
+
+    def __init__(self, kind: str, columns: dict[str, np.ndarray], meta: Optional[dict] = None):
+        """Wrap table columns.
+
+        Args:
+            kind: "detections" or "observations"
+            columns: Column arrays, all the same length
+            meta: Table metadata (pitch_id, camera, ...)
+        """
+        self.kind = kind
+        self.columns = columns
+        self.meta = dict(meta or {})
+
+    def __len__(self) -> int:
+        return len(next(iter(self.columns.values()))) if self.columns else 0
+
+    def __getitem__(self, name: str) -> np.ndarray:
+        return self.columns[name]
+
+    @classmethod
+    def from_detections(cls, detections: Iterable[dict], **meta) -> "TelemetryTable":
+        """Build a table from recorder detection dicts (the legacy JSON rows)."""
+        rows = list(detections)
+        return cls("detections", {
+            "frame_index": _column(rows, "frame_index", DETECTION_COLUMNS),
+            "t_ns": _column(rows, "timestamp_ns", DETECTION_COLUMNS, "t_ns"),
+            "u": _column(rows, "u_px", DETECTION_COLUMNS, "u"),
+            "v": _column(rows, "v_px", DETECTION_COLUMNS, "v"),
+            "radius": _column(rows, "radius_px", DETECTION_COLUMNS, "radius"),
+            "confidence": _column(rows, "confidence", DETECTION_COLUMNS),
+        }, meta)
+
+    @classmethod
+    def from_observations(cls, observations: Iterable[dict], **meta) -> "TelemetryTable":
+        """Build a table from recorder observation dicts (the legacy JSON rows)."""
+        rows = list(observations)
+        left = np.array([row["left_px"] for row in rows], dtype=np.float32).reshape(-1, 2)
+        right = np.array([row["right_px"] for row in rows], dtype=np.float32).reshape(-1, 2)
+        return cls("observations", {
+            "t_ns": _column(rows, "timestamp_ns", OBSERVATION_COLUMNS, "t_ns"),
+            "left_u": left[:, 0].copy(),
+            "left_v": left[:, 1].copy(),
+            "right_u": right[:, 0].copy(),
+            "right_v": right[:, 1].copy(),
+            "X_ft": _column(rows, "X_ft", OBSERVATION_COLUMNS),
+            "Y_ft": _column(rows, "Y_ft", OBSERVATION_COLUMNS),
+            "Z_ft": _column(rows, "Z_ft", OBSERVATION_COLUMNS),
+            "quality": _column(rows, "quality", OBSERVATION_COLUMNS),
+            "confidence": _column(rows, "confidence", OBSERVATION_COLUMNS),
+        }, meta)
+
+    def to_records(self) -> list[dict]:
+        """Rows in the legacy JSON layout."""
+        c = {name: column.tolist() for name, column in self.columns.items()}
+        if self.kind == "detections":
+            return [
+                {
+                    "frame_index": c["frame_index"][i],
+                    "timestamp_ns": c["t_ns"][i],
+                    "u_px": c["u"][i],
+                    "v_px": c["v"][i],
+                    "radius_px": c["radius"][i],
+                    "confidence": c["confidence"][i],
+                }
+                for i in range(len(self))
+            ]
+        return [
+            {
+                "timestamp_ns": c["t_ns"][i],
+                "left_px": [c["left_u"][i], c["left_v"][i]],
+                "right_px": [c["right_u"][i], c["right_v"][i]],
+                "X_ft": c["X_ft"][i],
+                "Y_ft": c["Y_ft"][i],
+                "Z_ft": c["Z_ft"][i],
+                "quality": c["quality"][i],
+                "confidence": c["confidence"][i],
+            }
+            for i in range(len(self))
+        ]
+
+    def to_payload(self) -> dict:
+        """Full legacy JSON document (metadata, count and rows)."""
+        payload = {key: value for key, value in self.meta.items() if key != "kind"}
+        count_key = "detection_count" if self.kind == "detections" else "observation_count"
+        payload[count_key] = len(self)
+        payload[self.kind] = self.to_records()
+        return payload
+
+
+def write_table(path: Path, table: TelemetryTable) -> None:
+    """Write a table as an uncompressed npz archive.
+
+    Args:
+        path: Destination path (``.npz``)
+        table: Table to write
+    """
+    meta = dict(table.meta, kind=table.kind, count=len(table))
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with open(path, "wb") as f:
+        np.savez(f, **table.columns, **{_META_MEMBER: np.array(json.dumps(meta))})
+
+
+def read_table(path: Path, mmap: bool = True) -> TelemetryTable:
+    """Read a table written by write_table.
+
+    Args:
+        path: Table path (``.npz``)
+        mmap: Memory-map columns instead of reading them into memory
+
+    Returns:
+        TelemetryTable
+
+    Raises:
+        FileNotFoundError: If the table does not exist
+        ValueError: If the file is not a telemetry table
+    """
+    if not path.exists():
+        raise FileNotFoundError(f"Telemetry table not found: {path}")
+    columns: dict[str, np.ndarray] = {}
+    meta: Optional[dict] = None
+    try:
+        with zipfile.ZipFile(path) as archive, open(path, "rb") as raw:
+            for info in archive.infolist():
+                name = info.filename[:-4] if info.filename.endswith(".npy") else info.filename
+                if name == _META_MEMBER:
+                    with archive.open(info) as member:
+                        meta = json.loads(np.lib.format.read_array(member, allow_pickle=False).item())
+                    continue
+                array = _memmap_member(path, raw, info) if mmap else None
+                if array is None:
+                    with archive.open(info) as member:
+                        array = np.lib.format.read_array(member, allow_pickle=False)
+                columns[name] = array
+    except (zipfile.BadZipFile, ValueError, KeyError) as e:
+        raise ValueError(f"Invalid telemetry table {path}: {e}")
+    if meta is None:
+        raise ValueError(f"Invalid telemetry table {path}: missing metadata")
+    kind = meta.pop("kind", "detections")
+    meta.pop("count", None)
+    return TelemetryTable(kind, columns, meta)
+
+
+def read_table_meta(path: Path) -> dict:
+    """Read only a table's metadata (includes ``kind`` and row ``count``)."""
+    with zipfile.ZipFile(path) as archive:
+        with archive.open(f"{_META_MEMBER}.npy") as member:
+            return json.loads(np.lib.format.read_array(member, allow_pickle=False).item())
+
+
+def table_json(table_path: Path) -> str:
+    """A table's legacy JSON document, as export_json writes it."""
+    return json.dumps(read_table(table_path, mmap=False).to_payload(), indent=2)
+
+
+def export_json(table_path: Path, json_path: Optional[Path] = None) -> Path:
+    """Export a table to the legacy JSON layout.
+
+    Args:
+        table_path: Table path (``.npz``)
+        json_path: Destination, defaults to the table path with a ``.json`` suffix
+
+    Returns:
+        Path of the written JSON file
+    """
+    json_path = json_path or table_path.with_suffix(".json")
+    json_path.write_text(table_json(table_path))
+    return json_path
+
+
+def read_detections(pitch_dir: Path, camera: str) -> Optional[TelemetryTable]:
+    """Read a camera's detection table, falling back to the legacy JSON file."""
+    return _read_pitch_table(detections_path(pitch_dir, camera), "detections")
+
+
+def read_observations(pitch_dir: Path) -> Optional[TelemetryTable]:
+    """Read the stereo observation table, falling back to the legacy JSON file."""
+    return _read_pitch_table(observations_path(pitch_dir), "observations")
+
+
+def table_from_payload(kind: str, payload: dict) -> TelemetryTable:
+    """Build a table from a legacy JSON document."""
+    meta = {key: value for key, value in payload.items() if key in ("pitch_id", "camera")}
+    if kind == "detections":
+        return TelemetryTable.from_detections(payload.get("detections", []), **meta)
+    return TelemetryTable.from_observations(payload.get("observations", []), **meta)
+
+
+def _read_pitch_table(npz_path: Path, kind: str) -> Optional[TelemetryTable]:
+    if npz_path.exists():
+        return read_table(npz_path)
+    json_path = npz_path.with_suffix(".json")
+    if json_path.exists():
+        with open(json_path, "r") as f:
+            return table_from_payload(kind, json.load(f))
+    return None
+
+
+def _column(rows: list[dict], key: str, schema: dict[str, np.dtype], column: Optional[str] = None) -> np.ndarray:
+    return np.fromiter((row[key] for row in rows), dtype=schema[column or key], count=len(rows))
+
+
+def _memmap_member(path: Path, raw, info: zipfile.ZipInfo) -> Optional[np.ndarray]:
+    """Memory-map a stored (uncompressed) npy member, or None if it cannot be mapped."""
+    if info.compress_type != zipfile.ZIP_STORED:
+        return None
+    raw.seek(info.header_offset)
+    header = _LOCAL_HEADER.unpack(raw.read(_LOCAL_HEADER.size))
+    name_length, extra_length = header[-2], header[-1]
+    raw.seek(info.header_offset + _LOCAL_HEADER.size + name_length + extra_length)
+    version = np.lib.format.read_magic(raw)
+    if version == (1, 0):
+        shape, fortran_order, dtype = np.lib.format.read_array_header_1_0(raw)
+    else:
+        shape, fortran_order, dtype = np.lib.format.read_array_header_2_0(raw)
+    if dtype.hasobject or fortran_order or 0 in shape:
+        return None
+    return np.memmap(path, dtype=dtype, mode="r", offset=raw.tell(), shape=shape)
@@ -0,0 +1,466 @@
+"""Headless replay of recorded sessions through the live detection pipeline.
+
+Recorded left/right videos are streamed by ReplayCamera backends with their
+original capture timestamps into the same components the pipeline service
+wires up live: DetectionThreadPool -> DetectionProcessor ->
+PitchStateMachineV2. Replay runs unthrottled (as fast as the pipeline keeps
+up, without dropping frames) or paced at a multiple of real time, and reports
+end-to-end throughput and per-stage latency. It is the regression and
+benchmark harness for pipeline performance changes.
+"""
+
+from __future__ import annotations
+
+import logging
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+from app.pipeline.detection.processor import DetectionProcessor
+from app.pipeline.detection.threading_pool import DetectionThreadPool
+from app.pipeline.initialization import PipelineInitializer
+from app.pipeline.pitch_tracking_v2 import PitchConfig, PitchData, PitchStateMachineV2
+from capture.replay_camera import ReplayCamera
+from configs.settings import AppConfig
+from contracts import Detection, Frame, StereoObservation
+from telemetry import LatencyHistogram, get_tracer
+
+logger = logging.getLogger(__name__)
+
+STAGES = ("decode", "queue", "detect", "stereo", "pitch", "end_to_end")
+
+# Enqueue times kept per camera for end-to-end latency. Frames in flight are
+# bounded by the detection queue and the stereo buffers (a few frames each),
+# so a frame this far behind the newest one will never be paired.
+PENDING_FRAMES = 256
+
+
+@dataclass
+class StageLatency:
+    """Latency summary for one pipeline stage (milliseconds)."""
+    count: int = 0
+    mean_ms: float = 0.0
+    p50_ms: float = 0.0
+    p95_ms: float = 0.0
+    max_ms: float = 0.0
+
+    @classmethod
+    def from_histogram(cls, histogram: LatencyHistogram) -> "StageLatency":
+        if not histogram.count:
+            return cls()
+        return cls(
+            count=histogram.count,
+            mean_ms=histogram.mean_ns / 1e6,
+            p50_ms=histogram.quantile(0.50) / 1e6,
+            p95_ms=histogram.quantile(0.95) / 1e6,
+            max_ms=histogram.max_ns / 1e6,
+        )
+
+
+@dataclass
+class ReplayReport:
+    """Outcome of a replay run.
+
+    Attributes:
+        frames: Frames fed into the pipeline per camera
+        detected: Frames that completed detection per camera
+        dropped: Frames dropped by full detection queues (paced replay only)
+        stereo_pairs: Stereo pairs processed
+        observations: Stereo observations triangulated
+        detections: Detections per camera
+        pitches: Finalized pitches (index, start/end ns, observation count)
+        elapsed_s: Wall time from first frame to drained pipeline
+        media_s: Recorded time span replayed
+        speed: Requested speed (0 = unthrottled)
+        stages: Per-stage latency, keyed by STAGES
+    """
+    frames: Dict[str, int] = field(default_factory=lambda: {"left": 0, "right": 0})
+    detected: Dict[str, int] = field(default_factory=lambda: {"left": 0, "right": 0})
+    dropped: Dict[str, int] = field(default_factory=lambda: {"left": 0, "right": 0})
+    stereo_pairs: int = 0
+    observations: int = 0
+    detections: Dict[str, int] = field(default_factory=lambda: {"left": 0, "right": 0})
+    pitches: List[dict] = field(default_factory=list)
+    elapsed_s: float = 0.0
+    media_s: float = 0.0
+    speed: float = 0.0
+    stages: Dict[str, StageLatency] = field(default_factory=dict)
+
+    @property
+    def throughput_fps(self) -> float:
+        """Frames (both cameras) pushed through the pipeline per wall-clock second."""
+        total = sum(self.frames.values())
+        return total / self.elapsed_s if self.elapsed_s > 0 else 0.0
+
+    @property
+    def pair_rate_hz(self) -> float:
+        """Stereo pairs processed per wall-clock second."""
+        return self.stereo_pairs / self.elapsed_s if self.elapsed_s > 0 else 0.0
+
+    @property
+    def realtime_factor(self) -> float:
+        """Recorded time replayed per wall-clock second (>1 is faster than real time)."""
+        return self.media_s / self.elapsed_s if self.elapsed_s > 0 else 0.0
+
+    def to_dict(self) -> dict:
+        """JSON-serializable report."""
+        return {
+            "frames": dict(self.frames),
+            "detected": dict(self.detected),
+            "dropped": dict(self.dropped),
+            "stereo_pairs": self.stereo_pairs,
+            "observations": self.observations,
+            "detections": dict(self.detections),
+            "pitches": list(self.pitches),
+            "elapsed_s": self.elapsed_s,
+            "media_s": self.media_s,
+            "speed": self.speed,
+            "throughput_fps": self.throughput_fps,
+            "pair_rate_hz": self.pair_rate_hz,
+            "realtime_factor": self.realtime_factor,
+            "stages": {name: vars(stage) for name, stage in self.stages.items()},
+        }
+
+
+class SessionReplay:
+    """Drives recorded left/right videos through the detection pipeline.
+
+    Example:
+        >>> replay = SessionReplay.from_session_dir(config, Path("recordings/session-001"))
+        >>> report = replay.run()
+        >>> print(format_replay_report(report))
+    """
+
+    def __init__(
+        self,
+        config: AppConfig,
+        left_camera: ReplayCamera,
+        right_camera: ReplayCamera,
+        speed: float = 0.0,
+        threading_mode: str = "per_camera",
+        worker_count: int = 2,
+        queue_size: int = 6,
+        use_rois: bool = True,
+        left_id: str = "left",
+        right_id: str = "right",
+    ):
+        """Initialize replay harness.
+
+        Args:
+            config: Application configuration (detector, stereo, recording settings)
+            left_camera: Left camera replay backend (not yet opened)
+            right_camera: Right camera replay backend (not yet opened)
+            speed: Speed the cameras were created with, 0 for unthrottled
+            threading_mode: Detection threading mode ("per_camera", "worker_pool" or "process_per_camera")
+            worker_count: Worker threads for worker_pool mode
+            queue_size: Detection queue depth
+            use_rois: Load lane/plate ROIs from configs/ like the live pipeline
+            left_id: Camera ID for left frames (ROIs are keyed by camera ID)
+            right_id: Camera ID for right frames
+        """
+        self._config = config
+        self._cameras = {"left": left_camera, "right": right_camera}
+        self._speed = speed
+        self._threading_mode = threading_mode
+        self._worker_count = worker_count
+        self._queue_size = queue_size
+        self._use_rois = use_rois
+        self._ids = {"left": left_id, "right": right_id}
+
+        self._lock = threading.Condition()
+        self._latency: Dict[str, LatencyHistogram] = {}
+        self._enqueued_ns: Dict[str, OrderedDict[int, int]] = {}
+        self._report = ReplayReport()
+        self._processed = 0
+        self._pitch_ns = 0
+        get_tracer().reset()
+        self._detectors: Dict[str, object] = {}
+        self._pool: Optional[DetectionThreadPool] = None
+        self._processor: Optional[DetectionProcessor] = None
+        self._pitch_tracker: Optional[PitchStateMachineV2] = None
+
+    @classmethod
+    def from_session_dir(cls, config: AppConfig, session_dir: Path, speed: float = 0.0, **kwargs) -> "SessionReplay":
+        """Create a replay of a recorded session directory.
+
+        Args:
+            config: Application configuration
+            session_dir: Directory containing session_left.avi/session_right.avi
+                and their timestamps CSVs
+            speed: Playback speed multiple of real time, 0 for unthrottled
+            **kwargs: Forwarded to SessionReplay
+
+        Raises:
+            FileNotFoundError: If either session video is missing
+        """
+        videos = {}
+        for label in ("left", "right"):
+            video = session_dir / f"session_{label}.avi"
+            if not video.exists():
+                raise FileNotFoundError(f"Session video not found: {video}")
+            videos[label] = video
+        return cls(
+            config,
+            ReplayCamera(videos["left"], speed=speed),
+            ReplayCamera(videos["right"], speed=speed),
+            speed=speed,
+            **kwargs,
+        )
+
+    def run(self, max_frames: Optional[int] = None, drain_timeout_s: float = 5.0) -> ReplayReport:
+        """Replay both videos to the end (or max_frames per camera).
+
+        Args:
+            max_frames: Stop after this many frames per camera
+            drain_timeout_s: Give up draining when the pipeline makes no
+                progress for this long
+
+        Returns:
+            ReplayReport with throughput and per-stage latency
+        """
+        self._reset()
+        pool = self._build_pipeline()
+        try:
+            for label, camera in self._cameras.items():
+                camera.open(self._ids[label])
+                camera.set_mode(0, 0, 0, self._config.camera.pixfmt)
+
+            pool.start(queue_size=self._queue_size)
+            started = time.perf_counter()
+            first_ns, last_ns = self._feed(pool, max_frames)
+            self._drain(drain_timeout_s)
+            if self._pitch_tracker is not None:
+                self._pitch_tracker.force_end(last_ns or None)
+            elapsed = time.perf_counter() - started
+        finally:
+            pool.stop()
+            for camera in self._cameras.values():
+                camera.close()
+
+        report = self._report
+        report.elapsed_s = elapsed
+        report.media_s = (last_ns - first_ns) / 1e9 if last_ns > first_ns else 0.0
+        report.speed = self._speed
+        for label in ("left", "right"):
+            report.dropped[label] = report.frames[label] - report.detected[label]
+        report.stages = {name: StageLatency.from_histogram(self._latency[name]) for name in STAGES}
+        logger.info(
+            f"Replay finished: {sum(report.frames.values())} frames in {elapsed:.2f}s "
+            f"({report.throughput_fps:.1f} fps, {report.realtime_factor:.2f}x real time)"
+        )
+        return report
+
+    def _reset(self) -> None:
+        self._latency = {name: LatencyHistogram() for name in STAGES}
+        self._enqueued_ns = {"left": OrderedDict(), "right": OrderedDict()}
+        self._report = ReplayReport()
+        self._processed = 0
+        self._pitch_ns = 0
+
+    def _build_pipeline(self) -> DetectionThreadPool:
+        """Wire detectors, stereo, processor, pitch tracker and thread pool as the live service does."""
+        config = self._config
+        left_id, right_id = self._ids["left"], self._ids["right"]
+        lane_polygon = lane_gate = stereo_gate = plate_gate = plate_stereo_gate = None
+        if self._use_rois:
+            lane_polygon, lane_gate, stereo_gate, plate_gate, plate_stereo_gate = PipelineInitializer.load_rois(
+                left_id, right_id
+            )
+
+        initializer = PipelineInitializer()
+        initializer.initialize_detector_config(config)
+        self._detectors = initializer.build_detectors(left_id, right_id, lane_polygon)
+
+        processor = DetectionProcessor(
+            config=config,
+            stereo_matcher=PipelineInitializer.create_stereo_matcher(config),
+            lane_gate=lane_gate,
+            plate_gate=plate_gate,
+            stereo_gate=stereo_gate,
+            plate_stereo_gate=plate_stereo_gate,
+            get_ball_radius_fn=lambda: config.ball.radius_in.get(config.ball.type, 1.45),
+        )
+        processor.set_stereo_pair_callback(self._on_stereo_pair)
+        self._processor = processor
+
+        self._pitch_tracker = PitchStateMachineV2(
+            PitchConfig(
+                min_active_frames=config.recording.session_min_active_frames,
+                end_gap_frames=config.recording.session_end_gap_frames,
+                use_plate_gate=plate_gate is not None,
+                min_observations=3,
+                min_duration_ms=100.0,
+                pre_roll_ms=float(config.recording.pre_roll_ms),
+                frame_rate=float(self._cameras["left"].fps or config.camera.fps),
+            )
+        )
+        self._pitch_tracker.set_callbacks(on_pitch_end=self._on_pitch_end)
+
+        pool = DetectionThreadPool(mode=self._threading_mode, worker_count=self._worker_count)
+        pool.set_detect_callback(self._detect_frame)
+        pool.set_detectors(self._detectors)
+        pool.set_stereo_callback(self._on_detection_result)
+        self._pool = pool
+        return pool
+
+    def _feed(self, pool: DetectionThreadPool, max_frames: Optional[int]) -> Tuple[int, int]:
+        """Read both cameras in capture-time order and enqueue frames; returns (first_ns, last_ns)."""
+        first_ns = 0
+        last_ns = 0
+        unthrottled = self._speed <= 0
+        frames = self._report.frames
+        while True:
+            pending = {
+                label: camera.peek_timestamp_ns()
+                for label, camera in self._cameras.items()
+                if max_frames is None or frames[label] < max_frames
+            }
+            pending = {label: t_ns for label, t_ns in pending.items() if t_ns is not None}
+            if not pending:
+                break
+            label = min(pending, key=pending.get)
+
+            camera = self._cameras[label]
+            try:
+                frame = camera.read_frame(timeout_ms=1000)
+            except EOFError:
+                continue
+
+            if unthrottled:
+                # Backpressure instead of drop-oldest so every frame is measured. Bounding
+                # frames in flight across both cameras also keeps one camera from running
+                # far enough ahead to overflow the processor's stereo pairing buffers.
+                with self._lock:
+                    while sum(frames.values()) - self._processed >= self._queue_size:
+                        self._lock.wait(0.05)
+
+            get_tracer().mark(label, frame.frame_index, "captured")
+            if self._pitch_tracker is not None:
+                self._pitch_tracker.buffer_frame(label, frame)
+            with self._lock:
+                self._latency["decode"].record(camera.last_decode_ns)
+                pending = self._enqueued_ns[label]
+                pending[frame.frame_index] = time.perf_counter_ns()
+                if len(pending) > PENDING_FRAMES:
+                    pending.popitem(last=False)  # Dropped or never paired
+                frames[label] += 1
+            pool.enqueue_frame(label, frame)
+
+            first_ns = frame.t_capture_monotonic_ns if not first_ns else min(first_ns, frame.t_capture_monotonic_ns)
+            last_ns = max(last_ns, frame.t_capture_monotonic_ns)
+        return first_ns, last_ns
+
+    def _drain(self, timeout_s: float) -> None:
+        """Wait until every fed frame has been through stereo processing."""
+        with self._lock:
+            progress = self._processed
+            deadline = time.monotonic() + timeout_s
+            while self._processed < sum(self._report.frames.values()):
+                self._lock.wait(0.05)
+                if self._processed != progress:
+                    progress = self._processed
+                    deadline = time.monotonic() + timeout_s
+                elif time.monotonic() > deadline:
+                    logger.warning(
+                        f"Replay drain timed out with {sum(self._report.frames.values()) - self._processed} "
+                        f"frames outstanding"
+                    )
+                    break
+
+    def _detect_frame(self, label: str, frame: Frame) -> list[Detection]:
+        started = time.perf_counter_ns()
+        detections: list[Detection] = []
+        try:
+            detector = self._detectors.get(label)
+            if self._pool is not None:
+                detector = self._pool.get_detector(label, detector)
+            if detector is not None:
+                detections = detector.detect(frame)
+            return detections
+        finally:
+            finished = time.perf_counter_ns()
+            with self._lock:
+                enqueued = self._enqueued_ns[label].get(frame.frame_index)
+                if enqueued is not None:
+                    self._latency["queue"].record(started - enqueued)
+                self._latency["detect"].record(finished - started)
+                self._report.detected[label] += 1
+                self._report.detections[label] += len(detections)
+                self._lock.notify_all()
+
+    def _on_detection_result(self, label: str, frame: Frame, detections: list[Detection]) -> None:
+        self._pitch_ns = 0
+        started = time.perf_counter_ns()
+        self._processor.process_detection_result(label, frame, detections)
+        elapsed = time.perf_counter_ns() - started - self._pitch_ns
+        with self._lock:
+            self._latency["stereo"].record(elapsed)
+            self._processed += 1
+            self._lock.notify_all()
+
+    def _on_stereo_pair(
+        self,
+        left_frame: Frame,
+        right_frame: Frame,
+        left_detections: list[Detection],
+        right_detections: list[Detection],
+        observations: List[StereoObservation],
+        lane_count: int,
+        plate_count: int,
+    ) -> None:
+        started = time.perf_counter_ns()
+        for obs in observations:
+            self._pitch_tracker.add_observation(obs)
+        frame_ns = max(left_frame.t_capture_monotonic_ns, right_frame.t_capture_monotonic_ns)
+        self._pitch_tracker.update(frame_ns, lane_count, plate_count, len(observations))
+        finished = time.perf_counter_ns()
+        get_tracer().mark_pair(left_frame.frame_index, right_frame.frame_index, "pitch_done")
+        # Runs inside process_detection_result on the stereo thread; excluded from its stereo time
+        self._pitch_ns += finished - started
+
+        with self._lock:
+            self._latency["pitch"].record(finished - started)
+            self._report.stereo_pairs += 1
+            self._report.observations += len(observations)
+            for label, frame_index in (("left", left_frame.frame_index), ("right", right_frame.frame_index)):
+                enqueued = self._enqueued_ns[label].pop(frame_index, None)
+                if enqueued is not None:
+                    self._latency["end_to_end"].record(finished - enqueued)
+
+    def _on_pitch_end(self, pitch_data: PitchData) -> None:
+        with self._lock:
+            self._report.pitches.append(
+                {
+                    "pitch_index": pitch_data.pitch_index,
+                    "start_ns": pitch_data.start_ns,
+                    "end_ns": pitch_data.end_ns,
+                    "observations": len(pitch_data.observations),
+                }
+            )
+
+
+def format_replay_report(report: ReplayReport) -> str:
+    """Render a replay report as a plain-text summary."""
+    mode = "unthrottled" if report.speed <= 0 else f"{report.speed:g}x"
+    lines = [
+        f"Replay ({mode}): {report.frames['left']} left / {report.frames['right']} right frames "
+        f"in {report.elapsed_s:.2f}s",
+        f"  Throughput:     {report.throughput_fps:.1f} frames/s, {report.pair_rate_hz:.1f} pairs/s "
+        f"({report.realtime_factor:.2f}x real time)",
+        f"  Dropped:        {report.dropped['left']} left / {report.dropped['right']} right",
+        f"  Detections:     {report.detections['left']} left / {report.detections['right']} right",
+        f"  Stereo pairs:   {report.stereo_pairs} ({report.observations} observations)",
+        f"  Pitches:        {len(report.pitches)}",
+        "",
+        f"  {'Stage':<12}{'Count':>8}{'Mean ms':>10}{'P50 ms':>10}{'P95 ms':>10}{'Max ms':>10}",
+    ]
+    for name in STAGES:
+        stage = report.stages.get(name, StageLatency())
+        lines.append(
+            f"  {name:<12}{stage.count:>8}{stage.mean_ms:>10.2f}{stage.p50_ms:>10.2f}"
+            f"{stage.p95_ms:>10.2f}{stage.max_ms:>10.2f}"
+        )
+    return "\n".join(lines)
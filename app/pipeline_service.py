@@ -54,6 +54,7 @@ from record.recorder import RecordingBundle
 from stereo import StereoLaneGate
 from stereo.association import StereoMatch
 from stereo.simple_stereo import SimpleStereoMatcher, StereoGeometry
+from telemetry import get_tracer
 from track.simple_tracker import SimpleTracker
 from trajectory.contracts import TrajectoryFitRequest
 from trajectory.physics import PhysicsDragFitter
@@ -170,6 +171,10 @@ class PipelineService(ABC):
     def get_stats(self) -> Dict[str, Dict[str, float]]:
         """Return capture stats for both cameras."""
 
+    def get_trace_stats(self) -> Dict[str, float]:
+        """Return per-stage latency stats, or {} when tracing is disabled."""
+        return {}
+
     @abstractmethod
     def get_plate_metrics(self) -> PlateMetricsStub:
         """Return latest plate-gated metrics (stubbed if unavailable)."""
@@ -234,6 +239,7 @@ class InProcessPipelineService(PipelineService):
         self._backend = backend
         self._initializer = PipelineInitializer()
         self._camera_mgr = CameraManager(backend, self._initializer)
+        self._tracer = get_tracer()
         self._detect_queue_size = 6
         self._detection_pool: Optional[DetectionThreadPool] = None
         self._detection_processor: Optional[DetectionProcessor] = None
@@ -335,6 +341,8 @@ class InProcessPipelineService(PipelineService):
             List of detections
         """
         detector = self._detectors_by_camera.get(label)
+        if self._detection_pool:
+            detector = self._detection_pool.get_detector(label, detector)
         if detector is None:
             return []
         try:
@@ -402,6 +410,7 @@ class InProcessPipelineService(PipelineService):
             frame_ns = max(left_frame.t_capture_monotonic_ns, right_frame.t_capture_monotonic_ns)
             obs_count = len(observations)
             self._pitch_tracker.update(frame_ns, lane_count, plate_count, obs_count)
+            self._tracer.mark_pair(left_frame.frame_index, right_frame.frame_index, "pitch_done")
 
     def _on_pitch_start(self, pitch_index: int, pitch_data: PitchData) -> None:
         """Callback when pitch starts (V2).
@@ -507,6 +516,11 @@ class InProcessPipelineService(PipelineService):
             self._config_path = config_path
             self._record_dir = Path(config.recording.output_dir)
             self._detect_queue_size = config.camera.queue_depth or 6
+            self._tracer.configure(
+                enabled=config.telemetry.trace_enabled,
+                capacity=config.telemetry.trace_capacity,
+            )
+            self._tracer.reset()
 
             # Start camera capture (opens, configures, starts threads)
             try:
@@ -581,6 +595,7 @@ class InProcessPipelineService(PipelineService):
                 logger.debug("Starting detection threads")
                 self._detection_pool = DetectionThreadPool(mode="per_camera", worker_count=2)
                 self._detection_pool.set_detect_callback(self._detect_frame)
+                self._detection_pool.set_detectors(self._detectors_by_camera)
                 self._detection_pool.set_stereo_callback(self._on_detection_result)
                 self._detection_pool.start(queue_size=self._detect_queue_size)
             except Exception as exc:
@@ -708,6 +723,18 @@ class InProcessPipelineService(PipelineService):
     def get_stats(self) -> Dict[str, Dict[str, float]]:
         return self._camera_mgr.get_stats()
 
+    def get_trace_stats(self) -> Dict[str, float]:
+        """Per-stage latency as "<span>_<stat>" keys such as "detect_p95_ms"
+        or "end_to_end_p99_ms" (see telemetry.tracing); {} when tracing is off.
+        """
+        if not self._tracer.enabled:
+            return {}
+        return self._tracer.flat_stats()
+
+    def dump_trace(self, path: Path) -> Path:
+        """Write recent per-frame stage spans as Chrome trace JSON."""
+        return self._tracer.dump_chrome_trace(path)
+
     def get_plate_metrics(self) -> PlateMetricsStub:
         if self._detection_processor:
             return self._detection_processor.get_plate_metrics()
@@ -739,9 +766,11 @@ class InProcessPipelineService(PipelineService):
             self._detectors_by_camera = self._initializer.build_detectors(
                 left_id, right_id, self._lane_polygon
             )
+            if self._detection_pool:
+                self._detection_pool.set_detectors(self._detectors_by_camera)
 
     def set_detection_threading(self, mode: str, worker_count: int) -> None:
-        if mode not in ("per_camera", "worker_pool"):
+        if mode not in ("per_camera", "worker_pool", "process_per_camera"):
             raise ValueError(f"Unknown detection threading mode: {mode}")
 
         if self._detection_pool:
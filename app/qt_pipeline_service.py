@@ -13,6 +13,7 @@ from typing import Optional
 
 from PySide6 import QtCore
 
+from app.ipc import EngineClient
 from app.services.orchestrator import PipelineOrchestrator
 from app.events.event_types import PitchStartEvent, PitchEndEvent
 from app.pipeline.pitch_tracking_v2 import PitchData
@@ -35,28 +36,36 @@ class QtPipelineService(QtCore.QObject):
     pitch_started = QtCore.Signal(int, object)  # (pitch_index, PitchData)
     pitch_ended = QtCore.Signal(object)  # (PitchData)
 
-    def __init__(self, backend: str = "uvc", parent: Optional[QtCore.QObject] = None):
+    def __init__(
+        self,
+        backend: str = "uvc",
+        parent: Optional[QtCore.QObject] = None,
+        engine_process: bool = False,
+    ):
         """Initialize Qt-safe pipeline service.
 
         Args:
             backend: Camera backend ("uvc" or other)
             parent: Optional Qt parent object
+            engine_process: Run the pipeline in a separate engine process
         """
         super().__init__(parent)
 
-        # Create underlying service
-        self._service = PipelineOrchestrator(backend=backend)
+        # Create underlying service (both expose subscribe(); EngineClient
+        # republishes the engine's pitch events on its own EventBus)
+        if engine_process:
+            self._service = EngineClient(backend=backend)
+        else:
+            self._service = PipelineOrchestrator(backend=backend)
 
         # Subscribe to EventBus events and convert to Qt signals
         self._subscribe_to_events()
 
     def _subscribe_to_events(self) -> None:
         """Subscribe to EventBus events and convert to Qt signals."""
-        # Access the EventBus from the orchestrator
-        if hasattr(self._service, '_event_bus'):
-            self._service._event_bus.subscribe(PitchStartEvent, self._on_pitch_start_event)
-            self._service._event_bus.subscribe(PitchEndEvent, self._on_pitch_end_event)
-            logger.debug("QtPipelineService subscribed to EventBus pitch events")
+        self._service.subscribe(PitchStartEvent, self._on_pitch_start_event)
+        self._service.subscribe(PitchEndEvent, self._on_pitch_end_event)
+        logger.debug("QtPipelineService subscribed to EventBus pitch events")
 
     def _on_pitch_start_event(self, event: PitchStartEvent) -> None:
         """Internal handler for PitchStartEvent - emits Qt signal.
@@ -149,3 +158,8 @@ class QtPipelineService(QtCore.QObject):
     def reload_rois(self):
         """Reload ROIs (delegates to underlying service)."""
         return self._service.reload_rois()
+
+    def close(self) -> None:
+        """Shut down the engine process, if the pipeline runs in one."""
+        if isinstance(self._service, EngineClient):
+            self._service.close()
@@ -1,5 +1,7 @@
 """Review and training mode for analyzing recorded sessions."""
 
+from .batch_detection import BatchDetectionEngine, BatchDetectionResult, BatchDetectionStats
+from .frame_cache import FrameCache, FramePrefetcher
 from .review_service import Annotation, PitchScore, ReviewService
 from .session_loader import LoadedPitch, LoadedSession, SessionLoader
 from .video_reader import PlaybackState, VideoInfo, VideoReader
@@ -11,6 +13,11 @@ __all__ = [
     "VideoReader",
     "VideoInfo",
     "PlaybackState",
+    "FrameCache",
+    "FramePrefetcher",
+    "BatchDetectionEngine",
+    "BatchDetectionResult",
+    "BatchDetectionStats",
     "ReviewService",
     "Annotation",
     "PitchScore",
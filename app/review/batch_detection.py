@@ -0,0 +1,348 @@
+"""Offline re-detection over recorded frame ranges for review-mode tuning."""
+
+from __future__ import annotations
+
+import queue
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Callable, Optional
+
+import cv2
+import numpy as np
+
+from app.pipeline.recording.seek_index import SeekIndex
+from app.review.frame_cache import FrameCache, StereoFrameSource
+from contracts import Detection, Frame
+from detect.classical_detector import ClassicalDetector
+from detect.config import DetectorConfig, Mode
+from log_config.logger import get_logger
+
+logger = get_logger(__name__)
+
+ProgressCallback = Callable[[int, int], None]
+
+_QUEUE_DEPTH = 32
+_END = None  # Queue sentinel
+
+
+@dataclass
+class BatchDetectionStats:
+    """Aggregate statistics for a batch detection run.
+
+    Attributes:
+        frames: Number of frames processed
+        left_detections: Total left camera detections
+        right_detections: Total right camera detections
+        left_frames_with_detections: Frames with at least one left detection
+        right_frames_with_detections: Frames with at least one right detection
+        stereo_frames: Frames with detections in both cameras
+        decoded_frames: Frames decoded from video (the rest came from cache)
+        elapsed_ms: Wall time of the run
+        detect_ms: Detection time summed over both cameras
+    """
+    frames: int = 0
+    left_detections: int = 0
+    right_detections: int = 0
+    left_frames_with_detections: int = 0
+    right_frames_with_detections: int = 0
+    stereo_frames: int = 0
+    decoded_frames: int = 0
+    elapsed_ms: float = 0.0
+    detect_ms: float = 0.0
+
+    @property
+    def stereo_ratio(self) -> float:
+        """Fraction of frames with detections in both cameras."""
+        return self.stereo_frames / self.frames if self.frames else 0.0
+
+
+@dataclass
+class BatchDetectionResult:
+    """Per-frame detections for a frame range.
+
+    Attributes:
+        start_frame: First frame processed (inclusive)
+        end_frame: Last frame processed (inclusive)
+        left: Left camera detections by frame index
+        right: Right camera detections by frame index
+        stats: Aggregate statistics
+        cancelled: True if the run was cancelled before the end of the range
+    """
+    start_frame: int
+    end_frame: int
+    left: dict[int, list[Detection]] = field(default_factory=dict)
+    right: dict[int, list[Detection]] = field(default_factory=dict)
+    stats: BatchDetectionStats = field(default_factory=BatchDetectionStats)
+    cancelled: bool = False
+
+    def detections_for(self, frame_index: int) -> tuple[list[Detection], list[Detection]]:
+        """Get (left, right) detections for a frame (empty if not processed)."""
+        return self.left.get(frame_index, []), self.right.get(frame_index, [])
+
+
+class BatchDetectionEngine:
+    """Runs a detector configuration across a pitch or a whole session.
+
+    Decoding and detection are pipelined: one thread decodes and converts
+    frames to grayscale while one worker per camera runs its detector (the
+    detectors are stateful, so each camera is processed in frame order).
+    Grayscale frames are cached between runs, so re-running with a changed
+    threshold only repeats detection.
+
+    Example:
+        >>> engine = BatchDetectionEngine(left_path, right_path)
+        >>> result = engine.run(config, Mode.MODE_A, start_frame=120, end_frame=240)
+        >>> print(result.stats.stereo_ratio)
+        >>> result = engine.run(tighter_config, Mode.MODE_A, 120, 240)  # no decoding
+        >>> engine.close()
+    """
+
+    def __init__(
+        self,
+        left_video_path: Path,
+        right_video_path: Path,
+        left_index: Optional[SeekIndex] = None,
+        right_index: Optional[SeekIndex] = None,
+        cache_budget_mb: float = 1024.0,
+        fps: Optional[float] = None,
+    ):
+        """Initialize batch detection engine.
+
+        Args:
+            left_video_path: Path to left camera video
+            right_video_path: Path to right camera video
+            left_index: Left camera seek index (frame timestamps and keyframes)
+            right_index: Right camera seek index (pairs right frames by capture time)
+            cache_budget_mb: Memory budget for decoded grayscale frames
+            fps: Frame rate used for timestamps when no seek index is available
+        """
+        self._left_video_path = left_video_path
+        self._right_video_path = right_video_path
+        self._left_index = left_index
+        self._right_index = right_index
+        self._cache = FrameCache(int(cache_budget_mb * 1024 * 1024))
+        self._source: Optional[StereoFrameSource] = None
+        self._total_frames = 0
+        self._fps = fps
+        self._cancel = threading.Event()
+        self._run_lock = threading.Lock()
+
+    def run(
+        self,
+        config: DetectorConfig,
+        mode: Mode = Mode.MODE_A,
+        start_frame: int = 0,
+        end_frame: Optional[int] = None,
+        progress_callback: Optional[ProgressCallback] = None,
+    ) -> BatchDetectionResult:
+        """Run detection over a frame range.
+
+        Args:
+            config: Detector configuration
+            mode: Detection mode
+            start_frame: First frame (inclusive)
+            end_frame: Last frame (inclusive), defaults to the last frame
+            progress_callback: Called with (frames_done, frames_total) from the decode thread
+
+        Returns:
+            BatchDetectionResult with per-frame detections and stats
+
+        Raises:
+            ValueError: If the videos cannot be opened
+        """
+        with self._run_lock:
+            self._ensure_open()
+            self._cancel.clear()
+            last = self._total_frames - 1 if end_frame is None else min(end_frame, self._total_frames - 1)
+            first = max(0, start_frame)
+            result = BatchDetectionResult(start_frame=first, end_frame=last)
+            if last < first:
+                return result
+
+            started = time.perf_counter()
+            left_queue: queue.Queue = queue.Queue(maxsize=_QUEUE_DEPTH)
+            right_queue: queue.Queue = queue.Queue(maxsize=_QUEUE_DEPTH)
+            with ThreadPoolExecutor(max_workers=3, thread_name_prefix="BatchDetect") as pool:
+                decode = pool.submit(
+                    self._decode_range, first, last, (left_queue, right_queue), progress_callback
+                )
+                left_run = pool.submit(self._detect_stream, "left", config, mode, left_queue)
+                right_run = pool.submit(self._detect_stream, "right", config, mode, right_queue)
+                decoded_frames, processed = decode.result()
+                result.left, left_ms = left_run.result()
+                result.right, right_ms = right_run.result()
+
+            result.end_frame = first + processed - 1 if processed else first - 1
+            result.cancelled = processed < last - first + 1 and self._cancel.is_set()
+            result.stats = self._summarize(result, decoded_frames, left_ms + right_ms)
+            result.stats.elapsed_ms = (time.perf_counter() - started) * 1000.0
+            logger.debug(
+                f"Batch detection {first}-{result.end_frame}: {result.stats.frames} frames, "
+                f"{decoded_frames} decoded, {result.stats.elapsed_ms:.0f}ms"
+            )
+            return result
+
+    def cancel(self) -> None:
+        """Stop a running batch after the frame in flight."""
+        self._cancel.set()
+
+    def cache_stats(self) -> dict:
+        """Get grayscale frame cache statistics."""
+        return self._cache.stats()
+
+    def close(self) -> None:
+        """Release captures and drop cached frames."""
+        self.cancel()
+        with self._run_lock:
+            if self._source is not None:
+                self._source.release()
+                self._source = None
+            self._cache.clear()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    @property
+    def total_frames(self) -> int:
+        """Number of frames available once opened."""
+        self._ensure_open()
+        return self._total_frames
+
+    def _ensure_open(self) -> None:
+        if self._source is not None:
+            return
+        left = cv2.VideoCapture(str(self._left_video_path))
+        right = cv2.VideoCapture(str(self._right_video_path))
+        if not left.isOpened() or not right.isOpened():
+            left.release()
+            right.release()
+            raise ValueError(
+                f"Failed to open videos: {self._left_video_path}, {self._right_video_path}"
+            )
+        left_frames = int(left.get(cv2.CAP_PROP_FRAME_COUNT))
+        right_frames = int(right.get(cv2.CAP_PROP_FRAME_COUNT))
+        if not self._fps:
+            self._fps = left.get(cv2.CAP_PROP_FPS) or 30.0
+
+        alignment = None
+        if self._left_index is not None and self._right_index is not None and len(self._left_index) and len(self._right_index):
+            self._total_frames = min(left_frames, len(self._left_index))
+            alignment = np.minimum(
+                self._left_index.align_to(self._right_index)[: self._total_frames], right_frames - 1
+            )
+        else:
+            self._total_frames = min(left_frames, right_frames)
+
+        self._source = StereoFrameSource(
+            left,
+            right,
+            left_index=self._left_index,
+            right_index=self._right_index,
+            right_alignment=alignment,
+        )
+
+    def _timestamp_ns(self, frame_index: int) -> int:
+        if self._left_index is not None and frame_index < len(self._left_index):
+            return self._left_index.timestamp_ns(frame_index)
+        return int(frame_index * 1e9 / self._fps)
+
+    def _decode_range(
+        self,
+        first: int,
+        last: int,
+        queues: tuple[queue.Queue, queue.Queue],
+        progress_callback: Optional[ProgressCallback],
+    ) -> tuple[int, int]:
+        """Feed grayscale frames to the detector workers; returns (decoded, processed)."""
+        decoded = 0
+        processed = 0
+        total = last - first + 1
+        try:
+            for frame_index in range(first, last + 1):
+                if self._cancel.is_set():
+                    break
+                pair = self._cache.get(frame_index)
+                if pair is None:
+                    color = self._source.read(frame_index)
+                    if color is None:
+                        logger.warning(f"Batch detection stopped: failed to read frame {frame_index}")
+                        break
+                    pair = (_to_gray(color[0]), _to_gray(color[1]))
+                    self._cache.put(frame_index, pair)
+                    decoded += 1
+
+                t_ns = self._timestamp_ns(frame_index)
+                queues[0].put((frame_index, t_ns, pair[0]))
+                queues[1].put((frame_index, t_ns, pair[1]))
+                processed += 1
+                if progress_callback is not None:
+                    progress_callback(processed, total)
+        finally:
+            queues[0].put(_END)
+            queues[1].put(_END)
+        return decoded, processed
+
+    def _detect_stream(
+        self,
+        camera_id: str,
+        config: DetectorConfig,
+        mode: Mode,
+        frames: queue.Queue,
+    ) -> tuple[dict[int, list[Detection]], float]:
+        """Run one camera's detector over frames in order."""
+        detector = ClassicalDetector(config=config, mode=mode, roi_by_camera={})
+        detections: dict[int, list[Detection]] = {}
+        detect_s = 0.0
+        try:
+            while True:
+                item = frames.get()
+                if item is _END:
+                    break
+                frame_index, t_ns, image = item
+                frame = Frame(
+                    camera_id=camera_id,
+                    frame_index=frame_index,
+                    t_capture_monotonic_ns=t_ns,
+                    image=image,
+                    width=image.shape[1],
+                    height=image.shape[0],
+                    pixfmt="GRAY8",
+                )
+                started = time.perf_counter()
+                found = detector.detect(frame)
+                detect_s += time.perf_counter() - started
+                if found:
+                    detections[frame_index] = found
+        except Exception:
+            # Unblock the decode thread before surfacing the error
+            self._cancel.set()
+            while frames.get() is not _END:
+                pass
+            raise
+        return detections, detect_s * 1000.0
+
+    @staticmethod
+    def _summarize(result: BatchDetectionResult, decoded_frames: int, detect_ms: float) -> BatchDetectionStats:
+        frames = max(0, result.end_frame - result.start_frame + 1)
+        return BatchDetectionStats(
+            frames=frames,
+            left_detections=sum(len(d) for d in result.left.values()),
+            right_detections=sum(len(d) for d in result.right.values()),
+            left_frames_with_detections=len(result.left),
+            right_frames_with_detections=len(result.right),
+            stereo_frames=len(result.left.keys() & result.right.keys()),
+            decoded_frames=decoded_frames,
+            detect_ms=detect_ms,
+        )
+
+
+def _to_gray(image: np.ndarray) -> np.ndarray:
+    if image.ndim == 3:
+        return cv2.cvtColor(image, cv2.COLOR_BGR2GRAY)
+    return image
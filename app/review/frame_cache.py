@@ -0,0 +1,363 @@
+"""Decoded-frame cache and background prefetcher for review mode playback."""
+
+from __future__ import annotations
+
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import Optional
+
+import cv2
+import numpy as np
+
+from app.pipeline.recording.seek_index import SeekIndex
+from log_config.logger import get_logger
+
+logger = get_logger(__name__)
+
+FramePair = tuple[np.ndarray, np.ndarray]
+
+
+class FrameCache:
+    """Memory-bounded LRU of decoded left/right frame pairs keyed by frame index.
+
+    Thread-safe: the review UI reads from it while the prefetch thread fills it.
+
+    Example:
+        >>> cache = FrameCache(max_bytes=256 * 1024 * 1024)
+        >>> cache.put(10, (left, right))
+        >>> pair = cache.get(10)
+        >>> print(cache.stats()["hit_rate"])
+    """
+
+    def __init__(self, max_bytes: int):
+        """Initialize frame cache.
+
+        Args:
+            max_bytes: Memory budget for decoded frames in bytes
+        """
+        self._max_bytes = max(0, int(max_bytes))
+        self._frames: OrderedDict[int, FramePair] = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.Lock()
+
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._prefetched = 0
+
+    def get(self, frame_index: int) -> Optional[FramePair]:
+        """Get cached frame pair and mark it most recently used.
+
+        Args:
+            frame_index: Frame index (0-based)
+
+        Returns:
+            (left, right) frame pair, or None on a miss
+        """
+        with self._lock:
+            pair = self._frames.get(frame_index)
+            if pair is None:
+                self._misses += 1
+                return None
+            self._frames.move_to_end(frame_index)
+            self._hits += 1
+            return pair
+
+    def contains(self, frame_index: int) -> bool:
+        """Check for a cached frame without touching LRU order or statistics."""
+        with self._lock:
+            return frame_index in self._frames
+
+    def put(self, frame_index: int, pair: FramePair, prefetched: bool = False) -> None:
+        """Insert a decoded frame pair, evicting least recently used pairs.
+
+        Args:
+            frame_index: Frame index (0-based)
+            pair: (left, right) decoded frames
+            prefetched: True when inserted by the prefetch thread
+        """
+        size = pair[0].nbytes + pair[1].nbytes
+        if size > self._max_bytes:
+            return
+        with self._lock:
+            old = self._frames.pop(frame_index, None)
+            if old is not None:
+                self._bytes -= old[0].nbytes + old[1].nbytes
+            self._frames[frame_index] = pair
+            self._bytes += size
+            if prefetched:
+                self._prefetched += 1
+            while self._bytes > self._max_bytes and self._frames:
+                _, evicted = self._frames.popitem(last=False)
+                self._bytes -= evicted[0].nbytes + evicted[1].nbytes
+                self._evictions += 1
+
+    def capacity_frames(self, pair_bytes: int) -> int:
+        """Number of frame pairs of ``pair_bytes`` that fit in the budget."""
+        if pair_bytes <= 0:
+            return 0
+        return self._max_bytes // pair_bytes
+
+    def clear(self) -> None:
+        """Drop all cached frames (statistics are kept)."""
+        with self._lock:
+            self._frames.clear()
+            self._bytes = 0
+
+    def stats(self) -> dict:
+        """Get cache statistics for tuning the memory budget.
+
+        Returns:
+            Dictionary with hits, misses, hit_rate, evictions, prefetched,
+            cached_frames, bytes_used and max_bytes
+        """
+        with self._lock:
+            lookups = self._hits + self._misses
+            return {
+                "hits": self._hits,
+                "misses": self._misses,
+                "hit_rate": (self._hits / lookups) if lookups else 0.0,
+                "evictions": self._evictions,
+                "prefetched": self._prefetched,
+                "cached_frames": len(self._frames),
+                "bytes_used": self._bytes,
+                "max_bytes": self._max_bytes,
+            }
+
+
+class StereoFrameSource:
+    """Decodes left/right frame pairs from a pair of captures.
+
+    Tracks where each capture is positioned and decodes forward instead of
+    seeking whenever the target lies between its keyframe and the current
+    position. With seek indexes, the right frame for a left frame is the one
+    closest in capture time rather than the one with the same index.
+    """
+
+    def __init__(
+        self,
+        left_capture: cv2.VideoCapture,
+        right_capture: cv2.VideoCapture,
+        left_index: Optional[SeekIndex] = None,
+        right_index: Optional[SeekIndex] = None,
+        right_alignment: Optional[np.ndarray] = None,
+    ):
+        """Initialize frame source.
+
+        Args:
+            left_capture: Opened left camera capture
+            right_capture: Opened right camera capture
+            left_index: Left camera seek index (keyframe lookup)
+            right_index: Right camera seek index (keyframe lookup)
+            right_alignment: Right frame index for each left frame index
+        """
+        self._left = left_capture
+        self._right = right_capture
+        self._left_index = left_index
+        self._right_index = right_index
+        self._alignment = right_alignment
+        self._left_position = 0
+        self._right_position = 0
+        self._last_right: Optional[tuple[int, np.ndarray]] = None
+
+    def right_frame_for(self, frame_index: int) -> int:
+        """Right video frame paired with left video frame ``frame_index``."""
+        if self._alignment is None:
+            return frame_index
+        return int(self._alignment[frame_index])
+
+    def read(self, frame_index: int) -> Optional[FramePair]:
+        """Decode the pair for left video frame ``frame_index``.
+
+        Returns:
+            (left, right) frames, or None if either capture fails
+        """
+        left_frame, self._left_position = _read_frame_at(
+            self._left, self._left_position, frame_index, self._left_index
+        )
+        if left_frame is None:
+            return None
+
+        right_index = self.right_frame_for(frame_index)
+        if self._last_right is not None and self._last_right[0] == right_index:
+            # Left camera delivered two frames within one right frame interval
+            return left_frame, self._last_right[1]
+        right_frame, self._right_position = _read_frame_at(
+            self._right, self._right_position, right_index, self._right_index
+        )
+        if right_frame is None:
+            self._last_right = None
+            return None
+        self._last_right = (right_index, right_frame)
+        return left_frame, right_frame
+
+    def release(self) -> None:
+        """Release both captures."""
+        self._left.release()
+        self._right.release()
+
+
+def _read_frame_at(
+    capture: cv2.VideoCapture,
+    position: int,
+    target: int,
+    index: Optional[SeekIndex],
+) -> tuple[Optional[np.ndarray], int]:
+    """Decode ``target`` from a capture currently positioned at ``position``.
+
+    Returns:
+        (frame or None, new capture position; -1 when the position is unknown)
+    """
+    keyframe = index.keyframe_for(target) if index is not None and target < len(index) else target
+    if not keyframe <= position <= target:
+        if not capture.set(cv2.CAP_PROP_POS_FRAMES, target):
+            return None, -1
+        position = target
+    while position < target:
+        if not capture.grab():
+            return None, -1
+        position += 1
+    ok, frame = capture.read()
+    if not ok:
+        return None, -1
+    return frame, target + 1
+
+
+class FramePrefetcher:
+    """Background thread that decodes ahead of the playback cursor.
+
+    Uses its own pair of ``cv2.VideoCapture`` objects (captures are not safe to
+    share across threads) wrapped in a StereoFrameSource. Each request covers a sliding window around the
+    cursor that extends further in the playback direction, so stepping in
+    either direction inside the window never seeks the reader's captures.
+    Going backward, the window behind the cursor is decoded forward from a
+    single keyframe seek.
+    """
+
+    def __init__(
+        self,
+        left_path: Path,
+        right_path: Path,
+        cache: FrameCache,
+        total_frames: int,
+        ahead: int = 30,
+        behind: int = 8,
+        left_index: Optional[SeekIndex] = None,
+        right_index: Optional[SeekIndex] = None,
+        right_alignment: Optional[np.ndarray] = None,
+    ):
+        """Initialize prefetcher.
+
+        Args:
+            left_path: Path to left camera video
+            right_path: Path to right camera video
+            cache: Frame cache to fill
+            total_frames: Number of frames available in both videos
+            ahead: Frames to decode in the playback direction
+            behind: Frames to keep decoded against the playback direction
+            left_index: Left camera seek index
+            right_index: Right camera seek index
+            right_alignment: Right frame index for each left frame index
+        """
+        self._left_path = left_path
+        self._right_path = right_path
+        self._left_index = left_index
+        self._right_index = right_index
+        self._right_alignment = right_alignment
+        self._cache = cache
+        self._total_frames = total_frames
+        self._ahead = max(1, ahead)
+        self._behind = max(0, behind)
+
+        self._cond = threading.Condition()
+        self._cursor = 0
+        self._direction = 1
+        self._generation = 0
+        self._running = False
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self) -> None:
+        """Start the prefetch thread."""
+        if self._running:
+            return
+        self._running = True
+        self._thread = threading.Thread(target=self._run, name="ReviewFramePrefetch", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        """Stop the prefetch thread and release its captures."""
+        with self._cond:
+            self._running = False
+            self._cond.notify_all()
+        if self._thread is not None:
+            self._thread.join(timeout=2.0)
+            self._thread = None
+
+    def set_window(self, ahead: int, behind: int) -> None:
+        """Resize the prefetch window (e.g. to fit the cache budget)."""
+        with self._cond:
+            self._ahead = max(1, ahead)
+            self._behind = max(0, behind)
+
+    def request(self, cursor: int, direction: int) -> None:
+        """Move the prefetch window to a new cursor position.
+
+        Args:
+            cursor: Current frame index
+            direction: +1 for forward playback, -1 for backward
+        """
+        with self._cond:
+            self._cursor = cursor
+            self._direction = 1 if direction >= 0 else -1
+            self._generation += 1
+            self._cond.notify_all()
+
+    def _window(self) -> tuple[int, int]:
+        if self._direction >= 0:
+            start, end = self._cursor - self._behind, self._cursor + self._ahead
+        else:
+            start, end = self._cursor - self._ahead, self._cursor + self._behind
+        return max(0, start), min(self._total_frames - 1, end)
+
+    def _run(self) -> None:
+        source = StereoFrameSource(
+            cv2.VideoCapture(str(self._left_path)),
+            cv2.VideoCapture(str(self._right_path)),
+            left_index=self._left_index,
+            right_index=self._right_index,
+            right_alignment=self._right_alignment,
+        )
+        handled_generation = -1
+        try:
+            while True:
+                with self._cond:
+                    while self._running and self._generation == handled_generation:
+                        self._cond.wait()
+                    if not self._running:
+                        return
+                    generation = self._generation
+                    start, end = self._window()
+
+                missing = [i for i in range(start, end + 1) if not self._cache.contains(i)]
+                if missing:
+                    self._decode_range(source, missing[0], missing[-1], generation)
+                with self._cond:
+                    if self._generation == generation:
+                        handled_generation = generation
+        except Exception as e:  # pragma: no cover - decode errors are non-fatal for playback
+            logger.warning(f"Frame prefetch stopped: {e}")
+        finally:
+            source.release()
+
+    def _decode_range(self, source: StereoFrameSource, first: int, last: int, generation: int) -> None:
+        """Decode frames first..last into the cache, stopping if the cursor moves."""
+        for frame_index in range(first, last + 1):
+            with self._cond:
+                if not self._running or self._generation != generation:
+                    return
+            pair = source.read(frame_index)
+            if pair is None:
+                return
+            if not self._cache.contains(frame_index):
+                self._cache.put(frame_index, pair, prefetched=True)
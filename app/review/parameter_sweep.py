@@ -0,0 +1,557 @@
+"""Parallel parameter sweep over detector configurations against recorded pitches."""
+
+from __future__ import annotations
+
+import csv
+import hashlib
+import itertools
+import json
+import os
+import random
+import time
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor, as_completed
+from dataclasses import dataclass, field, fields, replace
+from pathlib import Path
+from typing import Any, Callable, Mapping, Optional, Sequence
+
+import cv2
+import numpy as np
+
+from app.pipeline.recording.seek_index import SeekIndex
+from app.review.frame_cache import StereoFrameSource
+from app.review.session_loader import LoadedPitch, LoadedSession
+from contracts import Frame
+from detect.classical_detector import ClassicalDetector
+from detect.config import DetectorConfig, Mode
+from log_config.logger import get_logger
+
+logger = get_logger(__name__)
+
+CAMERAS = ("left", "right")
+
+# camera -> video frame index -> reference ball positions (u, v) in pixels
+TruthPoints = dict[str, dict[int, list[tuple[float, float]]]]
+SweepParams = dict[str, Any]
+
+_ANNOTATION_LEAD_IN_FRAMES = 30
+
+
+@dataclass(frozen=True)
+class SweepTarget:
+    """A recorded video pair to evaluate variants against.
+
+    Attributes:
+        name: Display name (e.g. pitch ID)
+        left_video_path: Path to left camera video
+        right_video_path: Path to right camera video
+        truth: Reference ball positions by camera and video frame (may be empty)
+        start_frame: First video frame to evaluate (inclusive)
+        end_frame: Last video frame to evaluate (inclusive), None for the whole video
+    """
+    name: str
+    left_video_path: Path
+    right_video_path: Path
+    truth: TruthPoints = field(default_factory=dict)
+    start_frame: int = 0
+    end_frame: Optional[int] = None
+
+
+@dataclass(frozen=True)
+class _PreparedTarget:
+    """Decoded grayscale frames of a target, stored as memory-mapped uint8 files."""
+    name: str
+    left_path: Path
+    right_path: Path
+    shape: tuple[int, int, int]
+    start_frame: int
+    truth: TruthPoints
+
+
+@dataclass
+class SweepResult:
+    """Evaluation of one detector configuration variant.
+
+    Attributes:
+        params: Parameter overrides that define the variant
+        score: Ranking score (F1 when reference data exists, else stereo yield)
+        precision: Fraction of detections on annotated frames matching a reference point
+        recall: Fraction of reference points detected
+        f1: Harmonic mean of precision and recall
+        stereo_yield: Fraction of frames with exactly one detection in each camera
+        detections: Total detections over all targets and cameras
+        frames: Frames evaluated per camera
+        elapsed_ms: Evaluation wall time
+        rank: 1-based rank after sorting (0 before ranking)
+    """
+    params: SweepParams
+    score: float
+    precision: Optional[float]
+    recall: Optional[float]
+    f1: Optional[float]
+    stereo_yield: float
+    detections: int
+    frames: int
+    elapsed_ms: float
+    rank: int = 0
+
+
+def apply_params(base: Any, params: Mapping[str, Any]) -> Any:
+    """Create a detector config with parameter overrides.
+
+    Filter fields (``min_area``, ``min_circularity``, ...) may be given either
+    plainly or as ``filters.<name>``; ``mode`` is ignored here (see
+    ``ParameterSweep``). Works for both ``detect.config.DetectorConfig`` and the
+    settings ``DetectorConfig``.
+
+    Raises:
+        ValueError: If a parameter is not a config or filter field
+    """
+    config_fields = {f.name for f in fields(base)}
+    filter_fields = {f.name for f in fields(base.filters)}
+    config_changes: dict[str, Any] = {}
+    filter_changes: dict[str, Any] = {}
+    for key, value in params.items():
+        name = key.split(".", 1)[1] if key.startswith("filters.") else key
+        if name == "mode":
+            continue
+        if name in filter_fields:
+            filter_changes[name] = value
+        elif name in config_fields and name != "filters":
+            config_changes[name] = value
+        else:
+            raise ValueError(f"Unknown detector parameter: {key}")
+    if filter_changes:
+        config_changes["filters"] = replace(base.filters, **filter_changes)
+    return replace(base, **config_changes) if config_changes else base
+
+
+def grid_variants(grid: Mapping[str, Sequence[Any]]) -> list[SweepParams]:
+    """Cartesian product of parameter values.
+
+    Example:
+        >>> grid_variants({"frame_diff_threshold": [12, 18], "min_area": [8, 16]})
+        [{'frame_diff_threshold': 12, 'min_area': 8}, ...]
+    """
+    keys = list(grid)
+    return [dict(zip(keys, values)) for values in itertools.product(*(grid[k] for k in keys))]
+
+
+def random_variants(
+    ranges: Mapping[str, tuple[float, float]],
+    count: int,
+    seed: Optional[int] = None,
+) -> list[SweepParams]:
+    """Uniformly sample parameter values from ranges.
+
+    Integer bounds produce integer samples (e.g. ``min_area``).
+    """
+    rng = random.Random(seed)
+    variants = []
+    for _ in range(count):
+        params: SweepParams = {}
+        for key, (low, high) in ranges.items():
+            if isinstance(low, int) and isinstance(high, int):
+                params[key] = rng.randint(low, high)
+            else:
+                params[key] = round(rng.uniform(float(low), float(high)), 4)
+        variants.append(params)
+    return variants
+
+
+def load_pitch_truth(pitch: LoadedPitch) -> TruthPoints:
+    """Reference points from a pitch's saved detections, keyed by pitch video frame.
+
+    Saved detections use camera frame indices; the pitch timestamps CSVs map
+    them to video frames.
+    """
+    truth: TruthPoints = {}
+    for camera in CAMERAS:
+        table = pitch.get_detection_table(camera)
+        timestamps_path = pitch.left_timestamps_path if camera == "left" else pitch.right_timestamps_path
+        if table is None or not timestamps_path.exists():
+            continue
+        index = SeekIndex.from_timestamps_csv(timestamps_path)
+        frames_by_camera_index = {
+            int(camera_index): video_frame
+            for video_frame, camera_index in enumerate(index.camera_frame_indices)
+        }
+        points: dict[int, list[tuple[float, float]]] = {}
+        for frame_index, u, v in zip(table["frame_index"].tolist(), table["u"].tolist(), table["v"].tolist()):
+            video_frame = frames_by_camera_index.get(frame_index)
+            if video_frame is not None:
+                points.setdefault(video_frame, []).append((u, v))
+        truth[camera] = points
+    return truth
+
+
+def load_annotation_truth(annotations_path: Path) -> TruthPoints:
+    """Reference points from a ReviewService.export_annotations() file."""
+    with open(annotations_path, "r") as f:
+        data = json.load(f)
+    truth: TruthPoints = {camera: {} for camera in CAMERAS}
+    for annotation in data.get("annotations", []):
+        camera = annotation.get("camera")
+        if camera in truth:
+            truth[camera].setdefault(int(annotation["frame_index"]), []).append(
+                (float(annotation["x"]), float(annotation["y"]))
+            )
+    return truth
+
+
+def targets_from_session(
+    session: LoadedSession,
+    annotations_path: Optional[Path] = None,
+) -> list[SweepTarget]:
+    """Build sweep targets for every pitch with videos in a session.
+
+    Args:
+        session: Loaded session
+        annotations_path: Optional exported review annotations; when given,
+            the session-level videos are added as a target scored against them
+
+    Returns:
+        List of SweepTarget
+    """
+    targets = []
+    for pitch in session.pitches:
+        if pitch.left_video_path.exists() and pitch.right_video_path.exists():
+            targets.append(
+                SweepTarget(
+                    name=f"{session.session_id}/{pitch.pitch_id}",
+                    left_video_path=pitch.left_video_path,
+                    right_video_path=pitch.right_video_path,
+                    truth=load_pitch_truth(pitch),
+                )
+            )
+    if annotations_path is not None:
+        truth = load_annotation_truth(annotations_path)
+        annotated = [frame for points in truth.values() for frame in points]
+        if annotated:
+            # Only the annotated span, plus lead-in frames so the detectors build history
+            targets.append(
+                SweepTarget(
+                    name=f"{session.session_id}/annotations",
+                    left_video_path=session.left_video_path,
+                    right_video_path=session.right_video_path,
+                    truth=truth,
+                    start_frame=max(0, min(annotated) - _ANNOTATION_LEAD_IN_FRAMES),
+                    end_frame=max(annotated),
+                )
+            )
+    return targets
+
+
+class ParameterSweep:
+    """Evaluates detector config variants across recorded pitches in parallel.
+
+    Every target is decoded once into memory-mapped grayscale uint8 files in
+    ``cache_dir``; worker processes map the same files read-only, so variants
+    share one decoded copy through the page cache and nothing is re-decoded
+    per variant (or across runs with the same cache directory).
+
+    Example:
+        >>> sweep = ParameterSweep(targets_from_session(session), cache_dir=Path(".sweep_cache"))
+        >>> results = sweep.run(grid_variants({"frame_diff_threshold": [12, 18, 24]}))
+        >>> print(format_results_table(results))
+    """
+
+    def __init__(
+        self,
+        targets: Sequence[SweepTarget],
+        base_config: Optional[Any] = None,
+        mode: Mode = Mode.MODE_A,
+        cache_dir: Optional[Path] = None,
+        max_workers: Optional[int] = None,
+        match_radius_px: float = 8.0,
+        use_processes: bool = True,
+    ):
+        """Initialize parameter sweep.
+
+        Args:
+            targets: Video pairs to evaluate against
+            base_config: Config the variants override (defaults to DetectorConfig())
+            mode: Detection mode unless a variant sets ``mode``
+            cache_dir: Directory for decoded frame files (defaults to ``.sweep_cache``)
+            max_workers: Worker count (defaults to CPU count)
+            match_radius_px: Max distance for a detection to match a reference point
+            use_processes: Use worker processes (threads if False)
+        """
+        self._targets = list(targets)
+        self._base_config = base_config if base_config is not None else DetectorConfig()
+        self._mode = mode
+        self._cache_dir = cache_dir or Path(".sweep_cache")
+        self._max_workers = max_workers or os.cpu_count() or 1
+        self._match_radius_px = match_radius_px
+        self._use_processes = use_processes
+
+    def prepare(self) -> list[_PreparedTarget]:
+        """Decode all targets into the frame cache (reused if already present)."""
+        self._cache_dir.mkdir(parents=True, exist_ok=True)
+        return [self._prepare_target(target) for target in self._targets]
+
+    def run(
+        self,
+        variants: Sequence[Mapping[str, Any]],
+        progress_callback: Optional[Callable[[int, int], None]] = None,
+    ) -> list[SweepResult]:
+        """Evaluate variants and rank them by score (best first).
+
+        Args:
+            variants: Parameter overrides, one dict per variant
+            progress_callback: Called with (variants_done, variants_total)
+
+        Returns:
+            Ranked list of SweepResult
+        """
+        prepared = self.prepare()
+        jobs = []
+        for params in variants:
+            params = dict(params)
+            mode = Mode(params["mode"]) if "mode" in params else self._mode
+            jobs.append((params, apply_params(self._base_config, params), mode))
+
+        results: list[SweepResult] = []
+        executor = self._make_executor(prepared, len(jobs))
+        try:
+            futures = [
+                executor.submit(_evaluate_variant, params, config, mode, self._match_radius_px)
+                for params, config, mode in jobs
+            ]
+            for future in as_completed(futures):
+                results.append(future.result())
+                if progress_callback is not None:
+                    progress_callback(len(results), len(jobs))
+        finally:
+            executor.shutdown(wait=True)
+            if not self._use_processes:
+                _WORKER_TARGETS.clear()
+
+        results.sort(key=lambda r: (-r.score, -r.stereo_yield, r.detections))
+        for rank, result in enumerate(results, start=1):
+            result.rank = rank
+        return results
+
+    def _make_executor(self, prepared: list[_PreparedTarget], job_count: int) -> Executor:
+        workers = max(1, min(self._max_workers, job_count))
+        if self._use_processes:
+            return ProcessPoolExecutor(max_workers=workers, initializer=_init_worker, initargs=(prepared,))
+        _init_worker(prepared)
+        return ThreadPoolExecutor(max_workers=workers, thread_name_prefix="ParameterSweep")
+
+    def _prepare_target(self, target: SweepTarget) -> _PreparedTarget:
+        key = _cache_key(target)
+        meta_path = self._cache_dir / f"{key}.json"
+        left_path = self._cache_dir / f"{key}_left.u8"
+        right_path = self._cache_dir / f"{key}_right.u8"
+
+        if meta_path.exists() and left_path.exists() and right_path.exists():
+            meta = json.loads(meta_path.read_text())
+            logger.debug(f"Using cached frames for {target.name}")
+        else:
+            meta = _decode_to_files(target, left_path, right_path)
+            meta_path.write_text(json.dumps(meta))
+
+        return _PreparedTarget(
+            name=target.name,
+            left_path=left_path,
+            right_path=right_path,
+            shape=tuple(meta["shape"]),
+            start_frame=meta["start_frame"],
+            truth=target.truth,
+        )
+
+
+def format_results_table(results: Sequence[SweepResult], limit: Optional[int] = 20) -> str:
+    """Format ranked results as a fixed-width text table."""
+    rows = list(results[:limit] if limit else results)
+    header = f"{'rank':>4}  {'score':>6}  {'prec':>6}  {'recall':>6}  {'yield':>6}  {'dets':>6}  params"
+    lines = [header, "-" * len(header)]
+    for r in rows:
+        lines.append(
+            f"{r.rank:>4}  {r.score:>6.3f}  {_fmt(r.precision):>6}  {_fmt(r.recall):>6}  "
+            f"{r.stereo_yield:>6.3f}  {r.detections:>6}  "
+            + ", ".join(f"{k}={v}" for k, v in r.params.items())
+        )
+    return "\n".join(lines)
+
+
+def write_results_csv(results: Sequence[SweepResult], path: Path) -> None:
+    """Write ranked results (one column per swept parameter) to CSV."""
+    param_keys: list[str] = []
+    for r in results:
+        for key in r.params:
+            if key not in param_keys:
+                param_keys.append(key)
+    with path.open("w", newline="") as handle:
+        writer = csv.writer(handle)
+        writer.writerow(
+            ["rank", "score", "precision", "recall", "f1", "stereo_yield", "detections", "frames", "elapsed_ms"]
+            + param_keys
+        )
+        for r in results:
+            writer.writerow(
+                [r.rank, f"{r.score:.4f}", _fmt(r.precision), _fmt(r.recall), _fmt(r.f1),
+                 f"{r.stereo_yield:.4f}", r.detections, r.frames, f"{r.elapsed_ms:.1f}"]
+                + [r.params.get(key, "") for key in param_keys]
+            )
+
+
+def _fmt(value: Optional[float]) -> str:
+    return "-" if value is None else f"{value:.3f}"
+
+
+def _cache_key(target: SweepTarget) -> str:
+    digest = hashlib.sha1()
+    for path in (target.left_video_path, target.right_video_path):
+        stat = path.stat()
+        digest.update(f"{path.resolve()}|{stat.st_size}|{stat.st_mtime_ns}".encode())
+    digest.update(f"{target.start_frame}|{target.end_frame}".encode())
+    return digest.hexdigest()[:16]
+
+
+def _decode_to_files(target: SweepTarget, left_path: Path, right_path: Path) -> dict:
+    """Decode a target's frame range to grayscale uint8 memory-mapped files."""
+    left = cv2.VideoCapture(str(target.left_video_path))
+    right = cv2.VideoCapture(str(target.right_video_path))
+    if not left.isOpened() or not right.isOpened():
+        left.release()
+        right.release()
+        raise ValueError(f"Failed to open videos for {target.name}")
+
+    total = min(int(left.get(cv2.CAP_PROP_FRAME_COUNT)), int(right.get(cv2.CAP_PROP_FRAME_COUNT)))
+    height = int(left.get(cv2.CAP_PROP_FRAME_HEIGHT))
+    width = int(left.get(cv2.CAP_PROP_FRAME_WIDTH))
+    first = max(0, target.start_frame)
+    last = total - 1 if target.end_frame is None else min(target.end_frame, total - 1)
+    count = max(0, last - first + 1)
+
+    source = StereoFrameSource(left, right)
+    started = time.perf_counter()
+    decoded = 0
+    try:
+        if count == 0:
+            left_path.write_bytes(b"")
+            right_path.write_bytes(b"")
+            return {"shape": [0, height, width], "start_frame": first}
+
+        shape = (count, height, width)
+        left_frames = np.memmap(left_path, dtype=np.uint8, mode="w+", shape=shape)
+        right_frames = np.memmap(right_path, dtype=np.uint8, mode="w+", shape=shape)
+        for offset in range(count):
+            pair = source.read(first + offset)
+            if pair is None:
+                break
+            left_frames[offset] = cv2.cvtColor(pair[0], cv2.COLOR_BGR2GRAY)
+            right_frames[offset] = cv2.cvtColor(pair[1], cv2.COLOR_BGR2GRAY)
+            decoded += 1
+        left_frames.flush()
+        right_frames.flush()
+        del left_frames, right_frames
+    finally:
+        source.release()
+
+    logger.info(f"Decoded {decoded} frames of {target.name} in {(time.perf_counter() - started):.1f}s")
+    return {"shape": [decoded, height, width], "start_frame": first}
+
+
+# Per-worker memory maps, opened once by the pool initializer
+_WORKER_TARGETS: list[tuple[_PreparedTarget, np.ndarray, np.ndarray]] = []
+
+
+def _init_worker(prepared: list[_PreparedTarget]) -> None:
+    _WORKER_TARGETS.clear()
+    for target in prepared:
+        if target.shape[0] == 0:
+            continue
+        left = np.memmap(target.left_path, dtype=np.uint8, mode="r", shape=target.shape)
+        right = np.memmap(target.right_path, dtype=np.uint8, mode="r", shape=target.shape)
+        _WORKER_TARGETS.append((target, left, right))
+
+
+def _evaluate_variant(
+    params: SweepParams,
+    config: Any,
+    mode: Mode,
+    match_radius_px: float,
+) -> SweepResult:
+    started = time.perf_counter()
+    matched = 0
+    detected = 0
+    scored = 0  # Detections on annotated frames, the precision denominator
+    referenced = 0
+    has_truth = False
+    stereo_frames = 0
+    frames = 0
+
+    for target, left_frames, right_frames in _WORKER_TARGETS:
+        per_camera = {}
+        for camera, images in (("left", left_frames), ("right", right_frames)):
+            detector = ClassicalDetector(config=config, mode=mode, roi_by_camera={})
+            points: dict[int, list[tuple[float, float]]] = {}
+            for offset in range(images.shape[0]):
+                frame_index = target.start_frame + offset
+                image = images[offset]
+                found = detector.detect(
+                    Frame(camera, frame_index, 0, image, image.shape[1], image.shape[0], "GRAY8")
+                )
+                if found:
+                    points[frame_index] = [(d.u, d.v) for d in found]
+            per_camera[camera] = points
+            detected += sum(len(p) for p in points.values())
+
+            truth = target.truth.get(camera)
+            if truth:
+                has_truth = True
+                referenced += sum(len(p) for p in truth.values())
+                scored += sum(len(p) for frame_index, p in points.items() if frame_index in truth)
+                matched += _count_matches(points, truth, match_radius_px)
+
+        frames += left_frames.shape[0]
+        stereo_frames += sum(
+            1
+            for frame_index, left_points in per_camera["left"].items()
+            if len(left_points) == 1 and len(per_camera["right"].get(frame_index, ())) == 1
+        )
+
+    stereo_yield = stereo_frames / frames if frames else 0.0
+    precision = recall = f1 = None
+    if has_truth:
+        precision = matched / scored if scored else 0.0
+        recall = matched / referenced if referenced else 0.0
+        f1 = 2 * precision * recall / (precision + recall) if precision + recall else 0.0
+    return SweepResult(
+        params=params,
+        score=f1 if f1 is not None else stereo_yield,
+        precision=precision,
+        recall=recall,
+        f1=f1,
+        stereo_yield=stereo_yield,
+        detections=detected,
+        frames=frames,
+        elapsed_ms=(time.perf_counter() - started) * 1000.0,
+    )
+
+
+def _count_matches(
+    detections: Mapping[int, list[tuple[float, float]]],
+    truth: Mapping[int, list[tuple[float, float]]],
+    radius_px: float,
+) -> int:
+    """Greedy nearest matching of detections to reference points per frame."""
+    matched = 0
+    radius_sq = radius_px * radius_px
+    for frame_index, reference in truth.items():
+        found = detections.get(frame_index)
+        if not found:
+            continue
+        ref = np.asarray(reference, dtype=float)
+        det = np.asarray(found, dtype=float)
+        dist_sq = ((ref[:, None, :] - det[None, :, :]) ** 2).sum(axis=2)
+        for _ in range(min(len(ref), len(det))):
+            r, d = np.unravel_index(np.argmin(dist_sq), dist_sq.shape)
+            if dist_sq[r, d] > radius_sq:
+                break
+            matched += 1
+            dist_sq[r, :] = np.inf
+            dist_sq[:, d] = np.inf
+    return matched
@@ -10,11 +10,15 @@ from typing import Optional
 
 import numpy as np
 
+from app.pipeline.recording.seek_index import SeekIndex
+from app.review.batch_detection import BatchDetectionEngine, BatchDetectionResult, ProgressCallback
 from app.review.session_loader import LoadedPitch, LoadedSession, SessionLoader
 from app.review.video_reader import PlaybackState, VideoReader
+from configs.settings import DetectorConfig
+from configs.settings import DetectorFiltersConfig as FilterConfig
 from contracts import Frame
 from detect.classical_detector import ClassicalDetector
-from detect.config import DetectorConfig, FilterConfig, Mode
+from detect.config import Mode
 from log_config.logger import get_logger
 
 logger = get_logger(__name__)
@@ -78,6 +82,12 @@ class ReviewService:
         self._detector_left: Optional[ClassicalDetector] = None
         self._detector_right: Optional[ClassicalDetector] = None
 
+        # Seek indexes and offline re-detection over frame ranges
+        self._left_seek_index: Optional[SeekIndex] = None
+        self._right_seek_index: Optional[SeekIndex] = None
+        self._batch_engine: Optional[BatchDetectionEngine] = None
+        self._last_detected_index: Optional[int] = None  # Frame the detectors saw last
+
         # Annotations and pitch scores
         self._annotations: dict[int, list[Annotation]] = {}  # frame_index -> list of annotations
         self._pitch_scores: dict[str, PitchScore] = {}  # pitch_id -> score
@@ -103,7 +113,7 @@ class ReviewService:
         logger.info(f"Loading session for review: {session_dir}")
 
         # Load session data
-        self._session = SessionLoader.load_session(session_dir)
+        self._session = SessionLoader.load_session(session_dir, lazy=True)
 
         # Open videos
         if not self._session.left_video_path.exists():
@@ -111,9 +121,19 @@ class ReviewService:
         if not self._session.right_video_path.exists():
             raise FileNotFoundError(f"Right video not found: {self._session.right_video_path}")
 
+        self._close_batch_engine()
+        self._last_detected_index = None
+        self._left_seek_index = self._load_seek_index(
+            self._session.left_seek_index_path, self._session.left_timestamps_path
+        )
+        self._right_seek_index = self._load_seek_index(
+            self._session.right_seek_index_path, self._session.right_timestamps_path
+        )
         self._video_reader.open_videos(
             self._session.left_video_path,
-            self._session.right_video_path
+            self._session.right_video_path,
+            left_index=self._left_seek_index,
+            right_index=self._right_seek_index,
         )
 
         # Initialize detector config from original config if available
@@ -165,6 +185,29 @@ class ReviewService:
 
         return self._session
 
+    @staticmethod
+    def _load_seek_index(index_path: Optional[Path], timestamps_path: Path) -> Optional[SeekIndex]:
+        """Load a camera's seek index, falling back to its timestamps CSV.
+
+        Args:
+            index_path: Path to the binary sidecar (None if not recorded)
+            timestamps_path: Path to the timestamps CSV
+
+        Returns:
+            SeekIndex, or None if neither source is usable
+        """
+        if index_path is not None:
+            try:
+                return SeekIndex.open(index_path)
+            except (OSError, ValueError) as e:
+                logger.warning(f"Failed to open seek index {index_path}: {e}")
+        if timestamps_path.exists():
+            try:
+                return SeekIndex.from_timestamps_csv(timestamps_path)
+            except (OSError, ValueError, KeyError) as e:
+                logger.warning(f"Failed to parse timestamps {timestamps_path}: {e}")
+        return None
+
     def get_current_frames(self) -> tuple[Optional[np.ndarray], Optional[np.ndarray]]:
         """Get current left and right frames.
 
@@ -198,16 +241,16 @@ class ReviewService:
             return False
 
         pitch = self._session.pitches[pitch_index]
+        logger.info(f"Seeking to pitch {pitch.pitch_id}")
 
-        # Calculate frame index from pitch start time
-        # This is approximate - need to correlate with video timestamps
-        # For now, just estimate based on frame rate
-        # Future Enhancement: Load and parse timestamp CSV files for accurate frame mapping
+        # Exact seek: first frame captured at or after the pitch start
+        t_start_ns = pitch.manifest.get("t_start_ns")
+        if t_start_ns is not None and self._video_reader.has_seek_index:
+            return self._video_reader.seek_to_timestamp(int(t_start_ns))
 
-        logger.info(f"Seeking to pitch {pitch.pitch_id}")
-        # Placeholder: just seek to a frame proportional to pitch number
-        # In reality, we need to parse timestamps
-        frame_index = pitch_index * 100  # Rough estimate
+        # No timestamps recorded for this session - rough estimate
+        logger.warning(f"No seek index for pitch {pitch.pitch_id}, estimating frame position")
+        frame_index = pitch_index * 100
         return self.seek_to_frame(frame_index)
 
     def step_forward(self, num_frames: int = 1) -> bool:
@@ -318,12 +361,98 @@ class ReviewService:
             mode=self._detector_mode,
             roi_by_camera={},
         )
+        self._last_detected_index = None
 
         logger.debug("Rebuilt detectors with updated config")
 
+    def run_batch_detection(
+        self,
+        start_frame: int = 0,
+        end_frame: Optional[int] = None,
+        progress_callback: Optional[ProgressCallback] = None,
+    ) -> Optional[BatchDetectionResult]:
+        """Run the current detector config over a frame range.
+
+        Decoded frames are cached between runs, so re-running after
+        update_detector_config() only repeats detection.
+
+        Args:
+            start_frame: First frame (inclusive)
+            end_frame: Last frame (inclusive), defaults to the end of the session
+            progress_callback: Called with (frames_done, frames_total)
+
+        Returns:
+            BatchDetectionResult, or None if no session is loaded
+        """
+        engine = self._get_batch_engine()
+        if engine is None or not self._detector_config:
+            logger.warning("Cannot run batch detection: no session loaded")
+            return None
+        return engine.run(
+            self._detector_config,
+            self._detector_mode,
+            start_frame=start_frame,
+            end_frame=end_frame,
+            progress_callback=progress_callback,
+        )
+
+    def run_pitch_detection(
+        self,
+        pitch_index: int,
+        progress_callback: Optional[ProgressCallback] = None,
+    ) -> Optional[BatchDetectionResult]:
+        """Run the current detector config over one pitch.
+
+        Args:
+            pitch_index: Pitch index (0-based)
+            progress_callback: Called with (frames_done, frames_total)
+
+        Returns:
+            BatchDetectionResult, or None if the pitch cannot be located
+        """
+        if not self._session or pitch_index < 0 or pitch_index >= len(self._session.pitches):
+            logger.warning(f"Invalid pitch index: {pitch_index}")
+            return None
+
+        manifest = self._session.pitches[pitch_index].manifest
+        t_start_ns = manifest.get("t_start_ns")
+        t_end_ns = manifest.get("t_end_ns")
+        if self._left_seek_index is None or t_start_ns is None or t_end_ns is None:
+            logger.warning(f"Cannot locate pitch {pitch_index} frames without timestamps")
+            return None
+
+        return self.run_batch_detection(
+            start_frame=self._left_seek_index.frame_at_or_after(int(t_start_ns)),
+            end_frame=self._left_seek_index.frame_at_or_after(int(t_end_ns)),
+            progress_callback=progress_callback,
+        )
+
+    def _get_batch_engine(self) -> Optional[BatchDetectionEngine]:
+        """Create the batch engine for the loaded session on first use."""
+        if self._batch_engine is None and self._session is not None:
+            self._batch_engine = BatchDetectionEngine(
+                self._session.left_video_path,
+                self._session.right_video_path,
+                left_index=self._left_seek_index,
+                right_index=self._right_seek_index,
+                fps=self._video_reader.fps,
+            )
+        return self._batch_engine
+
+    def _close_batch_engine(self) -> None:
+        if self._batch_engine is not None:
+            self._batch_engine.close()
+            self._batch_engine = None
+
     def run_detection_on_current_frame(self) -> tuple[list, list]:
         """Run detection on current frame for both cameras.
 
+        Detects directly on the decoded frames (served from the video
+        reader's cache); the batch engine is only used for range runs.
+        Frame differencing needs the previous frame, so after a seek or a
+        config change the detectors are first fed the preceding frame when
+        it is already cached.
+
         Returns:
             Tuple of (left_detections, right_detections)
             Each is a list of Detection objects
@@ -331,62 +460,56 @@ class ReviewService:
         if not self._detector_left or not self._detector_right:
             self._rebuild_detectors()
 
+        frame_index = self._video_reader.current_frame_index
+        if self._last_detected_index != frame_index - 1 and frame_index > 0:
+            previous = self._video_reader.peek_cached(frame_index - 1)
+            if previous is not None:
+                self._detect_pair(frame_index - 1, *previous)
+
         left_frame, right_frame = self.get_current_frames()
+        detections = self._detect_pair(frame_index, left_frame, right_frame)
+        self._last_detected_index = frame_index
+        return detections
 
-        left_detections = []
-        right_detections = []
+    def _detect_pair(
+        self,
+        frame_index: int,
+        left_frame: Optional[np.ndarray],
+        right_frame: Optional[np.ndarray],
+    ) -> tuple[list, list]:
+        return (
+            self._detect_frame(self._detector_left, "left", frame_index, left_frame),
+            self._detect_frame(self._detector_right, "right", frame_index, right_frame),
+        )
 
-        # Run detection on left frame
-        if left_frame is not None and self._detector_left:
-            try:
-                # Convert to grayscale if needed
-                import cv2
-                if len(left_frame.shape) == 3:
-                    gray_left = cv2.cvtColor(left_frame, cv2.COLOR_BGR2GRAY)
-                else:
-                    gray_left = left_frame
-
-                # Create Frame contract
-                frame_obj = Frame(
-                    camera_id="left",
-                    frame_index=self._video_reader.current_frame_index,
-                    t_capture_monotonic_ns=0,
-                    image=gray_left,
-                    width=gray_left.shape[1],
-                    height=gray_left.shape[0],
-                    pixfmt="GRAY8",
-                )
-
-                left_detections = self._detector_left.detect(frame_obj)
-            except Exception as e:
-                logger.warning(f"Left detection failed: {e}")
-
-        # Run detection on right frame
-        if right_frame is not None and self._detector_right:
-            try:
-                # Convert to grayscale if needed
-                import cv2
-                if len(right_frame.shape) == 3:
-                    gray_right = cv2.cvtColor(right_frame, cv2.COLOR_BGR2GRAY)
-                else:
-                    gray_right = right_frame
-
-                # Create Frame contract
-                frame_obj = Frame(
-                    camera_id="right",
-                    frame_index=self._video_reader.current_frame_index,
-                    t_capture_monotonic_ns=0,
-                    image=gray_right,
-                    width=gray_right.shape[1],
-                    height=gray_right.shape[0],
-                    pixfmt="GRAY8",
-                )
-
-                right_detections = self._detector_right.detect(frame_obj)
-            except Exception as e:
-                logger.warning(f"Right detection failed: {e}")
-
-        return left_detections, right_detections
+    @staticmethod
+    def _detect_frame(
+        detector: Optional[ClassicalDetector],
+        camera: str,
+        frame_index: int,
+        image: Optional[np.ndarray],
+    ) -> list:
+        if image is None or detector is None:
+            return []
+        try:
+            # Convert to grayscale if needed
+            import cv2
+            gray = cv2.cvtColor(image, cv2.COLOR_BGR2GRAY) if len(image.shape) == 3 else image
+
+            # Create Frame contract
+            frame_obj = Frame(
+                camera_id=camera,
+                frame_index=frame_index,
+                t_capture_monotonic_ns=0,
+                image=gray,
+                width=gray.shape[1],
+                height=gray.shape[0],
+                pixfmt="GRAY8",
+            )
+            return detector.detect(frame_obj)
+        except Exception as e:
+            logger.warning(f"{camera.capitalize()} detection failed: {e}")
+            return []
 
     def add_annotation(self, frame_index: int, camera: str, x: float, y: float, note: str = "") -> None:
         """Add manual annotation at frame.
@@ -545,6 +668,9 @@ class ReviewService:
     def close(self) -> None:
         """Close session and release resources."""
         self._video_reader.close()
+        self._close_batch_engine()
+        self._left_seek_index = None
+        self._right_seek_index = None
         self._session = None
         self._annotations.clear()
         self._pitch_scores.clear()
@@ -3,10 +3,25 @@
 from __future__ import annotations
 
 import json
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Optional
 
+from app.pipeline.recording.session_index import (
+    PITCH_MANIFEST_FILENAMES,
+    SESSION_MANIFEST_FILENAMES,
+    LibraryIndex,
+    find_manifest,
+    is_pitch_dir,
+    is_session_dir,
+    load_session_index,
+)
+from app.pipeline.recording.telemetry_store import (
+    TelemetryTable,
+    read_detections,
+    read_observations,
+    table_from_payload,
+)
 from configs.settings import AppConfig, load_config
 from log_config.logger import get_logger
 
@@ -17,10 +32,14 @@ logger = get_logger(__name__)
 class LoadedPitch:
     """Represents a single pitch loaded from a recording.
 
+    Sessions loaded lazily only carry the pitch's index entry in ``manifest``
+    and leave the payload fields as None; use the ``get_*`` methods, which
+    load a payload on first access and cache it in its field.
+
     Attributes:
         pitch_id: Unique pitch identifier (e.g., "pitch-001")
         pitch_dir: Directory containing pitch data
-        manifest: Parsed pitch manifest dictionary
+        manifest: Parsed pitch manifest dictionary (index summary when lazy)
         left_video_path: Path to left camera video file
         right_video_path: Path to right camera video file
         left_timestamps_path: Path to left camera timestamps CSV
@@ -41,6 +60,53 @@ class LoadedPitch:
     original_detections_right: Optional[dict] = None
     original_observations: Optional[list] = None
     frame_files: Optional[list[Path]] = None
+    lazy: bool = False
+    _loaded: set[str] = field(default_factory=set, repr=False, compare=False)
+
+    def get_manifest(self) -> dict:
+        """Get the full pitch manifest (the index summary is replaced on first call)."""
+        if self.lazy and "manifest" not in self._loaded:
+            self._loaded.add("manifest")
+            manifest_path = find_manifest(self.pitch_dir, PITCH_MANIFEST_FILENAMES)
+            manifest = None
+            if manifest_path is not None:
+                manifest = _read_optional_json(manifest_path, "manifest", self.pitch_id)
+            if manifest is not None:
+                self.manifest = manifest
+        return self.manifest
+
+    def get_detections(self, camera: str) -> Optional[dict]:
+        """Get original detections for "left" or "right" (None if not recorded)."""
+        attr = f"original_detections_{camera}"
+        if self.lazy and attr not in self._loaded:
+            self._loaded.add(attr)
+            setattr(self, attr, _load_detections(self.pitch_dir, camera, self.pitch_id))
+        return getattr(self, attr)
+
+    def get_detection_table(self, camera: str) -> Optional[TelemetryTable]:
+        """Get original detections for "left" or "right" as columns (memory-mapped when possible)."""
+        if (self.pitch_dir / f"detections_{camera}.json").exists():
+            payload = self.get_detections(camera) if self.lazy else getattr(self, f"original_detections_{camera}")
+            return table_from_payload("detections", payload) if payload else None
+        return _load_table(lambda: read_detections(self.pitch_dir, camera), f"{camera} detections", self.pitch_id)
+
+    def get_observation_table(self) -> Optional[TelemetryTable]:
+        """Get original 3D trajectory observations as columns (memory-mapped when possible)."""
+        return _load_table(lambda: read_observations(self.pitch_dir), "observations", self.pitch_id)
+
+    def get_observations(self) -> Optional[list]:
+        """Get original 3D trajectory observations (None if not recorded)."""
+        if self.lazy and "original_observations" not in self._loaded:
+            self._loaded.add("original_observations")
+            self.original_observations = _load_observations(self.pitch_dir, self.pitch_id)
+        return self.original_observations
+
+    def get_frame_files(self) -> Optional[list[Path]]:
+        """Get saved frame PNG files (None if frames were not saved)."""
+        if self.lazy and "frame_files" not in self._loaded:
+            self._loaded.add("frame_files")
+            self.frame_files = _find_frame_files(self.pitch_dir)
+        return self.frame_files
 
 
 @dataclass
@@ -56,6 +122,8 @@ class LoadedSession:
         right_video_path: Path to session-level right camera video
         left_timestamps_path: Path to left camera timestamps CSV
         right_timestamps_path: Path to right camera timestamps CSV
+        left_seek_index_path: Path to left camera seek-index sidecar (if recorded)
+        right_seek_index_path: Path to right camera seek-index sidecar (if recorded)
         session_summary: Session summary data (if available)
         calibration: Calibration data (if available)
         original_config: Original AppConfig used for this session
@@ -68,6 +136,8 @@ class LoadedSession:
     right_video_path: Path
     left_timestamps_path: Path
     right_timestamps_path: Path
+    left_seek_index_path: Optional[Path] = None
+    right_seek_index_path: Optional[Path] = None
     session_summary: Optional[dict] = None
     calibration: Optional[dict] = None
     original_config: Optional[AppConfig] = None
@@ -77,15 +147,19 @@ class SessionLoader:
     """Loads recorded sessions for review and training.
 
     Parses session directories, validates structure, and loads all
-    associated data (videos, manifests, detections, etc.).
+    associated data (videos, manifests, detections, etc.). Large libraries
+    can use the compact session and library indexes instead (see
+    ``session_index``).
     """
 
     @staticmethod
-    def get_available_sessions(recordings_dir: Path) -> list[Path]:
+    def get_available_sessions(recordings_dir: Path = Path("recordings"), use_index: bool = True) -> list[Path]:
         """Scan recordings directory for available session directories.
 
         Args:
             recordings_dir: Base recordings directory
+            use_index: Read the library index instead of scanning every
+                session directory (the index is refreshed if it is stale)
 
         Returns:
             List of session directory paths, sorted by date (newest first)
@@ -100,13 +174,16 @@ class SessionLoader:
             logger.warning(f"Recordings directory does not exist: {recordings_dir}")
             return []
 
+        if use_index:
+            sessions = LibraryIndex(recordings_dir).sessions()
+            logger.info(f"Found {len(sessions)} sessions in {recordings_dir}")
+            return sessions
+
         sessions = []
         for item in recordings_dir.iterdir():
-            if item.is_dir() and item.name.startswith("session-"):
-                # Check if it has a manifest file
-                manifest_path = item / "session_manifest.json"
-                if manifest_path.exists():
-                    sessions.append(item)
+            # Same rule as the library index: any directory with a session manifest
+            if is_session_dir(item):
+                sessions.append(item)
 
         # Sort by name (which includes timestamp) in descending order
         sessions.sort(reverse=True)
@@ -137,19 +214,9 @@ class SessionLoader:
         if not session_dir.is_dir():
             return False, f"Path is not a directory: {session_dir}"
 
-        # Check for required session files
-        required_files = [
-            "session_manifest.json",
-        ]
-
-        missing_files = []
-        for filename in required_files:
-            file_path = session_dir / filename
-            if not file_path.exists():
-                missing_files.append(filename)
-
-        if missing_files:
-            return False, f"Missing required files: {', '.join(missing_files)}"
+        # Check for a session manifest under any name the index accepts
+        if find_manifest(session_dir, SESSION_MANIFEST_FILENAMES) is None:
+            return False, f"Missing session manifest ({' or '.join(SESSION_MANIFEST_FILENAMES)})"
 
         # Check for session videos (at least one should exist)
         session_left = session_dir / "session_left.avi"
@@ -162,11 +229,13 @@ class SessionLoader:
         return True, ""
 
     @staticmethod
-    def load_session(session_dir: Path) -> LoadedSession:
+    def load_session(session_dir: Path, lazy: bool = False) -> LoadedSession:
         """Load a complete session with all data.
 
         Args:
             session_dir: Path to session directory
+            lazy: Only read the session index at open time; pitch manifests,
+                detections, observations and frame lists load on demand
 
         Returns:
             LoadedSession object with all session data
@@ -189,7 +258,7 @@ class SessionLoader:
             raise ValueError(f"Invalid session: {error_msg}")
 
         # Load session manifest
-        manifest_path = session_dir / "session_manifest.json"
+        manifest_path = find_manifest(session_dir, SESSION_MANIFEST_FILENAMES)
         try:
             with open(manifest_path, 'r') as f:
                 manifest = json.load(f)
@@ -204,6 +273,8 @@ class SessionLoader:
         right_video_path = session_dir / manifest.get("session_right_video", "session_right.avi")
         left_timestamps_path = session_dir / manifest.get("session_left_timestamps", "session_left_timestamps.csv")
         right_timestamps_path = session_dir / manifest.get("session_right_timestamps", "session_right_timestamps.csv")
+        left_seek_index_path = session_dir / manifest.get("session_left_seek_index", "session_left.seekidx")
+        right_seek_index_path = session_dir / manifest.get("session_right_seek_index", "session_right.seekidx")
 
         # Load session summary if available
         session_summary = None
@@ -228,7 +299,10 @@ class SessionLoader:
                 logger.warning(f"Failed to load original config from {config_path}: {e}")
 
         # Load individual pitches
-        pitches = SessionLoader._load_pitches(session_dir)
+        if lazy:
+            pitches = SessionLoader._load_pitch_index(session_dir)
+        else:
+            pitches = SessionLoader._load_pitches(session_dir)
 
         logger.info(f"Successfully loaded session '{session_id}' with {len(pitches)} pitches")
 
@@ -241,6 +315,8 @@ class SessionLoader:
             right_video_path=right_video_path,
             left_timestamps_path=left_timestamps_path,
             right_timestamps_path=right_timestamps_path,
+            left_seek_index_path=left_seek_index_path if left_seek_index_path.exists() else None,
+            right_seek_index_path=right_seek_index_path if right_seek_index_path.exists() else None,
             session_summary=session_summary,
             calibration=None,  # Future: Load calibration data from session directory
             original_config=original_config,
@@ -260,7 +336,7 @@ class SessionLoader:
 
         # Find all pitch directories
         for item in session_dir.iterdir():
-            if item.is_dir() and item.name.startswith("pitch-"):
+            if is_pitch_dir(item):
                 try:
                     pitch = SessionLoader._load_pitch(item)
                     pitches.append(pitch)
@@ -273,6 +349,33 @@ class SessionLoader:
         logger.debug(f"Loaded {len(pitches)} pitches from {session_dir}")
         return pitches
 
+    @staticmethod
+    def _load_pitch_index(session_dir: Path) -> list[LoadedPitch]:
+        """Create lazy pitches from the session index.
+
+        Args:
+            session_dir: Path to session directory
+
+        Returns:
+            List of lazy LoadedPitch objects, sorted by pitch ID
+        """
+        pitches = []
+        for entry in load_session_index(session_dir):
+            pitch_dir = session_dir / entry["dir"]
+            pitches.append(LoadedPitch(
+                pitch_id=pitch_dir.name,
+                pitch_dir=pitch_dir,
+                manifest=entry,
+                left_video_path=pitch_dir / entry.get("left_video", "left.avi"),
+                right_video_path=pitch_dir / entry.get("right_video", "right.avi"),
+                left_timestamps_path=pitch_dir / entry.get("left_timestamps", "left_timestamps.csv"),
+                right_timestamps_path=pitch_dir / entry.get("right_timestamps", "right_timestamps.csv"),
+                lazy=True,
+            ))
+
+        logger.debug(f"Indexed {len(pitches)} pitches from {session_dir}")
+        return pitches
+
     @staticmethod
     def _load_pitch(pitch_dir: Path) -> LoadedPitch:
         """Load a single pitch directory.
@@ -290,9 +393,9 @@ class SessionLoader:
         pitch_id = pitch_dir.name
 
         # Load pitch manifest
-        manifest_path = pitch_dir / "pitch_manifest.json"
-        if not manifest_path.exists():
-            raise FileNotFoundError(f"Pitch manifest not found: {manifest_path}")
+        manifest_path = find_manifest(pitch_dir, PITCH_MANIFEST_FILENAMES)
+        if manifest_path is None:
+            raise FileNotFoundError(f"Pitch manifest not found in {pitch_dir}")
 
         try:
             with open(manifest_path, 'r') as f:
@@ -306,40 +409,13 @@ class SessionLoader:
         left_timestamps_path = pitch_dir / manifest.get("left_timestamps", "left_timestamps.csv")
         right_timestamps_path = pitch_dir / manifest.get("right_timestamps", "right_timestamps.csv")
 
-        # Load original detections if available
-        detections_left = None
-        detections_left_path = pitch_dir / "detections_left.json"
-        if detections_left_path.exists():
-            try:
-                with open(detections_left_path, 'r') as f:
-                    detections_left = json.load(f)
-            except Exception as e:
-                logger.debug(f"Failed to load left detections for {pitch_id}: {e}")
-
-        detections_right = None
-        detections_right_path = pitch_dir / "detections_right.json"
-        if detections_right_path.exists():
-            try:
-                with open(detections_right_path, 'r') as f:
-                    detections_right = json.load(f)
-            except Exception as e:
-                logger.debug(f"Failed to load right detections for {pitch_id}: {e}")
-
-        # Load observations if available
-        observations = None
-        observations_path = pitch_dir / "observations.json"
-        if observations_path.exists():
-            try:
-                with open(observations_path, 'r') as f:
-                    observations = json.load(f)
-            except Exception as e:
-                logger.debug(f"Failed to load observations for {pitch_id}: {e}")
+        # Load original detections and observations if available
+        detections_left = _load_detections(pitch_dir, "left", pitch_id)
+        detections_right = _load_detections(pitch_dir, "right", pitch_id)
+        observations = _load_observations(pitch_dir, pitch_id)
 
         # Find saved frame files if available
-        frame_files = None
-        frames_dir = pitch_dir / "frames"
-        if frames_dir.exists() and frames_dir.is_dir():
-            frame_files = sorted(frames_dir.glob("*.png"))
+        frame_files = _find_frame_files(pitch_dir)
 
         logger.debug(f"Loaded pitch {pitch_id}")
 
@@ -356,3 +432,52 @@ class SessionLoader:
             original_observations=observations,
             frame_files=frame_files,
         )
+
+
+def _read_optional_json(path: Path, what: str, pitch_id: str):
+    """Read an optional pitch payload, returning None if missing or unreadable."""
+    if not path.exists():
+        return None
+    try:
+        with open(path, 'r') as f:
+            return json.load(f)
+    except Exception as e:
+        logger.debug(f"Failed to load {what} for {pitch_id}: {e}")
+        return None
+
+
+def _load_table(read, what: str, pitch_id: str) -> Optional[TelemetryTable]:
+    """Read a recorder telemetry table, returning None if missing or unreadable."""
+    try:
+        return read()
+    except Exception as e:
+        logger.debug(f"Failed to load {what} for {pitch_id}: {e}")
+        return None
+
+
+def _load_detections(pitch_dir: Path, camera: str, pitch_id: str) -> Optional[dict]:
+    """Load a camera's detections document from the pitch or its recorder tables."""
+    detections = _read_optional_json(pitch_dir / f"detections_{camera}.json", f"{camera} detections", pitch_id)
+    if detections is None:
+        table = _load_table(lambda: read_detections(pitch_dir, camera), f"{camera} detections", pitch_id)
+        if table is not None:
+            detections = table.to_payload()
+    return detections
+
+
+def _load_observations(pitch_dir: Path, pitch_id: str) -> Optional[list]:
+    """Load observations from the pitch or its recorder table."""
+    observations = _read_optional_json(pitch_dir / "observations.json", "observations", pitch_id)
+    if observations is None:
+        table = _load_table(lambda: read_observations(pitch_dir), "observations", pitch_id)
+        if table is not None:
+            observations = table.to_records()
+    return observations
+
+
+def _find_frame_files(pitch_dir: Path) -> Optional[list[Path]]:
+    """List saved frame PNGs, or None if the pitch has no frames directory."""
+    frames_dir = pitch_dir / "frames"
+    if frames_dir.exists() and frames_dir.is_dir():
+        return sorted(frames_dir.glob("*.png"))
+    return None
@@ -10,6 +10,8 @@ from typing import Optional
 import cv2
 import numpy as np
 
+from app.pipeline.recording.seek_index import SeekIndex
+from app.review.frame_cache import FrameCache, FramePrefetcher, StereoFrameSource
 from contracts import Frame
 from log_config.logger import get_logger
 
@@ -49,7 +51,9 @@ class VideoReader:
     """Reads video files with playback control for review mode.
 
     Provides frame-by-frame reading, seeking, and playback state management
-    for both left and right camera videos.
+    for both left and right camera videos. Decoded frames are kept in a
+    memory-bounded LRU cache that a background thread fills ahead of the
+    cursor, so stepping and scrubbing near the cursor never seek the videos.
 
     Example:
         >>> reader = VideoReader()
@@ -59,8 +63,19 @@ class VideoReader:
         >>> print(f"Frame {reader.current_frame_index}/{reader.total_frames}")
     """
 
-    def __init__(self):
-        """Initialize video reader."""
+    def __init__(
+        self,
+        cache_budget_mb: float = 256.0,
+        prefetch: bool = True,
+        prefetch_window: int = 30,
+    ):
+        """Initialize video reader.
+
+        Args:
+            cache_budget_mb: Memory budget for decoded frame pairs (0 disables caching)
+            prefetch: Decode frames around the cursor in a background thread
+            prefetch_window: Frames to decode ahead in the playback direction
+        """
         self._left_capture: Optional[cv2.VideoCapture] = None
         self._right_capture: Optional[cv2.VideoCapture] = None
 
@@ -73,14 +88,34 @@ class VideoReader:
 
         self._playback_state = PlaybackState.STOPPED
 
+        self._cache = FrameCache(int(cache_budget_mb * 1024 * 1024))
+        self._prefetch_enabled = prefetch
+        self._prefetch_window = max(1, prefetch_window)
+        self._prefetcher: Optional[FramePrefetcher] = None
+        self._source: Optional[StereoFrameSource] = None
+        self._direction = 1
+
+        # Optional per-camera seek indexes (frame <-> capture timestamp)
+        self._left_index: Optional[SeekIndex] = None
+        self._right_index: Optional[SeekIndex] = None
+        self._right_alignment: Optional[np.ndarray] = None
+
         logger.debug("VideoReader initialized")
 
-    def open_videos(self, left_video_path: Path, right_video_path: Path) -> tuple[VideoInfo, VideoInfo]:
+    def open_videos(
+        self,
+        left_video_path: Path,
+        right_video_path: Path,
+        left_index: Optional[SeekIndex] = None,
+        right_index: Optional[SeekIndex] = None,
+    ) -> tuple[VideoInfo, VideoInfo]:
         """Open left and right video files.
 
         Args:
             left_video_path: Path to left camera video
             right_video_path: Path to right camera video
+            left_index: Left camera seek index (enables timestamp seeks)
+            right_index: Right camera seek index (pairs frames by capture time)
 
         Returns:
             Tuple of (left_info, right_info) with video metadata
@@ -126,8 +161,28 @@ class VideoReader:
         self._total_frames = min(self._left_info.total_frames, self._right_info.total_frames)
         self._fps = self._left_info.fps
         self._current_frame_index = 0
+        self._direction = 1
         self._playback_state = PlaybackState.PAUSED
 
+        self._left_index = left_index
+        self._right_index = right_index
+        if left_index is not None and right_index is not None and len(left_index) and len(right_index):
+            # Pair frames by capture time instead of by frame count
+            self._total_frames = min(self._left_info.total_frames, len(left_index))
+            alignment = left_index.align_to(right_index)[: self._total_frames]
+            self._right_alignment = np.minimum(alignment, self._right_info.total_frames - 1)
+
+        self._source = StereoFrameSource(
+            self._left_capture,
+            self._right_capture,
+            left_index=left_index,
+            right_index=right_index,
+            right_alignment=self._right_alignment,
+        )
+
+        if self._prefetch_enabled:
+            self._start_prefetcher(left_video_path, right_video_path)
+
         logger.info(
             f"Videos opened: {self._total_frames} frames @ {self._fps:.1f} fps, "
             f"{self._left_info.width}x{self._left_info.height}"
@@ -165,6 +220,32 @@ class VideoReader:
             fourcc=fourcc,
         )
 
+    def _start_prefetcher(self, left_video_path: Path, right_video_path: Path) -> None:
+        """Start background decoding, sizing the window to fit the cache budget."""
+        pair_bytes = 2 * self._left_info.width * self._left_info.height * 3
+        capacity = self._cache.capacity_frames(pair_bytes)
+        if capacity < 2:
+            logger.debug("Frame cache budget too small for prefetch, decoding on demand")
+            return
+
+        # Leave room for the frame under the cursor; a quarter of the window trails it
+        ahead = min(self._prefetch_window, max(1, (capacity - 1) * 4 // 5))
+        behind = min(ahead // 4, capacity - 1 - ahead)
+
+        self._prefetcher = FramePrefetcher(
+            left_video_path,
+            right_video_path,
+            self._cache,
+            self._total_frames,
+            ahead=ahead,
+            behind=behind,
+            left_index=self._left_index,
+            right_index=self._right_index,
+            right_alignment=self._right_alignment,
+        )
+        self._prefetcher.start()
+        self._prefetcher.request(self._current_frame_index, self._direction)
+
     def read_frames(self) -> tuple[Optional[np.ndarray], Optional[np.ndarray]]:
         """Read current frame from both videos.
 
@@ -173,7 +254,8 @@ class VideoReader:
             Returns (None, None) if at end of video or not opened.
 
         Note:
-            Does not advance to next frame - use seek_to_frame() or step_forward()
+            Does not advance to next frame - use seek_to_frame() or step_forward().
+            Frames are copies, so callers may draw on them without touching the cache.
         """
         if not self.is_opened():
             return None, None
@@ -182,15 +264,24 @@ class VideoReader:
             logger.debug("At end of video")
             return None, None
 
-        # Read from both captures
-        left_ok, left_frame = self._left_capture.read()
-        right_ok, right_frame = self._right_capture.read()
+        pair = self._cache.get(self._current_frame_index)
+        if pair is None:
+            pair = self._source.read(self._current_frame_index)
+            if pair is None:
+                logger.warning(f"Failed to read frame {self._current_frame_index}")
+                return None, None
+            self._cache.put(self._current_frame_index, pair)
 
-        if not left_ok or not right_ok:
-            logger.warning(f"Failed to read frame {self._current_frame_index}")
-            return None, None
+        left_frame, right_frame = pair
+        return left_frame.copy(), right_frame.copy()
 
-        return left_frame, right_frame
+    def peek_cached(self, frame_index: int) -> Optional[tuple[np.ndarray, np.ndarray]]:
+        """Frame pair at ``frame_index`` if it is already decoded, without seeking.
+
+        Returns:
+            (left, right) cached frames (not copies, do not modify), or None
+        """
+        return self._cache.get(frame_index)
 
     def seek_to_frame(self, frame_index: int) -> bool:
         """Seek to specific frame index.
@@ -200,6 +291,10 @@ class VideoReader:
 
         Returns:
             True if seek successful, False otherwise
+
+        Note:
+            Seeking only moves the cursor; frames are decoded (or served from
+            the cache) by the next read_frames() call.
         """
         if not self.is_opened():
             logger.warning("Cannot seek: videos not opened")
@@ -213,15 +308,10 @@ class VideoReader:
 
         logger.debug(f"Seeking from frame {self._current_frame_index} to {frame_index}")
 
-        # Seek both captures
-        left_ok = self._left_capture.set(cv2.CAP_PROP_POS_FRAMES, frame_index)
-        right_ok = self._right_capture.set(cv2.CAP_PROP_POS_FRAMES, frame_index)
-
-        if not left_ok or not right_ok:
-            logger.error(f"Failed to seek to frame {frame_index}")
-            return False
-
+        self._direction = 1 if frame_index > self._current_frame_index else -1
         self._current_frame_index = frame_index
+        if self._prefetcher is not None:
+            self._prefetcher.request(frame_index, self._direction)
         return True
 
     def seek_to_time(self, time_ms: float) -> bool:
@@ -240,6 +330,21 @@ class VideoReader:
         frame_index = int((time_ms / 1000.0) * self._fps)
         return self.seek_to_frame(frame_index)
 
+    def seek_to_timestamp(self, t_capture_ns: int) -> bool:
+        """Seek to the first frame captured at or after a monotonic timestamp.
+
+        Requires a left seek index (binary search over capture timestamps).
+
+        Args:
+            t_capture_ns: Capture timestamp (t_capture_monotonic_ns)
+
+        Returns:
+            True if seek successful, False if no seek index is loaded
+        """
+        if not self.is_opened() or self._left_index is None or len(self._left_index) == 0:
+            return False
+        return self.seek_to_frame(self._left_index.frame_at_or_after(t_capture_ns))
+
     def step_forward(self, num_frames: int = 1) -> bool:
         """Step forward by specified number of frames.
 
@@ -291,8 +396,22 @@ class VideoReader:
             and self._right_capture.isOpened()
         )
 
+    def cache_stats(self) -> dict:
+        """Get decoded-frame cache statistics.
+
+        Returns:
+            Dictionary with hits, misses, hit_rate, evictions, prefetched,
+            cached_frames, bytes_used and max_bytes
+        """
+        return self._cache.stats()
+
     def close(self) -> None:
         """Close video files and release resources."""
+        if self._prefetcher is not None:
+            self._prefetcher.stop()
+            self._prefetcher = None
+        self._cache.clear()
+
         if self._left_capture is not None:
             self._left_capture.release()
             self._left_capture = None
@@ -303,6 +422,12 @@ class VideoReader:
 
         self._left_info = None
         self._right_info = None
+        # Seek indexes belong to the caller (they may be shared)
+        self._source = None
+        self._left_index = None
+        self._right_index = None
+        self._right_alignment = None
+
         self._current_frame_index = 0
         self._total_frames = 0
         self._playback_state = PlaybackState.STOPPED
@@ -324,6 +449,18 @@ class VideoReader:
         """Get video frame rate."""
         return self._fps
 
+    @property
+    def has_seek_index(self) -> bool:
+        """True if frames can be located by capture timestamp."""
+        return self._left_index is not None and len(self._left_index) > 0
+
+    @property
+    def current_timestamp_ns(self) -> Optional[int]:
+        """Capture timestamp of the current left frame, if a seek index is loaded."""
+        if not self.has_seek_index or self._current_frame_index >= len(self._left_index):
+            return None
+        return self._left_index.timestamp_ns(self._current_frame_index)
+
     @property
     def current_time_ms(self) -> float:
         """Get current playback time in milliseconds."""
@@ -136,21 +136,26 @@ class DetectionServiceImpl(DetectionService):
             self._left_detector = detectors["left"]
             self._right_detector = detectors["right"]
 
+            # Detector processes (process_per_camera) hold pickled copies; replace them
+            if self._thread_pool is not None:
+                self._thread_pool.set_detectors({"left": self._left_detector, "right": self._right_detector})
+
             logger.info(f"Detectors configured: type={detector_type}, mode={mode}")
 
     def configure_threading(self, mode: str, worker_count: int) -> None:
         """Configure detection threading mode.
 
         Args:
-            mode: "per_camera" (one thread per camera) or
-                  "worker_pool" (shared thread pool)
+            mode: "per_camera" (one thread per camera),
+                  "worker_pool" (shared thread pool) or
+                  "process_per_camera" (one detector process per camera)
             worker_count: Number of worker threads (for worker_pool mode)
 
         Raises:
             ValueError: If mode is invalid or worker_count <= 0
         """
         with self._lock:
-            if mode not in ("per_camera", "worker_pool"):
+            if mode not in ("per_camera", "worker_pool", "process_per_camera"):
                 raise ValueError(f"Invalid threading mode: {mode}")
             if worker_count <= 0:
                 raise ValueError(f"Invalid worker_count: {worker_count}")
@@ -198,6 +203,7 @@ class DetectionServiceImpl(DetectionService):
 
             # Set callbacks on thread pool
             self._thread_pool.set_detect_callback(self._detect_frame)
+            self._thread_pool.set_detectors({"left": self._left_detector, "right": self._right_detector})
             self._thread_pool.set_stereo_callback(self._on_stereo_result)
 
             # Set callback on processor
@@ -417,6 +423,8 @@ class DetectionServiceImpl(DetectionService):
         try:
             # Select detector
             detector = self._left_detector if camera_id == "left" else self._right_detector
+            if self._thread_pool is not None:
+                detector = self._thread_pool.get_detector(camera_id, detector)
             if detector is None:
                 return []
 
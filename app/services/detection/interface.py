@@ -72,8 +72,9 @@ class DetectionService(ABC):
         """Configure detection threading mode.
 
         Args:
-            mode: "per_camera" (one thread per camera) or
-                  "worker_pool" (shared thread pool)
+            mode: "per_camera" (one thread per camera),
+                  "worker_pool" (shared thread pool) or
+                  "process_per_camera" (one detector process per camera)
             worker_count: Number of worker threads (for worker_pool mode)
 
         Raises:
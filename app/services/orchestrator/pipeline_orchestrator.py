@@ -8,9 +8,9 @@ from __future__ import annotations
 
 import threading
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple
+from typing import Dict, List, Optional, Tuple, Type
 
-from app.events.event_bus import EventBus
+from app.events.event_bus import EventBus, EventHandler
 from app.events.event_types import (
     FrameCapturedEvent,
     ObservationDetectedEvent,
@@ -31,6 +31,7 @@ from log_config.logger import get_logger
 from metrics.simple_metrics import PlateMetricsStub
 from metrics.strike_zone import StrikeResult
 from record.recorder import RecordingBundle
+from telemetry import get_tracer
 
 logger = get_logger(__name__)
 
@@ -326,6 +327,18 @@ class PipelineOrchestrator(PipelineService):
 
             return self._capture_service.get_stats()
 
+    def get_trace_stats(self) -> Dict[str, float]:
+        """Return per-stage pipeline latency.
+
+        Returns:
+            "<span>_<stat>" keys such as "detect_p95_ms" (see
+            telemetry.tracing), or {} when pipeline tracing is disabled
+        """
+        tracer = get_tracer()
+        if not tracer.enabled:
+            return {}
+        return tracer.flat_stats()
+
     def get_plate_metrics(self) -> PlateMetricsStub:
         """Return latest plate-gated metrics (stubbed if unavailable).
 
@@ -380,7 +393,7 @@ class PipelineOrchestrator(PipelineService):
         """Set detection threading mode.
 
         Args:
-            mode: "per_camera" or "worker_pool"
+            mode: "per_camera", "worker_pool" or "process_per_camera"
             worker_count: Number of worker threads
         """
         with self._lock:
@@ -594,6 +607,26 @@ class PipelineOrchestrator(PipelineService):
 
     # EventBus Subscription Management
 
+    def subscribe(self, event_type: Type, handler: EventHandler) -> None:
+        """Register handler for pipeline events of ``event_type``.
+
+        Handlers run on the thread that publishes the event (capture,
+        detection or pitch tracking), so they should return quickly.
+
+        Args:
+            event_type: Event class (e.g., PitchEndEvent)
+            handler: Callback taking the event
+        """
+        self._event_bus.subscribe(event_type, handler)
+
+    def unsubscribe(self, event_type: Type, handler: EventHandler) -> bool:
+        """Unregister a handler added with subscribe().
+
+        Returns:
+            True if handler was found and removed, False otherwise
+        """
+        return self._event_bus.unsubscribe(event_type, handler)
+
     def _subscribe_to_observations(self) -> None:
         """Subscribe to ObservationDetectedEvent from EventBus."""
         self._event_bus.subscribe(ObservationDetectedEvent, self._on_observation_detected_internal)
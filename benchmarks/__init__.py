@@ -8,4 +8,6 @@ This package contains benchmarks to measure:
 
 Run all benchmarks: python -m benchmarks.run_all
 Run specific benchmark: python -m benchmarks.throughput
+Check hot paths against the stored baseline: python -m benchmarks.regression
+Import time and time to first frame: python -m benchmarks.startup
 """
@@ -0,0 +1,21 @@
+"""Synthetic frames shared by the benchmarks."""
+
+from functools import lru_cache
+
+from capture.synthetic_scene import SceneConfig, StereoScene, default_geometry
+from contracts import Frame
+
+
+@lru_cache(maxsize=4)
+def benchmark_scene(width: int, height: int) -> StereoScene:
+    """Stereo scene for a resolution, built once and reused across benchmarks."""
+    return StereoScene(
+        default_geometry(width, height),
+        SceneConfig(width=width, height=height),
+        left_id="benchmark",
+    )
+
+
+def create_test_frame(width: int, height: int, timestamp_ns: int, index: int = 0) -> Frame:
+    """Render a synthetic pitch frame (ball in flight over a textured, noisy background)."""
+    return benchmark_scene(width, height).camera_frame(index, t_capture_ns=timestamp_ns)
@@ -5,30 +5,16 @@ Target: <20ms p95 latency for real-time responsiveness.
 """
 
 import time
-import numpy as np
 from typing import List, Tuple
 from collections import deque
 
 from app.pipeline.detection.threading_pool import DetectionThreadPool
+from benchmarks.frames import create_test_frame
 from contracts import Frame
 from detect.classical_detector import ClassicalDetector
 from detect.config import DetectorConfig, FilterConfig
 
 
-def create_test_frame(width: int, height: int, timestamp_ns: int) -> Frame:
-    """Create a test frame with random data."""
-    image = np.random.randint(0, 255, (height, width, 3), dtype=np.uint8)
-    return Frame(
-        image=image,
-        t_capture_monotonic_ns=timestamp_ns,
-        t_capture_utc_ns=timestamp_ns,
-        t_received_monotonic_ns=timestamp_ns,
-        width=width,
-        height=height,
-        camera_id="benchmark",
-    )
-
-
 def calculate_percentiles(latencies: List[float]) -> dict:
     """Calculate latency percentiles."""
     if not latencies:
@@ -99,7 +85,7 @@ def benchmark_detection_latency(
     print("Warming up...")
     for i in range(10):
         timestamp = int(time.time() * 1e9) + i * 16_666_667
-        frame = create_test_frame(width, height, timestamp)
+        frame = create_test_frame(width, height, timestamp, i)
         pool.enqueue_frame("left", frame)
     time.sleep(0.5)
     results_queue.clear()
@@ -110,7 +96,7 @@ def benchmark_detection_latency(
 
     for i in range(num_frames):
         timestamp = start_ns + i * 16_666_667
-        frame = create_test_frame(width, height, timestamp)
+        frame = create_test_frame(width, height, timestamp, i)
         pool.enqueue_frame("left", frame)
 
         # Throttle input to not overwhelm queue
@@ -198,7 +184,7 @@ def benchmark_latency_under_load(
 
     for i in range(num_frames):
         timestamp = start_ns + i * 16_666_667
-        frame = create_test_frame(width, height, timestamp)
+        frame = create_test_frame(width, height, timestamp, i)
         pool.enqueue_frame("left", frame)
 
     # Wait for processing
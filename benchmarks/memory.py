@@ -6,7 +6,6 @@ Target: Memory growth <10% over 30 minutes of operation.
 
 import time
 import gc
-import numpy as np
 from typing import List, Tuple
 
 try:
@@ -17,7 +16,7 @@ except ImportError:
     print("Warning: psutil not available. Install with: pip install psutil")
 
 from app.pipeline.detection.threading_pool import DetectionThreadPool
-from contracts import Frame
+from benchmarks.frames import create_test_frame
 from detect.classical_detector import ClassicalDetector
 from detect.config import DetectorConfig, FilterConfig
 
@@ -30,20 +29,6 @@ def get_memory_mb() -> float:
     return process.memory_info().rss / (1024 * 1024)
 
 
-def create_test_frame(width: int, height: int, timestamp_ns: int) -> Frame:
-    """Create a test frame with random data."""
-    image = np.random.randint(0, 255, (height, width, 3), dtype=np.uint8)
-    return Frame(
-        image=image,
-        t_capture_monotonic_ns=timestamp_ns,
-        t_capture_utc_ns=timestamp_ns,
-        t_received_monotonic_ns=timestamp_ns,
-        width=width,
-        height=height,
-        camera_id="benchmark",
-    )
-
-
 def benchmark_memory_stability(
     duration_seconds: int = 300,
     sample_interval: int = 10,
@@ -89,7 +74,7 @@ def benchmark_memory_stability(
     print("Warming up pipeline...")
     for i in range(50):
         timestamp = int(time.time() * 1e9) + i * 16_666_667
-        frame = create_test_frame(width, height, timestamp)
+        frame = create_test_frame(width, height, timestamp, i)
         pool.enqueue_frame("left", frame)
     time.sleep(1.0)
 
@@ -112,7 +97,7 @@ def benchmark_memory_stability(
     while time.time() - start_time < duration_seconds:
         # Send frames continuously
         timestamp = int(time.time() * 1e9)
-        frame = create_test_frame(width, height, timestamp)
+        frame = create_test_frame(width, height, timestamp, frame_count)
         pool.enqueue_frame("left", frame)
         frame_count += 1
 
@@ -238,7 +223,7 @@ def benchmark_memory_rapid_cycling(
         # Process a few frames
         for j in range(10):
             timestamp = int(time.time() * 1e9) + j * 16_666_667
-            frame = create_test_frame(width, height, timestamp)
+            frame = create_test_frame(width, height, timestamp, j)
             pool.enqueue_frame("left", frame)
 
         time.sleep(0.05)
@@ -26,16 +26,17 @@ sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from configs.settings import load_config
 from app.services.orchestrator import PipelineOrchestrator
+from telemetry import LatencyHistogram
 
 
 @dataclass
 class PerformanceMetrics:
     """Container for performance measurements."""
 
-    # Timing metrics (milliseconds)
-    capture_latency_ms: List[float] = field(default_factory=list)
-    detection_latency_ms: List[float] = field(default_factory=list)
-    recording_latency_ms: List[float] = field(default_factory=list)
+    # Timing metrics (fixed-memory histograms, recorded in milliseconds)
+    capture_latency: LatencyHistogram = field(default_factory=LatencyHistogram)
+    detection_latency: LatencyHistogram = field(default_factory=LatencyHistogram)
+    recording_latency: LatencyHistogram = field(default_factory=LatencyHistogram)
 
     # Memory metrics (MB)
     memory_usage_mb: List[float] = field(default_factory=list)
@@ -58,15 +59,15 @@ class PerformanceMetrics:
 
     def add_capture_latency(self, latency_ms: float):
         """Add capture latency sample."""
-        self.capture_latency_ms.append(latency_ms)
+        self.capture_latency.record(int(latency_ms * 1e6))
 
     def add_detection_latency(self, latency_ms: float):
         """Add detection latency sample."""
-        self.detection_latency_ms.append(latency_ms)
+        self.detection_latency.record(int(latency_ms * 1e6))
 
     def add_recording_latency(self, latency_ms: float):
         """Add recording latency sample."""
-        self.recording_latency_ms.append(latency_ms)
+        self.recording_latency.record(int(latency_ms * 1e6))
 
     def add_memory_sample(self, memory_mb: float):
         """Add memory usage sample."""
@@ -84,27 +85,9 @@ class PerformanceMetrics:
     def to_dict(self) -> Dict:
         """Convert metrics to dictionary for JSON serialization."""
         return {
-            "capture_latency": {
-                "min_ms": min(self.capture_latency_ms) if self.capture_latency_ms else 0,
-                "max_ms": max(self.capture_latency_ms) if self.capture_latency_ms else 0,
-                "avg_ms": sum(self.capture_latency_ms) / len(self.capture_latency_ms) if self.capture_latency_ms else 0,
-                "p95_ms": self._percentile(self.capture_latency_ms, 95),
-                "samples": len(self.capture_latency_ms)
-            },
-            "detection_latency": {
-                "min_ms": min(self.detection_latency_ms) if self.detection_latency_ms else 0,
-                "max_ms": max(self.detection_latency_ms) if self.detection_latency_ms else 0,
-                "avg_ms": sum(self.detection_latency_ms) / len(self.detection_latency_ms) if self.detection_latency_ms else 0,
-                "p95_ms": self._percentile(self.detection_latency_ms, 95),
-                "samples": len(self.detection_latency_ms)
-            },
-            "recording_latency": {
-                "min_ms": min(self.recording_latency_ms) if self.recording_latency_ms else 0,
-                "max_ms": max(self.recording_latency_ms) if self.recording_latency_ms else 0,
-                "avg_ms": sum(self.recording_latency_ms) / len(self.recording_latency_ms) if self.recording_latency_ms else 0,
-                "p95_ms": self._percentile(self.recording_latency_ms, 95),
-                "samples": len(self.recording_latency_ms)
-            },
+            "capture_latency": self._latency_dict(self.capture_latency),
+            "detection_latency": self._latency_dict(self.detection_latency),
+            "recording_latency": self._latency_dict(self.recording_latency),
             "memory": {
                 "avg_mb": sum(self.memory_usage_mb) / len(self.memory_usage_mb) if self.memory_usage_mb else 0,
                 "peak_mb": self.peak_memory_mb,
@@ -128,13 +111,16 @@ class PerformanceMetrics:
             }
         }
 
-    def _percentile(self, data: List[float], percentile: int) -> float:
-        """Calculate percentile of data."""
-        if not data:
-            return 0.0
-        sorted_data = sorted(data)
-        index = int(len(sorted_data) * percentile / 100)
-        return sorted_data[min(index, len(sorted_data) - 1)]
+    def _latency_dict(self, histogram: LatencyHistogram) -> Dict:
+        """Summarize a latency histogram."""
+        return {
+            "min_ms": histogram.min_ns / 1e6,
+            "max_ms": histogram.max_ns / 1e6,
+            "avg_ms": histogram.mean_ns / 1e6,
+            "p95_ms": histogram.quantile(0.95) / 1e6,
+            "p99_ms": histogram.quantile(0.99) / 1e6,
+            "samples": histogram.count
+        }
 
 
 class PerformanceMonitor:
@@ -325,6 +311,7 @@ def print_metrics_report(metrics: PerformanceMetrics):
         print("CAPTURE LATENCY:")
         print(f"  Average:     {data['capture_latency']['avg_ms']:.2f} ms")
         print(f"  P95:         {data['capture_latency']['p95_ms']:.2f} ms")
+        print(f"  P99:         {data['capture_latency']['p99_ms']:.2f} ms")
         print(f"  Min/Max:     {data['capture_latency']['min_ms']:.2f} / {data['capture_latency']['max_ms']:.2f} ms")
         print()
 
@@ -332,6 +319,7 @@ def print_metrics_report(metrics: PerformanceMetrics):
         print("DETECTION LATENCY:")
         print(f"  Average:     {data['detection_latency']['avg_ms']:.2f} ms")
         print(f"  P95:         {data['detection_latency']['p95_ms']:.2f} ms")
+        print(f"  P99:         {data['detection_latency']['p99_ms']:.2f} ms")
         print(f"  Min/Max:     {data['detection_latency']['min_ms']:.2f} / {data['detection_latency']['max_ms']:.2f} ms")
         print()
 
@@ -0,0 +1,608 @@
+"""Hot-path regression benchmarks compared against a stored baseline.
+
+Each case times one hot path in isolation (no threads, no cameras) on
+synthetic data: warm-up calls first, then repeated trials of a fixed number
+of calls. Per-call trial times are stored in a versioned baseline JSON, and
+later runs compare against it with a one-sided Mann-Whitney U test. A case
+regresses when its median is more than ``threshold`` slower than the
+baseline AND the slowdown is statistically significant at ``alpha``, so a
+single noisy trial does not fail the run.
+
+Runs headless on a CPU-only machine. Baselines are only comparable on the
+machine that recorded them; the recorded environment is checked and a
+mismatch is reported.
+
+Usage:
+    # Record a baseline (commit it, or keep one per CI runner)
+    python -m benchmarks.regression --update-baseline
+
+    # Compare against it; exits 1 on a significant regression
+    python -m benchmarks.regression
+
+    # Subset, quicker trials, custom threshold
+    python -m benchmarks.regression --quick --filter detect --threshold 0.15
+"""
+
+from __future__ import annotations
+
+import argparse
+import gc
+import json
+import math
+import os
+import platform
+import sys
+import tempfile
+import time
+from contextlib import ExitStack
+from dataclasses import dataclass, field
+from datetime import datetime
+from pathlib import Path
+from typing import Callable, Dict, List, Optional
+
+import cv2
+import numpy as np
+
+# Add parent directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from capture.synthetic_scene import SceneConfig, StereoScene, default_geometry
+
+BASELINE_SCHEMA_VERSION = 1
+DEFAULT_BASELINE = Path(__file__).parent / "baselines" / "baseline.json"
+
+
+@dataclass
+class BenchmarkCase:
+    """One isolated hot path.
+
+    ``setup`` builds inputs, registers any cleanup on the ExitStack it is
+    given, and returns the zero-argument callable to time.
+    """
+
+    name: str
+    setup: Callable[[ExitStack], Callable[[], object]]
+    number: int = 1  # Calls per trial
+
+
+@dataclass
+class CaseResult:
+    name: str
+    samples_s: List[float]  # Per-call seconds, one entry per trial
+
+    @property
+    def median_s(self) -> float:
+        return float(np.median(self.samples_s)) if self.samples_s else 0.0
+
+    @property
+    def mad_s(self) -> float:
+        """Median absolute deviation of the trials."""
+        if not self.samples_s:
+            return 0.0
+        samples = np.asarray(self.samples_s)
+        return float(np.median(np.abs(samples - np.median(samples))))
+
+    def to_dict(self) -> dict:
+        return {"median_s": self.median_s, "mad_s": self.mad_s, "samples_s": list(self.samples_s)}
+
+
+@dataclass
+class Comparison:
+    name: str
+    status: str  # "ok", "regression", "improved", "new" or "missing"
+    baseline_median_s: Optional[float] = None
+    current_median_s: Optional[float] = None
+    change: Optional[float] = None  # current / baseline - 1
+    p_value: Optional[float] = None
+
+
+@dataclass
+class RegressionReport:
+    comparisons: List[Comparison] = field(default_factory=list)
+    environment_matches: bool = True
+
+    @property
+    def regressions(self) -> List[Comparison]:
+        return [item for item in self.comparisons if item.status == "regression"]
+
+    @property
+    def passed(self) -> bool:
+        return not self.regressions
+
+
+def run_case(case: BenchmarkCase, warmup: int = 3, trials: int = 15) -> CaseResult:
+    """Time a case: ``warmup`` untimed calls, then ``trials`` timed batches of ``case.number`` calls.
+
+    Garbage collection is disabled inside each timed batch so collector
+    pauses from earlier cases do not land in this one.
+    """
+    with ExitStack() as stack:
+        fn = case.setup(stack)
+        for _ in range(warmup):
+            fn()
+        samples: List[float] = []
+        for _ in range(trials):
+            gc.collect()
+            gc.disable()
+            try:
+                started = time.perf_counter()
+                for _ in range(case.number):
+                    fn()
+                elapsed = time.perf_counter() - started
+            finally:
+                gc.enable()
+            samples.append(elapsed / case.number)
+    return CaseResult(case.name, samples)
+
+
+def mann_whitney_greater(baseline: List[float], current: List[float]) -> float:
+    """One-sided p-value that ``current`` tends to be larger than ``baseline``.
+
+    Mann-Whitney U with the tie-corrected normal approximation (adequate
+    for the 10+ trials per side used here).
+    """
+    n1, n2 = len(baseline), len(current)
+    if n1 == 0 or n2 == 0:
+        return 1.0
+    combined = np.concatenate([np.asarray(baseline, dtype=float), np.asarray(current, dtype=float)])
+    order = combined.argsort(kind="mergesort")
+    ranks = np.empty(len(combined))
+    sorted_values = combined[order]
+    # Average ranks across ties
+    start = 0
+    tie_term = 0.0
+    while start < len(sorted_values):
+        end = start
+        while end + 1 < len(sorted_values) and sorted_values[end + 1] == sorted_values[start]:
+            end += 1
+        ranks[order[start:end + 1]] = (start + end) / 2.0 + 1.0
+        ties = end - start + 1
+        tie_term += ties ** 3 - ties
+        start = end + 1
+
+    u_current = ranks[n1:].sum() - n2 * (n2 + 1) / 2.0
+    mean_u = n1 * n2 / 2.0
+    n = n1 + n2
+    var_u = n1 * n2 / 12.0 * ((n + 1) - tie_term / (n * (n - 1)))
+    if var_u <= 0:
+        return 1.0
+    z = (u_current - mean_u - 0.5) / math.sqrt(var_u)  # continuity correction
+    return 0.5 * math.erfc(z / math.sqrt(2.0))
+
+
+def compare(
+    baseline: dict,
+    results: Dict[str, CaseResult],
+    threshold: float = 0.10,
+    alpha: float = 0.01,
+) -> RegressionReport:
+    """Compare results against a loaded baseline.
+
+    Args:
+        baseline: Baseline dict from load_baseline()
+        results: Current results by case name
+        threshold: Minimum relative slowdown of the median that counts
+        alpha: Significance level for the Mann-Whitney test
+
+    Returns:
+        RegressionReport with one comparison per case in either set
+    """
+    report = RegressionReport(environment_matches=baseline.get("environment") == environment_info())
+    cases = baseline.get("cases", {})
+    for name, result in results.items():
+        recorded = cases.get(name)
+        if recorded is None:
+            report.comparisons.append(Comparison(name, "new", current_median_s=result.median_s))
+            continue
+        base_samples = recorded["samples_s"]
+        base_median = float(np.median(base_samples))
+        change = result.median_s / base_median - 1.0 if base_median > 0 else 0.0
+        slower_p = mann_whitney_greater(base_samples, result.samples_s)
+        faster_p = mann_whitney_greater(result.samples_s, base_samples)
+        if change > threshold and slower_p < alpha:
+            status, p_value = "regression", slower_p
+        elif change < -threshold and faster_p < alpha:
+            status, p_value = "improved", faster_p
+        else:
+            status, p_value = "ok", min(slower_p, faster_p)
+        report.comparisons.append(
+            Comparison(name, status, base_median, result.median_s, change, p_value)
+        )
+    for name in cases:
+        if name not in results:
+            report.comparisons.append(Comparison(name, "missing"))
+    return report
+
+
+def environment_info() -> dict:
+    """Machine and library versions a baseline is only valid for."""
+    return {
+        "platform": platform.platform(),
+        "machine": platform.machine(),
+        "processor": platform.processor(),
+        "cpu_count": os.cpu_count(),
+        "python": platform.python_version(),
+        "numpy": np.__version__,
+        "opencv": cv2.__version__,
+    }
+
+
+def load_baseline(path: Path) -> dict:
+    """Load a baseline file.
+
+    Raises:
+        FileNotFoundError: If the file does not exist
+        ValueError: If the schema version is not supported
+    """
+    data = json.loads(Path(path).read_text())
+    version = data.get("schema_version")
+    if version != BASELINE_SCHEMA_VERSION:
+        raise ValueError(
+            f"Unsupported baseline schema version {version} (expected {BASELINE_SCHEMA_VERSION}); "
+            f"re-record with --update-baseline"
+        )
+    return data
+
+
+def save_baseline(path: Path, results: Dict[str, CaseResult], settings: dict) -> Path:
+    """Write results as a baseline file (merging into an existing one)."""
+    path = Path(path)
+    cases = {}
+    if path.exists():
+        try:
+            cases = load_baseline(path).get("cases", {})
+        except ValueError:
+            cases = {}
+    cases.update({name: result.to_dict() for name, result in results.items()})
+    data = {
+        "schema_version": BASELINE_SCHEMA_VERSION,
+        "created": datetime.now().isoformat(timespec="seconds"),
+        "environment": environment_info(),
+        "settings": settings,
+        "cases": dict(sorted(cases.items())),
+    }
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps(data, indent=2))
+    return path
+
+
+# ---------------------------------------------------------------------------
+# Cases
+# ---------------------------------------------------------------------------
+
+
+def _scene(width: int, height: int, frames: int = 60) -> StereoScene:
+    return StereoScene(
+        default_geometry(width, height),
+        SceneConfig(width=width, height=height, frames=frames),
+    )
+
+
+def _cycle(items: list) -> Callable[[], object]:
+    """Callable returning the next item on each call, wrapping around."""
+    position = [0]
+
+    def next_item():
+        item = items[position[0] % len(items)]
+        position[0] += 1
+        return item
+
+    return next_item
+
+
+def _detect_case(mode_name: str, width: int, height: int) -> BenchmarkCase:
+    def setup(stack: ExitStack):
+        from detect.classical_detector import ClassicalDetector
+        from detect.config import Mode
+
+        scene = _scene(width, height)
+        frames = _cycle([pair.left for pair in scene])
+        detector = ClassicalDetector(mode=Mode[mode_name.upper()])
+        return lambda: detector.detect(frames())
+
+    # MODE_B (edge-based) is two orders of magnitude slower than MODE_A
+    number = 5 if mode_name == "mode_a" else 1
+    return BenchmarkCase(f"detect/classical/{mode_name}/{width}x{height}", setup, number=number)
+
+
+def _connected_components_case(width: int, height: int) -> BenchmarkCase:
+    def setup(stack: ExitStack):
+        from detect.utils import connected_components
+
+        scene = _scene(width, height, frames=20)
+        first, second = scene.render(10), scene.render(11)
+        diff = cv2.absdiff(first.left.image, second.left.image)
+        mask = (diff > 12).astype(np.uint8)
+        return lambda: connected_components(mask)
+
+    return BenchmarkCase(f"connected_components/{width}x{height}", setup, number=5)
+
+
+def _stereo_matching_case() -> BenchmarkCase:
+    def setup(stack: ExitStack):
+        from app.pipeline.utils import build_stereo_matches
+        from contracts import Detection
+
+        rng = np.random.default_rng(11)
+
+        def detections(camera_id: str) -> list:
+            points = rng.uniform((0, 0), (1280, 720), size=(12, 2))
+            return [
+                Detection(camera_id, 0, 0, float(u), float(v), 4.0, 1.0)
+                for u, v in points
+            ]
+
+        left, right = detections("left"), detections("right")
+        return lambda: build_stereo_matches(left, right)
+
+    return BenchmarkCase("stereo/build_matches/12x12", setup, number=200)
+
+
+def _triangulation_case() -> BenchmarkCase:
+    def setup(stack: ExitStack):
+        from stereo.association import StereoMatch
+        from stereo.simple_stereo import SimpleStereoMatcher
+
+        scene = _scene(1280, 720)
+        matcher = SimpleStereoMatcher(scene.geometry)
+        matches = [
+            StereoMatch(left=truth.left, right=truth.right, epipolar_error_px=0.0, score=1.0)
+            for truth in scene.truth
+            if truth.visible
+        ]
+        return lambda: [matcher.triangulate(match) for match in matches]
+
+    return BenchmarkCase("stereo/triangulate/pitch", setup, number=20)
+
+
+def _strike_zone_case() -> BenchmarkCase:
+    def setup(stack: ExitStack):
+        from metrics.strike_zone import build_strike_zone, is_strike
+
+        observations = _scene(1280, 720).observations()
+        zone = build_strike_zone(
+            plate_z_ft=0.0,
+            plate_width_in=17.0,
+            plate_length_in=17.0,
+            batter_height_in=72.0,
+            top_ratio=0.56,
+            bottom_ratio=0.28,
+        )
+        return lambda: is_strike(observations, zone, 1.45)
+
+    return BenchmarkCase("strike_zone/evaluate/pitch", setup, number=50)
+
+
+def _trajectory_fit_case() -> BenchmarkCase:
+    def setup(stack: ExitStack):
+        from trajectory.contracts import TrajectoryFitRequest
+        from trajectory.physics import PhysicsDragFitter
+        from trajectory.sim import SimConfig, simulate_ballistic
+
+        observations = simulate_ballistic(SimConfig(outlier_prob=0.0, noise_ft=0.01))
+        request = TrajectoryFitRequest(observations=observations, plate_plane_z_ft=0.0)
+        return lambda: PhysicsDragFitter().fit_trajectory(request)
+
+    return BenchmarkCase("trajectory/physics_fit", setup, number=1)
+
+
+def _ekf_case() -> BenchmarkCase:
+    def setup(stack: ExitStack):
+        from trajectory.camera_model import CameraModel
+        from trajectory.reprojection import ReprojectionEKF
+
+        scene = _scene(1280, 720)
+        geometry = scene.geometry
+        left = CameraModel(
+            fx=geometry.focal_length_px,
+            fy=geometry.focal_length_px,
+            cx=geometry.cx,
+            cy=geometry.cy,
+            R=np.eye(3),
+            t=np.zeros(3),
+        )
+        right = CameraModel(
+            fx=geometry.focal_length_px,
+            fy=geometry.focal_length_px,
+            cx=geometry.cx,
+            cy=geometry.cy,
+            R=np.eye(3),
+            t=np.array([-geometry.baseline_ft, 0.0, 0.0]),
+        )
+        matches = [(obs.t_ns, obs.left, obs.right) for obs in scene.observations()]
+        ekf = ReprojectionEKF(left, right)
+        return lambda: ekf.run(matches)
+
+    return BenchmarkCase("trajectory/ekf/pitch", setup, number=5)
+
+
+def _write_clip(path: Path, width: int, height: int, frames: int) -> Path:
+    scene = _scene(width, height, frames=frames)
+    writer = cv2.VideoWriter(str(path), cv2.VideoWriter_fourcc(*"MJPG"), 60.0, (width, height), False)
+    for pair in scene:
+        writer.write(pair.left.image)
+    writer.release()
+    return path
+
+
+def _video_encode_case(width: int, height: int) -> BenchmarkCase:
+    def setup(stack: ExitStack):
+        directory = Path(stack.enter_context(tempfile.TemporaryDirectory()))
+        images = _cycle([pair.left.image for pair in _scene(width, height, frames=30)])
+        writer = cv2.VideoWriter(
+            str(directory / "encode.avi"), cv2.VideoWriter_fourcc(*"MJPG"), 60.0, (width, height), False
+        )
+        stack.callback(writer.release)
+        return lambda: writer.write(images())
+
+    return BenchmarkCase(f"video/encode_mjpg/{width}x{height}", setup, number=10)
+
+
+def _video_decode_case(width: int, height: int) -> BenchmarkCase:
+    def setup(stack: ExitStack):
+        directory = Path(stack.enter_context(tempfile.TemporaryDirectory()))
+        clip = _write_clip(directory / "decode.avi", width, height, frames=60)
+        capture = cv2.VideoCapture(str(clip))
+        stack.callback(capture.release)
+
+        def read_next():
+            ok, image = capture.read()
+            if not ok:
+                capture.set(cv2.CAP_PROP_POS_FRAMES, 0)
+                ok, image = capture.read()
+            return image
+
+        return read_next
+
+    return BenchmarkCase(f"video/decode_mjpg/{width}x{height}", setup, number=10)
+
+
+def _video_seek_case(width: int, height: int) -> BenchmarkCase:
+    def setup(stack: ExitStack):
+        from app.review.video_reader import VideoReader
+
+        directory = Path(stack.enter_context(tempfile.TemporaryDirectory()))
+        left = _write_clip(directory / "session_left.avi", width, height, frames=60)
+        right = _write_clip(directory / "session_right.avi", width, height, frames=60)
+        reader = VideoReader(cache_budget_mb=0, prefetch=False)
+        reader.open_videos(left, right)
+        stack.callback(reader.close)
+        targets = _cycle([int(i) for i in np.random.default_rng(5).integers(0, 60, size=64)])
+
+        def seek_and_read():
+            reader.seek_to_frame(targets())
+            return reader.read_frames()
+
+        return seek_and_read
+
+    return BenchmarkCase(f"video/seek_read/{width}x{height}", setup, number=5)
+
+
+def build_cases(quick: bool = False) -> List[BenchmarkCase]:
+    """All regression cases; quick mode drops the largest resolutions."""
+    resolutions = [(640, 360), (1280, 720)] if quick else [(640, 360), (1280, 720), (1920, 1080)]
+    cases: List[BenchmarkCase] = []
+    for width, height in resolutions:
+        cases.append(_detect_case("mode_a", width, height))
+    cases.append(_detect_case("mode_b", 1280, 720))
+    cases.append(_connected_components_case(1280, 720))
+    cases.append(_stereo_matching_case())
+    cases.append(_triangulation_case())
+    cases.append(_strike_zone_case())
+    cases.append(_trajectory_fit_case())
+    cases.append(_ekf_case())
+    cases.append(_video_encode_case(1280, 720))
+    cases.append(_video_decode_case(1280, 720))
+    cases.append(_video_seek_case(1280, 720))
+    return cases
+
+
+def run_cases(
+    cases: List[BenchmarkCase],
+    warmup: int = 3,
+    trials: int = 15,
+    verbose: bool = True,
+) -> Dict[str, CaseResult]:
+    """Run cases in order and return results by name."""
+    results: Dict[str, CaseResult] = {}
+    for case in cases:
+        result = run_case(case, warmup=warmup, trials=trials)
+        results[case.name] = result
+        if verbose:
+            print(f"  {case.name:<40} {result.median_s * 1e3:>10.3f} ms  (±{result.mad_s * 1e3:.3f})")
+    return results
+
+
+def format_report(report: RegressionReport, threshold: float) -> str:
+    """Human-readable comparison table."""
+    lines = [f"{'Case':<40} {'Baseline':>11} {'Current':>11} {'Change':>8} {'p':>8}  Status"]
+    lines.append("-" * len(lines[0]))
+    for item in report.comparisons:
+        baseline = f"{item.baseline_median_s * 1e3:.3f}ms" if item.baseline_median_s is not None else "-"
+        current = f"{item.current_median_s * 1e3:.3f}ms" if item.current_median_s is not None else "-"
+        change = f"{item.change * 100:+.1f}%" if item.change is not None else "-"
+        p_value = f"{item.p_value:.4f}" if item.p_value is not None else "-"
+        lines.append(f"{item.name:<40} {baseline:>11} {current:>11} {change:>8} {p_value:>8}  {item.status.upper()}")
+    if not report.environment_matches:
+        lines.append("\nWarning: baseline was recorded on a different machine or library versions")
+    summary = "PASS" if report.passed else f"FAIL: {len(report.regressions)} regression(s) beyond {threshold * 100:.0f}%"
+    lines.append(f"\n{summary}")
+    return "\n".join(lines)
+
+
+def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    """Parse command-line arguments."""
+    parser = argparse.ArgumentParser(
+        description="Hot-path benchmark regression suite",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog=__doc__,
+    )
+    parser.add_argument("--baseline", type=Path, default=DEFAULT_BASELINE, help="Baseline JSON file")
+    parser.add_argument("--update-baseline", action="store_true", help="Record results as the new baseline")
+    parser.add_argument("--quick", action="store_true", help="Fewer trials and resolutions")
+    parser.add_argument("--filter", default=None, help="Only run cases whose name contains this text")
+    parser.add_argument("--warmup", type=int, default=None, help="Warm-up calls per case (default: 3)")
+    parser.add_argument("--trials", type=int, default=None, help="Timed trials per case (default: 15, quick: 10)")
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=0.10,
+        help="Relative median slowdown that counts as a regression (default: 0.10)",
+    )
+    parser.add_argument("--alpha", type=float, default=0.01, help="Significance level (default: 0.01)")
+    parser.add_argument("--json", type=Path, default=None, help="Write results and comparison as JSON")
+    return parser.parse_args(argv)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Run the suite; returns 1 on regression, 2 without a usable baseline."""
+    args = parse_args(argv)
+    warmup = args.warmup if args.warmup is not None else 3
+    trials = args.trials if args.trials is not None else (10 if args.quick else 15)
+    cases = [case for case in build_cases(quick=args.quick) if not args.filter or args.filter in case.name]
+    if not cases:
+        print(f"No cases match filter {args.filter!r}", file=sys.stderr)
+        return 2
+
+    print(f"Running {len(cases)} case(s): warmup={warmup}, trials={trials}")
+    results = run_cases(cases, warmup=warmup, trials=trials)
+
+    if args.update_baseline:
+        path = save_baseline(args.baseline, results, {"warmup": warmup, "trials": trials, "quick": args.quick})
+        print(f"\nBaseline written to {path}")
+        return 0
+
+    try:
+        baseline = load_baseline(args.baseline)
+    except FileNotFoundError:
+        print(f"\nNo baseline at {args.baseline}; record one with --update-baseline", file=sys.stderr)
+        return 2
+    except ValueError as e:
+        print(f"\nError: {e}", file=sys.stderr)
+        return 2
+
+    if args.filter:
+        baseline["cases"] = {
+            name: recorded for name, recorded in baseline.get("cases", {}).items() if args.filter in name
+        }
+    report = compare(baseline, results, threshold=args.threshold, alpha=args.alpha)
+    print()
+    print(format_report(report, args.threshold))
+
+    if args.json:
+        args.json.write_text(
+            json.dumps(
+                {
+                    "environment": environment_info(),
+                    "results": {name: result.to_dict() for name, result in results.items()},
+                    "comparisons": [item.__dict__ for item in report.comparisons],
+                    "passed": report.passed,
+                },
+                indent=2,
+            )
+        )
+    return 0 if report.passed else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
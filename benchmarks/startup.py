@@ -0,0 +1,279 @@
+"""Startup benchmark: import cost and time-to-first-frame.
+
+Two measurements, each in a fresh interpreter so nothing is already imported:
+
+- Import profile: ``python -X importtime -c "import <module>"`` (the main
+  window by default). Reports total import time and the modules with the
+  largest cumulative cost, which is where lazy imports pay off.
+- Time to first frame: a child process imports the orchestrator, starts
+  capture on the simulated backend and polls for the first preview frame.
+  Reports wall time from process launch, split into interpreter + imports,
+  capture start, and waiting for the frame. The child also runs under
+  ``-X importtime`` so its slowest imports are listed.
+
+Timings include bytecode compilation when ``__pycache__`` is cold, so run
+twice after an update and compare the second run.
+
+Usage:
+    python -m benchmarks.startup
+    python -m benchmarks.startup --module ui.coaching --runs 5 --top 20
+    python -m benchmarks.startup --json startup.json --max-first-frame-ms 4000
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, List, Optional
+
+ROOT = Path(__file__).parent.parent
+
+# Add parent directory to path for imports
+sys.path.insert(0, str(ROOT))
+
+DEFAULT_MODULE = "ui.main_window"
+DEFAULT_CONFIG = ROOT / "configs" / "default.yaml"
+
+
+@dataclass(frozen=True)
+class ImportRecord:
+    """One line of ``-X importtime`` output."""
+
+    module: str
+    self_us: int
+    cumulative_us: int
+    depth: int  # Nesting level; 0 for imports made directly by the script
+
+
+def parse_importtime(text: str) -> List[ImportRecord]:
+    """Parse ``-X importtime`` stderr, ignoring any other output mixed in."""
+    records = []
+    for line in text.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        fields = line[len("import time:"):].split("|")
+        if len(fields) != 3:
+            continue
+        try:
+            self_us = int(fields[0])
+            cumulative_us = int(fields[1])
+        except ValueError:
+            continue  # Header line
+        name = fields[2].rstrip()
+        depth = (len(name) - len(name.lstrip(" ")) - 1) // 2
+        records.append(ImportRecord(name.strip(), self_us, cumulative_us, max(depth, 0)))
+    return records
+
+
+def summarize_imports(records: List[ImportRecord], top: int = 15) -> dict:
+    """Total import time and the most expensive modules by cumulative time."""
+    total_us = sum(record.cumulative_us for record in records if record.depth == 0)
+    slowest = sorted(records, key=lambda record: record.cumulative_us, reverse=True)[:top]
+    return {
+        "total_ms": total_us / 1000.0,
+        "modules": len(records),
+        "slowest": [
+            {
+                "module": record.module,
+                "cumulative_ms": record.cumulative_us / 1000.0,
+                "self_ms": record.self_us / 1000.0,
+            }
+            for record in slowest
+        ],
+    }
+
+
+def _child_env() -> Dict[str, str]:
+    env = dict(os.environ)
+    env.setdefault("QT_QPA_PLATFORM", "offscreen")
+    env["PYTHONPATH"] = os.pathsep.join(filter(None, [str(ROOT), env.get("PYTHONPATH")]))
+    return env
+
+
+def measure_imports(module: str = DEFAULT_MODULE, runs: int = 3, top: int = 15) -> dict:
+    """Import ``module`` in ``runs`` fresh interpreters; report the median run.
+
+    Raises:
+        RuntimeError: If the import fails
+    """
+    summaries = []
+    for _ in range(max(1, runs)):
+        completed = subprocess.run(
+            [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+            cwd=ROOT,
+            env=_child_env(),
+            capture_output=True,
+            text=True,
+        )
+        if completed.returncode != 0:
+            raise RuntimeError(f"import {module} failed:\n{completed.stderr[-2000:]}")
+        summaries.append(summarize_imports(parse_importtime(completed.stderr), top=top))
+    summaries.sort(key=lambda summary: summary["total_ms"])
+    result = dict(summaries[len(summaries) // 2])
+    result["module"] = module
+    result["runs_ms"] = [summary["total_ms"] for summary in summaries]
+    return result
+
+
+def measure_time_to_first_frame(
+    backend: str = "sim",
+    config_path: Path = DEFAULT_CONFIG,
+    timeout_s: float = 60.0,
+    top: int = 15,
+) -> dict:
+    """Launch a child that starts capture and report when its first frame arrives.
+
+    Raises:
+        RuntimeError: If the child fails or no frame arrives in time
+    """
+    command = [
+        sys.executable, "-X", "importtime", "-m", "benchmarks.startup",
+        "--first-frame-child", "--backend", backend, "--config", str(config_path),
+        "--timeout", str(timeout_s),
+    ]
+    with tempfile.TemporaryFile(mode="w+") as stderr:
+        launched = time.perf_counter()
+        child = subprocess.Popen(command, cwd=ROOT, env=_child_env(), stdout=subprocess.PIPE, stderr=stderr, text=True)
+        line = child.stdout.readline()
+        first_frame_wall_s = time.perf_counter() - launched
+        child.stdout.read()
+        returncode = child.wait(timeout=timeout_s)
+        stderr.seek(0)
+        log = stderr.read()
+    if not line:
+        raise RuntimeError(f"First-frame child exited with {returncode}:\n{log[-2000:]}")
+    timings = json.loads(line)
+    if timings.get("first_frame_s") is None:
+        raise RuntimeError(f"No frame from {backend} backend within {timeout_s:.0f} s")
+    return {
+        "backend": backend,
+        "first_frame_ms": first_frame_wall_s * 1000.0,
+        "interpreter_and_imports_ms": (first_frame_wall_s - timings["first_frame_s"] + timings["import_s"]) * 1000.0,
+        "start_capture_ms": (timings["capture_started_s"] - timings["import_s"]) * 1000.0,
+        "wait_for_frame_ms": (timings["first_frame_s"] - timings["capture_started_s"]) * 1000.0,
+        "imports": summarize_imports(parse_importtime(log), top=top),
+    }
+
+
+def _first_frame_child(backend: str, config_path: Path, timeout_s: float) -> int:
+    """Child side of measure_time_to_first_frame(); prints one JSON line."""
+    started = time.perf_counter()
+    from app.services.orchestrator import PipelineOrchestrator
+    from configs.settings import load_config
+
+    imported = time.perf_counter()
+    service = PipelineOrchestrator(backend=backend)
+    service.start_capture(load_config(config_path), f"{backend}-left", f"{backend}-right")
+    capture_started = time.perf_counter()
+    first_frame = None
+    try:
+        while time.perf_counter() - capture_started < timeout_s:
+            try:
+                service.get_preview_frames()
+            except Exception:
+                time.sleep(0.002)
+                continue
+            first_frame = time.perf_counter()
+            break
+        print(
+            json.dumps(
+                {
+                    "import_s": imported - started,
+                    "capture_started_s": capture_started - started,
+                    "first_frame_s": None if first_frame is None else first_frame - started,
+                }
+            ),
+            flush=True,
+        )
+    finally:
+        service.stop_capture()
+    return 0 if first_frame is not None else 1
+
+
+def format_report(imports: Optional[dict], first_frame: Optional[dict]) -> str:
+    lines = []
+    if imports is not None:
+        lines.append(f"{'='*60}")
+        lines.append(f"Import time: {imports['module']}")
+        lines.append(f"{'='*60}")
+        runs = ", ".join(f"{value:.0f}" for value in imports["runs_ms"])
+        lines.append(f"  Total: {imports['total_ms']:.1f} ms (median of runs: {runs} ms)")
+        lines.append(f"  Modules imported: {imports['modules']}")
+        lines.extend(_format_slowest(imports["slowest"]))
+    if first_frame is not None:
+        lines.append(f"{'='*60}")
+        lines.append(f"Time to first frame ({first_frame['backend']} backend)")
+        lines.append(f"{'='*60}")
+        lines.append(f"  First frame: {first_frame['first_frame_ms']:.1f} ms after launch")
+        lines.append(f"    Interpreter + imports: {first_frame['interpreter_and_imports_ms']:.1f} ms")
+        lines.append(f"    Start capture:         {first_frame['start_capture_ms']:.1f} ms")
+        lines.append(f"    Wait for frame:        {first_frame['wait_for_frame_ms']:.1f} ms")
+        lines.extend(_format_slowest(first_frame["imports"]["slowest"]))
+    lines.append(f"{'='*60}")
+    return "\n".join(lines)
+
+
+def _format_slowest(slowest: List[dict]) -> List[str]:
+    lines = [f"  {'Slowest imports':<44} {'cumul ms':>9} {'self ms':>8}"]
+    for item in slowest:
+        lines.append(f"  {item['module']:<44} {item['cumulative_ms']:>9.1f} {item['self_ms']:>8.1f}")
+    return lines
+
+
+def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Startup import-time and time-to-first-frame benchmark")
+    parser.add_argument("--module", default=DEFAULT_MODULE, help=f"Module to import (default: {DEFAULT_MODULE})")
+    parser.add_argument("--runs", type=int, default=3, help="Import runs; the median is reported (default: 3)")
+    parser.add_argument("--top", type=int, default=15, help="Slowest imports to list (default: 15)")
+    parser.add_argument("--backend", default="sim", help="Camera backend for first frame (default: sim)")
+    parser.add_argument("--config", type=Path, default=DEFAULT_CONFIG, help="Config file for capture")
+    parser.add_argument("--timeout", type=float, default=60.0, help="Seconds to wait for the first frame")
+    parser.add_argument("--skip-imports", action="store_true", help="Only measure time to first frame")
+    parser.add_argument("--skip-first-frame", action="store_true", help="Only measure import time")
+    parser.add_argument("--max-import-ms", type=float, help="Exit 1 if import time exceeds this")
+    parser.add_argument("--max-first-frame-ms", type=float, help="Exit 1 if time to first frame exceeds this")
+    parser.add_argument("--json", type=Path, help="Write results as JSON")
+    parser.add_argument("--first-frame-child", action="store_true", help=argparse.SUPPRESS)
+    return parser.parse_args(argv)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Run the startup benchmark; returns 1 if a budget is exceeded."""
+    args = parse_args(argv)
+    if args.first_frame_child:
+        return _first_frame_child(args.backend, args.config, args.timeout)
+
+    imports = None if args.skip_imports else measure_imports(args.module, runs=args.runs, top=args.top)
+    first_frame = (
+        None
+        if args.skip_first_frame
+        else measure_time_to_first_frame(args.backend, args.config, timeout_s=args.timeout, top=args.top)
+    )
+    print(format_report(imports, first_frame))
+
+    if args.json:
+        args.json.write_text(json.dumps({"imports": imports, "first_frame": first_frame}, indent=2))
+
+    failures = []
+    if args.max_import_ms is not None and imports is not None and imports["total_ms"] > args.max_import_ms:
+        failures.append(f"import time {imports['total_ms']:.0f} ms > {args.max_import_ms:.0f} ms")
+    if (
+        args.max_first_frame_ms is not None
+        and first_frame is not None
+        and first_frame["first_frame_ms"] > args.max_first_frame_ms
+    ):
+        failures.append(f"time to first frame {first_frame['first_frame_ms']:.0f} ms > {args.max_first_frame_ms:.0f} ms")
+    for failure in failures:
+        print(f"Budget exceeded: {failure}", file=sys.stderr)
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -4,30 +4,17 @@ Measures frames per second (FPS) through the detection pipeline.
 Target: 60 FPS minimum for real-time processing.
 """
 
+import threading
 import time
-import numpy as np
-from typing import List, Tuple
+from typing import List, Optional, Tuple
 
 from app.pipeline.detection.threading_pool import DetectionThreadPool
+from benchmarks.frames import benchmark_scene, create_test_frame
 from contracts import Frame
 from detect.classical_detector import ClassicalDetector
 from detect.config import DetectorConfig, FilterConfig
 
 
-def create_test_frame(width: int, height: int, timestamp_ns: int) -> Frame:
-    """Create a test frame with random data."""
-    image = np.random.randint(0, 255, (height, width, 3), dtype=np.uint8)
-    return Frame(
-        image=image,
-        t_capture_monotonic_ns=timestamp_ns,
-        t_capture_utc_ns=timestamp_ns,
-        t_received_monotonic_ns=timestamp_ns,
-        width=width,
-        height=height,
-        camera_id="benchmark",
-    )
-
-
 def benchmark_detection_throughput(
     num_frames: int = 1000,
     width: int = 1280,
@@ -70,7 +57,7 @@ def benchmark_detection_throughput(
     start_ns = int(time.time() * 1e9)
     for i in range(num_frames):
         timestamp = start_ns + i * 16_666_667  # ~60 FPS spacing
-        frames.append(create_test_frame(width, height, timestamp))
+        frames.append(create_test_frame(width, height, timestamp, i))
 
     # Warm-up (process first 10 frames)
     print("Warming up pipeline...")
@@ -149,6 +136,123 @@ def benchmark_multiple_resolutions() -> List[dict]:
     return results
 
 
+THREADING_MODES = ("per_camera", "worker_pool", "process_per_camera")
+
+
+def benchmark_threading_mode(
+    mode: str,
+    num_frames: int = 300,
+    width: int = 1280,
+    height: int = 720,
+    queue_size: int = 6,
+    worker_count: int = 2,
+    frames: Optional[List[Tuple[Frame, Frame]]] = None,
+) -> dict:
+    """Feed both cameras through one DetectionThreadPool mode and time it.
+
+    Frames are enqueued no faster than the pool drains them (at most
+    ``queue_size`` outstanding per camera), so nothing is dropped and the
+    result is the pool's sustained detection capacity for a stereo pair.
+
+    Args:
+        mode: Threading mode ("per_camera", "worker_pool", "process_per_camera")
+        num_frames: Frames per camera
+        width: Frame width in pixels
+        height: Frame height in pixels
+        queue_size: Detection queue size
+        worker_count: Worker threads for worker_pool mode
+        frames: Pre-rendered (left, right) pairs, to share between modes
+
+    Returns:
+        Dictionary with benchmark results
+    """
+    if frames is None:
+        scene = benchmark_scene(width, height)
+        frames = [(scene.camera_frame(i, "left"), scene.camera_frame(i, "right")) for i in range(num_frames)]
+    num_frames = len(frames)
+
+    detectors = {
+        label: ClassicalDetector(DetectorConfig(filters=FilterConfig())) for label in ("left", "right")
+    }
+    pool = DetectionThreadPool(mode=mode, worker_count=worker_count)
+    done = threading.Condition()
+    processed = {"left": 0, "right": 0}
+
+    def detect(label: str, frame: Frame) -> list:
+        return pool.get_detector(label, detectors[label]).detect(frame)
+
+    def on_result(label: str, frame: Frame, detections: list) -> None:
+        with done:
+            processed[label] += 1
+            done.notify_all()
+
+    pool.set_detect_callback(detect)
+    pool.set_detectors(detectors)
+    pool.set_stereo_callback(on_result)
+    pool.start(queue_size=queue_size)
+
+    def feed(pairs: List[Tuple[Frame, Frame]]) -> None:
+        target = {label: processed[label] for label in processed}
+        for left, right in pairs:
+            for label, frame in (("left", left), ("right", right)):
+                with done:
+                    while target[label] - processed[label] >= queue_size:
+                        done.wait(timeout=1.0)
+                target[label] += 1
+                pool.enqueue_frame(label, frame)
+        with done:
+            while any(processed[label] < target[label] for label in processed):
+                if not done.wait(timeout=10.0):
+                    raise RuntimeError(f"{mode}: detection stalled")
+
+    try:
+        feed(frames[:10])  # Warm-up (process start-up, detector background models)
+        start = time.perf_counter()
+        feed(frames)
+        elapsed = time.perf_counter() - start
+    finally:
+        pool.stop()
+
+    pair_fps = num_frames / elapsed
+    return {
+        "mode": mode,
+        "frames_per_camera": num_frames,
+        "elapsed_seconds": elapsed,
+        "fps": pair_fps,
+        "frame_time_ms": (elapsed / num_frames) * 1000,
+        "resolution": f"{width}x{height}",
+        "queue_size": queue_size,
+    }
+
+
+def benchmark_threading_modes(
+    num_frames: int = 300,
+    width: int = 1280,
+    height: int = 720,
+    modes: Tuple[str, ...] = THREADING_MODES,
+) -> List[dict]:
+    """Compare stereo detection throughput across DetectionThreadPool modes."""
+    print(f"\n{'='*60}")
+    print(f"Threading Mode Comparison ({width}x{height}, {num_frames} frames per camera)")
+    print(f"{'='*60}")
+    scene = benchmark_scene(width, height)
+    frames = [(scene.camera_frame(i, "left"), scene.camera_frame(i, "right")) for i in range(num_frames)]
+
+    results = [benchmark_threading_mode(mode, width=width, height=height, frames=frames) for mode in modes]
+
+    baseline = results[0]["fps"]
+    print(f"{'Mode':<20} {'pairs/s':>10} {'ms/pair':>10} {'Speedup':>10}")
+    print(f"{'-'*60}")
+    for result in results:
+        result["speedup"] = result["fps"] / baseline
+        print(
+            f"{result['mode']:<20} {result['fps']:>10.2f} "
+            f"{result['frame_time_ms']:>10.2f} {result['speedup']:>9.2f}x"
+        )
+    print(f"{'='*60}\n")
+    return results
+
+
 def print_summary(results: List[dict]) -> None:
     """Print summary table of all results."""
     print(f"\n{'='*60}")
@@ -189,10 +293,17 @@ if __name__ == "__main__":
         action="store_true",
         help="Run benchmark at multiple resolutions",
     )
+    parser.add_argument(
+        "--compare-modes",
+        action="store_true",
+        help="Compare per_camera, worker_pool and process_per_camera on both cameras",
+    )
 
     args = parser.parse_args()
 
-    if args.all_resolutions:
+    if args.compare_modes:
+        benchmark_threading_modes(num_frames=args.frames, width=args.width, height=args.height)
+    elif args.all_resolutions:
         results = benchmark_multiple_resolutions()
         print_summary(results)
     else:
@@ -1,7 +1,8 @@
 """Capture module."""
 
 from .camera_device import CameraDevice, CameraStats
+from .replay_camera import ReplayCamera
 from .simulated_camera import SimulatedCamera
 from .uvc_backend import UvcCamera
 
-__all__ = ["CameraDevice", "CameraStats", "SimulatedCamera", "UvcCamera"]
+__all__ = ["CameraDevice", "CameraStats", "ReplayCamera", "SimulatedCamera", "UvcCamera"]
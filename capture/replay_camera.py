@@ -0,0 +1,211 @@
+"""Replay camera backend that streams a recorded session video."""
+
+from __future__ import annotations
+
+import csv
+import time
+from pathlib import Path
+from typing import Optional
+
+import cv2
+import numpy as np
+
+from contracts import Frame
+from exceptions import CameraConnectionError
+
+from .camera_device import CameraDevice, CameraStats
+
+
+class ReplayCamera(CameraDevice):
+    """Plays back a recorded video with its original capture timestamps.
+
+    Frames carry the camera frame index and ``t_capture_monotonic_ns`` from
+    the recorder's timestamps CSV, so downstream stereo pairing and pitch
+    timing behave as they did live. ``speed`` paces delivery relative to the
+    recorded timeline (1.0 = real time, 4.0 = 4x); 0 delivers frames as fast
+    as they can be decoded. ``read_frame`` raises EOFError at the end of the
+    video.
+
+    Example:
+        >>> camera = ReplayCamera(Path("session/session_left.avi"), speed=0.0)
+        >>> camera.open("left")
+        >>> camera.set_mode(0, 0, 0, "GRAY8")
+        >>> frame = camera.read_frame(timeout_ms=1000)
+    """
+
+    def __init__(
+        self,
+        video_path: Path,
+        timestamps_path: Optional[Path] = None,
+        speed: float = 0.0,
+    ) -> None:
+        """Create a replay camera.
+
+        Args:
+            video_path: Recorded video file
+            timestamps_path: Recorder timestamps CSV, defaults to
+                ``<video stem>_timestamps.csv`` next to the video when present
+            speed: Playback speed multiple of real time, 0 for unthrottled
+        """
+        if timestamps_path is None:
+            candidate = video_path.with_name(f"{video_path.stem}_timestamps.csv")
+            timestamps_path = candidate if candidate.exists() else None
+        self._video_path = video_path
+        self._timestamps_path = timestamps_path
+        self._speed = max(0.0, float(speed))
+        self._serial: Optional[str] = None
+        self._capture: Optional[cv2.VideoCapture] = None
+        self._frame_indices: Optional[np.ndarray] = None
+        self._timestamps_ns: Optional[np.ndarray] = None
+        self._frame_count = 0
+        self._position = 0
+        self._width = 0
+        self._height = 0
+        self._fps = 0.0
+        self._pixfmt = "GRAY8"
+        self._start_wall_ns = 0
+        self._start_capture_ns = 0
+        self._decode_ns = 0
+        self._last_decode_ns = 0
+
+    def open(self, serial: str) -> None:
+        """Open the video; ``serial`` becomes the frames' camera_id.
+
+        Raises:
+            CameraConnectionError: If the video cannot be opened
+        """
+        capture = cv2.VideoCapture(str(self._video_path))
+        if not capture.isOpened():
+            capture.release()
+            raise CameraConnectionError(f"Failed to open replay video: {self._video_path}")
+        self._serial = serial
+        self._capture = capture
+        self._width = int(capture.get(cv2.CAP_PROP_FRAME_WIDTH))
+        self._height = int(capture.get(cv2.CAP_PROP_FRAME_HEIGHT))
+        self._fps = capture.get(cv2.CAP_PROP_FPS) or 30.0
+        self._frame_count = int(capture.get(cv2.CAP_PROP_FRAME_COUNT))
+        if self._timestamps_path is not None:
+            self._frame_indices, self._timestamps_ns = _read_timestamps_csv(self._timestamps_path)
+            self._frame_count = min(self._frame_count, len(self._timestamps_ns))
+        self._position = 0
+        self._start_wall_ns = 0
+        self._decode_ns = 0
+
+    def set_mode(self, width: int, height: int, fps: int, pixfmt: str, flip_180: bool = False) -> None:
+        """Select the delivered pixel format.
+
+        Frames are delivered at the recorded resolution and orientation (the
+        recorder stores frames after any flip), so only ``pixfmt`` applies.
+        """
+        self._pixfmt = pixfmt
+
+    def set_controls(
+        self,
+        exposure_us: int,
+        gain: float,
+        wb_mode: Optional[str],
+        wb: Optional[int],
+    ) -> None:
+        return None
+
+    def read_frame(self, timeout_ms: int) -> Frame:
+        """Decode the next frame, waiting for its replay time when paced.
+
+        Raises:
+            RuntimeError: If the camera is not open
+            EOFError: At the end of the recording
+        """
+        if self._capture is None:
+            raise RuntimeError("Camera not opened.")
+        if self._position >= self._frame_count:
+            raise EOFError(f"Replay finished: {self._video_path}")
+
+        t_capture_ns = self.peek_timestamp_ns()
+        if self._speed > 0:
+            self._wait_for(t_capture_ns)
+
+        started = time.perf_counter_ns()
+        ok, image = self._capture.read()
+        if not ok or image is None:
+            self._frame_count = self._position
+            raise EOFError(f"Replay finished: {self._video_path}")
+        if self._pixfmt == "GRAY8" and image.ndim == 3:
+            image = cv2.cvtColor(image, cv2.COLOR_BGR2GRAY)
+        self._last_decode_ns = time.perf_counter_ns() - started
+        self._decode_ns += self._last_decode_ns
+
+        if self._frame_indices is not None:
+            frame_index = int(self._frame_indices[self._position])
+        else:
+            frame_index = self._position
+        self._position += 1
+        return Frame(
+            camera_id=self._serial or "replay",
+            frame_index=frame_index,
+            t_capture_monotonic_ns=t_capture_ns,
+            image=image,
+            width=image.shape[1],
+            height=image.shape[0],
+            pixfmt=self._pixfmt,
+        )
+
+    def peek_timestamp_ns(self) -> Optional[int]:
+        """Capture timestamp of the next frame, or None at the end of the recording."""
+        if self._position >= self._frame_count:
+            return None
+        if self._timestamps_ns is not None:
+            return int(self._timestamps_ns[self._position])
+        return int(self._position * 1e9 / self._fps)
+
+    @property
+    def last_decode_ns(self) -> int:
+        """Decode (and grayscale conversion) time of the last frame, excluding pacing."""
+        return self._last_decode_ns
+
+    @property
+    def frame_count(self) -> int:
+        """Frames available for replay (known once opened)."""
+        return self._frame_count
+
+    @property
+    def fps(self) -> float:
+        """Recorded frame rate."""
+        return self._fps
+
+    def get_stats(self) -> CameraStats:
+        decode_ms = self._decode_ns / 1e6 / self._position if self._position else 0.0
+        return CameraStats(
+            fps_avg=float(self._fps),
+            fps_instant=float(self._fps),
+            jitter_p95_ms=0.0,
+            dropped_frames=0,
+            queue_depth=0,
+            capture_latency_ms=decode_ms,
+        )
+
+    def close(self) -> None:
+        if self._capture is not None:
+            self._capture.release()
+            self._capture = None
+
+    def _wait_for(self, t_capture_ns: int) -> None:
+        """Sleep until a frame's scaled offset from the first replayed frame."""
+        now = time.monotonic_ns()
+        if not self._start_wall_ns:
+            self._start_wall_ns = now
+            self._start_capture_ns = t_capture_ns
+            return
+        due = self._start_wall_ns + int((t_capture_ns - self._start_capture_ns) / self._speed)
+        if due > now:
+            time.sleep((due - now) / 1e9)
+
+
+def _read_timestamps_csv(path: Path) -> tuple[np.ndarray, np.ndarray]:
+    """Read (frame_index, t_capture_monotonic_ns) columns from a recorder CSV."""
+    frame_indices = []
+    timestamps = []
+    with path.open("r", newline="") as handle:
+        for row in csv.DictReader(handle):
+            frame_indices.append(int(row["frame_index"]))
+            timestamps.append(int(row["t_capture_monotonic_ns"]))
+    return np.asarray(frame_indices, dtype=np.int64), np.asarray(timestamps, dtype=np.int64)
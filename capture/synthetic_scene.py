@@ -0,0 +1,355 @@
+"""Synthetic stereo scenes of a pitched ball for benchmarks and accuracy tests.
+
+Renders left/right frames of a ball flying along a simulated drag trajectory
+over a textured background, projected through a rectified StereoGeometry the
+same way SimpleStereoMatcher triangulates. Each rendered pair carries the
+ground-truth 3D position and the per-camera detections the detector should
+find, so benchmarks exercise realistic connected-component and filter costs
+and accuracy tests can score against known truth.
+"""
+
+from __future__ import annotations
+
+import math
+from dataclasses import dataclass, field
+from typing import Iterator, List, Optional, Tuple
+
+import cv2
+import numpy as np
+
+from contracts import Detection, Frame, StereoObservation
+from stereo.simple_stereo import StereoGeometry
+from trajectory.sim import FlightConfig, simulate_flight
+
+_NOISE_BANK_SIZE = 8
+_SUBPIXEL_SHIFT = 4  # cv2.circle fractional bits
+
+
+@dataclass(frozen=True)
+class SceneConfig:
+    """Rendering parameters for a synthetic stereo scene.
+
+    Attributes:
+        width: Frame width in pixels
+        height: Frame height in pixels
+        fps: Frame rate (sets the timestamps and trajectory sampling)
+        frames: Number of stereo pairs in the scene
+        pitch_every_frames: A new pitch is released every N frames
+        lead_in_frames: Ball-free frames before the first release
+        start_ns: Capture timestamp of frame 0
+        right_offset_ns: Right camera timestamp offset (trigger skew)
+        flight: Release state and drag of each pitch
+        ball_radius_ft: Ball radius (regulation baseball by default)
+        ball_intensity: Ball gray level
+        background_z_ft: Depth of the background plane (sets its disparity)
+        background_level: Mean background gray level
+        texture_contrast: Peak-to-peak amplitude of the background texture
+        texture_scale_px: Feature size of the background texture
+        flicker_amplitude: Relative gain modulation of the lighting
+        flicker_hz: Apparent flicker frequency (mains flicker aliased by the frame rate)
+        noise_sigma: Per-pixel sensor noise (gray levels)
+        pixfmt: "GRAY8" or a color format (frames are then BGR)
+        seed: Random seed for texture and noise
+    """
+    width: int = 1280
+    height: int = 720
+    fps: float = 60.0
+    frames: int = 60
+    pitch_every_frames: int = 60
+    lead_in_frames: int = 5
+    start_ns: int = 1_000_000_000
+    right_offset_ns: int = 0
+    flight: FlightConfig = field(default_factory=FlightConfig)
+    ball_radius_ft: float = 1.45 / 12.0
+    ball_intensity: int = 235
+    background_z_ft: float = 90.0
+    background_level: float = 90.0
+    texture_contrast: float = 50.0
+    texture_scale_px: int = 24
+    flicker_amplitude: float = 0.02
+    flicker_hz: float = 1.5
+    noise_sigma: float = 1.5
+    pixfmt: str = "GRAY8"
+    seed: int = 7
+
+
+@dataclass(frozen=True)
+class SceneTruth:
+    """Ground truth for one stereo pair.
+
+    Attributes:
+        t_ns: Capture timestamp (left camera)
+        position_ft: Ball position (X, Y, Z) in the left camera frame, None between pitches
+        left: Detection the left camera should report, None if the ball is not visible
+        right: Detection the right camera should report, None if the ball is not visible
+        pitch_index: Pitch number (0-based), -1 between pitches
+    """
+    t_ns: int
+    position_ft: Optional[Tuple[float, float, float]] = None
+    left: Optional[Detection] = None
+    right: Optional[Detection] = None
+    pitch_index: int = -1
+
+    @property
+    def visible(self) -> bool:
+        """True if the ball is visible in both cameras."""
+        return self.left is not None and self.right is not None
+
+
+@dataclass(frozen=True)
+class SceneFrame:
+    """A rendered stereo pair with its ground truth."""
+    index: int
+    left: Frame
+    right: Frame
+    truth: SceneTruth
+
+
+def default_geometry(width: int = 1280, height: int = 720) -> StereoGeometry:
+    """Stereo geometry matching configs/default.yaml for a given resolution."""
+    return StereoGeometry(
+        baseline_ft=1.625,
+        focal_length_px=1200.0 * width / 1280.0,
+        cx=width / 2.0,
+        cy=height / 2.0,
+        epipolar_epsilon_px=3.0,
+        z_min_ft=3.0,
+        z_max_ft=80.0,
+    )
+
+
+class StereoScene:
+    """Deterministic synthetic stereo sequence with ground truth.
+
+    Frames are rendered on demand, so long sequences do not have to be held
+    in memory; the background texture and a small bank of sensor-noise
+    fields are generated once per scene.
+
+    Example:
+        >>> scene = StereoScene(default_geometry(), SceneConfig(frames=120))
+        >>> for pair in scene:
+        ...     left_dets = detector.detect(pair.left)
+        ...     expected = pair.truth.left
+    """
+
+    def __init__(
+        self,
+        geometry: StereoGeometry,
+        config: Optional[SceneConfig] = None,
+        left_id: str = "left",
+        right_id: str = "right",
+    ):
+        """Build a scene.
+
+        Args:
+            geometry: Rectified stereo geometry used to project the ball
+            config: Rendering parameters
+            left_id: Left camera ID stamped on frames and detections
+            right_id: Right camera ID stamped on frames and detections
+        """
+        self._geometry = geometry
+        self._config = config or SceneConfig()
+        self._ids = (left_id, right_id)
+        self._period_ns = int(round(1e9 / self._config.fps))
+        rng = np.random.default_rng(self._config.seed)
+        self._backgrounds = self._build_backgrounds(rng)
+        self._noise = self._build_noise_bank(rng)
+        self._truth = self._build_truth()
+
+    def __len__(self) -> int:
+        return self._config.frames
+
+    def __iter__(self) -> Iterator[SceneFrame]:
+        for index in range(len(self)):
+            yield self.render(index)
+
+    @property
+    def config(self) -> SceneConfig:
+        return self._config
+
+    @property
+    def geometry(self) -> StereoGeometry:
+        return self._geometry
+
+    @property
+    def truth(self) -> List[SceneTruth]:
+        """Ground truth for every frame, without rendering."""
+        return list(self._truth)
+
+    def observations(self) -> List[StereoObservation]:
+        """Noise-free stereo observations for frames where the ball is visible in both cameras."""
+        result = []
+        for truth in self._truth:
+            if not truth.visible:
+                continue
+            x, y, z = truth.position_ft
+            result.append(
+                StereoObservation(
+                    t_ns=truth.t_ns,
+                    left=(truth.left.u, truth.left.v),
+                    right=(truth.right.u, truth.right.v),
+                    X=x,
+                    Y=y,
+                    Z=z,
+                    quality=1.0,
+                    confidence=1.0,
+                )
+            )
+        return result
+
+    def render(self, index: int) -> SceneFrame:
+        """Render stereo pair ``index``.
+
+        Raises:
+            IndexError: If index is outside the scene
+        """
+        if not 0 <= index < len(self):
+            raise IndexError(f"Scene frame {index} out of range (0-{len(self) - 1})")
+        return SceneFrame(
+            index=index,
+            left=self.camera_frame(index, "left"),
+            right=self.camera_frame(index, "right"),
+            truth=self._truth[index],
+        )
+
+    def camera_frame(
+        self,
+        index: int,
+        camera: str = "left",
+        t_capture_ns: Optional[int] = None,
+    ) -> Frame:
+        """Render one camera's frame, cycling through the scene for open-ended runs.
+
+        Args:
+            index: Frame number; frames past the end repeat the scene
+            camera: "left" or "right"
+            t_capture_ns: Override the capture timestamp (defaults to the scene timeline)
+
+        Returns:
+            Frame with ``frame_index`` set to ``index``
+        """
+        cfg = self._config
+        side = 1 if camera == "right" else 0
+        truth = self._truth[index % len(self._truth)]
+        if t_capture_ns is None:
+            t_capture_ns = cfg.start_ns + index * self._period_ns + (cfg.right_offset_ns if side else 0)
+        detection = truth.right if side else truth.left
+        return Frame(
+            camera_id=self._ids[side],
+            frame_index=index,
+            t_capture_monotonic_ns=t_capture_ns,
+            image=self._render_image(side, index, t_capture_ns, detection),
+            width=cfg.width,
+            height=cfg.height,
+            pixfmt=cfg.pixfmt,
+        )
+
+    def _render_image(self, camera: int, index: int, t_ns: int, detection: Optional[Detection]) -> np.ndarray:
+        cfg = self._config
+        gain = 1.0 + cfg.flicker_amplitude * math.sin(2.0 * math.pi * cfg.flicker_hz * t_ns / 1e9)
+        noise = self._noise[(index + camera * 3) % len(self._noise)]
+        image = self._backgrounds[camera] * gain + noise
+        if detection is not None:
+            scale = 1 << _SUBPIXEL_SHIFT
+            cv2.circle(
+                image,
+                (int(round(detection.u * scale)), int(round(detection.v * scale))),
+                max(1, int(round(detection.radius_px * scale))),
+                float(cfg.ball_intensity),
+                -1,
+                cv2.LINE_AA,
+                _SUBPIXEL_SHIFT,
+            )
+        image = np.clip(image, 0, 255).astype(np.uint8)
+        if cfg.pixfmt != "GRAY8":
+            image = cv2.cvtColor(image, cv2.COLOR_GRAY2BGR)
+        return image
+
+    def _build_backgrounds(self, rng: np.random.Generator) -> Tuple[np.ndarray, np.ndarray]:
+        """Left/right views of one textured plane at background_z_ft."""
+        cfg = self._config
+        geo = self._geometry
+        disparity = int(round(geo.focal_length_px * geo.baseline_ft / cfg.background_z_ft))
+        pad = disparity + 1
+        width = cfg.width + pad * 2
+        scale = max(2, cfg.texture_scale_px)
+        coarse = rng.random((cfg.height // scale + 2, width // scale + 2)).astype(np.float32)
+        texture = cv2.resize(coarse, (width, cfg.height), interpolation=cv2.INTER_CUBIC)
+        fine = cv2.GaussianBlur(rng.random((cfg.height, width)).astype(np.float32), (0, 0), 1.5)
+        gradient = np.linspace(-0.5, 0.5, cfg.height, dtype=np.float32)[:, None]
+        plane = cfg.background_level + cfg.texture_contrast * (
+            (texture - 0.5) + 0.3 * (fine - 0.5) + 0.4 * gradient
+        )
+        # A plane point at column c is seen at c - pad on the left and c - pad - disparity on the right
+        left = np.ascontiguousarray(plane[:, pad:pad + cfg.width])
+        right = np.ascontiguousarray(plane[:, pad + disparity:pad + disparity + cfg.width])
+        return left, right
+
+    def _build_noise_bank(self, rng: np.random.Generator) -> List[np.ndarray]:
+        cfg = self._config
+        if cfg.noise_sigma <= 0:
+            return [np.zeros((cfg.height, cfg.width), dtype=np.float32)]
+        return [
+            rng.normal(0.0, cfg.noise_sigma, (cfg.height, cfg.width)).astype(np.float32)
+            for _ in range(_NOISE_BANK_SIZE)
+        ]
+
+    def _build_truth(self) -> List[SceneTruth]:
+        cfg = self._config
+        period = max(1, cfg.pitch_every_frames)
+        offsets = np.arange(cfg.frames) - cfg.lead_in_frames
+        flight_frames = np.arange(period)
+        positions = simulate_flight(cfg.flight, flight_frames / cfg.fps)
+
+        truth = []
+        for index, offset in enumerate(offsets):
+            t_ns = cfg.start_ns + index * self._period_ns
+            if offset < 0:
+                truth.append(SceneTruth(t_ns=t_ns))
+                continue
+            position = positions[offset % period]
+            left, right = self._project(position, index, t_ns)
+            if left is None and right is None:
+                truth.append(SceneTruth(t_ns=t_ns))
+                continue
+            truth.append(
+                SceneTruth(
+                    t_ns=t_ns,
+                    position_ft=(float(position[0]), float(position[1]), float(position[2])),
+                    left=left,
+                    right=right,
+                    pitch_index=int(offset // period),
+                )
+            )
+        return truth
+
+    def _project(
+        self, position: np.ndarray, index: int, t_ns: int
+    ) -> Tuple[Optional[Detection], Optional[Detection]]:
+        """Project a ball position into both cameras (inverse of SimpleStereoMatcher.triangulate)."""
+        geo = self._geometry
+        x, y, z = (float(value) for value in position)
+        if z < geo.z_min_ft:
+            return None, None
+        f = geo.focal_length_px
+        u_left = f * x / z + geo.cx
+        v = f * y / z + geo.cy
+        u_right = u_left - f * geo.baseline_ft / z
+        radius = f * self._config.ball_radius_ft / z
+        detections = []
+        for camera, u in enumerate((u_left, u_right)):
+            if not (0.0 <= u < self._config.width and 0.0 <= v < self._config.height):
+                detections.append(None)
+                continue
+            detections.append(
+                Detection(
+                    camera_id=self._ids[camera],
+                    frame_index=index,
+                    t_capture_monotonic_ns=t_ns + (self._config.right_offset_ns if camera else 0),
+                    u=u,
+                    v=v,
+                    radius_px=radius,
+                    confidence=1.0,
+                )
+            )
+        return detections[0], detections[1]
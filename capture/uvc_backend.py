@@ -5,9 +5,8 @@ from __future__ import annotations
 import json
 import subprocess
 import time
-from collections import deque
 from dataclasses import dataclass
-from typing import Deque, Optional
+from typing import Optional
 
 import cv2
 
@@ -18,6 +17,7 @@ from exceptions import (
     CameraNotFoundError,
 )
 from log_config.logger import get_logger
+from telemetry import WindowedHistogram
 
 from .camera_device import CameraDevice, CameraStats
 from .timeout_utils import RetryPolicy, retry_on_failure, run_with_timeout
@@ -40,7 +40,7 @@ class UvcCamera(CameraDevice):
         self._friendly_name: Optional[str] = None
         self._capture: Optional[cv2.VideoCapture] = None
         self._stats = _Stats()
-        self._deltas_ns: Deque[int] = deque(maxlen=240)
+        self._deltas_ns = WindowedHistogram(window_s=4.0, slices=8)  # ~240 frames at 60 fps
         self._width = 0
         self._height = 0
         self._fps = 0
@@ -229,7 +229,7 @@ class UvcCamera(CameraDevice):
         now_ns = time.monotonic_ns()
         if self._stats.last_frame_ns:
             delta_ns = now_ns - self._stats.last_frame_ns
-            self._deltas_ns.append(delta_ns)
+            self._deltas_ns.record(delta_ns, now_ns)
             delta_s = delta_ns / 1e9
             if delta_s > 0:
                 self._stats.fps_instant = 1.0 / delta_s
@@ -249,11 +249,7 @@ class UvcCamera(CameraDevice):
         )
 
     def get_stats(self) -> CameraStats:
-        jitter_p95_ms = 0.0
-        if self._deltas_ns:
-            samples = sorted(self._deltas_ns)
-            index = int(0.95 * (len(samples) - 1))
-            jitter_p95_ms = samples[index] / 1e6
+        jitter_p95_ms = self._deltas_ns.snapshot().quantile(0.95) / 1e6
         return CameraStats(
             fps_avg=self._stats.fps_avg,
             fps_instant=self._stats.fps_instant,
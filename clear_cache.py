@@ -1,8 +1,9 @@
 #!/usr/bin/env python3
 """Clear all Python bytecode cache files.
 
-NOTE: As of recent versions, launcher.py automatically clears cache on startup,
-so you typically don't need to run this script manually.
+NOTE: launcher.py automatically clears the cache on the first launch after an
+update (new version or git commit), so you typically don't need to run this
+script manually.
 
 Use this script when:
 - Running tests or scripts directly (not via launcher.py)
@@ -0,0 +1,277 @@
+"""Cache of parsed configuration files.
+
+load_config() is called over and over - by review mode, the batch tools
+(record/analyze_video.py, record/training_report.py) and most dialogs - and
+each call used to parse the YAML and run schema validation again. ConfigCache
+keeps the validated config per file instead:
+
+- In memory, keyed by resolved path and the SHA-256 of the file's bytes. The
+  file is still read on every call, so edits are always picked up, but it is
+  only parsed and validated when its content changed.
+- On disk, as pickled snapshots in a per-user cache directory (see
+  default_cache_dir()), never next to the YAML. A snapshot is named after the
+  YAML digest and config fingerprint, so a new process loading the same
+  content under the same schema skips parsing and validation altogether.
+  Each snapshot starts with a JSON header carrying those digests and the
+  SHA-256 of the pickled payload; the payload is only unpickled when all of
+  them match. Snapshots are written only for configs that loaded cleanly;
+  stale or unreadable ones are ignored and replaced.
+- Listeners added with subscribe() are called with ``(path, config)`` when a
+  cached file's content changes, so holders of a config can update in place
+  instead of re-reading it. refresh() re-checks every cached file.
+
+Every caller and listener gets its own deep copy of the cached config, so
+editing one (e.g. the ``ball.radius_in`` dict) cannot leak into the others.
+"""
+
+from __future__ import annotations
+
+import copy
+import hashlib
+import json
+import os
+import pickle
+import sys
+import threading
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional
+
+from log_config.logger import get_logger
+
+logger = get_logger(__name__)
+
+SNAPSHOT_VERSION = 2
+CACHE_DIR_ENV_VAR = "PITCHTRACKER_CONFIG_CACHE"
+
+# Parses and validates one file: loader(path, content) -> config
+ConfigLoader = Callable[[Path, bytes], Any]
+
+# Called as listener(path, config) after a cached file changed
+ConfigListener = Callable[[Path, Any], None]
+
+
+def default_cache_dir() -> Path:
+    """Snapshot directory: $PITCHTRACKER_CONFIG_CACHE, else the user cache dir.
+
+    That is %LOCALAPPDATA%/PitchTracker/config-cache on Windows and
+    $XDG_CACHE_HOME/pitchtracker/config (default ~/.cache) elsewhere.
+    """
+    override = os.environ.get(CACHE_DIR_ENV_VAR)
+    if override:
+        return Path(override)
+    if sys.platform == "win32" and os.environ.get("LOCALAPPDATA"):
+        return Path(os.environ["LOCALAPPDATA"]) / "PitchTracker" / "config-cache"
+    base = os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache"
+    return Path(base) / "pitchtracker" / "config"
+
+
+@dataclass
+class _Entry:
+    digest: str
+    fingerprint: str
+    config: Any
+    loader: ConfigLoader
+
+
+class ConfigCache:
+    """Validated configs keyed by file path and content digest.
+
+    Thread-safe.
+
+    Example:
+        >>> cache = get_config_cache()
+        >>> config = cache.load(Path("configs/default.yaml"), parse_config)
+        >>> cache.subscribe(lambda path, config: print(f"{path} changed"))
+    """
+
+    def __init__(self, snapshots: bool = True, cache_dir: Optional[Path] = None) -> None:
+        """Initialize config cache.
+
+        Args:
+            snapshots: Read and write on-disk snapshots
+            cache_dir: Snapshot directory (defaults to default_cache_dir())
+        """
+        self._snapshots = snapshots
+        self._cache_dir = Path(cache_dir) if cache_dir is not None else default_cache_dir()
+        self._entries: Dict[Path, _Entry] = {}
+        self._listeners: List[ConfigListener] = []
+        self._lock = threading.Lock()
+        self._stats = {"hits": 0, "snapshot_loads": 0, "parses": 0}
+
+    @property
+    def cache_dir(self) -> Path:
+        return self._cache_dir
+
+    def load(self, path: Path, loader: ConfigLoader, fingerprint: str = "") -> Any:
+        """Get the config for ``path``, parsing the file only if it changed.
+
+        Args:
+            path: Config file
+            loader: Parses and validates the file; its exceptions propagate
+                and nothing is cached
+            fingerprint: Identifies the schema and config classes; snapshots
+                written under another fingerprint are ignored
+
+        Returns:
+            A copy of the cached config if the content is unchanged, else of
+            the newly loaded one
+
+        Raises:
+            OSError: If the file cannot be read
+        """
+        key = Path(path).resolve()
+        content = key.read_bytes()
+        digest = hashlib.sha256(content).hexdigest()
+        with self._lock:
+            previous = self._entries.get(key)
+            if previous is not None and previous.digest == digest and previous.fingerprint == fingerprint:
+                self._stats["hits"] += 1
+                return copy.deepcopy(previous.config)
+
+        config = self._read_snapshot(digest, fingerprint)
+        if config is not None:
+            logger.debug(f"Loaded configuration snapshot for {key}")
+            stat = "snapshot_loads"
+        else:
+            config = loader(key, content)
+            self._write_snapshot(digest, fingerprint, config)
+            stat = "parses"
+
+        with self._lock:
+            self._stats[stat] += 1
+            self._entries[key] = _Entry(digest, fingerprint, config, loader)
+            listeners = list(self._listeners)
+        if previous is not None and previous.digest != digest:
+            logger.info(f"Configuration {key} changed; notifying {len(listeners)} listener(s)")
+            for listener in listeners:
+                try:
+                    listener(key, copy.deepcopy(config))
+                except Exception as e:
+                    logger.error(f"Configuration listener failed: {e}")
+        return copy.deepcopy(config)
+
+    def refresh(self) -> List[Path]:
+        """Re-check every cached file and reload those whose content changed.
+
+        Listeners are notified for each changed file. A file that can no
+        longer be read or loaded keeps its last good config.
+
+        Returns:
+            Paths whose config changed
+        """
+        with self._lock:
+            entries = dict(self._entries)
+        changed = []
+        for key, entry in entries.items():
+            try:
+                self.load(key, entry.loader, entry.fingerprint)
+            except Exception as e:
+                logger.warning(f"Failed to reload configuration {key}: {e}")
+                continue
+            with self._lock:
+                current = self._entries.get(key)
+            if current is not None and current.digest != entry.digest:
+                changed.append(key)
+        return changed
+
+    def subscribe(self, listener: ConfigListener) -> None:
+        """Call ``listener(path, config)`` whenever a cached config changes.
+
+        Listeners run on the thread that loaded or refreshed the file.
+        """
+        with self._lock:
+            if listener not in self._listeners:
+                self._listeners.append(listener)
+
+    def unsubscribe(self, listener: ConfigListener) -> None:
+        with self._lock:
+            if listener in self._listeners:
+                self._listeners.remove(listener)
+
+    def snapshot_path(self, digest: str, fingerprint: str) -> Path:
+        """Snapshot file for a YAML content digest under a config fingerprint."""
+        key = hashlib.sha256(f"{SNAPSHOT_VERSION}:{fingerprint}:{digest}".encode("ascii")).hexdigest()
+        return self._cache_dir / f"{key}.snapshot"
+
+    def clear(self) -> None:
+        """Forget all cached configs (snapshots on disk are kept)."""
+        with self._lock:
+            self._entries.clear()
+
+    def get_stats(self) -> Dict[str, int]:
+        """Counts of cache hits, snapshot loads and full parses."""
+        with self._lock:
+            return dict(self._stats)
+
+    def _read_snapshot(self, digest: str, fingerprint: str) -> Optional[Any]:
+        if not self._snapshots:
+            return None
+        path = self.snapshot_path(digest, fingerprint)
+        try:
+            with open(path, "rb") as f:
+                header = json.loads(f.readline())
+                payload = f.read()
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            logger.debug(f"Ignoring unreadable configuration snapshot {path}: {e}")
+            return None
+        expected = _snapshot_header(digest, fingerprint, hashlib.sha256(payload).hexdigest())
+        if header != expected:
+            logger.debug(f"Ignoring mismatched configuration snapshot {path}")
+            return None
+        try:
+            return pickle.loads(payload)
+        except Exception as e:
+            logger.debug(f"Ignoring unreadable configuration snapshot {path}: {e}")
+            return None
+
+    def _write_snapshot(self, digest: str, fingerprint: str, config: Any) -> None:
+        if not self._snapshots:
+            return
+        target = self.snapshot_path(digest, fingerprint)
+        tmp_path = target.with_name(f"{target.name}.{os.getpid()}.tmp")
+        try:
+            payload = pickle.dumps(config, protocol=pickle.HIGHEST_PROTOCOL)
+            header = _snapshot_header(digest, fingerprint, hashlib.sha256(payload).hexdigest())
+            target.parent.mkdir(parents=True, exist_ok=True)
+            with open(tmp_path, "wb") as f:
+                f.write(json.dumps(header).encode("ascii") + b"\n")
+                f.write(payload)
+            os.replace(tmp_path, target)
+        except Exception as e:
+            logger.debug(f"Failed to write configuration snapshot {target}: {e}")
+            try:
+                tmp_path.unlink()
+            except OSError:
+                pass
+
+
+def _snapshot_header(digest: str, fingerprint: str, payload_sha256: str) -> dict:
+    return {
+        "version": SNAPSHOT_VERSION,
+        "digest": digest,
+        "fingerprint": fingerprint,
+        "payload_sha256": payload_sha256,
+    }
+
+
+# Global config cache instance
+_config_cache: Optional[ConfigCache] = None
+_config_cache_lock = threading.Lock()
+
+
+def get_config_cache() -> ConfigCache:
+    """Get the global config cache (used by configs.settings.load_config)."""
+    global _config_cache
+
+    if _config_cache is None:
+        with _config_cache_lock:
+            if _config_cache is None:
+                _config_cache = ConfigCache()
+
+    return _config_cache
+
+
+__all__ = ["CACHE_DIR_ENV_VAR", "ConfigCache", "ConfigListener", "default_cache_dir", "get_config_cache"]
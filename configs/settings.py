@@ -2,13 +2,17 @@
 
 from __future__ import annotations
 
-from dataclasses import dataclass
+import hashlib
+import json
+from dataclasses import dataclass, fields
+from functools import lru_cache
 from pathlib import Path
 from typing import Dict, Optional, Tuple
 
 import yaml
 
-from configs.validator import validate_config
+from configs.config_cache import get_config_cache
+from configs.validator import CONFIG_SCHEMA, validate_config
 from exceptions import ConfigError, InvalidConfigError
 from log_config.logger import get_logger
 
@@ -80,16 +84,22 @@ class RecordingConfig:
     save_observations: bool = False
     save_training_frames: bool = False
     frame_save_interval: int = 5
+    telemetry_format: str = "npz"  # "npz" (columnar) or "json" (legacy)
+    frame_format: str = "png"  # Training frames: "png", "webp" or "jpg"
+    frame_compression: Optional[int] = None  # PNG level, WebP/JPEG quality (None = format default)
 
 
 @dataclass(frozen=True)
 class UiConfig:
     refresh_hz: int
+    engine_process: bool = False  # Run capture/detection in a separate engine process
 
 
 @dataclass(frozen=True)
 class TelemetryConfig:
     latency_p95_ms_warn: int
+    trace_enabled: bool = True  # Per-stage pipeline latency tracing
+    trace_capacity: int = 4096  # Frames per camera kept for Chrome trace dumps
 
 
 @dataclass(frozen=True)
@@ -159,9 +169,31 @@ class AppConfig:
     upload: UploadConfig
 
 
+# Classes whose shape is baked into cached config snapshots
+_CONFIG_CLASSES = (
+    CameraConfig,
+    StereoConfig,
+    TrackingConfig,
+    MetricsConfig,
+    RecordingConfig,
+    UiConfig,
+    TelemetryConfig,
+    DetectorFiltersConfig,
+    DetectorConfig,
+    StrikeZoneConfig,
+    BallConfig,
+    UploadConfig,
+    AppConfig,
+)
+
+
 def load_config(path: Path) -> AppConfig:
     """Load and validate configuration from YAML file.
 
+    Loaded configs are cached per file (see configs.config_cache): while the
+    file's content is unchanged, repeated calls return a copy of the cached
+    AppConfig without parsing YAML or running schema validation.
+
     Args:
         path: Path to configuration file
 
@@ -171,12 +203,31 @@ def load_config(path: Path) -> AppConfig:
     Raises:
         ConfigError: If configuration is invalid or cannot be loaded
     """
+    path = Path(path)
+    if not path.exists():
+        logger.error(f"Configuration file not found: {path}")
+        raise InvalidConfigError(f"Configuration file not found: {path}")
     try:
-        logger.info(f"Loading configuration from {path}")
-        if not path.exists():
-            raise InvalidConfigError(f"Configuration file not found: {path}")
+        return get_config_cache().load(path, _parse_config, _config_fingerprint())
+    except OSError as e:
+        logger.error(f"Failed to read configuration file: {e}")
+        raise InvalidConfigError(f"Failed to read configuration file: {e}")
+
 
-        data = yaml.safe_load(path.read_text())
+@lru_cache(maxsize=1)
+def _config_fingerprint() -> str:
+    """Digest of the schema and config classes; snapshots from other versions are ignored."""
+    parts = [json.dumps(CONFIG_SCHEMA, sort_keys=True)]
+    for cls in _CONFIG_CLASSES:
+        parts.append(f"{cls.__name__}(" + ", ".join(f"{f.name}: {f.type}" for f in fields(cls)) + ")")
+    return hashlib.sha256("\n".join(parts).encode("utf-8")).hexdigest()
+
+
+def _parse_config(path: Path, content: bytes) -> AppConfig:
+    """Parse and validate configuration file content (uncached)."""
+    try:
+        logger.info(f"Loading configuration from {path}")
+        data = yaml.safe_load(content)
 
         # Validate against JSON Schema
         validate_config(data)
@@ -2,7 +2,8 @@
 
 from __future__ import annotations
 
-from typing import Any, Dict
+import threading
+from typing import Any, Dict, Optional
 
 import jsonschema
 from jsonschema import Draft7Validator, validators
@@ -97,18 +98,39 @@ CONFIG_SCHEMA = {
                 "output_dir": {"type": "string"},
                 "session_min_active_frames": {"type": "integer", "minimum": 1},
                 "session_end_gap_frames": {"type": "integer", "minimum": 1},
+                "telemetry_format": {"type": "string", "enum": ["npz", "json"]},
+                "frame_format": {"type": "string", "enum": ["png", "webp", "jpg"]},
+                "frame_compression": {"type": ["integer", "null"], "minimum": 0, "maximum": 101},
             },
+            # frame_compression range depends on frame_format (png is the default format)
+            "allOf": [
+                {
+                    "if": {"properties": {"frame_format": {"const": "png"}}},
+                    "then": {"properties": {"frame_compression": {"maximum": 9}}},
+                },
+                {
+                    "if": {"properties": {"frame_format": {"const": "webp"}}, "required": ["frame_format"]},
+                    "then": {"properties": {"frame_compression": {"minimum": 1}}},
+                },
+                {
+                    "if": {"properties": {"frame_format": {"const": "jpg"}}, "required": ["frame_format"]},
+                    "then": {"properties": {"frame_compression": {"maximum": 100}}},
+                },
+            ],
         },
         "ui": {
             "type": "object",
             "properties": {
                 "refresh_hz": {"type": "number", "minimum": 1, "maximum": 60},
+                "engine_process": {"type": "boolean"},
             },
         },
         "telemetry": {
             "type": "object",
             "properties": {
                 "latency_p95_ms_warn": {"type": "number", "minimum": 10, "maximum": 5000},
+                "trace_enabled": {"type": "boolean"},
+                "trace_capacity": {"type": "integer", "minimum": 16, "maximum": 1048576},
             },
         },
         "detector": {
@@ -192,6 +214,26 @@ def extend_with_default(validator_class):
 
 DefaultValidatingValidator = extend_with_default(Draft7Validator)
 
+_validator: Optional[Draft7Validator] = None
+_validator_lock = threading.Lock()
+
+
+def get_config_validator() -> Draft7Validator:
+    """Get the compiled validator for CONFIG_SCHEMA.
+
+    The schema is checked and compiled on first use and reused afterwards.
+
+    Raises:
+        jsonschema.exceptions.SchemaError: If CONFIG_SCHEMA itself is invalid
+    """
+    global _validator
+    if _validator is None:
+        with _validator_lock:
+            if _validator is None:
+                DefaultValidatingValidator.check_schema(CONFIG_SCHEMA)
+                _validator = DefaultValidatingValidator(CONFIG_SCHEMA)
+    return _validator
+
 
 def validate_config(config: Dict[str, Any]) -> None:
     """Validate configuration against JSON Schema.
@@ -203,8 +245,7 @@ def validate_config(config: Dict[str, Any]) -> None:
         ConfigValidationError: If configuration is invalid
     """
     try:
-        validator = DefaultValidatingValidator(CONFIG_SCHEMA)
-        errors = list(validator.iter_errors(config))
+        errors = list(get_config_validator().iter_errors(config))
 
         if errors:
             error_messages = []
@@ -254,4 +295,4 @@ def validate_config_file(config_path: str) -> None:
     validate_config(config)
 
 
-__all__ = ["validate_config", "validate_config_file", "CONFIG_SCHEMA"]
+__all__ = ["validate_config", "validate_config_file", "get_config_validator", "CONFIG_SCHEMA"]
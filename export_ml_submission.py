@@ -1,6 +1,8 @@
 """Export ML training submission packages for cloud upload.
 
 Creates ZIP packages containing session data for ML model training.
+Detections and observations recorded as npz tables are packaged as the JSON
+documents described in CLOUD_SUBMISSION_SCHEMA.md, converted at package time.
 Supports two variants:
   - full: Videos + all ML data (4-5 GB, enables all 5 models)
   - telemetry_only: JSON metadata only (50-100 MB, enables 2 of 5 models)
@@ -27,11 +29,16 @@ Usage:
 import argparse
 import hashlib
 import json
+import os
+import struct
 import time
-import zipfile
+import zlib
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass
 from pathlib import Path
-from typing import Dict, Any, Optional, List
+from typing import Any, BinaryIO, Callable, Dict, List, Optional, Tuple
 
+from app.pipeline.recording.telemetry_store import table_json
 from contracts.versioning import APP_VERSION, SCHEMA_VERSION
 
 
@@ -104,6 +111,12 @@ def parse_args() -> argparse.Namespace:
         default="privacy_preserving",
         help="Reason for telemetry-only (if applicable)",
     )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=None,
+        help="Compression threads for text/JSON members (default: CPU count, max 8)",
+    )
     return parser.parse_args()
 
 
@@ -172,15 +185,9 @@ def collect_files_to_package(
                 if f.exists():
                     files["pitch_videos"].append(f)
 
-        # Detections (always included if present)
-        detections_dir = pitch_dir / "detections"
-        if detections_dir.exists():
-            files["detections"].extend(detections_dir.glob("*.json"))
-
-        # Observations (always included if present)
-        observations_dir = pitch_dir / "observations"
-        if observations_dir.exists():
-            files["observations"].extend(observations_dir.glob("*.json"))
+        # Detections and observations (always included if present)
+        files["detections"].extend(_telemetry_files(pitch_dir / "detections"))
+        files["observations"].extend(_telemetry_files(pitch_dir / "observations"))
 
         # Key frames (full package only)
         if submission_type == "full":
@@ -191,6 +198,19 @@ def collect_files_to_package(
     return files
 
 
+def _telemetry_files(directory: Path) -> List[Path]:
+    """JSON telemetry files, plus npz tables that have no JSON export yet.
+
+    The tables are converted to JSON when they are packaged (see archive_name
+    and compress_file).
+    """
+    if not directory.exists():
+        return []
+    json_files = sorted(directory.glob("*.json"))
+    tables = [path for path in sorted(directory.glob("*.npz")) if not path.with_suffix(".json").exists()]
+    return json_files + tables
+
+
 def calculate_total_size(files: Dict[str, List[Path]]) -> int:
     """Calculate total size of all files in bytes.
 
@@ -208,6 +228,365 @@ def calculate_total_size(files: Dict[str, List[Path]]) -> int:
     return total
 
 
+# ---------------------------------------------------------------------------
+# Streaming packager
+# ---------------------------------------------------------------------------
+
+# Members with these suffixes are already compressed and are stored as-is
+STORED_SUFFIXES = {".avi", ".mp4", ".mkv", ".mov", ".png", ".jpg", ".jpeg", ".zip", ".gz"}
+
+ProgressCallback = Callable[[int, int, int, int], None]
+
+# Source bytes whose compression may run ahead of the writer; compressed
+# results wait in memory until their turn
+DEFAULT_LOOKAHEAD_BYTES = 64 * 1024 * 1024
+
+_CHUNK_SIZE = 1024 * 1024
+_ZIP64_MARKER = 0xFFFFFFFF
+_ZIP64_LIMIT = _ZIP64_MARKER
+_ZIP64_COUNT_LIMIT = 0xFFFF
+_FLAG_DATA_DESCRIPTOR = 0x08
+_FLAG_UTF8 = 0x800
+_METHOD_STORED = 0
+_METHOD_DEFLATED = 8
+
+
+@dataclass
+class _Member:
+    """Central directory record for one written member."""
+    name: bytes
+    flags: int
+    method: int
+    dos_time: int
+    dos_date: int
+    crc: int
+    compressed_size: int
+    size: int
+    offset: int
+    external_attr: int
+
+
+class _HashingSink:
+    """Write-only file wrapper that hashes and counts bytes as they are written."""
+
+    def __init__(self, handle: BinaryIO):
+        self._handle = handle
+        self.sha256 = hashlib.sha256()
+        self.position = 0
+
+    def write(self, data: bytes) -> None:
+        self._handle.write(data)
+        self.sha256.update(data)
+        self.position += len(data)
+
+
+class StreamingZipWriter:
+    """Single-pass ZIP writer that hashes the archive while writing it.
+
+    Each member is written exactly once: stored members are streamed from
+    disk, deflated members arrive already compressed (so compression can run
+    in worker threads). ZIP64 records are emitted when sizes or offsets need
+    them, so multi-GB sessions are supported.
+
+    Example:
+        >>> with open("package.zip", "wb") as f:
+        ...     writer = StreamingZipWriter(f)
+        ...     writer.write_stored_file(Path("left.avi"), "session/left.avi")
+        ...     writer.write_compressed("a.json", *compress_file(Path("a.json")), mtime=time.time())
+        ...     writer.close()
+        >>> print(writer.sha256_hex)
+    """
+
+    def __init__(self, handle: BinaryIO):
+        """Initialize writer.
+
+        Args:
+            handle: Output file opened for binary writing
+        """
+        self._sink = _HashingSink(handle)
+        self._members: List[_Member] = []
+        self._closed = False
+
+    @property
+    def bytes_written(self) -> int:
+        return self._sink.position
+
+    @property
+    def sha256_hex(self) -> str:
+        """SHA-256 of everything written so far."""
+        return self._sink.sha256.hexdigest()
+
+    def write_stored_file(self, path: Path, arcname: str) -> int:
+        """Stream a file into the archive without compression.
+
+        Returns:
+            Number of file bytes written
+        """
+        stat = path.stat()
+        member = self._start_member(
+            arcname, _METHOD_STORED, stat.st_mtime, stat.st_mode, _FLAG_DATA_DESCRIPTOR
+        )
+        self._write_local_header(member, zip64=stat.st_size >= _ZIP64_LIMIT)
+
+        crc = 0
+        size = 0
+        with open(path, "rb") as f:
+            while chunk := f.read(_CHUNK_SIZE):
+                crc = zlib.crc32(chunk, crc)
+                size += len(chunk)
+                self._sink.write(chunk)
+
+        member.crc, member.compressed_size, member.size = crc, size, size
+        if stat.st_size >= _ZIP64_LIMIT:
+            self._sink.write(struct.pack("<4sLQQ", b"PK\x07\x08", crc, size, size))
+        else:
+            self._sink.write(struct.pack("<4sLLL", b"PK\x07\x08", crc, size, size))
+        self._members.append(member)
+        return size
+
+    def write_compressed(
+        self, arcname: str, data: bytes, crc: int, size: int, mtime: float, mode: int = 0o100644
+    ) -> None:
+        """Write a member whose raw-deflate payload was produced by compress_bytes."""
+        member = self._start_member(arcname, _METHOD_DEFLATED, mtime, mode, 0)
+        member.crc, member.compressed_size, member.size = crc, len(data), size
+        self._write_local_header(member, zip64=max(size, len(data)) >= _ZIP64_LIMIT)
+        self._sink.write(data)
+        self._members.append(member)
+
+    def payload_sha256(self) -> str:
+        """SHA-256 of the members written so far (taken before the central directory)."""
+        return self._sink.sha256.copy().hexdigest()
+
+    def close(self) -> None:
+        """Write the central directory and end records."""
+        if self._closed:
+            return
+        self._closed = True
+        cd_offset = self._sink.position
+        for member in self._members:
+            self._write_central_header(member)
+        cd_size = self._sink.position - cd_offset
+        count = len(self._members)
+
+        if count >= _ZIP64_COUNT_LIMIT or cd_offset >= _ZIP64_LIMIT or cd_size >= _ZIP64_LIMIT:
+            zip64_offset = self._sink.position
+            self._sink.write(struct.pack(
+                "<4sQHHLLQQQQ", b"PK\x06\x06", 44, 45, 45, 0, 0, count, count, cd_size, cd_offset
+            ))
+            self._sink.write(struct.pack("<4sLQL", b"PK\x06\x07", 0, zip64_offset, 1))
+            count = min(count, _ZIP64_COUNT_LIMIT)
+            cd_size = min(cd_size, _ZIP64_MARKER)
+            cd_offset = min(cd_offset, _ZIP64_MARKER)
+        self._sink.write(struct.pack("<4s4H2LH", b"PK\x05\x06", 0, 0, count, count, cd_size, cd_offset, 0))
+
+    def _start_member(self, arcname: str, method: int, mtime: float, mode: int, flags: int) -> _Member:
+        try:
+            name = arcname.encode("ascii")
+        except UnicodeEncodeError:
+            name = arcname.encode("utf-8")
+            flags |= _FLAG_UTF8
+        dos_time, dos_date = _dos_datetime(mtime)
+        return _Member(
+            name=name,
+            flags=flags,
+            method=method,
+            dos_time=dos_time,
+            dos_date=dos_date,
+            crc=0,
+            compressed_size=0,
+            size=0,
+            offset=self._sink.position,
+            external_attr=(mode & 0xFFFF) << 16,
+        )
+
+    def _write_local_header(self, member: _Member, zip64: bool) -> None:
+        extra = b""
+        size, compressed_size = member.size, member.compressed_size
+        if zip64:
+            extra = struct.pack("<HHQQ", 0x0001, 16, size, compressed_size)
+            size = compressed_size = _ZIP64_MARKER
+        self._sink.write(struct.pack(
+            "<4s5H3L2H",
+            b"PK\x03\x04",
+            45 if zip64 else 20,
+            member.flags,
+            member.method,
+            member.dos_time,
+            member.dos_date,
+            member.crc,
+            compressed_size,
+            size,
+            len(member.name),
+            len(extra),
+        ))
+        self._sink.write(member.name)
+        self._sink.write(extra)
+
+    def _write_central_header(self, member: _Member) -> None:
+        values = []
+        size, compressed_size, offset = member.size, member.compressed_size, member.offset
+        if size >= _ZIP64_LIMIT:
+            values.append(size)
+            size = _ZIP64_MARKER
+        if compressed_size >= _ZIP64_LIMIT:
+            values.append(compressed_size)
+            compressed_size = _ZIP64_MARKER
+        if offset >= _ZIP64_LIMIT:
+            values.append(offset)
+            offset = _ZIP64_MARKER
+        extra = struct.pack(f"<HH{len(values)}Q", 0x0001, 8 * len(values), *values) if values else b""
+        version = 45 if values else 20
+        self._sink.write(struct.pack(
+            "<4s6H3L5H2L",
+            b"PK\x01\x02",
+            (3 << 8) | version,
+            version,
+            member.flags,
+            member.method,
+            member.dos_time,
+            member.dos_date,
+            member.crc,
+            compressed_size,
+            size,
+            len(member.name),
+            len(extra),
+            0,
+            0,
+            0,
+            member.external_attr,
+            offset,
+        ))
+        self._sink.write(member.name)
+        self._sink.write(extra)
+
+
+def compress_file(path: Path, level: int = 6) -> Tuple[bytes, int, int]:
+    """Raw-deflate a file for StreamingZipWriter.write_compressed.
+
+    npz telemetry tables are converted to their JSON document first.
+
+    Returns:
+        Tuple of (compressed bytes, crc32, uncompressed size)
+    """
+    if path.suffix.lower() == ".npz":
+        data = table_json(path).encode("utf-8")
+    else:
+        data = path.read_bytes()
+    return compress_bytes(data, level)
+
+
+def compress_bytes(data: bytes, level: int = 6) -> Tuple[bytes, int, int]:
+    """Raw-deflate bytes (zlib releases the GIL, so this scales across threads)."""
+    compressor = zlib.compressobj(level, zlib.DEFLATED, -zlib.MAX_WBITS)
+    return compressor.compress(data) + compressor.flush(), zlib.crc32(data), len(data)
+
+
+def _dos_datetime(mtime: float) -> Tuple[int, int]:
+    t = time.localtime(max(mtime, 315532800))  # DOS dates start in 1980
+    return (
+        (t.tm_hour << 11) | (t.tm_min << 5) | (t.tm_sec // 2),
+        ((t.tm_year - 1980) << 9) | (t.tm_mon << 5) | t.tm_mday,
+    )
+
+
+def archive_name(category: str, file_path: Path, session_dir: Path) -> str:
+    """Path of a collected file inside the submission package."""
+    rel_path = file_path.relative_to(session_dir)
+    if category in ["session_metadata", "session_videos"]:
+        return f"session/{rel_path.as_posix()}"
+    if category == "calibration":
+        return f"session/calibration/{rel_path.name}"
+    # npz telemetry tables are packaged as JSON (see compress_file)
+    if category in ("detections", "observations") and rel_path.suffix.lower() == ".npz":
+        rel_path = rel_path.with_suffix(".json")
+    # Pitch files go under pitches/{pitch-id}/
+    return f"pitches/{rel_path.as_posix()}"
+
+
+def write_package(
+    writer: StreamingZipWriter,
+    entries: List[Tuple[Path, str]],
+    max_workers: Optional[int] = None,
+    progress_callback: Optional[ProgressCallback] = None,
+    lookahead_bytes: int = DEFAULT_LOOKAHEAD_BYTES,
+) -> Dict[str, Any]:
+    """Write files into a package in order, compressing text members in parallel.
+
+    Compression jobs are submitted ahead of the writer, so the writer only
+    waits on compression when it outruns it. The lookahead is bounded to a
+    few jobs per worker and to ``lookahead_bytes`` of source files (the
+    next member is always submitted, however large).
+
+    Args:
+        writer: Open streaming writer
+        entries: (file path, archive name) pairs in package order
+        max_workers: Compression threads (defaults to CPU count)
+        progress_callback: Called with (bytes_done, bytes_total, files_done,
+            files_total); bytes are source file sizes on disk
+        lookahead_bytes: Source bytes that may be compressed ahead of the writer
+
+    Returns:
+        Packaging statistics (files, stored/deflated counts, bytes in/out,
+        elapsed seconds, throughput in MB/s)
+    """
+    workers = max_workers or min(8, os.cpu_count() or 1)
+    sizes = [path.stat().st_size for path, _ in entries]
+    bytes_total = sum(sizes)
+    bytes_done = 0
+    stats = {"files": 0, "stored_files": 0, "deflated_files": 0, "bytes_in": 0}
+    started = time.perf_counter()
+    start_offset = writer.bytes_written
+
+    pending: Dict[int, Future] = {}
+    pending_bytes = 0
+    lookahead = workers * 4
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="MLPackage") as pool:
+        next_submit = 0
+
+        def submit_ahead(limit: int) -> None:
+            nonlocal next_submit, pending_bytes
+            while next_submit < len(entries) and next_submit < limit:
+                path = entries[next_submit][0]
+                if path.suffix.lower() not in STORED_SUFFIXES:
+                    size = sizes[next_submit]
+                    if pending and pending_bytes + size > lookahead_bytes:
+                        return
+                    pending[next_submit] = pool.submit(compress_file, path)
+                    pending_bytes += size
+                next_submit += 1
+
+        for i, (path, arcname) in enumerate(entries):
+            submit_ahead(i + lookahead)
+            future = pending.pop(i, None)
+            if future is None:
+                size = writer.write_stored_file(path, arcname)
+                stats["stored_files"] += 1
+            else:
+                data, crc, size = future.result()
+                pending_bytes -= sizes[i]
+                stat = path.stat()
+                writer.write_compressed(arcname, data, crc, size, stat.st_mtime, stat.st_mode)
+                stats["deflated_files"] += 1
+            stats["files"] += 1
+            stats["bytes_in"] += size
+            bytes_done += sizes[i]
+            if progress_callback is not None:
+                progress_callback(bytes_done, bytes_total, stats["files"], len(entries))
+
+    elapsed = time.perf_counter() - started
+    stats["bytes_out"] = writer.bytes_written - start_offset
+    stats["elapsed_s"] = elapsed
+    stats["throughput_mb_s"] = (stats["bytes_in"] / 1024 / 1024 / elapsed) if elapsed > 0 else 0.0
+    return stats
+
+
+def _print_progress(bytes_done: int, bytes_total: int, files_done: int, files_total: int) -> None:
+    if files_done % 100 == 0 or files_done == files_total:
+        percent = 100.0 * bytes_done / bytes_total if bytes_total else 100.0
+        print(f"  Added {files_done}/{files_total} files ({percent:.0f}%)...")
+
+
 def create_submission_manifest(
     session_dir: Path,
     submission_type: str,
@@ -286,9 +665,15 @@ def create_ml_submission(
     source: Optional[Dict[str, Any]] = None,
     privacy: Optional[Dict[str, Any]] = None,
     telemetry_only_reason: Optional[str] = None,
-) -> None:
+    max_workers: Optional[int] = None,
+    progress_callback: Optional[ProgressCallback] = None,
+) -> Dict[str, Any]:
     """Create ML training submission package.
 
+    Videos and images are stored as-is, text and JSON members are compressed
+    in worker threads, and the package is hashed while it is written, so the
+    data is read once and written once.
+
     Args:
         session_dir: Session directory path
         output_path: Output ZIP file path
@@ -296,6 +681,11 @@ def create_ml_submission(
         source: Source metadata (rig_id, location, pitcher_id, operator)
         privacy: Privacy settings (player_consent, anonymized, retention_days)
         telemetry_only_reason: Reason for telemetry-only (if applicable)
+        max_workers: Compression threads (defaults to CPU count, max 8)
+        progress_callback: Called with (bytes_done, bytes_total, files_done, files_total)
+
+    Returns:
+        Submission manifest (with archive_sha256 and packaging statistics)
     """
     if not session_dir.exists():
         raise FileNotFoundError(f"Session directory not found: {session_dir}")
@@ -346,62 +736,52 @@ def create_ml_submission(
     total_files = sum(len(file_list) for file_list in files.values())
     print(f"Total files: {total_files}")
 
-    # Create ZIP package
+    entries = [
+        (file_path, archive_name(category, file_path, session_dir))
+        for category, file_list in files.items()
+        for file_path in file_list
+        if file_path.exists()
+    ]
+
+    # Create ZIP package, hashing while writing
     print(f"Creating ZIP package: {output_path}")
-    with zipfile.ZipFile(
-        output_path, "w", compression=zipfile.ZIP_DEFLATED, compresslevel=6
-    ) as archive:
-        # Add all files
-        file_count = 0
-        for category, file_list in files.items():
-            for file_path in file_list:
-                if file_path.exists():
-                    # Create relative path within ZIP
-                    rel_path = file_path.relative_to(session_dir)
-
-                    # Organize by category
-                    if category in ["session_metadata", "session_videos"]:
-                        zip_path = f"session/{rel_path}"
-                    elif category == "calibration":
-                        zip_path = f"session/calibration/{rel_path.name}"
-                    else:
-                        # Pitch files go under pitches/{pitch-id}/
-                        zip_path = f"pitches/{rel_path}"
-
-                    archive.write(file_path, zip_path)
-                    file_count += 1
-                    if file_count % 100 == 0:
-                        print(f"  Added {file_count}/{total_files} files...")
+    with open(output_path, "wb") as handle:
+        writer = StreamingZipWriter(handle)
+        stats = write_package(
+            writer, entries, max_workers=max_workers, progress_callback=progress_callback or _print_progress
+        )
+        print(
+            f"  {stats['stored_files']} stored, {stats['deflated_files']} compressed, "
+            f"{stats['throughput_mb_s']:.1f} MB/s"
+        )
+
+        # Checksum covers every packaged file (the bytes before the manifest member)
+        checksum = writer.payload_sha256()
+        print(f"SHA256: {checksum}")
+
+        # Create submission manifest
+        print("Creating submission manifest...")
+        submission_manifest = create_submission_manifest(
+            session_dir=session_dir,
+            submission_type=submission_type,
+            source=source,
+            privacy=privacy,
+            intended_use=intended_use,
+            size_bytes=size_bytes,
+            checksum=checksum,
+            telemetry_only_reason=telemetry_only_reason,
+        )
+        manifest_json = json.dumps(submission_manifest, indent=2).encode("utf-8")
+        writer.write_compressed(
+            "submission_manifest.json", *compress_bytes(manifest_json), mtime=time.time()
+        )
+        writer.close()
 
     print(f"Package created: {output_path}")
-
-    # Calculate checksum
-    print("Calculating checksum...")
-    sha256 = hashlib.sha256()
-    with open(output_path, "rb") as f:
-        while chunk := f.read(8192):
-            sha256.update(chunk)
-    checksum = sha256.hexdigest()
-    print(f"SHA256: {checksum}")
-
-    # Create submission manifest
-    print("Creating submission manifest...")
-    submission_manifest = create_submission_manifest(
-        session_dir=session_dir,
-        submission_type=submission_type,
-        source=source,
-        privacy=privacy,
-        intended_use=intended_use,
-        size_bytes=size_bytes,
-        checksum=checksum,
-        telemetry_only_reason=telemetry_only_reason,
-    )
-
-    # Add manifest to ZIP
-    print("Adding submission manifest to package...")
-    with zipfile.ZipFile(output_path, "a", compression=zipfile.ZIP_DEFLATED) as archive:
-        manifest_json = json.dumps(submission_manifest, indent=2)
-        archive.writestr("submission_manifest.json", manifest_json)
+    submission_manifest["archive_sha256"] = writer.sha256_hex
+    submission_manifest["packaging"] = {
+        key: round(value, 3) if isinstance(value, float) else value for key, value in stats.items()
+    }
 
     # Save manifest as separate file for reference
     manifest_path = output_path.with_suffix(".manifest.json")
@@ -430,6 +810,8 @@ def create_ml_submission(
         print("    ✗ Field segmentation (requires videos)")
         print("    ✗ Batter pose estimation (requires videos)")
 
+    return submission_manifest
+
 
 def main() -> None:
     """Main entry point."""
@@ -456,6 +838,7 @@ def main() -> None:
         source=source,
         privacy=privacy,
         telemetry_only_reason=args.reason if args.type == "telemetry_only" else None,
+        max_workers=args.workers,
     )
 
 
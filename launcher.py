@@ -51,6 +51,64 @@ def clear_python_cache(verbose: bool = False) -> None:
         print(f"[Cache] Cleared {pyc_count} .pyc files and {cache_count} __pycache__ directories")
 
 
+BYTECODE_STAMP_FILE = Path(".bytecode_stamp")
+
+
+def bytecode_stamp() -> str:
+    """Identify the installed code: app version plus git commit when run from a checkout.
+
+    Reads .git directly so no git subprocess is spawned at startup.
+
+    Returns:
+        Stamp string, e.g. "1.2.0+3f9c2a1..." or "1.2.0"
+    """
+    stamp = get_current_version()
+    git_dir = Path(".git")
+    try:
+        head = (git_dir / "HEAD").read_text().strip()
+        if head.startswith("ref: "):
+            ref = head[5:]
+            ref_file = git_dir / ref
+            if ref_file.exists():
+                head = ref_file.read_text().strip()
+            else:
+                packed = (git_dir / "packed-refs").read_text().splitlines()
+                head = next((line.split()[0] for line in packed if line.endswith(f" {ref}")), "")
+        if head:
+            stamp = f"{stamp}+{head}"
+    except OSError:
+        pass
+    return stamp
+
+
+def clear_stale_python_cache(verbose: bool = False) -> bool:
+    """Clear bytecode only when the code changed since the last launch.
+
+    Python already recompiles a .pyc whose source changed; wiping every
+    cache on each launch just made every start recompile the whole tree.
+    The purge now runs once after an update (new version or new git commit),
+    which still covers stale bytecode left behind by moved or deleted files.
+
+    Args:
+        verbose: Print statistics about cleared files
+
+    Returns:
+        True if the cache was cleared
+    """
+    stamp = bytecode_stamp()
+    try:
+        if BYTECODE_STAMP_FILE.read_text().strip() == stamp:
+            return False
+    except OSError:
+        pass
+    clear_python_cache(verbose=verbose)
+    try:
+        BYTECODE_STAMP_FILE.write_text(stamp + "\n")
+    except OSError:
+        pass
+    return True
+
+
 class AboutDialog(QtWidgets.QDialog):
     """About dialog with version and project information."""
 
@@ -442,11 +500,11 @@ class UpdateCheckThread(QtCore.QThread):
 
 def main():
     """Main entry point."""
-    # Clear Python bytecode cache to ensure fresh code loads
-    # (prevents issues after git pull or code changes)
+    # Clear Python bytecode cache once after an update (git pull or new
+    # version) so stale code never loads, without recompiling every launch.
     # Set PITCHTRACKER_NO_CACHE_CLEAR=1 to disable if needed
     if not os.environ.get('PITCHTRACKER_NO_CACHE_CLEAR'):
-        clear_python_cache(verbose=False)
+        clear_stale_python_cache(verbose=False)
 
     # Create required directories first
     create_required_directories()
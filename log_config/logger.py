@@ -19,9 +19,9 @@ logger.add(
     colorize=True,
 )
 
-# Add file handler with rotation
+# Add file handler with rotation. The logs directory and files are created on
+# the first message (delay=True), so importing this module does not touch disk.
 logs_dir = Path("logs")
-logs_dir.mkdir(exist_ok=True)
 
 logger.add(
     logs_dir / "pitchtracker_{time}.log",
@@ -30,6 +30,7 @@ logger.add(
     level="DEBUG",
     format="{time:YYYY-MM-DD HH:mm:ss.SSS} | {level: <8} | {name}:{function}:{line} - {message}",
     enqueue=True,  # Thread-safe logging
+    delay=True,
 )
 
 # Add error-specific log file
@@ -40,6 +41,7 @@ logger.add(
     level="ERROR",
     format="{time:YYYY-MM-DD HH:mm:ss.SSS} | {level: <8} | {name}:{function}:{line} - {message}",
     enqueue=True,
+    delay=True,
 )
 
 
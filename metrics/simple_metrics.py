@@ -2,8 +2,9 @@
 
 from __future__ import annotations
 
+from collections import deque
 from dataclasses import dataclass
-from typing import Iterable, List
+from typing import Deque, Iterable, Iterator, List, Optional
 
 from contracts import StereoObservation
 from stereo.association import StereoMatch
@@ -25,6 +26,70 @@ def compute_plate_stub(matches: Iterable[StereoMatch]) -> PlateMetricsStub:
     )
 
 
+class PlateMetricsAccumulator:
+    """Running plate metrics over a (optionally bounded) observation window.
+
+    Mirrors ``compute_plate_from_observations`` over the same window, but
+    updates in O(1) per appended observation, including eviction of the oldest
+    one when ``maxlen`` is reached. The accumulator owns the window, so callers
+    iterate it instead of keeping their own deque. ``metrics()`` returns a
+    cached object that only changes identity when the window changes;
+    ``version`` increments on every change so readers can skip redundant work.
+    """
+
+    def __init__(self, maxlen: Optional[int] = None) -> None:
+        self._window: Deque[StereoObservation] = deque(maxlen=maxlen)
+        self.version = 0
+        self._metrics = PlateMetricsStub(run_in=0.0, rise_in=0.0, sample_count=0)
+        self._metrics_version = 0
+
+    def reset(self) -> None:
+        self._window.clear()
+        self.version += 1
+
+    def __len__(self) -> int:
+        return len(self._window)
+
+    def __iter__(self) -> Iterator[StereoObservation]:
+        return iter(self._window)
+
+    @property
+    def maxlen(self) -> Optional[int]:
+        return self._window.maxlen
+
+    @property
+    def first(self) -> Optional[StereoObservation]:
+        return self._window[0] if self._window else None
+
+    @property
+    def last(self) -> Optional[StereoObservation]:
+        return self._window[-1] if self._window else None
+
+    def append(self, obs: StereoObservation) -> None:
+        self._window.append(obs)
+        self.version += 1
+
+    def extend(self, observations: Iterable[StereoObservation]) -> None:
+        for obs in observations:
+            self.append(obs)
+
+    def metrics(self) -> PlateMetricsStub:
+        if self._metrics_version != self.version:
+            count = len(self._window)
+            if count < 2:
+                self._metrics = PlateMetricsStub(run_in=0.0, rise_in=0.0, sample_count=count)
+            else:
+                first = self._window[0]
+                last = self._window[-1]
+                self._metrics = PlateMetricsStub(
+                    run_in=(last.X - first.X) * 12.0,
+                    rise_in=(last.Y - first.Y) * 12.0,
+                    sample_count=count,
+                )
+            self._metrics_version = self.version
+        return self._metrics
+
+
 def compute_plate_from_observations(
     observations: Iterable[StereoObservation],
 ) -> PlateMetricsStub:
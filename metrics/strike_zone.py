@@ -2,8 +2,11 @@
 
 from __future__ import annotations
 
+from collections import deque
 from dataclasses import dataclass
-from typing import Iterable, List, Tuple
+from typing import Deque, Iterable, List, Optional, Tuple
+
+import numpy as np
 
 from contracts import StereoObservation
 from detect.utils import point_in_polygon
@@ -61,50 +64,121 @@ def is_strike(
     strike_zone: StrikeZone,
     ball_radius_in: float,
 ) -> StrikeResult:
-    obs_list = list(observations)
-    if not obs_list:
-        return StrikeResult(is_strike=False, sample_count=0)
-    radius_ft = ball_radius_in / 12.0
-    zone_row = None
-    zone_col = None
-    crossing = _find_plate_crossing(obs_list, strike_zone.plate_z_ft)
-    if crossing is not None:
-        zone_row, zone_col = _zone_cell(
-            crossing,
-            strike_zone.y_bottom_ft,
-            strike_zone.y_top_ft,
-            strike_zone.polygon_xz,
-        )
-    for obs in obs_list:
-        if _sphere_intersects_zone(obs, strike_zone, radius_ft):
-            return StrikeResult(
-                is_strike=True,
-                sample_count=len(obs_list),
-                zone_row=zone_row,
-                zone_col=zone_col,
+    evaluator = StrikeZoneEvaluator(strike_zone, ball_radius_in)
+    evaluator.extend(observations)
+    return evaluator.result()
+
+
+class StrikeZoneEvaluator:
+    """Incremental, vectorized strike decision over a window of observations.
+
+    Edge vectors and squared lengths of the plate polygon are precomputed once,
+    each batch of new observations is tested against the zone prism in a single
+    NumPy pass, and per-observation hits are cached so the decision costs
+    O(new observations). With ``maxlen`` set, the window evicts the oldest
+    observation exactly like a ``deque(maxlen=...)`` of observations would.
+    """
+
+    def __init__(
+        self,
+        zone: StrikeZone,
+        ball_radius_in: float,
+        maxlen: Optional[int] = None,
+    ) -> None:
+        self.zone = zone
+        self.ball_radius_in = ball_radius_in
+        self._radius_ft = ball_radius_in / 12.0
+        vertices = np.asarray(zone.polygon_xz, dtype=float).reshape(-1, 2)
+        self._vertices = vertices
+        self._edges = np.roll(vertices, -1, axis=0) - vertices
+        self._edge_len_sq = np.einsum("ij,ij->i", self._edges, self._edges)
+        self._safe_len_sq = np.where(self._edge_len_sq == 0, 1.0, self._edge_len_sq)
+        # Ray-casting terms matching detect.utils.point_in_polygon.
+        prev = np.roll(vertices, 1, axis=0)
+        self._ray_dx = prev[:, 0] - vertices[:, 0]
+        self._ray_dz = prev[:, 1] - vertices[:, 1] + 1e-9
+        self._prev_z = prev[:, 1]
+        self._window: Deque[StereoObservation] = deque(maxlen=maxlen)
+        self._hits: Deque[bool] = deque(maxlen=maxlen)
+        self._hit_count = 0
+        self._result = StrikeResult(is_strike=False, sample_count=0)
+        self._dirty = False
+
+    def reset(self) -> None:
+        self._window.clear()
+        self._hits.clear()
+        self._hit_count = 0
+        self._result = StrikeResult(is_strike=False, sample_count=0)
+        self._dirty = False
+
+    def __len__(self) -> int:
+        return len(self._window)
+
+    def append(self, obs: StereoObservation) -> None:
+        self.extend([obs])
+
+    def extend(self, observations: Iterable[StereoObservation]) -> None:
+        new = list(observations)
+        if not new:
+            return
+        xyz = np.array([(obs.X, obs.Y, obs.Z) for obs in new], dtype=float)
+        hits = self.intersects(xyz)
+        maxlen = self._hits.maxlen
+        for obs, hit in zip(new, hits.tolist()):
+            if maxlen is not None and len(self._hits) == maxlen:
+                self._hit_count -= self._hits[0]
+            self._window.append(obs)
+            self._hits.append(hit)
+            self._hit_count += hit
+        self._dirty = True
+
+    def result(self) -> StrikeResult:
+        """Strike decision for the current window (cached until it changes)."""
+        if not self._dirty:
+            return self._result
+        self._dirty = False
+        zone_row = None
+        zone_col = None
+        crossing = _find_plate_crossing(list(self._window), self.zone.plate_z_ft)
+        if crossing is not None:
+            zone_row, zone_col = _zone_cell(
+                crossing,
+                self.zone.y_bottom_ft,
+                self.zone.y_top_ft,
+                self.zone.polygon_xz,
             )
-    return StrikeResult(
-        is_strike=False,
-        sample_count=len(obs_list),
-        zone_row=zone_row,
-        zone_col=zone_col,
-    )
-
-
-def _sphere_intersects_zone(
-    obs: StereoObservation,
-    zone: StrikeZone,
-    radius_ft: float,
-) -> bool:
-    if obs.Y + radius_ft < zone.y_bottom_ft:
-        return False
-    if obs.Y - radius_ft > zone.y_top_ft:
-        return False
-    point = (obs.X, obs.Z)
-    if point_in_polygon(point, zone.polygon_xz):
-        return True
-    distance = _distance_to_polygon(point, zone.polygon_xz)
-    return distance <= radius_ft
+        self._result = StrikeResult(
+            is_strike=self._hit_count > 0,
+            sample_count=len(self._window),
+            zone_row=zone_row,
+            zone_col=zone_col,
+        )
+        return self._result
+
+    def intersects(self, xyz: np.ndarray) -> np.ndarray:
+        """Sphere-versus-prism test for an (N, 3) array of ball centres."""
+        xyz = np.asarray(xyz, dtype=float).reshape(-1, 3)
+        r = self._radius_ft
+        y = xyz[:, 1]
+        in_band = (y + r >= self.zone.y_bottom_ft) & (y - r <= self.zone.y_top_ft)
+        if not self._vertices.size:
+            return np.zeros(len(xyz), dtype=bool)
+        px = xyz[:, 0:1]
+        pz = xyz[:, 2:3]
+        vx = self._vertices[:, 0]
+        vz = self._vertices[:, 1]
+
+        crosses = ((vz > pz) != (self._prev_z > pz)) & (px < self._ray_dx * (pz - vz) / self._ray_dz + vx)
+        inside = (np.count_nonzero(crosses, axis=1) % 2) == 1
+
+        apx = px - vx
+        apz = pz - vz
+        t = (apx * self._edges[:, 0] + apz * self._edges[:, 1]) / self._safe_len_sq
+        t = np.clip(np.where(self._edge_len_sq == 0, 0.0, t), 0.0, 1.0)
+        dx = apx - t * self._edges[:, 0]
+        dz = apz - t * self._edges[:, 1]
+        near = np.min(dx * dx + dz * dz, axis=1) <= r * r
+        return in_band & (inside | near)
 
 
 def _find_plate_crossing(
@@ -113,20 +187,22 @@ def _find_plate_crossing(
 ) -> Tuple[float, float, float] | None:
     if not observations:
         return None
-    for i in range(len(observations) - 1):
-        a = observations[i]
-        b = observations[i + 1]
-        az = a.Z - plate_z_ft
-        bz = b.Z - plate_z_ft
-        if az == 0:
-            return (a.X, a.Y, a.Z)
-        if az * bz <= 0:
-            t = az / (az - bz)
+    dz = np.array([obs.Z for obs in observations], dtype=float) - plate_z_ft
+    if len(dz) > 1:
+        # First segment that touches or straddles the plate plane.
+        candidates = np.flatnonzero((dz[:-1] == 0) | (dz[:-1] * dz[1:] <= 0))
+        if candidates.size:
+            i = int(candidates[0])
+            a = observations[i]
+            if dz[i] == 0:
+                return (a.X, a.Y, a.Z)
+            b = observations[i + 1]
+            t = dz[i] / (dz[i] - dz[i + 1])
             x = a.X + t * (b.X - a.X)
             y = a.Y + t * (b.Y - a.Y)
             z = a.Z + t * (b.Z - a.Z)
-            return (x, y, z)
-    closest = min(observations, key=lambda obs: abs(obs.Z - plate_z_ft))
+            return (float(x), float(y), float(z))
+    closest = observations[int(np.argmin(np.abs(dz)))]
     return (closest.X, closest.Y, closest.Z)
 
 
@@ -160,29 +236,3 @@ def _plate_width_ft(polygon_xz: List[Point2D]) -> float:
     if not xs:
         return 0.0
     return max(xs) - min(xs)
-
-
-def _distance_to_polygon(point: Point2D, polygon: List[Point2D]) -> float:
-    min_dist = float("inf")
-    for i in range(len(polygon)):
-        a = polygon[i]
-        b = polygon[(i + 1) % len(polygon)]
-        min_dist = min(min_dist, _distance_to_segment(point, a, b))
-    return min_dist
-
-
-def _distance_to_segment(p: Point2D, a: Point2D, b: Point2D) -> float:
-    px, pz = p
-    ax, az = a
-    bx, bz = b
-    abx = bx - ax
-    abz = bz - az
-    apx = px - ax
-    apz = pz - az
-    denom = abx * abx + abz * abz
-    if denom == 0:
-        return ((px - ax) ** 2 + (pz - az) ** 2) ** 0.5
-    t = max(0.0, min(1.0, (apx * abx + apz * abz) / denom))
-    cx = ax + t * abx
-    cz = az + t * abz
-    return ((px - cx) ** 2 + (pz - cz) ** 2) ** 0.5
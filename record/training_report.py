@@ -5,12 +5,14 @@ from __future__ import annotations
 import argparse
 import csv
 import json
+import os
 import time
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from dataclasses import dataclass
 from pathlib import Path
 from typing import Any, Dict, Iterable, List, Optional, Tuple
 
 import cv2
-import numpy as np
 
 from configs.roi_io import load_rois
 from configs.settings import load_config
@@ -30,6 +32,7 @@ def parse_args() -> argparse.Namespace:
     parser.add_argument("--stride", type=int, default=1, help="Process every Nth frame.")
     parser.add_argument("--skip-detection", action="store_true", help="Skip detector stats.")
     parser.add_argument("--skip-brightness", action="store_true", help="Skip brightness stats.")
+    parser.add_argument("--workers", type=int, default=None, help="Worker processes (default: CPU count).")
     parser.add_argument("--pitcher", default=None)
     parser.add_argument("--location-profile", default=None)
     parser.add_argument("--rig-id", default=None)
@@ -146,89 +149,152 @@ def _build_detector(config_path: Path, roi_path: Path, camera_id: str):
     return ClassicalDetector(config=detector_cfg, mode=Mode(cfg.mode), roi_by_camera=roi_by_camera)
 
 
-def _analyze_videos(
-    video_paths: Iterable[Path],
-    detector,
-    stride: int,
-    skip_detection: bool,
-    skip_brightness: bool,
-    camera_id: str,
-    pixfmt: str,
-    logs: List[Dict[str, Any]],
-    errors: List[Dict[str, Any]],
-) -> Tuple[Optional[Dict[str, Any]], Optional[Dict[str, Any]]]:
-    means: List[float] = []
-    stds: List[float] = []
-    best_confidences: List[float] = []
-    radii: List[float] = []
-    detections_total = 0
-    frame_count = 0
-
-    for path in video_paths:
-        capture = cv2.VideoCapture(str(path))
-        if not capture.isOpened():
-            errors.append(
-                {
-                    "t_utc": None,
-                    "level": "error",
-                    "message": f"Failed to open video {path}",
-                    "context": {"camera": camera_id},
-                }
-            )
-            continue
-        logs.append(
+# Brightness statistics are computed on a 1/N-scale image (area-averaged)
+_BRIGHTNESS_DOWNSAMPLE = 4
+
+
+@dataclass(frozen=True)
+class _VideoTask:
+    path: Path
+    camera_id: str
+    config_path: Path
+    roi_path: Path
+    stride: int
+    skip_detection: bool
+    skip_brightness: bool
+    pixfmt: str
+
+
+def _analyze_video(task: _VideoTask) -> Dict[str, Any]:
+    """Analyze one pitch video; runs in a worker process with its own detector."""
+    result: Dict[str, Any] = {
+        "frame_count": 0,
+        "means": [],
+        "stds": [],
+        "best_confidences": [],
+        "radii": [],
+        "detections_total": 0,
+        "logs": [],
+        "errors": [],
+    }
+    capture = cv2.VideoCapture(str(task.path))
+    if not capture.isOpened():
+        result["errors"].append(
             {
                 "t_utc": None,
-                "level": "info",
-                "message": f"Analyzing video {path.name}",
-                "context": {"camera": camera_id},
+                "level": "error",
+                "message": f"Failed to open video {task.path}",
+                "context": {"camera": task.camera_id},
             }
         )
-        frame_index = 0
+        return result
+    result["logs"].append(
+        {
+            "t_utc": None,
+            "level": "info",
+            "message": f"Analyzing video {task.path.name}",
+            "context": {"camera": task.camera_id},
+        }
+    )
+    detector = None
+    if not task.skip_detection:
+        detector = _build_detector(task.config_path, task.roi_path, task.camera_id)
+
+    frame_index = 0
+    try:
         while True:
-            ok, frame = capture.read()
-            if not ok:
+            # Only decode sampled frames; grab() skips the rest without decoding
+            if not capture.grab():
                 break
             frame_index += 1
-            if stride > 1 and frame_index % stride != 0:
+            if task.stride > 1 and frame_index % task.stride != 0:
                 continue
-            frame_count += 1
+            ok, frame = capture.retrieve()
+            if not ok:
+                break
+            result["frame_count"] += 1
             if frame.ndim == 3:
                 gray = cv2.cvtColor(frame, cv2.COLOR_BGR2GRAY)
             else:
                 gray = frame
-            if not skip_brightness:
-                means.append(float(np.mean(gray)))
-                stds.append(float(np.std(gray)))
-            if skip_detection:
+            if not task.skip_brightness:
+                size = (
+                    max(1, gray.shape[1] // _BRIGHTNESS_DOWNSAMPLE),
+                    max(1, gray.shape[0] // _BRIGHTNESS_DOWNSAMPLE),
+                )
+                small = cv2.resize(gray, size, interpolation=cv2.INTER_AREA)
+                mean, std = cv2.meanStdDev(small)
+                result["means"].append(float(mean[0][0]))
+                result["stds"].append(float(std[0][0]))
+            if detector is None:
                 continue
             try:
                 frame_obj = Frame(
-                    camera_id=camera_id,
+                    camera_id=task.camera_id,
                     frame_index=frame_index,
                     t_capture_monotonic_ns=0,
                     image=gray,
                     width=gray.shape[1],
                     height=gray.shape[0],
-                    pixfmt=pixfmt,
+                    pixfmt=task.pixfmt,
                 )
                 detections = detector.detect(frame_obj)
             except Exception as exc:  # noqa: BLE001 - capture detector failures
-                errors.append(
+                result["errors"].append(
                     {
                         "t_utc": None,
                         "level": "error",
                         "message": f"Detector error: {exc}",
-                        "context": {"camera": camera_id},
+                        "context": {"camera": task.camera_id},
                     }
                 )
                 detections = []
-            detections_total += len(detections)
+            result["detections_total"] += len(detections)
             if detections:
                 best = max(detections, key=lambda det: det.confidence)
-                best_confidences.append(float(best.confidence))
-                radii.append(float(best.radius_px))
+                result["best_confidences"].append(float(best.confidence))
+                result["radii"].append(float(best.radius_px))
+    finally:
         capture.release()
+    return result
+
+
+def _run_video_tasks(tasks: List[_VideoTask], max_workers: int, use_processes: bool) -> List[Dict[str, Any]]:
+    """Analyze videos in parallel, one video per task; results keep task order."""
+    workers = max(1, min(max_workers, len(tasks)))
+    if workers == 1:
+        return [_analyze_video(task) for task in tasks]
+    if use_processes:
+        executor: Executor = ProcessPoolExecutor(max_workers=workers)
+    else:
+        executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="TrainingReport")
+    with executor:
+        return list(executor.map(_analyze_video, tasks))
+
+
+def _merge_video_results(
+    results: List[Dict[str, Any]],
+    skip_detection: bool,
+    skip_brightness: bool,
+    logs: List[Dict[str, Any]],
+    errors: List[Dict[str, Any]],
+) -> Tuple[Optional[Dict[str, Any]], Optional[Dict[str, Any]]]:
+    """Combine per-video results (in video order) into per-camera stats."""
+    means: List[float] = []
+    stds: List[float] = []
+    best_confidences: List[float] = []
+    radii: List[float] = []
+    detections_total = 0
+    frame_count = 0
+    for result in results:
+        logs.extend(result["logs"])
+        errors.extend(result["errors"])
+        means.extend(result["means"])
+        stds.extend(result["stds"])
+        best_confidences.extend(result["best_confidences"])
+        radii.extend(result["radii"])
+        detections_total += result["detections_total"]
+        frame_count += result["frame_count"]
 
     brightness_stats = None
     if not skip_brightness:
@@ -277,6 +343,8 @@ def build_training_report(
     source: Optional[Dict[str, Any]] = None,
     report_id: Optional[str] = None,
     created_utc: Optional[str] = None,
+    max_workers: Optional[int] = None,
+    use_processes: bool = True,
 ) -> Dict[str, Any]:
     summary_path = session_dir / "session_summary.json"
     if not summary_path.exists():
@@ -301,21 +369,31 @@ def build_training_report(
 
     capture_stats = _compute_capture_stats(session_dir, config.camera.fps)
 
+    # One task per pitch video; each task builds its own detector, so results
+    # do not depend on which worker ran which video
+    tasks = [
+        _VideoTask(
+            path=path,
+            camera_id=label,
+            config_path=config_path,
+            roi_path=roi_path,
+            stride=max(stride, 1),
+            skip_detection=skip_detection,
+            skip_brightness=skip_brightness,
+            pixfmt=config.camera.pixfmt,
+        )
+        for label in ("left", "right")
+        for path in sorted(session_dir.rglob(f"{label}.avi"))
+    ]
+    results = _run_video_tasks(tasks, max_workers or os.cpu_count() or 1, use_processes)
+
     brightness_by_camera: Dict[str, Any] = {}
     detection_by_camera: Dict[str, Any] = {}
     for label in ("left", "right"):
-        videos = list(session_dir.rglob(f"{label}.avi"))
-        detector = None
-        if not skip_detection:
-            detector = _build_detector(config_path, roi_path, label)
-        brightness, detection = _analyze_videos(
-            videos,
-            detector,
-            stride=max(stride, 1),
+        brightness, detection = _merge_video_results(
+            [result for task, result in zip(tasks, results) if task.camera_id == label],
             skip_detection=skip_detection,
             skip_brightness=skip_brightness,
-            camera_id=label,
-            pixfmt=config.camera.pixfmt,
             logs=logs,
             errors=errors,
         )
@@ -382,6 +460,7 @@ def main() -> None:
         stride=args.stride,
         skip_detection=args.skip_detection,
         skip_brightness=args.skip_brightness,
+        max_workers=args.workers,
         source={
             "app": "PitchTracker",
             "rig_id": args.rig_id,
@@ -0,0 +1,158 @@
+"""Replay a recorded session through the detection pipeline and report performance.
+
+Streams session_left.avi/session_right.avi with their recorded timestamps
+through the same detection thread pool, stereo processor and pitch state
+machine used live, then prints throughput and per-stage latency.
+
+Usage:
+    # As fast as the pipeline keeps up
+    python replay_session.py --session-dir "recordings/session-2026-01-16_001"
+
+    # Paced at 2x real time with the worker pool, JSON report for CI
+    python replay_session.py \\
+        --session-dir "recordings/session-2026-01-16_001" \\
+        --speed 2 --threading worker_pool --workers 4 \\
+        --json replay_report.json
+"""
+
+import argparse
+import json
+import sys
+from pathlib import Path
+
+from app.pipeline.replay import SessionReplay, format_replay_report
+from capture import ReplayCamera
+from configs.settings import load_config
+from telemetry import get_profiler, get_tracer
+
+
+def parse_args() -> argparse.Namespace:
+    """Parse command-line arguments."""
+    parser = argparse.ArgumentParser(
+        description="Headless session replay harness",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog=__doc__,
+    )
+    parser.add_argument(
+        "--session-dir",
+        type=Path,
+        default=None,
+        help="Session directory with session_left.avi/session_right.avi",
+    )
+    parser.add_argument("--left-video", type=Path, default=None, help="Left video (instead of --session-dir)")
+    parser.add_argument("--right-video", type=Path, default=None, help="Right video (instead of --session-dir)")
+    parser.add_argument("--left-timestamps", type=Path, default=None, help="Left timestamps CSV")
+    parser.add_argument("--right-timestamps", type=Path, default=None, help="Right timestamps CSV")
+    parser.add_argument(
+        "--config",
+        type=Path,
+        default=Path("configs/default.yaml"),
+        help="Configuration file (default: configs/default.yaml)",
+    )
+    parser.add_argument(
+        "--speed",
+        type=float,
+        default=0.0,
+        help="Playback speed as a multiple of real time, 0 for unthrottled (default: 0)",
+    )
+    parser.add_argument(
+        "--threading",
+        choices=("per_camera", "worker_pool", "process_per_camera"),
+        default="per_camera",
+        help="Detection threading mode (default: per_camera)",
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=2,
+        help="Worker threads for worker_pool mode (default: 2)",
+    )
+    parser.add_argument(
+        "--queue-size",
+        type=int,
+        default=6,
+        help="Detection queue depth (default: 6)",
+    )
+    parser.add_argument(
+        "--max-frames",
+        type=int,
+        default=None,
+        help="Stop after this many frames per camera",
+    )
+    parser.add_argument(
+        "--no-rois",
+        action="store_true",
+        help="Skip lane/plate ROIs from configs/roi.json",
+    )
+    parser.add_argument(
+        "--json",
+        type=Path,
+        default=None,
+        help="Write the report as JSON",
+    )
+    parser.add_argument(
+        "--trace",
+        type=Path,
+        default=None,
+        help="Write per-frame stage spans as Chrome trace JSON (chrome://tracing, ui.perfetto.dev)",
+    )
+    parser.add_argument(
+        "--profile",
+        type=Path,
+        default=None,
+        help="Sample thread stacks during the replay and write collapsed/speedscope profiles to this directory",
+    )
+    return parser.parse_args()
+
+
+def main() -> int:
+    """Run the replay and print the report."""
+    args = parse_args()
+    config = load_config(args.config)
+    get_tracer().configure(enabled=True, capacity=max(config.telemetry.trace_capacity, args.max_frames or 0))
+    options = dict(
+        threading_mode=args.threading,
+        worker_count=args.workers,
+        queue_size=args.queue_size,
+        use_rois=not args.no_rois,
+    )
+
+    if args.left_video and args.right_video:
+        replay = SessionReplay(
+            config,
+            ReplayCamera(args.left_video, args.left_timestamps, speed=args.speed),
+            ReplayCamera(args.right_video, args.right_timestamps, speed=args.speed),
+            speed=args.speed,
+            **options,
+        )
+    elif args.session_dir:
+        try:
+            replay = SessionReplay.from_session_dir(config, args.session_dir, speed=args.speed, **options)
+        except FileNotFoundError as e:
+            print(f"Error: {e}", file=sys.stderr)
+            return 1
+    else:
+        print("Error: use --session-dir or both --left-video and --right-video", file=sys.stderr)
+        return 2
+
+    if args.profile:
+        get_profiler().start()
+    report = replay.run(max_frames=args.max_frames)
+    if args.profile:
+        get_profiler().stop()
+    print(format_replay_report(report))
+
+    if args.json:
+        args.json.write_text(json.dumps(report.to_dict(), indent=2))
+        print(f"\nWrote report to {args.json}")
+    if args.trace:
+        get_tracer().dump_chrome_trace(args.trace)
+        print(f"Wrote trace to {args.trace}")
+    if args.profile:
+        for path in get_profiler().save(args.profile):
+            print(f"Wrote profile to {path}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
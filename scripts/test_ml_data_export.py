@@ -11,6 +11,12 @@ import json
 import sys
 from pathlib import Path
 
+# Add project root to Python path so we can import the telemetry reader
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from app.pipeline.recording.telemetry_store import read_detections, read_observations
+
 
 def test_ml_data_export(session_dir: Path) -> bool:
     """Verify ML training data was exported correctly.
@@ -46,32 +52,28 @@ def test_ml_data_export(session_dir: Path) -> bool:
     pitch_dir = pitch_dirs[0]
     print(f"Testing pitch: {pitch_dir.name}\n")
 
-    # Check for detection export
-    detections_dir = pitch_dir / "detections"
-    left_det = detections_dir / "left_detections.json"
-    right_det = detections_dir / "right_detections.json"
+    # Check for detection export (npz tables or legacy JSON)
+    left_det = read_detections(pitch_dir, "left")
+    right_det = read_detections(pitch_dir, "right")
 
-    if left_det.exists():
-        data = json.loads(left_det.read_text())
-        print(f"[PASS] Left detections: {data['detection_count']} detections")
+    if left_det is not None:
+        print(f"[PASS] Left detections: {len(left_det)} detections")
         passed += 1
     else:
         print("[WARN] Left detections not found (may be disabled in config)")
         failed += 1
 
-    if right_det.exists():
-        data = json.loads(right_det.read_text())
-        print(f"[PASS] Right detections: {data['detection_count']} detections")
+    if right_det is not None:
+        print(f"[PASS] Right detections: {len(right_det)} detections")
         passed += 1
     else:
         print("[WARN] Right detections not found (may be disabled in config)")
         failed += 1
 
     # Check for observation export
-    obs_file = pitch_dir / "observations" / "stereo_observations.json"
-    if obs_file.exists():
-        data = json.loads(obs_file.read_text())
-        print(f"[PASS] Observations: {data['observation_count']} observations")
+    observations = read_observations(pitch_dir)
+    if observations is not None:
+        print(f"[PASS] Observations: {len(observations)} observations")
         passed += 1
     else:
         print("[WARN] Observations not found (may be disabled in config)")
@@ -0,0 +1,210 @@
+"""Sweep detector parameters against recorded pitches and rank the variants.
+
+Evaluates a grid or a random sample of DetectorConfig variants in parallel
+worker processes. Each session's pitch videos are decoded once into a
+memory-mapped grayscale cache shared by all workers. Variants are scored
+against saved pitch detections and, optionally, exported review annotations
+(F1), or by stereo yield when no reference data exists.
+
+Usage:
+    # Grid search
+    python sweep_detector.py \\
+        --session-dir "recordings/session-2026-01-16_001" \\
+        --grid frame_diff_threshold=12,18,24 \\
+        --grid min_area=8,12,20
+
+    # Random search with annotations and CSV output
+    python sweep_detector.py \\
+        --session-dir "recordings/session-2026-01-16_001" \\
+        --annotations annotations.json \\
+        --random 50 --range bg_diff_threshold=6:24 --range min_circularity=0.05:0.6 \\
+        --csv sweep_results.csv
+"""
+
+import argparse
+import sys
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Tuple
+
+from app.review.parameter_sweep import (
+    ParameterSweep,
+    format_results_table,
+    grid_variants,
+    random_variants,
+    targets_from_session,
+    write_results_csv,
+)
+from app.review.session_loader import SessionLoader
+from detect.config import Mode
+
+
+def parse_args() -> argparse.Namespace:
+    """Parse command-line arguments."""
+    parser = argparse.ArgumentParser(
+        description="Parallel detector parameter sweep",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog=__doc__,
+    )
+    parser.add_argument(
+        "--session-dir",
+        type=Path,
+        action="append",
+        required=True,
+        help="Session directory path (repeatable)",
+    )
+    parser.add_argument(
+        "--grid",
+        action="append",
+        default=[],
+        metavar="NAME=V1,V2,...",
+        help="Grid values for a parameter (repeatable)",
+    )
+    parser.add_argument(
+        "--random",
+        type=int,
+        default=0,
+        metavar="N",
+        help="Number of random variants to sample from --range",
+    )
+    parser.add_argument(
+        "--range",
+        action="append",
+        default=[],
+        metavar="NAME=LOW:HIGH",
+        help="Sampling range for a parameter (repeatable)",
+    )
+    parser.add_argument(
+        "--seed",
+        type=int,
+        default=None,
+        help="Random seed for --random",
+    )
+    parser.add_argument(
+        "--mode",
+        choices=[m.value for m in Mode],
+        default=Mode.MODE_A.value,
+        help="Detection mode (default: MODE_A)",
+    )
+    parser.add_argument(
+        "--annotations",
+        type=Path,
+        default=None,
+        help="Annotations JSON exported from review mode (first session only)",
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=None,
+        help="Worker processes (default: CPU count)",
+    )
+    parser.add_argument(
+        "--cache-dir",
+        type=Path,
+        default=Path(".sweep_cache"),
+        help="Decoded frame cache directory (default: .sweep_cache)",
+    )
+    parser.add_argument(
+        "--match-radius",
+        type=float,
+        default=8.0,
+        help="Max pixel distance for a detection to match a reference point",
+    )
+    parser.add_argument(
+        "--top",
+        type=int,
+        default=20,
+        help="Rows to print (default: 20)",
+    )
+    parser.add_argument(
+        "--csv",
+        type=Path,
+        default=None,
+        help="Write the full ranked table to CSV",
+    )
+    return parser.parse_args()
+
+
+def _parse_value(text: str) -> Any:
+    """Parse a parameter value (int, float or None)."""
+    text = text.strip()
+    if text.lower() == "none":
+        return None
+    try:
+        return int(text)
+    except ValueError:
+        return float(text)
+
+
+def _parse_grid(specs: List[str]) -> Dict[str, List[Any]]:
+    grid = {}
+    for spec in specs:
+        name, _, values = spec.partition("=")
+        if not values:
+            raise ValueError(f"Invalid --grid spec: {spec}")
+        grid[name.strip()] = [_parse_value(v) for v in values.split(",")]
+    return grid
+
+
+def _parse_ranges(specs: List[str]) -> Dict[str, Tuple[Any, Any]]:
+    ranges = {}
+    for spec in specs:
+        name, _, bounds = spec.partition("=")
+        low, sep, high = bounds.partition(":")
+        if not sep:
+            raise ValueError(f"Invalid --range spec: {spec}")
+        ranges[name.strip()] = (_parse_value(low), _parse_value(high))
+    return ranges
+
+
+def main() -> int:
+    """Run the sweep and print the ranked table."""
+    args = parse_args()
+
+    try:
+        variants = grid_variants(_parse_grid(args.grid)) if args.grid else []
+        if args.random:
+            variants += random_variants(_parse_ranges(args.range), args.random, seed=args.seed)
+    except ValueError as e:
+        print(f"Error: {e}", file=sys.stderr)
+        return 2
+    if not variants:
+        print("Error: no variants (use --grid and/or --random with --range)", file=sys.stderr)
+        return 2
+
+    targets = []
+    base_config = None
+    for i, session_dir in enumerate(args.session_dir):
+        session = SessionLoader.load_session(session_dir)
+        if base_config is None and session.original_config is not None:
+            base_config = session.original_config.detector
+        targets += targets_from_session(session, args.annotations if i == 0 else None)
+    if not targets:
+        print("Error: no pitch videos found in the given sessions", file=sys.stderr)
+        return 1
+
+    print(f"Evaluating {len(variants)} variants on {len(targets)} targets...")
+    started = time.perf_counter()
+    sweep = ParameterSweep(
+        targets,
+        base_config=base_config,
+        mode=Mode(args.mode),
+        cache_dir=args.cache_dir,
+        max_workers=args.workers,
+        match_radius_px=args.match_radius,
+    )
+    results = sweep.run(
+        variants,
+        progress_callback=lambda done, total: print(f"  {done}/{total}", end="\r", flush=True),
+    )
+    print(f"\nCompleted in {time.perf_counter() - started:.1f}s\n")
+    print(format_results_table(results, limit=args.top))
+
+    if args.csv:
+        write_results_csv(results, args.csv)
+        print(f"\nWrote {len(results)} rows to {args.csv}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,5 +1,18 @@
 """Telemetry module."""
 
+from .histogram import LatencyHistogram, WindowedHistogram
 from .monitor import LatencyStats, TelemetryMonitor, TelemetrySnapshot
+from .profiler import SamplingProfiler, get_profiler
+from .tracing import PipelineTracer, get_tracer
 
-__all__ = ["LatencyStats", "TelemetryMonitor", "TelemetrySnapshot"]
+__all__ = [
+    "LatencyHistogram",
+    "LatencyStats",
+    "PipelineTracer",
+    "SamplingProfiler",
+    "TelemetryMonitor",
+    "TelemetrySnapshot",
+    "WindowedHistogram",
+    "get_profiler",
+    "get_tracer",
+]
@@ -0,0 +1,222 @@
+"""Fixed-memory latency histograms with log-spaced buckets.
+
+``LatencyHistogram`` is an HDR-style sketch: recording is O(1), memory is
+fixed by the value range and precision, and histograms with the same
+layout merge by adding bucket counts. ``WindowedHistogram`` keeps a ring
+of per-interval histograms so "last N seconds" views cost a merge instead
+of a sort over raw samples.
+"""
+
+from __future__ import annotations
+
+import math
+import threading
+import time
+from typing import Dict, List, Optional
+
+
+class LatencyHistogram:
+    """Streaming latency distribution in constant memory.
+
+    Values (nanoseconds) fall into logarithmically spaced buckets, so
+    recording is O(1) and quantiles are accurate to within ``growth - 1``
+    relative error (2% by default) over ``min_ns``..``max_ns``. Values
+    outside the range clamp to the first/last bucket; the exact minimum and
+    maximum are tracked separately.
+
+    Not thread-safe: callers recording from several threads hold a lock
+    (or use WindowedHistogram).
+    """
+
+    def __init__(
+        self,
+        min_ns: int = 1_000,
+        max_ns: int = 60_000_000_000,
+        growth: float = 1.02,
+    ) -> None:
+        if min_ns <= 0 or max_ns <= min_ns or growth <= 1.0:
+            raise ValueError("Histogram needs 0 < min_ns < max_ns and growth > 1")
+        self._min_ns = int(min_ns)
+        self._max_ns = int(max_ns)
+        self._growth = growth
+        self._log_min = math.log(min_ns)
+        self._log_growth = math.log(growth)
+        bucket_count = int(math.ceil((math.log(max_ns) - self._log_min) / self._log_growth)) + 2
+        self._counts: List[int] = [0] * bucket_count
+        self.reset()
+
+    def reset(self) -> None:
+        """Discard all recorded values."""
+        self._counts = [0] * len(self._counts)
+        self._count = 0
+        self._total_ns = 0
+        self._min_seen = 0
+        self._max_seen = 0
+
+    def record(self, value_ns: int) -> None:
+        """Add one value in nanoseconds (negative values count as 0)."""
+        if value_ns < self._min_ns:
+            index = 0
+            value_ns = max(0, value_ns)
+        else:
+            index = min(int((math.log(value_ns) - self._log_min) / self._log_growth) + 1, len(self._counts) - 1)
+        self._counts[index] += 1
+        if self._count == 0 or value_ns < self._min_seen:
+            self._min_seen = value_ns
+        if value_ns > self._max_seen:
+            self._max_seen = value_ns
+        self._count += 1
+        self._total_ns += value_ns
+
+    def merge(self, other: "LatencyHistogram") -> "LatencyHistogram":
+        """Add another histogram's values into this one and return self.
+
+        Raises:
+            ValueError: If the bucket layouts differ
+        """
+        if (self._min_ns, self._max_ns, self._growth) != (other._min_ns, other._max_ns, other._growth):
+            raise ValueError("Cannot merge histograms with different bucket layouts")
+        if not other._count:
+            return self
+        self._counts = [mine + theirs for mine, theirs in zip(self._counts, other._counts)]
+        self._min_seen = other._min_seen if not self._count else min(self._min_seen, other._min_seen)
+        self._max_seen = max(self._max_seen, other._max_seen)
+        self._count += other._count
+        self._total_ns += other._total_ns
+        return self
+
+    def empty_like(self) -> "LatencyHistogram":
+        """New empty histogram with the same bucket layout."""
+        return LatencyHistogram(self._min_ns, self._max_ns, self._growth)
+
+    def snapshot(self) -> "LatencyHistogram":
+        """Independent copy of the current state."""
+        return self.empty_like().merge(self)
+
+    @property
+    def count(self) -> int:
+        return self._count
+
+    @property
+    def mean_ns(self) -> float:
+        return self._total_ns / self._count if self._count else 0.0
+
+    @property
+    def min_ns(self) -> int:
+        return self._min_seen
+
+    @property
+    def max_ns(self) -> int:
+        return self._max_seen
+
+    def quantile(self, q: float) -> float:
+        """Approximate value (ns) below which a fraction ``q`` of samples fall."""
+        if not self._count:
+            return 0.0
+        if q <= 0.0:
+            return float(self._min_seen)
+        if q >= 1.0:
+            return float(self._max_seen)
+        rank = q * (self._count - 1)
+        seen = 0
+        for index, bucket in enumerate(self._counts):
+            seen += bucket
+            if seen > rank:
+                return float(min(max(self._bucket_value(index), self._min_seen), self._max_seen))
+        return float(self._max_seen)
+
+    def summary_ms(self) -> Dict[str, float]:
+        """Count plus mean/p50/p95/p99/max in milliseconds."""
+        return {
+            "count": float(self._count),
+            "mean_ms": self.mean_ns / 1e6,
+            "p50_ms": self.quantile(0.50) / 1e6,
+            "p95_ms": self.quantile(0.95) / 1e6,
+            "p99_ms": self.quantile(0.99) / 1e6,
+            "max_ms": self._max_seen / 1e6,
+        }
+
+    def _bucket_value(self, index: int) -> float:
+        """Representative value of a bucket (geometric midpoint of its bounds)."""
+        if index == 0:
+            return float(self._min_ns)
+        lower = self._min_ns * self._growth ** (index - 1)
+        return lower * math.sqrt(self._growth)
+
+
+class WindowedHistogram:
+    """Latency histogram over a sliding time window.
+
+    The window is split into ``slices`` fixed intervals, each with its own
+    LatencyHistogram; a slice is cleared when time wraps back onto it.
+    Views over the last N seconds merge the slices that cover them, so the
+    window edge has the granularity of one slice. A cumulative histogram of
+    everything ever recorded is kept alongside. Thread-safe.
+
+    Example:
+        >>> jitter = WindowedHistogram(window_s=10.0)
+        >>> jitter.record(delta_ns)
+        >>> jitter.snapshot(window_s=5.0).quantile(0.95)
+    """
+
+    def __init__(
+        self,
+        window_s: float = 60.0,
+        slices: int = 12,
+        min_ns: int = 1_000,
+        max_ns: int = 60_000_000_000,
+        growth: float = 1.02,
+    ) -> None:
+        if window_s <= 0 or slices < 1:
+            raise ValueError("Window needs window_s > 0 and at least one slice")
+        self._window_s = float(window_s)
+        self._slice_ns = max(1, int(window_s * 1e9 / slices))
+        self._slices = [LatencyHistogram(min_ns, max_ns, growth) for _ in range(slices)]
+        self._slice_ids = [-1] * slices
+        self._total = LatencyHistogram(min_ns, max_ns, growth)
+        self._lock = threading.Lock()
+
+    @property
+    def window_s(self) -> float:
+        return self._window_s
+
+    def record(self, value_ns: int, now_ns: Optional[int] = None) -> None:
+        """Add one value (ns) to the current slice and the cumulative histogram."""
+        if now_ns is None:
+            now_ns = time.monotonic_ns()
+        slice_id = now_ns // self._slice_ns
+        index = slice_id % len(self._slices)
+        with self._lock:
+            if self._slice_ids[index] != slice_id:
+                self._slices[index].reset()
+                self._slice_ids[index] = slice_id
+            self._slices[index].record(value_ns)
+            self._total.record(value_ns)
+
+    def snapshot(self, window_s: Optional[float] = None, now_ns: Optional[int] = None) -> LatencyHistogram:
+        """Merged histogram of the last ``window_s`` seconds (default: whole window)."""
+        if now_ns is None:
+            now_ns = time.monotonic_ns()
+        if window_s is None:
+            window_s = self._window_s
+        span = min(len(self._slices), max(1, int(math.ceil(window_s * 1e9 / self._slice_ns))))
+        oldest = now_ns // self._slice_ns - span
+        with self._lock:
+            merged = self._total.empty_like()
+            for slice_id, histogram in zip(self._slice_ids, self._slices):
+                if slice_id > oldest:
+                    merged.merge(histogram)
+            return merged
+
+    def total(self) -> LatencyHistogram:
+        """Copy of the cumulative histogram since creation or the last reset."""
+        with self._lock:
+            return self._total.snapshot()
+
+    def reset(self) -> None:
+        """Discard all recorded values."""
+        with self._lock:
+            for histogram in self._slices:
+                histogram.reset()
+            self._slice_ids = [-1] * len(self._slices)
+            self._total.reset()
@@ -3,7 +3,9 @@
 from __future__ import annotations
 
 from dataclasses import dataclass, field
-from typing import Dict, List
+from typing import Dict, Optional
+
+from .histogram import WindowedHistogram
 
 
 @dataclass
@@ -11,6 +13,7 @@ class LatencyStats:
     p50_ms: float
     p95_ms: float
     max_ms: float
+    p99_ms: float = 0.0
 
 
 @dataclass
@@ -23,16 +26,25 @@ class TelemetrySnapshot:
 
 @dataclass
 class TelemetryMonitor:
-    latency_samples_ms: List[float] = field(default_factory=list)
+    """Latency tracking in fixed memory.
+
+    Samples go into a windowed log-bucketed histogram, so hours of samples
+    cost the same memory as a few and ``summarize`` never sorts.
+    """
+
+    latency: WindowedHistogram = field(default_factory=lambda: WindowedHistogram(window_s=60.0))
 
     def record_latency_ms(self, value: float) -> None:
-        self.latency_samples_ms.append(value)
+        self.latency.record(int(value * 1e6))
 
-    def summarize(self) -> LatencyStats:
-        if not self.latency_samples_ms:
+    def summarize(self, window_s: Optional[float] = None) -> LatencyStats:
+        """Latency percentiles since start, or over the last ``window_s`` seconds."""
+        histogram = self.latency.total() if window_s is None else self.latency.snapshot(window_s)
+        if not histogram.count:
             return LatencyStats(p50_ms=0.0, p95_ms=0.0, max_ms=0.0)
-        values = sorted(self.latency_samples_ms)
-        max_ms = values[-1]
-        p50_ms = values[int(0.5 * (len(values) - 1))]
-        p95_ms = values[int(0.95 * (len(values) - 1))]
-        return LatencyStats(p50_ms=p50_ms, p95_ms=p95_ms, max_ms=max_ms)
+        return LatencyStats(
+            p50_ms=histogram.quantile(0.50) / 1e6,
+            p95_ms=histogram.quantile(0.95) / 1e6,
+            max_ms=histogram.max_ns / 1e6,
+            p99_ms=histogram.quantile(0.99) / 1e6,
+        )
@@ -0,0 +1,276 @@
+"""Opt-in in-process sampling profiler.
+
+A background thread periodically snapshots every thread's Python stack via
+``sys._current_frames()`` and counts identical stacks per thread name
+(``Capture-left``, ``Detect-right``, ``StereoLoop``, ``DiskSpaceMonitor``,
+...). Nothing is installed on the profiled threads, so it can be switched on
+and off while a rig is running, from the Tools menu or by setting
+``PITCHTRACKER_PROFILE`` before launch (``1`` for the default rate, or a
+sampling rate in Hz).
+
+Sampling cost is measured on every tick and the sleep between samples is
+stretched so the sampler's share of wall time stays under ``max_overhead``
+(2% by default), whatever the requested rate.
+
+Profiles are written as collapsed stacks (``profile.folded``, for
+flamegraph.pl / inferno) and as a speedscope file
+(``profile.speedscope.json``, open at https://www.speedscope.app).
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import sys
+import threading
+import time
+from collections import Counter
+from pathlib import Path
+from typing import Dict, List, Mapping, Optional, Tuple
+
+PROFILE_ENV_VAR = "PITCHTRACKER_PROFILE"
+
+COLLAPSED_FILENAME = "profile.folded"
+SPEEDSCOPE_FILENAME = "profile.speedscope.json"
+
+_SPEEDSCOPE_SCHEMA = "https://www.speedscope.app/file-format-schema.json"
+
+# (thread name, frame labels root-first)
+StackKey = Tuple[str, Tuple[str, ...]]
+
+
+class SamplingProfiler:
+    """Statistical profiler sampling all thread stacks from a daemon thread.
+
+    Example:
+        >>> profiler = get_profiler()
+        >>> profiler.start(hz=200)
+        >>> ...
+        >>> profiler.stop()
+        >>> profiler.save(session_dir)
+    """
+
+    def __init__(self, hz: float = 100.0, max_overhead: float = 0.02, max_depth: int = 64) -> None:
+        if hz <= 0 or not 0.0 < max_overhead < 1.0 or max_depth < 1:
+            raise ValueError("Profiler needs hz > 0, 0 < max_overhead < 1 and max_depth >= 1")
+        self._hz = float(hz)
+        self._max_overhead = max_overhead
+        self._max_depth = max_depth
+        self._stacks: Counter[StackKey] = Counter()
+        self._labels: Dict[object, str] = {}
+        self._lock = threading.Lock()
+        self._stop_event = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._samples = 0
+        self._sample_time_s = 0.0
+        self._started_at = 0.0
+        self._elapsed_s = 0.0
+
+    @property
+    def running(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+
+    @property
+    def hz(self) -> float:
+        return self._hz
+
+    def start(self, hz: Optional[float] = None) -> None:
+        """Start sampling (no-op if already running); counts accumulate until reset()."""
+        if self.running:
+            return
+        if hz is not None:
+            if hz <= 0:
+                raise ValueError("Sampling rate must be positive")
+            self._hz = float(hz)
+        self._stop_event.clear()
+        self._started_at = time.perf_counter()
+        self._thread = threading.Thread(target=self._run, name="SamplingProfiler", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        """Stop sampling and wait for the sampler thread to exit."""
+        thread = self._thread
+        if thread is None:
+            return
+        self._stop_event.set()
+        thread.join(timeout=2.0)
+        self._thread = None
+        self._elapsed_s += time.perf_counter() - self._started_at
+
+    def reset(self) -> None:
+        """Discard collected samples."""
+        with self._lock:
+            self._stacks.clear()
+            self._samples = 0
+            self._sample_time_s = 0.0
+            self._elapsed_s = 0.0
+            self._started_at = time.perf_counter()
+
+    def sample(self, frames: Optional[Mapping[int, object]] = None) -> None:
+        """Record one snapshot of every thread's stack except the sampler's own.
+
+        Args:
+            frames: Thread id -> frame mapping (defaults to sys._current_frames())
+        """
+        if frames is None:
+            frames = sys._current_frames()
+        names = {thread.ident: thread.name for thread in threading.enumerate()}
+        sampler = self._thread.ident if self._thread is not None else None
+        stacks = []
+        for ident, frame in frames.items():
+            if ident == sampler:
+                continue
+            labels: List[str] = []
+            while frame is not None and len(labels) < self._max_depth:
+                labels.append(self._label(frame.f_code))
+                frame = frame.f_back
+            labels.reverse()
+            stacks.append((names.get(ident, f"Thread-{ident}"), tuple(labels)))
+        with self._lock:
+            self._stacks.update(stacks)
+            self._samples += 1
+
+    def stats(self) -> Dict[str, float]:
+        """Sample count, distinct stacks and measured sampler overhead."""
+        with self._lock:
+            elapsed = self._elapsed_s
+            if self.running:
+                elapsed += time.perf_counter() - self._started_at
+            return {
+                "samples": float(self._samples),
+                "stacks": float(len(self._stacks)),
+                "threads": float(len({name for name, _ in self._stacks})),
+                "overhead": self._sample_time_s / elapsed if elapsed > 0 else 0.0,
+                "effective_hz": self._samples / elapsed if elapsed > 0 else 0.0,
+            }
+
+    def collapsed(self) -> List[str]:
+        """Collapsed stack lines ("thread;outer;...;inner count"), heaviest first."""
+        with self._lock:
+            items = self._stacks.most_common()
+        return [";".join((name,) + labels) + f" {count}" for (name, labels), count in items]
+
+    def speedscope(self) -> Dict[str, object]:
+        """Speedscope document with one sampled profile per thread name."""
+        with self._lock:
+            items = sorted(self._stacks.items())
+        frame_index: Dict[str, int] = {}
+        frames: List[Dict[str, object]] = []
+        profiles: Dict[str, Dict[str, list]] = {}
+        for (name, labels), count in items:
+            indices = []
+            for label in labels:
+                if label not in frame_index:
+                    frame_index[label] = len(frames)
+                    frames.append(self._speedscope_frame(label))
+                indices.append(frame_index[label])
+            profile = profiles.setdefault(name, {"samples": [], "weights": []})
+            profile["samples"].append(indices)
+            profile["weights"].append(count)
+        return {
+            "$schema": _SPEEDSCOPE_SCHEMA,
+            "name": "PitchTracker sampling profile",
+            "exporter": "telemetry.profiler",
+            "shared": {"frames": frames},
+            "profiles": [
+                {
+                    "type": "sampled",
+                    "name": name,
+                    "unit": "none",
+                    "startValue": 0,
+                    "endValue": sum(profile["weights"]),
+                    "samples": profile["samples"],
+                    "weights": profile["weights"],
+                }
+                for name, profile in profiles.items()
+            ],
+        }
+
+    def write_collapsed(self, path: Path) -> Path:
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        lines = self.collapsed()
+        path.write_text("\n".join(lines) + ("\n" if lines else ""))
+        return path
+
+    def write_speedscope(self, path: Path) -> Path:
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(json.dumps(self.speedscope()))
+        return path
+
+    def save(self, directory: Path) -> List[Path]:
+        """Write both profile formats into ``directory`` and return their paths."""
+        directory = Path(directory)
+        return [
+            self.write_collapsed(directory / COLLAPSED_FILENAME),
+            self.write_speedscope(directory / SPEEDSCOPE_FILENAME),
+        ]
+
+    def _run(self) -> None:
+        interval = 1.0 / self._hz
+        while not self._stop_event.is_set():
+            began = time.perf_counter()
+            self.sample()
+            cost = time.perf_counter() - began
+            with self._lock:
+                self._sample_time_s += cost
+            # Sleep long enough that cost / (cost + sleep) <= max_overhead
+            budget = cost * (1.0 - self._max_overhead) / self._max_overhead
+            self._stop_event.wait(max(interval - cost, budget))
+
+    def _label(self, code) -> str:
+        label = self._labels.get(code)
+        if label is None:
+            filename = os.path.basename(code.co_filename)
+            label = f"{code.co_name} ({filename}:{code.co_firstlineno})".replace(";", ",")
+            self._labels[code] = label
+        return label
+
+    @staticmethod
+    def _speedscope_frame(label: str) -> Dict[str, object]:
+        name, _, location = label.rpartition(" (")
+        filename, _, line = location.rstrip(")").rpartition(":")
+        return {"name": name, "file": filename, "line": int(line)}
+
+
+_profiler: Optional[SamplingProfiler] = None
+_profiler_lock = threading.Lock()
+
+
+def get_profiler() -> SamplingProfiler:
+    """Get the global sampling profiler instance.
+
+    Returns:
+        Global sampling profiler
+    """
+    global _profiler
+    if _profiler is None:
+        with _profiler_lock:
+            if _profiler is None:
+                _profiler = SamplingProfiler()
+    return _profiler
+
+
+def start_from_env(environ: Optional[Mapping[str, str]] = None) -> bool:
+    """Start the global profiler if PITCHTRACKER_PROFILE asks for it.
+
+    ``1``/``true``/``on`` use the default rate; a number above 1 is taken as
+    the sampling rate in Hz. Empty, ``0`` or unparsable values leave it off.
+
+    Returns:
+        True if the profiler is running afterwards
+    """
+    value = (environ if environ is not None else os.environ).get(PROFILE_ENV_VAR, "").strip().lower()
+    if value in ("", "0", "false", "off", "no"):
+        return False
+    hz: Optional[float] = None
+    if value not in ("1", "true", "on", "yes"):
+        try:
+            hz = float(value)
+        except ValueError:
+            return False
+        if hz <= 0:
+            return False
+    get_profiler().start(hz=hz)
+    return True
@@ -0,0 +1,236 @@
+"""Per-frame pipeline stage tracing.
+
+Each captured frame gets a trace record holding a monotonic timestamp for
+every stage boundary it crosses (capture, detection queue, detector, stereo
+pairing, triangulation, pitch state update). Records live in a preallocated
+ring indexed by frame index, so marking a stage is a few array writes and a
+histogram update: no allocation and no logging on the hot path.
+
+Stage-to-stage spans aggregate into streaming histograms exposed through
+``get_stats()``, and the ring can be dumped as Chrome trace JSON
+(chrome://tracing or https://ui.perfetto.dev) to inspect individual frames.
+"""
+
+from __future__ import annotations
+
+import json
+import threading
+import time
+from pathlib import Path
+from typing import Dict, List, Optional
+
+import numpy as np
+
+from .histogram import LatencyHistogram
+
+CAMERAS = ("left", "right")
+
+# Stage boundaries in pipeline order
+MARKS = (
+    "captured",      # Frame returned by the camera
+    "enqueued",      # Routed (pre-roll buffer, recording) and queued for detection
+    "detect_start",  # Detection worker picked it up
+    "detect_end",    # Detector returned
+    "stereo_start",  # Stereo thread dequeued the detection result
+    "paired",        # Matched with the other camera's frame
+    "triangulated",  # Gating, triangulation and plate metrics done
+    "pitch_done",    # Pitch state machine updated
+)
+
+# Span ending at each mark (index-aligned with MARKS; nothing ends at "captured")
+SPANS = (
+    None,
+    "route",
+    "queue_wait",
+    "detect",
+    "result_queue",
+    "pairing",
+    "stereo",
+    "pitch",
+)
+
+END_TO_END = "end_to_end"
+
+_MARK_INDEX = {name: index for index, name in enumerate(MARKS)}
+
+
+class PipelineTracer:
+    """Preallocated per-frame trace ring with per-stage latency histograms.
+
+    Example:
+        >>> tracer = PipelineTracer(capacity=1024)
+        >>> tracer.mark("left", frame.frame_index, "captured")
+        >>> tracer.mark("left", frame.frame_index, "enqueued")
+        >>> tracer.get_stats()["route"]["p95_ms"]
+    """
+
+    def __init__(self, capacity: int = 4096, enabled: bool = True) -> None:
+        """Create a tracer.
+
+        Args:
+            capacity: Frames per camera kept in the ring for Chrome trace dumps
+            enabled: When False, ``mark`` returns immediately
+        """
+        self._lock = threading.Lock()
+        self._enabled = enabled
+        self._allocate(capacity)
+        self._histograms: Dict[str, LatencyHistogram] = {
+            name: LatencyHistogram() for name in SPANS[1:] + (END_TO_END,)
+        }
+
+    @property
+    def enabled(self) -> bool:
+        return self._enabled
+
+    @property
+    def capacity(self) -> int:
+        return self._capacity
+
+    def configure(self, enabled: Optional[bool] = None, capacity: Optional[int] = None) -> None:
+        """Enable/disable tracing or resize the ring (resizing clears it)."""
+        if enabled is not None:
+            self._enabled = bool(enabled)
+        if capacity is not None and capacity != self._capacity:
+            with self._lock:
+                self._allocate(capacity)
+
+    def reset(self) -> None:
+        """Clear trace records and histograms."""
+        with self._lock:
+            self._marks.fill(0)
+            self._frames.fill(-1)
+            for histogram in self._histograms.values():
+                histogram.reset()
+
+    def mark(self, camera: str, frame_index: int, stage: str, t_ns: Optional[int] = None) -> None:
+        """Record that a frame crossed a stage boundary.
+
+        ``captured`` starts a new record for the frame; later marks for a frame
+        whose record was never started (or already overwritten) are ignored.
+        The span since the frame's previous mark is added to that stage's
+        histogram, and ``pitch_done`` also records the end-to-end latency.
+
+        Args:
+            camera: "left" or "right"
+            frame_index: Camera frame index
+            stage: One of MARKS
+            t_ns: Timestamp (time.monotonic_ns), defaults to now
+        """
+        if not self._enabled:
+            return
+        if t_ns is None:
+            t_ns = time.monotonic_ns()
+        stage_index = _MARK_INDEX[stage]
+        cam = 0 if camera == "left" else 1
+        slot = frame_index % self._capacity
+
+        with self._lock:
+            row = self._marks[slot, cam]
+            if stage_index == 0:
+                row.fill(0)
+                row[0] = t_ns
+                self._frames[slot, cam] = frame_index
+                return
+            if self._frames[slot, cam] != frame_index:
+                return
+            row[stage_index] = t_ns
+            previous = stage_index - 1
+            while previous > 0 and row[previous] == 0:
+                previous -= 1
+            self._histograms[SPANS[stage_index]].record(t_ns - int(row[previous]))
+            if stage_index == len(MARKS) - 1:
+                self._histograms[END_TO_END].record(t_ns - int(row[0]))
+
+    def mark_pair(self, left_index: int, right_index: int, stage: str, t_ns: Optional[int] = None) -> None:
+        """Mark the same stage boundary for both frames of a stereo pair."""
+        if not self._enabled:
+            return
+        if t_ns is None:
+            t_ns = time.monotonic_ns()
+        self.mark("left", left_index, stage, t_ns)
+        self.mark("right", right_index, stage, t_ns)
+
+    def get_stats(self) -> Dict[str, Dict[str, float]]:
+        """Per-span latency summary in milliseconds.
+
+        Returns:
+            {span: {"count", "mean_ms", "p50_ms", "p95_ms", "p99_ms", "max_ms"}}
+            for each span in SPANS plus "end_to_end"
+        """
+        with self._lock:
+            return {name: histogram.summary_ms() for name, histogram in self._histograms.items()}
+
+    def flat_stats(self) -> Dict[str, float]:
+        """``get_stats()`` flattened to "<span>_<stat>" keys (e.g. "detect_p95_ms")."""
+        return {
+            f"{span}_{key}": value
+            for span, summary in self.get_stats().items()
+            for key, value in summary.items()
+        }
+
+    def to_chrome_trace(self) -> dict:
+        """Build a Chrome trace (JSON object format) from the records in the ring.
+
+        Each camera is a thread; each span of each frame is a complete ("X")
+        event with the frame index in its args.
+        """
+        with self._lock:
+            marks = self._marks.copy()
+            frames = self._frames.copy()
+
+        events: List[dict] = [
+            {"name": "thread_name", "ph": "M", "pid": 0, "tid": cam, "args": {"name": camera}}
+            for cam, camera in enumerate(CAMERAS)
+        ]
+        for slot, cam in zip(*np.nonzero(frames >= 0)):
+            row = marks[slot, cam]
+            frame_index = int(frames[slot, cam])
+            stamped = np.flatnonzero(row)
+            for start, end in zip(stamped[:-1], stamped[1:]):
+                events.append(
+                    {
+                        "name": SPANS[end],
+                        "cat": "pipeline",
+                        "ph": "X",
+                        "ts": int(row[start]) / 1e3,
+                        "dur": int(row[end] - row[start]) / 1e3,
+                        "pid": 0,
+                        "tid": int(cam),
+                        "args": {"frame_index": frame_index},
+                    }
+                )
+        events[len(CAMERAS):] = sorted(events[len(CAMERAS):], key=lambda event: event["ts"])
+        return {"traceEvents": events, "displayTimeUnit": "ms"}
+
+    def dump_chrome_trace(self, path: Path) -> Path:
+        """Write the ring as Chrome trace JSON and return the path."""
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(json.dumps(self.to_chrome_trace()))
+        return path
+
+    def _allocate(self, capacity: int) -> None:
+        if capacity < 1:
+            raise ValueError("Trace capacity must be positive")
+        self._capacity = int(capacity)
+        self._marks = np.zeros((self._capacity, len(CAMERAS), len(MARKS)), dtype=np.int64)
+        self._frames = np.full((self._capacity, len(CAMERAS)), -1, dtype=np.int64)
+
+
+# Global tracer shared by the capture, detection and stereo stages
+_tracer: Optional[PipelineTracer] = None
+_tracer_lock = threading.Lock()
+
+
+def get_tracer() -> PipelineTracer:
+    """Get the global pipeline tracer instance.
+
+    Returns:
+        Global pipeline tracer
+    """
+    global _tracer
+    if _tracer is None:
+        with _tracer_lock:
+            if _tracer is None:
+                _tracer = PipelineTracer()
+    return _tracer
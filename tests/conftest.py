@@ -0,0 +1,34 @@
+"""Shared test fixtures."""
+
+import cv2
+import numpy as np
+import pytest
+
+from configs import config_cache
+
+
+@pytest.fixture(autouse=True)
+def isolated_config_cache(tmp_path, monkeypatch):
+    """Keep config snapshots under tmp_path and start each test with an empty cache."""
+    monkeypatch.setenv(config_cache.CACHE_DIR_ENV_VAR, str(tmp_path / "config-cache"))
+    monkeypatch.setattr(config_cache, "_config_cache", None)
+
+
+@pytest.fixture
+def write_ball_video():
+    """Factory writing a 160x120 MJPG video of a white ball moving right along row 60.
+
+    The ball is centred at ``(10 + step_px * i + x_offset, 60)`` in frame ``i``.
+    """
+
+    def write(path, num_frames, x_offset=0, step_px=5):
+        writer = cv2.VideoWriter(str(path), cv2.VideoWriter_fourcc(*"MJPG"), 30.0, (160, 120))
+        if not writer.isOpened():
+            pytest.skip("MJPG writer not available")
+        for i in range(num_frames):
+            image = np.full((120, 160, 3), 20, dtype=np.uint8)
+            cv2.circle(image, (10 + step_px * i + x_offset, 60), 5, (255, 255, 255), -1)
+            writer.write(image)
+        writer.release()
+
+    return write
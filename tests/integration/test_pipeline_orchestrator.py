@@ -478,8 +478,8 @@ class TestPipelineOrchestratorEventFlow:
         orchestrator.start_capture(config, left_serial="left", right_serial="right")
 
         # Subscribe to pitch events
-        orchestrator._event_bus.subscribe(PitchStartEvent, handle_pitch_start)
-        orchestrator._event_bus.subscribe(PitchEndEvent, handle_pitch_end)
+        orchestrator.subscribe(PitchStartEvent, handle_pitch_start)
+        orchestrator.subscribe(PitchEndEvent, handle_pitch_end)
 
         # Simulate observations being published
         # (In real system, DetectionService publishes these)
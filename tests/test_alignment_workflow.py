@@ -75,10 +75,10 @@ def test_preset_management(tmp_path):
     
     # Save preset
     preset_name = "test_preset"
-    save_alignment_preset(results, preset_name, "left_test", "right_test")
+    save_alignment_preset(results, preset_name, "left_test", "right_test", presets_dir=tmp_path)
     
     # Load preset
-    preset_data = load_alignment_preset(preset_name)
+    preset_data = load_alignment_preset(preset_name, presets_dir=tmp_path)
     assert preset_data is not None
     assert preset_data["preset_name"] == preset_name
     assert preset_data["quality_score"] == results.get_quality_score()
@@ -0,0 +1,74 @@
+"""Tests for the review-mode batch re-detection engine."""
+
+import cv2
+import pytest
+
+from app.review.batch_detection import BatchDetectionEngine
+from contracts import Frame
+from detect.classical_detector import ClassicalDetector
+from detect.config import DetectorConfig, FilterConfig, Mode
+
+NUM_FRAMES = 30
+
+
+@pytest.fixture
+def engine(tmp_path, write_ball_video):
+    left = tmp_path / "left.avi"
+    right = tmp_path / "right.avi"
+    write_ball_video(left, NUM_FRAMES, x_offset=0, step_px=4)
+    write_ball_video(right, NUM_FRAMES, x_offset=6, step_px=4)
+    with BatchDetectionEngine(left, right) as engine:
+        yield engine
+
+
+def _config(threshold=18.0):
+    return DetectorConfig(
+        frame_diff_threshold=threshold,
+        bg_diff_threshold=threshold,
+        min_consecutive=1,
+        filters=FilterConfig(min_area=20, max_area=400, min_circularity=0.3),
+    )
+
+
+def test_matches_sequential_detection(engine, tmp_path):
+    result = engine.run(_config(), Mode.MODE_A, start_frame=5, end_frame=25)
+
+    detector = ClassicalDetector(config=_config(), mode=Mode.MODE_A, roi_by_camera={})
+    capture = cv2.VideoCapture(str(tmp_path / "left.avi"))
+    capture.set(cv2.CAP_PROP_POS_FRAMES, 5)
+    for frame_index in range(5, 26):
+        _, image = capture.read()
+        gray = cv2.cvtColor(image, cv2.COLOR_BGR2GRAY)
+        expected = detector.detect(Frame("left", frame_index, 0, gray, 160, 120, "GRAY8"))
+        got = result.left.get(frame_index, [])
+        assert [(d.u, d.v) for d in got] == [(d.u, d.v) for d in expected]
+    capture.release()
+
+    assert result.stats.frames == 21
+    assert result.stats.stereo_frames >= 15
+    assert result.stats.decoded_frames == 21
+
+
+def test_rerun_with_new_threshold_skips_decoding(engine):
+    engine.run(_config(), Mode.MODE_A)
+    result = engine.run(_config(threshold=250.0), Mode.MODE_A)
+
+    assert result.stats.decoded_frames == 0
+    assert result.stats.frames == NUM_FRAMES
+    assert result.stats.left_detections == 0
+    assert engine.cache_stats()["hits"] >= NUM_FRAMES
+
+
+def test_progress_and_cancel(engine):
+    progress = []
+
+    def on_progress(done, total):
+        progress.append((done, total))
+        if done == 10:
+            engine.cancel()
+
+    result = engine.run(_config(), Mode.MODE_A, progress_callback=on_progress)
+
+    assert result.cancelled
+    assert result.end_frame == 9
+    assert progress[0] == (1, NUM_FRAMES)
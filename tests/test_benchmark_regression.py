@@ -0,0 +1,125 @@
+"""Tests for the benchmark regression harness."""
+
+import json
+
+import numpy as np
+import pytest
+
+from benchmarks.regression import (
+    BASELINE_SCHEMA_VERSION,
+    BenchmarkCase,
+    CaseResult,
+    build_cases,
+    compare,
+    load_baseline,
+    main,
+    mann_whitney_greater,
+    run_case,
+    save_baseline,
+)
+
+
+def _samples(median_s, seed, count=15, spread=0.02):
+    rng = np.random.default_rng(seed)
+    return list(median_s * (1.0 + rng.normal(0.0, spread, size=count)))
+
+
+def test_mann_whitney_detects_shift_but_not_noise():
+    baseline = _samples(0.010, seed=1)
+
+    assert mann_whitney_greater(baseline, _samples(0.013, seed=2)) < 0.001
+    assert mann_whitney_greater(baseline, _samples(0.010, seed=3)) > 0.01
+    assert mann_whitney_greater([0.010] * 15, [0.010] * 15) > 0.4
+
+
+def test_compare_flags_only_significant_regressions_beyond_threshold():
+    baseline = {
+        "cases": {
+            "slower": {"samples_s": _samples(0.010, seed=1)},
+            "noisy": {"samples_s": _samples(0.010, seed=2, spread=0.2)},
+            "faster": {"samples_s": _samples(0.010, seed=3)},
+            "removed": {"samples_s": _samples(0.010, seed=4)},
+        }
+    }
+    results = {
+        "slower": CaseResult("slower", _samples(0.012, seed=5)),
+        "noisy": CaseResult("noisy", _samples(0.0105, seed=6, spread=0.2)),
+        "faster": CaseResult("faster", _samples(0.007, seed=7)),
+        "added": CaseResult("added", _samples(0.001, seed=8)),
+    }
+
+    report = compare(baseline, results, threshold=0.10, alpha=0.01)
+    status = {item.name: item.status for item in report.comparisons}
+
+    assert status == {
+        "slower": "regression",
+        "noisy": "ok",
+        "faster": "improved",
+        "added": "new",
+        "removed": "missing",
+    }
+    assert not report.passed
+    assert [item.name for item in report.regressions] == ["slower"]
+
+
+def test_baseline_round_trip_and_schema_check(tmp_path):
+    path = tmp_path / "baseline.json"
+    save_baseline(path, {"a": CaseResult("a", [0.1, 0.2, 0.3])}, {"trials": 3})
+    save_baseline(path, {"b": CaseResult("b", [0.4])}, {"trials": 1})
+
+    data = load_baseline(path)
+    assert data["schema_version"] == BASELINE_SCHEMA_VERSION
+    assert set(data["cases"]) == {"a", "b"}
+    assert data["cases"]["a"]["median_s"] == pytest.approx(0.2)
+
+    data["schema_version"] = 0
+    path.write_text(json.dumps(data))
+    with pytest.raises(ValueError):
+        load_baseline(path)
+
+
+def test_run_case_warms_up_and_cleans_up():
+    calls = []
+    cleaned = []
+
+    def setup(stack):
+        stack.callback(lambda: cleaned.append(True))
+        return lambda: calls.append(1)
+
+    result = run_case(BenchmarkCase("count", setup, number=4), warmup=2, trials=3)
+
+    assert len(calls) == 2 + 3 * 4
+    assert len(result.samples_s) == 3
+    assert cleaned == [True]
+
+
+def test_cases_cover_hot_paths():
+    names = [case.name for case in build_cases(quick=True)]
+
+    for prefix in (
+        "detect/classical/mode_a/",
+        "detect/classical/mode_b/",
+        "connected_components/",
+        "stereo/build_matches/",
+        "stereo/triangulate/",
+        "strike_zone/",
+        "trajectory/physics_fit",
+        "trajectory/ekf/",
+        "video/encode_mjpg/",
+        "video/decode_mjpg/",
+        "video/seek_read/",
+    ):
+        assert any(name.startswith(prefix) for name in names), prefix
+    assert len(names) == len(set(names))
+
+
+def test_cli_records_then_passes_against_own_baseline(tmp_path):
+    baseline = tmp_path / "baseline.json"
+    args = ["--baseline", str(baseline), "--filter", "stereo/triangulate", "--trials", "10", "--warmup", "1"]
+
+    assert main(args) == 2  # no baseline yet
+    assert main(args + ["--update-baseline"]) == 0
+    assert main(args + ["--threshold", "5.0", "--json", str(tmp_path / "report.json")]) == 0
+    report = json.loads((tmp_path / "report.json").read_text())
+    assert report["passed"] is True
+    assert [item["name"] for item in report["comparisons"]] == ["stereo/triangulate/pitch"]
@@ -0,0 +1,130 @@
+"""Tests for the parsed configuration cache."""
+
+from pathlib import Path
+
+import pytest
+
+from configs.config_cache import CACHE_DIR_ENV_VAR, ConfigCache, default_cache_dir
+from configs.settings import _config_fingerprint, _parse_config, load_config
+from exceptions import ConfigError
+
+DEFAULT_CONFIG = Path(__file__).resolve().parent.parent / "configs" / "default.yaml"
+
+
+@pytest.fixture
+def config_path(tmp_path):
+    path = tmp_path / "app.yaml"
+    path.write_text(DEFAULT_CONFIG.read_text())
+    return path
+
+
+def _set_fps(path, fps):
+    text = path.read_text()
+    lines = text.splitlines()
+    for index, line in enumerate(lines):
+        if line.strip().startswith("fps:"):
+            lines[index] = line.split("fps:")[0] + f"fps: {fps}"
+            break
+    path.write_text("\n".join(lines) + "\n")
+
+
+def test_unchanged_file_is_served_from_cache(config_path):
+    cache = ConfigCache(snapshots=False)
+
+    first = cache.load(config_path, _parse_config, _config_fingerprint())
+    second = cache.load(config_path, _parse_config, _config_fingerprint())
+
+    assert second == first
+    assert cache.get_stats() == {"hits": 1, "snapshot_loads": 0, "parses": 1}
+
+
+def test_callers_get_independent_copies(config_path):
+    cache = ConfigCache(snapshots=False)
+    first = cache.load(config_path, _parse_config)
+    original = dict(first.ball.radius_in)
+
+    first.ball.radius_in["baseball"] = 99.0
+
+    assert cache.load(config_path, _parse_config).ball.radius_in == original
+
+
+def test_changed_file_is_reparsed_and_listeners_notified(config_path):
+    cache = ConfigCache(snapshots=False)
+    changes = []
+    cache.subscribe(lambda path, config: changes.append((path, config.camera.fps)))
+    cache.load(config_path, _parse_config)
+    assert cache.refresh() == []
+
+    _set_fps(config_path, 90)
+
+    assert cache.refresh() == [config_path.resolve()]
+    assert changes == [(config_path.resolve(), 90)]
+    assert cache.load(config_path, _parse_config).camera.fps == 90
+    assert cache.get_stats()["parses"] == 2
+    assert cache.refresh() == []
+
+    _set_fps(config_path, 60)
+    assert cache.load(config_path, _parse_config).camera.fps == 60
+    assert changes[-1] == (config_path.resolve(), 60)
+
+
+def test_snapshot_is_reused_by_a_new_cache_until_the_file_changes(config_path, tmp_path):
+    cache_dir = tmp_path / "cache"
+    fingerprint = _config_fingerprint()
+    expected = ConfigCache(cache_dir=cache_dir).load(config_path, _parse_config, fingerprint)
+    assert [path.name for path in config_path.parent.iterdir() if path.is_file()] == [config_path.name]
+    assert len(list(cache_dir.glob("*.snapshot"))) == 1
+
+    cache = ConfigCache(cache_dir=cache_dir)
+    assert cache.load(config_path, _parse_config, fingerprint) == expected
+    assert cache.get_stats()["snapshot_loads"] == 1
+
+    stale = ConfigCache(cache_dir=cache_dir)
+    stale.load(config_path, _parse_config, "other-schema")
+    assert stale.get_stats()["parses"] == 1
+
+    _set_fps(config_path, 90)
+    edited = ConfigCache(cache_dir=cache_dir)
+    assert edited.load(config_path, _parse_config, fingerprint).camera.fps == 90
+    assert edited.get_stats()["parses"] == 1
+
+
+def test_tampered_or_corrupt_snapshots_are_not_unpickled(config_path, tmp_path):
+    cache_dir = tmp_path / "cache"
+    fingerprint = _config_fingerprint()
+    expected = ConfigCache(cache_dir=cache_dir).load(config_path, _parse_config, fingerprint)
+    (snapshot,) = cache_dir.glob("*.snapshot")
+
+    header, payload = snapshot.read_bytes().split(b"\n", 1)
+    snapshot.write_bytes(header + b"\n" + payload[:-1] + bytes([payload[-1] ^ 0xFF]))
+    tampered = ConfigCache(cache_dir=cache_dir)
+    assert tampered.load(config_path, _parse_config, fingerprint) == expected
+    assert tampered.get_stats()["parses"] == 1
+
+    snapshot.write_bytes(b"not a snapshot")
+    corrupt = ConfigCache(cache_dir=cache_dir)
+    assert corrupt.load(config_path, _parse_config, fingerprint) == expected
+    assert corrupt.get_stats()["parses"] == 1
+
+
+def test_default_cache_dir_honours_override(tmp_path, monkeypatch):
+    monkeypatch.setenv(CACHE_DIR_ENV_VAR, str(tmp_path / "override"))
+
+    assert default_cache_dir() == tmp_path / "override"
+    assert ConfigCache().cache_dir == tmp_path / "override"
+
+
+def test_invalid_config_raises_and_keeps_last_good_config(config_path):
+    cache = ConfigCache(snapshots=False)
+    good = cache.load(config_path, _parse_config)
+
+    config_path.write_text("camera: [unclosed\n")
+
+    with pytest.raises(ConfigError):
+        cache.load(config_path, _parse_config)
+    assert cache.refresh() == []
+    with pytest.raises(ConfigError):
+        load_config(config_path)
+    config_path.write_text(DEFAULT_CONFIG.read_text())
+    assert cache.load(config_path, _parse_config) == good
+    assert cache.get_stats()["hits"] == 1
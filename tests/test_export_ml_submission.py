@@ -0,0 +1,168 @@
+"""Tests for the streaming ML submission packager."""
+
+import hashlib
+import json
+import os
+import zipfile
+
+import pytest
+
+import export_ml_submission
+from app.pipeline.recording.telemetry_store import (
+    TelemetryTable,
+    detections_path,
+    observations_path,
+    write_table,
+)
+from export_ml_submission import StreamingZipWriter, compress_bytes, create_ml_submission, write_package
+
+
+def _make_session(tmp_path):
+    session_dir = tmp_path / "session-2026-01-19_001"
+    pitch_dir = session_dir / "s1-pitch-001"
+    (pitch_dir / "detections").mkdir(parents=True)
+    (pitch_dir / "frames" / "left").mkdir(parents=True)
+    (session_dir / "manifest.json").write_text(json.dumps({"session": "s1"}))
+    (session_dir / "session_summary.json").write_text(json.dumps({"session_id": "s1", "pitch_count": 1}))
+    (session_dir / "session_left.avi").write_bytes(os.urandom(300_000))
+    (session_dir / "session_right.avi").write_bytes(os.urandom(300_000))
+    (pitch_dir / "manifest.json").write_text(json.dumps({"pitch_id": "p1"}))
+    (pitch_dir / "left.avi").write_bytes(os.urandom(50_000))
+    (pitch_dir / "left_timestamps.csv").write_text("frame_index,t\n" * 2000)
+    (pitch_dir / "detections" / "left_detections.json").write_text(json.dumps({"detections": [{"u": 1}] * 500}))
+    (pitch_dir / "frames" / "left" / "frame_0001.png").write_bytes(os.urandom(1000))
+    return session_dir
+
+
+def test_full_package_stores_media_and_hashes_in_one_pass(tmp_path):
+    session_dir = _make_session(tmp_path)
+    output = tmp_path / "submission.zip"
+    progress = []
+
+    manifest = create_ml_submission(
+        session_dir, output, "full", max_workers=2, progress_callback=lambda *args: progress.append(args)
+    )
+
+    with zipfile.ZipFile(output) as archive:
+        assert archive.testzip() is None
+        infos = {info.filename: info for info in archive.infolist()}
+        assert infos["session/session_left.avi"].compress_type == zipfile.ZIP_STORED
+        assert infos["pitches/s1-pitch-001/frames/left/frame_0001.png"].compress_type == zipfile.ZIP_STORED
+        assert infos["pitches/s1-pitch-001/left_timestamps.csv"].compress_type == zipfile.ZIP_DEFLATED
+        assert archive.read("session/session_left.avi") == (session_dir / "session_left.avi").read_bytes()
+        embedded = json.loads(archive.read("submission_manifest.json"))
+        manifest_offset = infos["submission_manifest.json"].header_offset
+
+    data = output.read_bytes()
+    assert embedded["checksum_sha256"] == hashlib.sha256(data[:manifest_offset]).hexdigest()
+    assert manifest["archive_sha256"] == hashlib.sha256(data).hexdigest()
+    assert manifest["packaging"]["stored_files"] == 4
+    assert manifest["packaging"]["deflated_files"] == 5
+    assert progress[-1][2:] == (9, 9)
+    assert progress[-1][0] == progress[-1][1]
+    sidecar = json.loads(output.with_suffix(".manifest.json").read_text())
+    assert sidecar["archive_sha256"] == manifest["archive_sha256"]
+
+
+def test_telemetry_only_package_excludes_videos(tmp_path):
+    session_dir = _make_session(tmp_path)
+    output = tmp_path / "telemetry.zip"
+    create_ml_submission(session_dir, output, "telemetry_only", telemetry_only_reason="bandwidth")
+
+    with zipfile.ZipFile(output) as archive:
+        names = archive.namelist()
+    assert "pitches/s1-pitch-001/detections/left_detections.json" in names
+    assert not [name for name in names if name.endswith((".avi", ".png"))]
+
+
+def test_npz_telemetry_is_packaged_as_schema_json(tmp_path):
+    session_dir = _make_session(tmp_path)
+    pitch_dir = session_dir / "s1-pitch-001"
+    (pitch_dir / "observations").mkdir()
+    detections = TelemetryTable.from_detections(
+        [{"frame_index": 3, "timestamp_ns": 30, "u_px": 1.5, "v_px": 2.5, "radius_px": 4.0, "confidence": 0.5}],
+        pitch_id="p1", camera="right",
+    )
+    observations = TelemetryTable.from_observations(
+        [{
+            "timestamp_ns": 30, "left_px": [1.0, 2.0], "right_px": [3.0, 4.0],
+            "X_ft": 0.5, "Y_ft": 1.5, "Z_ft": 40.0, "quality": 0.75, "confidence": 0.5,
+        }],
+        pitch_id="p1",
+    )
+    write_table(detections_path(pitch_dir, "right"), detections)
+    write_table(observations_path(pitch_dir), observations)
+    output = tmp_path / "telemetry.zip"
+    progress = []
+
+    create_ml_submission(
+        session_dir, output, "telemetry_only", telemetry_only_reason="bandwidth",
+        progress_callback=lambda *args: progress.append(args),
+    )
+
+    with zipfile.ZipFile(output) as archive:
+        names = archive.namelist()
+        right = json.loads(archive.read("pitches/s1-pitch-001/detections/right_detections.json"))
+        stereo = json.loads(archive.read("pitches/s1-pitch-001/observations/stereo_observations.json"))
+    assert not [name for name in names if name.endswith(".npz")]
+    assert "pitches/s1-pitch-001/detections/left_detections.json" in names
+    assert right == detections.to_payload()
+    assert stereo["observation_count"] == 1
+    assert stereo["observations"][0]["left_px"] == [1.0, 2.0]
+    # Progress counts on-disk sizes, although npz members grow into JSON
+    assert all(done <= total for done, total, _, _ in progress)
+    assert progress[-1][0] == progress[-1][1]
+
+
+def test_compression_lookahead_is_bounded_by_bytes(tmp_path, monkeypatch):
+    submitted = []
+
+    class RecordingPool(export_ml_submission.ThreadPoolExecutor):
+        def submit(self, fn, path, *args):
+            submitted.append(path)
+            return super().submit(fn, path, *args)
+
+    monkeypatch.setattr(export_ml_submission, "ThreadPoolExecutor", RecordingPool)
+    entries = []
+    for index, size in enumerate([100_000] * 6 + [1_000_000]):
+        path = tmp_path / f"table_{index}.csv"
+        path.write_bytes(b"x" * size)
+        entries.append((path, path.name))
+    ahead = []
+
+    with open(tmp_path / "out.zip", "wb") as handle:
+        writer = StreamingZipWriter(handle)
+        stats = write_package(
+            writer, entries, max_workers=2, lookahead_bytes=250_000,
+            progress_callback=lambda done, total, files, _: ahead.append(len(submitted) - files),
+        )
+        writer.close()
+
+    # Never more than two 100 kB files compressed ahead; the 1 MB file still goes in
+    assert max(ahead) <= 2
+    assert stats["deflated_files"] == 7
+    with zipfile.ZipFile(tmp_path / "out.zip") as archive:
+        assert archive.read("table_6.csv") == b"x" * 1_000_000
+
+
+def test_zip64_records_are_readable(tmp_path, monkeypatch):
+    monkeypatch.setattr(export_ml_submission, "_ZIP64_LIMIT", 100)
+    source = tmp_path / "big.avi"
+    source.write_bytes(os.urandom(5000))
+    output = tmp_path / "zip64.zip"
+
+    with open(output, "wb") as handle:
+        writer = StreamingZipWriter(handle)
+        writer.write_stored_file(source, "big.avi")
+        writer.write_compressed("notes.txt", *compress_bytes(b"hello " * 100), mtime=0.0)
+        writer.close()
+
+    with zipfile.ZipFile(output) as archive:
+        assert archive.testzip() is None
+        assert archive.read("big.avi") == source.read_bytes()
+        assert archive.read("notes.txt") == b"hello " * 100
+
+
+def test_missing_session_raises(tmp_path):
+    with pytest.raises(FileNotFoundError):
+        create_ml_submission(tmp_path / "missing", tmp_path / "out.zip", "full")
@@ -0,0 +1,116 @@
+"""Tests for asynchronous training frame extraction."""
+
+import copy
+import threading
+from pathlib import Path
+
+import cv2
+import numpy as np
+import pytest
+import yaml
+
+from app.pipeline.recording import frame_extractor
+from app.pipeline.recording.frame_extractor import FrameExtractor, FrameWriterPool
+from configs.validator import ConfigValidationError, validate_config
+from contracts import Frame
+
+DEFAULT_CONFIG = Path(__file__).resolve().parent.parent / "configs" / "default.yaml"
+
+
+def _frame(index, value=100):
+    image = np.full((48, 64, 3), value, dtype=np.uint8)
+    return Frame(
+        camera_id="left", frame_index=index, t_capture_monotonic_ns=index,
+        image=image, width=64, height=48, pixfmt="BGR",
+    )
+
+
+@pytest.mark.parametrize("image_format, extension", [("png", ".png"), ("webp", ".webp"), ("jpg", ".jpg")])
+def test_frames_are_written_in_background(tmp_path, image_format, extension):
+    pool = FrameWriterPool(workers=2, max_queue=16)
+    extractor = FrameExtractor(tmp_path, image_format=image_format, writer_pool=pool)
+    for i in range(10):
+        extractor.save_uniform("left", _frame(i), interval=2)
+
+    assert extractor.flush(timeout=5.0)
+    pool.shutdown()
+    files = sorted((tmp_path / "frames" / "left").iterdir())
+    assert [f.name for f in files] == [f"uniform_{n:05d}{extension}" for n in (2, 4, 6, 8, 10)]
+    assert extractor.stats() == {"queued": 5, "written": 5, "failed": 0, "dropped": 0}
+    if image_format != "jpg":
+        np.testing.assert_array_equal(cv2.imread(str(files[0])), _frame(0).image)
+
+
+def test_saturated_queue_drops_with_accounting(tmp_path, monkeypatch):
+    release = threading.Event()
+    real_imwrite = cv2.imwrite
+
+    def slow_imwrite(path, image, params):
+        release.wait(5.0)
+        return real_imwrite(path, image, params)
+
+    monkeypatch.setattr(frame_extractor.cv2, "imwrite", slow_imwrite)
+    pool = FrameWriterPool(workers=1, max_queue=2)
+    extractor = FrameExtractor(tmp_path, writer_pool=pool)
+
+    for i in range(10):
+        extractor.save_uniform("left", _frame(i), interval=1)
+    stats = extractor.stats()
+    # One frame in the writer plus two queued; the rest are dropped
+    assert stats["queued"] + stats["dropped"] == 10
+    assert 2 <= stats["queued"] <= 3
+
+    release.set()
+    assert extractor.flush(timeout=5.0)
+    pool.shutdown()
+    assert extractor.stats()["written"] == stats["queued"]
+
+
+def test_unknown_format_rejected(tmp_path):
+    with pytest.raises(ValueError):
+        FrameExtractor(tmp_path, image_format="bmp")
+
+
+@pytest.mark.parametrize("image_format, compression", [("png", 10), ("webp", 0), ("jpg", 101)])
+def test_out_of_range_compression_rejected(tmp_path, image_format, compression):
+    with pytest.raises(ValueError):
+        FrameExtractor(tmp_path, image_format=image_format, compression=compression)
+
+
+@pytest.mark.parametrize(
+    "image_format, compression, valid",
+    [
+        (None, 9, True), (None, 10, False), ("png", 50, False),
+        ("webp", 101, True), ("webp", 0, False),
+        ("jpg", 100, True), ("jpg", 101, False),
+        ("jpg", None, True),
+    ],
+)
+def test_schema_checks_compression_per_format(image_format, compression, valid):
+    with open(DEFAULT_CONFIG) as f:
+        config = copy.deepcopy(yaml.safe_load(f))
+    config["recording"].pop("frame_format", None)
+    if image_format is not None:
+        config["recording"]["frame_format"] = image_format
+    config["recording"]["frame_compression"] = compression
+
+    if valid:
+        validate_config(config)
+    else:
+        with pytest.raises(ConfigValidationError):
+            validate_config(config)
+
+
+def test_session_shutdown_writes_out_shared_pool(tmp_path, monkeypatch):
+    monkeypatch.setattr(frame_extractor, "_shared_pool", None)
+    extractor = FrameExtractor(tmp_path)
+    for i in range(4):
+        extractor.save_uniform("left", _frame(i), interval=1)
+    pool = frame_extractor.get_frame_writer_pool()
+
+    frame_extractor.shutdown_frame_writer_pool()
+
+    assert extractor.stats()["written"] == 4
+    assert not any(thread.is_alive() for thread in pool._threads)
+    assert frame_extractor.get_frame_writer_pool() is not pool
+    frame_extractor.shutdown_frame_writer_pool()
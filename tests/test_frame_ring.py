@@ -0,0 +1,121 @@
+"""Tests for the shared-memory frame ring and engine process transport."""
+
+import multiprocessing
+import time
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+from app.ipc import EngineClient, SharedFrameRing
+from contracts import Frame
+
+
+def _frame(index, shape=(48, 64, 3), pixfmt="BGR"):
+    image = np.full(shape, index % 256, dtype=np.uint8)
+    return Frame("left", index, 1_000 * index, image, shape[1], shape[0], pixfmt)
+
+
+@pytest.fixture
+def ring():
+    ring = SharedFrameRing.create("left", slots=4, slot_bytes=48 * 64 * 3)
+    yield ring
+    ring.close()
+
+
+def test_round_trip_is_zero_copy(ring):
+    seq = ring.write(_frame(7))
+    gray_seq = ring.write(_frame(8, shape=(48, 64), pixfmt="GRAY8"))
+
+    reader = SharedFrameRing.attach(ring.name)
+    try:
+        latest = reader.latest()
+        assert latest.seq == gray_seq
+        assert latest.frame.image.shape == (48, 64)
+        assert latest.frame.pixfmt == "GRAY8"
+
+        first = reader.read(seq)
+        assert first.frame.frame_index == 7
+        assert first.frame.t_capture_monotonic_ns == 7_000
+        assert first.frame.camera_id == "left"
+        assert (first.frame.image == 7).all()
+        assert not first.frame.image.flags.owndata  # view into shared memory
+        assert reader.read(seq, copy=True).frame.image.flags.owndata
+        del latest, first
+    finally:
+        reader.close()
+
+
+def test_lapped_slots_are_reported_invalid(ring):
+    first = ring.write(_frame(0))
+    for index in range(1, ring.slots + 1):
+        ring.write(_frame(index))
+
+    assert not ring.is_valid(first)
+    assert ring.read(first) is None
+    assert ring.latest().frame.frame_index == ring.slots
+
+
+def test_copies_survive_lapping(ring):
+    ring.write(_frame(3))
+    copied = ring.latest(copy=True)
+    for index in range(10, 10 + ring.slots):
+        ring.write(_frame(index))
+
+    assert not ring.is_valid(copied.seq)
+    assert (copied.frame.image == 3).all()
+
+
+def test_oversized_frames_are_rejected(ring):
+    with pytest.raises(ValueError):
+        ring.write(_frame(0, shape=(96, 64, 3)))
+    assert ring.latest() is None
+
+
+def _write_frames(name, count):
+    ring = SharedFrameRing.attach(name)
+    for index in range(count):
+        ring.write(_frame(index))
+    ring.close()
+
+
+def test_frames_written_by_another_process(ring):
+    context = multiprocessing.get_context("spawn")
+    writer = context.Process(target=_write_frames, args=(ring.name, 10))
+    writer.start()
+    writer.join(timeout=30)
+
+    assert writer.exitcode == 0
+    latest = ring.latest()
+    assert latest.seq == 9
+    assert latest.frame.frame_index == 9
+    assert (latest.frame.image == 9).all()
+
+
+def test_engine_client_streams_simulated_capture():
+    from configs.settings import load_config
+
+    client = EngineClient(backend="sim")
+    try:
+        assert client.get_session_summary().pitch_count == 0  # forwarded call
+        with pytest.raises(AttributeError):
+            client.no_such_method()
+
+        client.start_capture(load_config(Path("configs/default.yaml")), "sim-left", "sim-right")
+        frames = None
+        for _ in range(100):
+            try:
+                frames = client.get_preview_frames()
+                break
+            except RuntimeError:
+                time.sleep(0.05)
+        assert frames is not None
+        left, right = frames
+        assert (left.camera_id, right.camera_id) == ("left", "right")
+        assert left.image.size > 0
+        assert left.image.flags.owndata and right.image.flags.owndata  # not views into the rings
+        client.stop_capture()
+    finally:
+        client.close()
+
+    assert client._process.exitcode == 0
@@ -0,0 +1,64 @@
+"""Tests for the fixed-memory latency histograms."""
+
+import numpy as np
+import pytest
+
+from telemetry import LatencyHistogram, TelemetryMonitor, WindowedHistogram
+
+MS = 1_000_000
+S = 1_000_000_000
+
+
+def test_quantiles_match_numpy_on_heavy_tailed_samples():
+    rng = np.random.default_rng(3)
+    samples = (rng.lognormal(mean=np.log(8.0), sigma=0.6, size=20_000) * MS).astype(np.int64)
+    histogram = LatencyHistogram()
+    for value in samples:
+        histogram.record(int(value))
+
+    for q in (0.5, 0.95, 0.99):
+        assert histogram.quantile(q) == pytest.approx(np.quantile(samples, q), rel=0.02)
+    assert histogram.max_ns == samples.max()
+    assert histogram.mean_ns == pytest.approx(samples.mean())
+
+
+def test_merge_equals_recording_everything_once():
+    left, right, both = LatencyHistogram(), LatencyHistogram(), LatencyHistogram()
+    for value_ms in range(1, 200):
+        (left if value_ms % 2 else right).record(value_ms * MS)
+        both.record(value_ms * MS)
+
+    merged = left.snapshot().merge(right)
+
+    assert merged.count == both.count
+    assert merged.min_ns == MS and merged.max_ns == 199 * MS
+    assert merged.quantile(0.95) == both.quantile(0.95)
+    assert left.count == 100  # snapshot left the original untouched
+    with pytest.raises(ValueError):
+        merged.merge(LatencyHistogram(growth=1.05))
+
+
+def test_windowed_view_drops_old_slices():
+    window = WindowedHistogram(window_s=10.0, slices=10)
+    for second in range(30):
+        value = 100 * MS if second < 20 else 5 * MS
+        window.record(value, now_ns=second * S)
+
+    recent = window.snapshot(now_ns=29 * S)
+    assert recent.count == 10
+    assert recent.max_ns == 5 * MS
+    assert window.snapshot(window_s=3.0, now_ns=29 * S).count == 3
+    assert window.total().count == 30
+    assert window.total().max_ns == 100 * MS
+
+
+def test_monitor_memory_is_constant():
+    monitor = TelemetryMonitor()
+    for index in range(50_000):
+        monitor.record_latency_ms(1.0 + (index % 100))
+
+    stats = monitor.summarize()
+    assert stats.p50_ms == pytest.approx(50.5, rel=0.03)
+    assert stats.p99_ms == pytest.approx(99.0, rel=0.03)
+    assert stats.max_ms == pytest.approx(100.0)
+    assert not hasattr(monitor, "latency_samples_ms")
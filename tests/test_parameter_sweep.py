@@ -0,0 +1,105 @@
+"""Tests for the detector parameter sweep."""
+
+import pytest
+
+from app.review.parameter_sweep import (
+    ParameterSweep,
+    SweepTarget,
+    apply_params,
+    format_results_table,
+    grid_variants,
+    random_variants,
+)
+from detect.config import DetectorConfig, FilterConfig
+
+NUM_FRAMES = 24
+
+
+def _ball_position(i, x_offset):
+    return 10 + 5 * i + x_offset, 60
+
+
+@pytest.fixture
+def target(tmp_path, write_ball_video):
+    write_ball_video(tmp_path / "left.avi", NUM_FRAMES, x_offset=0)
+    write_ball_video(tmp_path / "right.avi", NUM_FRAMES, x_offset=6)
+    truth = {
+        camera: {i: [_ball_position(i, offset)] for i in range(1, NUM_FRAMES)}
+        for camera, offset in (("left", 0), ("right", 6))
+    }
+    return SweepTarget("pitch-001", tmp_path / "left.avi", tmp_path / "right.avi", truth=truth)
+
+
+def _base_config():
+    return DetectorConfig(min_consecutive=1, filters=FilterConfig(min_area=20, min_circularity=0.3))
+
+
+def test_apply_params_and_variant_generation():
+    config = apply_params(_base_config(), {"frame_diff_threshold": 9.0, "filters.min_area": 40, "max_area": 90})
+    assert config.frame_diff_threshold == 9.0
+    assert config.filters.min_area == 40
+    assert config.filters.max_area == 90
+    with pytest.raises(ValueError):
+        apply_params(_base_config(), {"not_a_field": 1})
+
+    assert len(grid_variants({"a": [1, 2], "b": [3, 4, 5]})) == 6
+    sampled = random_variants({"min_area": (5, 50), "bg_alpha": (0.01, 0.1)}, 10, seed=3)
+    assert all(isinstance(v["min_area"], int) and 5 <= v["min_area"] <= 50 for v in sampled)
+    assert sampled == random_variants({"min_area": (5, 50), "bg_alpha": (0.01, 0.1)}, 10, seed=3)
+
+
+@pytest.mark.parametrize("use_processes", [False, True])
+def test_sweep_ranks_variants_against_reference(target, tmp_path, use_processes):
+    sweep = ParameterSweep(
+        [target],
+        base_config=_base_config(),
+        cache_dir=tmp_path / "cache",
+        max_workers=2,
+        use_processes=use_processes,
+    )
+    variants = grid_variants({"frame_diff_threshold": [18.0, 250.0], "bg_diff_threshold": [12.0, 250.0]})
+    results = sweep.run(variants)
+
+    assert [r.rank for r in results] == [1, 2, 3, 4]
+    # Frame differencing also fires on the spot the ball just left
+    assert results[0].recall > 0.9
+    assert results[0].f1 > 0.6
+    assert results[-1].params == {"frame_diff_threshold": 250.0, "bg_diff_threshold": 250.0}
+    assert results[-1].f1 == 0.0
+    assert "frame_diff_threshold=" in format_results_table(results)
+
+
+def test_decoded_frames_are_reused_across_runs(target, tmp_path, monkeypatch):
+    sweep = ParameterSweep([target], base_config=_base_config(), cache_dir=tmp_path / "cache", use_processes=False)
+    sweep.prepare()
+
+    import app.review.parameter_sweep as parameter_sweep
+
+    def fail_decode(*args, **kwargs):
+        raise AssertionError("frames decoded twice")
+
+    monkeypatch.setattr(parameter_sweep, "_decode_to_files", fail_decode)
+    results = ParameterSweep(
+        [target], base_config=_base_config(), cache_dir=tmp_path / "cache", use_processes=False
+    ).run([{}])
+    assert results[0].frames == NUM_FRAMES
+
+
+def test_precision_only_counts_detections_on_annotated_frames(target, tmp_path):
+    annotated = range(NUM_FRAMES // 2, NUM_FRAMES)
+    partial = SweepTarget(
+        "pitch-001",
+        target.left_video_path,
+        target.right_video_path,
+        truth={camera: {i: points[i] for i in annotated} for camera, points in target.truth.items()},
+    )
+    variant = [{"frame_diff_threshold": 18.0, "bg_diff_threshold": 250.0}]
+
+    full = ParameterSweep([target], base_config=_base_config(), cache_dir=tmp_path / "full", use_processes=False)
+    half = ParameterSweep([partial], base_config=_base_config(), cache_dir=tmp_path / "half", use_processes=False)
+    full_result = full.run(variant)[0]
+    half_result = half.run(variant)[0]
+
+    assert half_result.detections == full_result.detections
+    assert half_result.recall > 0.9
+    assert half_result.precision == full_result.precision
@@ -0,0 +1,128 @@
+"""Tests for per-stage pipeline latency tracing."""
+
+import json
+from pathlib import Path
+
+import cv2
+import pytest
+
+from app.pipeline.replay import SessionReplay
+from app.pipeline_service import InProcessPipelineService
+from app.services.orchestrator import PipelineOrchestrator
+from capture.synthetic_scene import SceneConfig, StereoScene, default_geometry
+from configs.settings import load_config
+from telemetry import LatencyHistogram, PipelineTracer, get_tracer
+from telemetry.tracing import MARKS
+
+MS = 1_000_000
+
+
+def _trace_frame(tracer, camera, frame_index, start_ns, step_ms=1):
+    for offset, stage in enumerate(MARKS):
+        tracer.mark(camera, frame_index, stage, t_ns=start_ns + offset * step_ms * MS)
+
+
+def test_histogram_quantiles_within_bucket_error():
+    histogram = LatencyHistogram()
+    for value_ms in range(1, 1001):
+        histogram.record(value_ms * MS)
+
+    assert histogram.count == 1000
+    assert histogram.mean_ns == pytest.approx(500.5 * MS)
+    assert histogram.quantile(0.5) == pytest.approx(500 * MS, rel=0.02)
+    assert histogram.quantile(0.99) == pytest.approx(990 * MS, rel=0.02)
+    assert histogram.quantile(1.0) == 1000 * MS
+    assert histogram.min_ns == MS
+
+
+def test_spans_and_end_to_end_are_recorded():
+    tracer = PipelineTracer(capacity=16)
+    for frame_index in range(10):
+        _trace_frame(tracer, "left", frame_index, start_ns=frame_index * 100 * MS, step_ms=2)
+        _trace_frame(tracer, "right", frame_index, start_ns=frame_index * 100 * MS, step_ms=2)
+
+    stats = tracer.get_stats()
+    assert stats["detect"]["count"] == 20
+    assert stats["detect"]["p50_ms"] == pytest.approx(2.0, rel=0.02)
+    assert stats["end_to_end"]["p99_ms"] == pytest.approx(2.0 * (len(MARKS) - 1), rel=0.02)
+    assert tracer.flat_stats()["pitch_p95_ms"] == pytest.approx(2.0, rel=0.02)
+
+
+def test_marks_for_unknown_or_overwritten_frames_are_ignored():
+    tracer = PipelineTracer(capacity=4)
+    tracer.mark("left", 3, "detect_end", t_ns=5 * MS)  # never captured
+    tracer.mark("left", 1, "captured", t_ns=MS)
+    tracer.mark("left", 5, "captured", t_ns=2 * MS)  # same slot as frame 1
+    tracer.mark("left", 1, "enqueued", t_ns=3 * MS)
+
+    assert tracer.get_stats()["route"]["count"] == 0
+
+    # Skipped stages: span measured from the last recorded mark
+    tracer.mark("left", 5, "detect_start", t_ns=7 * MS)
+    assert tracer.get_stats()["queue_wait"]["max_ms"] == pytest.approx(5.0)
+
+
+def test_disabled_tracer_records_nothing():
+    tracer = PipelineTracer(enabled=False)
+    _trace_frame(tracer, "left", 0, start_ns=MS)
+
+    assert tracer.get_stats()["end_to_end"]["count"] == 0
+
+
+def test_chrome_trace_dump(tmp_path):
+    tracer = PipelineTracer(capacity=8)
+    _trace_frame(tracer, "left", 0, start_ns=10 * MS)
+    _trace_frame(tracer, "right", 0, start_ns=10 * MS)
+
+    path = tracer.dump_chrome_trace(tmp_path / "trace.json")
+    events = json.loads(path.read_text())["traceEvents"]
+    spans = [event for event in events if event["ph"] == "X"]
+
+    assert len(spans) == 2 * (len(MARKS) - 1)
+    assert {event["tid"] for event in spans} == {0, 1}
+    detect = next(event for event in spans if event["name"] == "detect" and event["tid"] == 0)
+    assert detect["ts"] == pytest.approx(12_000.0)  # microseconds
+    assert detect["dur"] == pytest.approx(1_000.0)
+    assert detect["args"] == {"frame_index": 0}
+
+
+def _write_video(path, frames):
+    height, width = frames[0].shape
+    writer = cv2.VideoWriter(str(path), cv2.VideoWriter_fourcc(*"MJPG"), 60, (width, height), False)
+    for image in frames:
+        writer.write(image)
+    writer.release()
+
+
+def test_replay_populates_every_stage(tmp_path):
+    config = load_config(Path("configs/default.yaml"))
+    scene = StereoScene(default_geometry(320, 180), SceneConfig(width=320, height=180, frames=12))
+    for camera in ("left", "right"):
+        _write_video(tmp_path / f"session_{camera}.avi", [getattr(pair, camera).image for pair in scene])
+
+    replay = SessionReplay.from_session_dir(config, tmp_path, use_rois=False)
+    replay.run()
+    stats = get_tracer().get_stats()
+
+    for span in ("route", "queue_wait", "detect", "result_queue", "stereo", "pitch", "end_to_end"):
+        assert stats[span]["count"] > 0, span
+    assert stats["end_to_end"]["p50_ms"] >= stats["detect"]["p50_ms"]
+
+
+@pytest.mark.parametrize("service_class", [InProcessPipelineService, PipelineOrchestrator])
+def test_trace_stats_are_kept_out_of_capture_stats(service_class):
+    tracer = get_tracer()
+    was_enabled = tracer.enabled
+    tracer.configure(enabled=True)
+    tracer.reset()
+    _trace_frame(tracer, "left", 0, start_ns=MS)
+    service = service_class(backend="sim")
+    try:
+        assert service.get_stats() == {}
+        assert service.get_trace_stats() == tracer.flat_stats()
+        assert service.get_trace_stats()["pitch_p50_ms"] > 0
+
+        tracer.configure(enabled=False)
+        assert service.get_trace_stats() == {}
+    finally:
+        tracer.configure(enabled=was_enabled)
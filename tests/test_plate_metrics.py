@@ -0,0 +1,39 @@
+"""Tests for incremental plate metrics."""
+
+from __future__ import annotations
+
+from contracts import StereoObservation
+from metrics.simple_metrics import PlateMetricsAccumulator, compute_plate_from_observations
+
+
+def _obs(i: int) -> StereoObservation:
+    return StereoObservation(
+        t_ns=i,
+        left=(0.0, 0.0),
+        right=(0.0, 0.0),
+        X=0.1 * i,
+        Y=2.0 - 0.05 * i * i,
+        Z=1.0 - 0.3 * i,
+        quality=1.0,
+    )
+
+
+def test_accumulator_matches_batch_computation_with_eviction():
+    accumulator = PlateMetricsAccumulator(maxlen=4)
+    observations = [_obs(i) for i in range(10)]
+    for i, obs in enumerate(observations):
+        accumulator.append(obs)
+        window = observations[max(0, i - 3) : i + 1]
+        assert accumulator.metrics() == compute_plate_from_observations(window)
+    assert list(accumulator) == observations[-4:]
+    assert accumulator.first is observations[6]
+
+
+def test_accumulator_metrics_cached_until_change():
+    accumulator = PlateMetricsAccumulator()
+    accumulator.extend([_obs(0), _obs(1)])
+    metrics = accumulator.metrics()
+    assert accumulator.metrics() is metrics
+    accumulator.append(_obs(2))
+    assert accumulator.metrics() is not metrics
+    assert accumulator.metrics().sample_count == 3
@@ -0,0 +1,107 @@
+"""Tests for the off-GUI-thread preview compositor."""
+
+import sys
+import threading
+
+import cv2
+import numpy as np
+import pytest
+from PySide6 import QtCore, QtGui, QtWidgets
+
+from contracts import Detection
+from ui.drawing import FOCUS_FAIR_SCORE, FOCUS_GOOD_SCORE, render_preview, scale_to_fit
+from ui.preview_compositor import PreviewCompositor, PreviewRequest, reduced_focus_score
+
+
+@pytest.fixture(scope="module")
+def qapp():
+    """Create Qt application for testing."""
+    app = QtWidgets.QApplication.instance()
+    if app is None:
+        app = QtWidgets.QApplication(sys.argv)
+    yield app
+
+
+def _checkerboard(width, height, square=40):
+    ys, xs = np.mgrid[0:height, 0:width]
+    gray = (((xs // square) + (ys // square)) % 2 * 255).astype(np.uint8)
+    return cv2.cvtColor(gray, cv2.COLOR_GRAY2BGR)
+
+
+def test_scale_to_fit_never_upscales():
+    assert scale_to_fit((1920, 1080), (640, 360)) == (640, 360)
+    assert scale_to_fit((640, 480), (1280, 720)) == (640, 480)
+    assert scale_to_fit((640, 480), (0, 0)) == (640, 480)
+
+
+def test_scale_to_fit_keeps_aspect_ratio():
+    assert scale_to_fit((1920, 1080), (640, 480)) == (640, 360)
+    assert scale_to_fit((1280, 720), (1280, 360)) == (640, 360)
+
+
+def test_render_preview_downscales_and_keeps_colors(qapp):
+    image = np.zeros((1080, 1920, 3), dtype=np.uint8)
+    image[..., 0] = 255  # pure blue in BGR
+
+    qimage = render_preview(image, (480, 270))
+
+    assert (qimage.width(), qimage.height()) == (480, 270)
+    assert qimage.pixelColor(10, 10) == QtGui.QColor(0, 0, 255)
+
+
+def test_render_preview_draws_overlays_in_image_coordinates(qapp):
+    image = np.zeros((1080, 1920), dtype=np.uint8)
+    detection = Detection("left", 0, 0, u=960.0, v=540.0, radius_px=60.0, confidence=1.0)
+
+    qimage = render_preview(image, (480, 270), detections=[detection])
+
+    # Circle of radius 60 image px -> 15 preview px around (240, 135)
+    assert qimage.pixelColor(240 + 15, 135).red() > 0
+    assert qimage.pixelColor(240, 135).red() == 0
+    assert not image.any()  # source frame untouched
+
+
+def test_focus_is_scored_on_fixed_size_reduction(qapp):
+    # Independent of the preview size and of the capture resolution
+    sharp = _checkerboard(1920, 1080, square=24)
+    blurred = cv2.GaussianBlur(sharp, (0, 0), 15)
+    scores = []
+    compositor = PreviewCompositor(focus_interval_s=0.0)
+    compositor.focus_ready.connect(lambda camera, score: scores.append(score), QtCore.Qt.DirectConnection)
+
+    compositor.compose(PreviewRequest("left", sharp, (320, 180)))
+    compositor.compose(PreviewRequest("left", sharp, (1280, 720)))
+    compositor.compose(PreviewRequest("left", _checkerboard(1280, 720, square=16), (320, 180)))
+    compositor.compose(PreviewRequest("left", blurred, (320, 180)))
+
+    assert scores[0] == scores[1] == scores[2] == pytest.approx(reduced_focus_score(sharp))
+    assert scores[0] >= FOCUS_GOOD_SCORE
+    assert scores[3] < FOCUS_FAIR_SCORE
+
+
+def test_compositor_delivers_images_and_rate_limits_focus(qapp):
+    compositor = PreviewCompositor(focus_interval_s=60.0)
+    images, scores = [], []
+    done = threading.Event()
+
+    def on_frame(camera, image):
+        images.append((camera, image.size()))
+        if len(images) == 3:
+            done.set()
+
+    compositor.frame_ready.connect(on_frame, QtCore.Qt.DirectConnection)
+    compositor.focus_ready.connect(lambda camera, score: scores.append(camera), QtCore.Qt.DirectConnection)
+    compositor.start()
+    try:
+        for _ in range(3):
+            compositor.submit(PreviewRequest("left", _checkerboard(1280, 720), (320, 180), show_focus=True))
+            compositor.submit(PreviewRequest("right", _checkerboard(1280, 720), (320, 180)))
+            done.wait(timeout=0.5)
+        assert done.wait(timeout=5.0)
+    finally:
+        compositor.stop()
+
+    assert {size for _, size in images} == {QtCore.QSize(320, 180)}
+    assert sorted(set(scores)) == ["left", "right"]
+    assert len(scores) == 2  # once per camera within the interval
+    assert compositor.focus_score("left") > 0
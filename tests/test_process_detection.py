@@ -0,0 +1,181 @@
+"""Tests for process-per-camera detection."""
+
+import threading
+import time
+
+import numpy as np
+import pytest
+
+from app.events.event_bus import EventBus
+from app.pipeline.detection.process_worker import ProcessDetector, pack_detections, unpack_detections
+from app.pipeline.detection.threading_pool import DetectionThreadPool
+from app.services.detection import DetectionServiceImpl
+from capture.synthetic_scene import SceneConfig, StereoScene, default_geometry
+from configs.settings import load_config
+from contracts import Detection
+from detect.classical_detector import ClassicalDetector
+from detect.config import DetectorConfig, FilterConfig, Mode
+
+
+class FailingDetector:
+    """Picklable detector that raises on every frame."""
+
+    def detect(self, frame):
+        raise ValueError(f"bad frame {frame.frame_index}")
+
+
+class StallingDetector:
+    """Picklable detector that hangs on frame 5."""
+
+    def detect(self, frame):
+        if frame.frame_index == 5:
+            time.sleep(60.0)
+        return []
+
+
+class UnpicklableDetector:
+    def __init__(self):
+        self._lock = threading.Lock()
+
+    def detect(self, frame):
+        return []
+
+
+@pytest.fixture(scope="module")
+def scene():
+    return StereoScene(default_geometry(320, 240), SceneConfig(width=320, height=240, frames=40))
+
+
+def test_pack_round_trip(scene):
+    frame = scene.camera_frame(3)
+    detections = [
+        Detection(frame.camera_id, 3, frame.t_capture_monotonic_ns, 10.5, 20.25, 4.0, 0.9),
+        Detection(frame.camera_id, 3, frame.t_capture_monotonic_ns, 100.0, 50.0, 6.5, 0.4),
+    ]
+
+    packed = pack_detections(detections)
+
+    assert packed.dtype == np.float64 and packed.shape == (2, 4)
+    assert unpack_detections(packed, frame) == detections
+    assert unpack_detections(pack_detections([]), frame) == []
+
+
+def test_process_detector_matches_in_process_detector(scene):
+    reference = ClassicalDetector(DetectorConfig(), mode=Mode.MODE_A)
+    worker = ProcessDetector("left", ClassicalDetector(DetectorConfig(), mode=Mode.MODE_A))
+    worker.start()
+    try:
+        found = 0
+        for index in range(len(scene)):
+            frame = scene.camera_frame(index)
+            expected = reference.detect(frame)
+            assert worker.detect(frame) == expected
+            found += len(expected)
+    finally:
+        worker.stop()
+
+    assert found > 0
+    assert not worker.is_alive()
+
+
+def test_process_detector_reraises_detector_errors(scene):
+    worker = ProcessDetector("right", FailingDetector())
+    worker.start()
+    try:
+        with pytest.raises(ValueError, match="bad frame 7"):
+            worker.detect(scene.camera_frame(7))
+        with pytest.raises(ValueError, match="bad frame 8"):
+            worker.detect(scene.camera_frame(8))
+    finally:
+        worker.stop()
+
+    with pytest.raises(RuntimeError):
+        worker.detect(scene.camera_frame(9))
+
+
+def test_process_detector_restarts_child_after_timeout(scene):
+    worker = ProcessDetector("left", StallingDetector(), timeout_s=5.0)
+    worker.start()
+    try:
+        assert worker.detect(scene.camera_frame(4)) == []
+        stalled = worker._process
+        with pytest.raises(RuntimeError, match="did not answer"):
+            worker.detect(scene.camera_frame(5))
+
+        # The stalled child (which may still read its slot) is gone
+        assert not stalled.is_alive()
+        assert worker.is_alive() and worker._process is not stalled
+        assert worker.detect(scene.camera_frame(6)) == []
+    finally:
+        worker.stop()
+
+
+def test_pool_runs_detectors_in_processes_with_error_accounting(scene):
+    pool = DetectionThreadPool(mode="process_per_camera")
+    in_process = {"left": ClassicalDetector(DetectorConfig()), "right": FailingDetector()}
+    results = {"left": [], "right": []}
+    done = threading.Condition()
+
+    def on_result(label, frame, detections):
+        with done:
+            results[label].append(detections)
+            done.notify_all()
+
+    pool.set_detect_callback(lambda label, frame: pool.get_detector(label, in_process[label]).detect(frame))
+    pool.set_detectors(in_process)
+    pool.set_stereo_callback(on_result)
+    pool.start(queue_size=64)
+    try:
+        assert isinstance(pool.get_detector("left"), ProcessDetector)
+        for index in range(len(scene)):
+            pair = scene.render(index)
+            pool.enqueue_frame("left", pair.left)
+            pool.enqueue_frame("right", pair.right)
+        with done:
+            assert done.wait_for(lambda: all(len(items) == len(scene) for items in results.values()), timeout=30.0)
+        errors = pool.get_error_stats()
+    finally:
+        pool.stop()
+
+    assert any(results["left"])
+    assert not any(results["right"])
+    assert errors == {"left": 0, "right": len(scene)}
+    assert pool.get_detector("left", "fallback") == "fallback"
+
+
+def test_pool_falls_back_to_in_thread_detection_when_detector_cannot_be_pickled():
+    pool = DetectionThreadPool(mode="process_per_camera")
+    detector = UnpicklableDetector()
+    pool.set_detectors({"left": detector, "right": detector})
+    pool.start()
+    try:
+        assert pool.get_detector("left", detector) is detector
+        assert pool.is_running()
+    finally:
+        pool.stop()
+
+    with pytest.raises(ValueError):
+        pool.set_mode("process_per_frame", 1)
+
+
+def test_service_reconfigure_replaces_detector_processes(scene):
+    service = DetectionServiceImpl(EventBus(), load_config("configs/default.yaml"))
+    service.configure_detectors(DetectorConfig(), Mode.MODE_A)
+    service.configure_threading("process_per_camera", 1)
+    service.start_detection()
+    try:
+        first = service._thread_pool.get_detector("left")
+        assert isinstance(first, ProcessDetector)
+        before = sum(len(service._detect_frame("left", scene.camera_frame(i))) for i in range(len(scene)))
+
+        # No blob can pass this area limit
+        service.configure_detectors(DetectorConfig(filters=FilterConfig(min_area=10**7)), Mode.MODE_A)
+        second = service._thread_pool.get_detector("left")
+        after = sum(len(service._detect_frame("left", scene.camera_frame(i))) for i in range(len(scene)))
+    finally:
+        service.stop_detection()
+
+    assert before > 0
+    assert isinstance(second, ProcessDetector) and second is not first
+    assert not first.is_alive()
+    assert after == 0
@@ -0,0 +1,108 @@
+"""Tests for the review-mode decoded-frame cache."""
+
+import cv2
+import numpy as np
+import pytest
+
+from app.review.frame_cache import FrameCache
+from app.review.video_reader import VideoReader
+
+
+def _write_video(path, num_frames, offset=0):
+    writer = cv2.VideoWriter(str(path), cv2.VideoWriter_fourcc(*"MJPG"), 30.0, (64, 48))
+    if not writer.isOpened():
+        pytest.skip("MJPG writer not available")
+    for i in range(num_frames):
+        writer.write(np.full((48, 64, 3), (i * 4 + offset) % 256, dtype=np.uint8))
+    writer.release()
+
+
+def _frame_value(frame):
+    return int(round(float(frame.mean())))
+
+
+@pytest.fixture
+def video_pair(tmp_path):
+    left = tmp_path / "left.avi"
+    right = tmp_path / "right.avi"
+    _write_video(left, 40)
+    _write_video(right, 40, offset=2)
+    return left, right
+
+
+def test_cache_evicts_least_recently_used():
+    frame = np.zeros((10, 10, 3), dtype=np.uint8)
+    pair_bytes = 2 * frame.nbytes
+    cache = FrameCache(max_bytes=3 * pair_bytes)
+    for i in range(3):
+        cache.put(i, (frame, frame))
+    assert cache.get(0) is not None  # 0 becomes most recently used
+    cache.put(3, (frame, frame))
+
+    assert cache.get(1) is None
+    assert cache.get(0) is not None
+    stats = cache.stats()
+    assert stats["evictions"] == 1
+    assert stats["cached_frames"] == 3
+    assert stats["bytes_used"] == 3 * pair_bytes
+    assert stats["hits"] == 2 and stats["misses"] == 1
+
+
+@pytest.mark.parametrize("prefetch", [False, True])
+def test_reader_returns_exact_frames_when_scrubbing(video_pair, prefetch):
+    reader = VideoReader(cache_budget_mb=16, prefetch=prefetch, prefetch_window=10)
+    reader.open_videos(*video_pair)
+    try:
+        for index in [0, 1, 2, 10, 9, 8, 30, 5, 5, 39]:
+            assert reader.seek_to_frame(index)
+            left, right = reader.read_frames()
+            assert abs(_frame_value(left) - index * 4) <= 2
+            assert abs(_frame_value(right) - (index * 4 + 2)) <= 2
+        assert reader.cache_stats()["hits"] > 0
+    finally:
+        reader.close()
+
+
+def test_reader_frames_are_copies(video_pair):
+    reader = VideoReader(prefetch=False)
+    reader.open_videos(*video_pair)
+    try:
+        left, _ = reader.read_frames()
+        left[:] = 255
+        left_again, _ = reader.read_frames()
+        assert _frame_value(left_again) == 0
+    finally:
+        reader.close()
+
+
+class _RecordingDetector:
+    def __init__(self):
+        self.frames = []
+
+    def detect(self, frame):
+        self.frames.append(frame.frame_index)
+        return []
+
+
+def test_current_frame_detection_runs_on_cached_frames(video_pair, monkeypatch):
+    import app.review.review_service as review_service
+
+    def no_batch_engine(*args, **kwargs):
+        raise AssertionError("per-frame detection must not use the batch engine")
+
+    monkeypatch.setattr(review_service, "BatchDetectionEngine", no_batch_engine)
+    service = review_service.ReviewService()
+    service._video_reader = VideoReader(prefetch=False)
+    service._video_reader.open_videos(*video_pair)
+    left, right = _RecordingDetector(), _RecordingDetector()
+    service._detector_left, service._detector_right = left, right
+    try:
+        for index in (4, 5, 20, 5, 6):
+            service.seek_to_frame(index)
+            assert service.run_detection_on_current_frame() == ([], [])
+    finally:
+        service.close()
+
+    # After a jump the preceding frame is fed first, but only when already cached
+    assert left.frames == [4, 5, 20, 4, 5, 6]
+    assert right.frames == left.frames
@@ -0,0 +1,87 @@
+"""Tests for the opt-in sampling profiler."""
+
+import json
+import threading
+import time
+
+import pytest
+
+from telemetry import SamplingProfiler, get_profiler
+from telemetry.profiler import COLLAPSED_FILENAME, SPEEDSCOPE_FILENAME, start_from_env
+
+
+def _spin_until(event):
+    while not event.is_set():
+        sum(range(200))
+
+
+@pytest.fixture
+def busy_thread():
+    done = threading.Event()
+    thread = threading.Thread(target=_spin_until, args=(done,), name="Detect-left", daemon=True)
+    thread.start()
+    yield thread
+    done.set()
+    thread.join(timeout=1.0)
+
+
+def test_sample_groups_stacks_by_thread_name(busy_thread):
+    profiler = SamplingProfiler()
+    for _ in range(5):
+        profiler.sample()
+
+    lines = [line for line in profiler.collapsed() if line.startswith("Detect-left;")]
+    assert lines
+    assert all("_spin_until (test_sampling_profiler.py:" in line for line in lines)
+    assert sum(int(line.rsplit(" ", 1)[1]) for line in lines) == 5
+    assert profiler.stats()["samples"] == 5
+
+
+def test_background_sampling_excludes_itself_and_respects_overhead_budget(busy_thread):
+    profiler = SamplingProfiler(hz=1000.0, max_overhead=0.02)
+    profiler.start()
+    time.sleep(0.5)
+    profiler.stop()
+
+    stats = profiler.stats()
+    assert not profiler.running
+    assert stats["samples"] > 0
+    assert stats["overhead"] <= 0.025
+    assert not any(line.startswith("SamplingProfiler;") for line in profiler.collapsed())
+
+    profiler.reset()
+    assert profiler.collapsed() == []
+
+
+def test_save_writes_collapsed_and_speedscope(tmp_path, busy_thread):
+    profiler = SamplingProfiler()
+    for _ in range(3):
+        profiler.sample()
+
+    paths = profiler.save(tmp_path / "session")
+
+    assert [path.name for path in paths] == [COLLAPSED_FILENAME, SPEEDSCOPE_FILENAME]
+    assert paths[0].read_text().splitlines() == profiler.collapsed()
+    document = json.loads(paths[1].read_text())
+    profile = next(item for item in document["profiles"] if item["name"] == "Detect-left")
+    assert profile["type"] == "sampled"
+    assert sum(profile["weights"]) == profile["endValue"] == 3
+    leaf = document["shared"]["frames"][profile["samples"][0][-1]]
+    assert leaf["name"] == "_spin_until"
+    assert leaf["file"] == "test_sampling_profiler.py"
+
+
+def test_env_var_controls_startup():
+    profiler = get_profiler()
+    try:
+        assert not start_from_env({})
+        assert not start_from_env({"PITCHTRACKER_PROFILE": "0"})
+        assert not start_from_env({"PITCHTRACKER_PROFILE": "fast"})
+        assert not profiler.running
+
+        assert start_from_env({"PITCHTRACKER_PROFILE": "250"})
+        assert profiler.running
+        assert profiler.hz == 250.0
+    finally:
+        profiler.stop()
+        profiler.reset()
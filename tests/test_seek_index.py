@@ -0,0 +1,98 @@
+"""Tests for the session video seek-index sidecar."""
+
+from unittest.mock import Mock
+
+import cv2
+import numpy as np
+import pytest
+
+from app.pipeline.recording.seek_index import SeekIndex, SeekIndexWriter, seek_index_path
+from app.pipeline.recording.session_recorder import SessionRecorder
+from app.review.video_reader import VideoReader
+from contracts import Frame
+
+FRAME_PERIOD_NS = 10_000_000
+
+
+def _write_index(path, capture_indices, key_interval=1):
+    writer = SeekIndexWriter(path, key_interval=key_interval, fps=100.0)
+    for i in capture_indices:
+        writer.append(i, 1_000_000_000 + i * FRAME_PERIOD_NS)
+    writer.close()
+    return SeekIndex.open(path)
+
+
+def _write_video(path, capture_indices, offset=0):
+    writer = cv2.VideoWriter(str(path), cv2.VideoWriter_fourcc(*"MJPG"), 30.0, (64, 48))
+    if not writer.isOpened():
+        pytest.skip("MJPG writer not available")
+    for i in capture_indices:
+        writer.write(np.full((48, 64, 3), (i * 4 + offset) % 256, dtype=np.uint8))
+    writer.release()
+
+
+def test_index_roundtrip_and_timestamp_search(tmp_path):
+    index = _write_index(tmp_path / "left.seekidx", range(30), key_interval=12)
+
+    assert len(index) == 30
+    assert index.key_interval == 12
+    assert index.keyframe_for(11) == 0
+    assert index.keyframe_for(25) == 24
+    start = 1_000_000_000
+    assert index.frame_at_or_after(start + 7 * FRAME_PERIOD_NS) == 7
+    assert index.frame_at_or_after(start + 7 * FRAME_PERIOD_NS + 1) == 8
+    assert index.frame_at_or_after(start + 100 * FRAME_PERIOD_NS) == 29
+    assert index.nearest_frame(start + 7 * FRAME_PERIOD_NS + 4_000_000) == 7
+    assert index.nearest_frame(start + 7 * FRAME_PERIOD_NS + 6_000_000) == 8
+    index.close()
+
+
+def test_truncated_trailing_record_is_ignored(tmp_path):
+    path = tmp_path / "left.seekidx"
+    _write_index(path, range(5)).close()
+    with path.open("ab") as handle:
+        handle.write(b"\x00" * 7)
+
+    assert len(SeekIndex.open(path)) == 5
+
+
+def test_recorder_writes_sidecar(tmp_path):
+    config = Mock()
+    config.camera.width = 64
+    config.camera.height = 48
+    config.camera.fps = 30
+    recorder = SessionRecorder(config, tmp_path)
+    recorder._session_dir = tmp_path / "session"
+    recorder._session_dir.mkdir()
+    recorder._open_writers()
+    for i in range(4):
+        frame = Frame("left", 100 + i, 5_000 + i, np.zeros((48, 64), dtype=np.uint8), 64, 48, "GRAY8")
+        recorder.write_frame("left", frame)
+    recorder._close_writers()
+
+    index = SeekIndex.open(seek_index_path(recorder._session_dir / "session_left.avi"))
+    assert len(index) == 4
+    assert index.timestamp_ns(2) == 5_002
+    assert len(SeekIndex.open(recorder._session_dir / "session_right.seekidx")) == 0
+
+
+def test_reader_pairs_frames_by_timestamp_and_seeks_exactly(tmp_path):
+    left_captures = list(range(40))
+    right_captures = [i for i in range(41) if i != 5]  # Right camera dropped frame 5
+    _write_video(tmp_path / "left.avi", left_captures)
+    _write_video(tmp_path / "right.avi", right_captures, offset=2)
+    left_index = _write_index(tmp_path / "left.seekidx", left_captures)
+    right_index = _write_index(tmp_path / "right.seekidx", right_captures)
+
+    reader = VideoReader(prefetch=False)
+    reader.open_videos(tmp_path / "left.avi", tmp_path / "right.avi", left_index, right_index)
+    try:
+        assert reader.seek_to_timestamp(1_000_000_000 + 20 * FRAME_PERIOD_NS - 1)
+        assert reader.current_frame_index == 20
+        for index in (20, 21, 3, 12):
+            reader.seek_to_frame(index)
+            left, right = reader.read_frames()
+            assert abs(float(left.mean()) - index * 4) <= 2
+            assert abs(float(right.mean()) - (index * 4 + 2)) <= 2
+    finally:
+        reader.close()
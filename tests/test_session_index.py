@@ -0,0 +1,191 @@
+"""Tests for lazy session loading and the recordings library index."""
+
+import json
+import os
+from pathlib import Path
+
+import numpy as np
+
+from app.pipeline.recording.pitch_recorder import PitchRecorder
+from app.pipeline.recording.session_index import (
+    LIBRARY_INDEX_FILENAME,
+    SESSION_INDEX_FILENAME,
+    LibraryIndex,
+    load_session_index,
+)
+from app.pipeline.recording.session_recorder import SessionRecorder
+from app.pipeline_service import PitchSummary
+from app.review.session_loader import SessionLoader
+from configs.settings import load_config
+from contracts import Detection, Frame
+
+
+def _make_session(recordings_dir, name, pitch_count=2):
+    session_dir = recordings_dir / name
+    session_dir.mkdir(parents=True)
+    (session_dir / "session_manifest.json").write_text(
+        json.dumps({"session": name, "created_utc": "2026-01-19T12:00:00Z"})
+    )
+    (session_dir / "session_left.avi").write_bytes(b"")
+    (session_dir / "session_right.avi").write_bytes(b"")
+    for i in range(1, pitch_count + 1):
+        _make_pitch(session_dir, i)
+    return session_dir
+
+
+def _make_pitch(session_dir, number):
+    pitch_dir = session_dir / f"pitch-{number:03d}"
+    pitch_dir.mkdir()
+    (pitch_dir / "pitch_manifest.json").write_text(json.dumps({
+        "pitch_id": f"p{number}",
+        "t_start_ns": number * 1_000_000_000,
+        "t_end_ns": number * 1_000_000_000 + 500_000_000,
+        "measured_speed_mph": 80.0 + number,
+        "pitch_notes": "x" * 100,
+    }))
+    (pitch_dir / "detections_left.json").write_text(json.dumps({
+        "detection_count": 3,
+        "detections": [{"frame_index": i} for i in range(3)],
+    }))
+    (pitch_dir / "observations.json").write_text(json.dumps([{"t_ns": 1}, {"t_ns": 2}]))
+    frames = pitch_dir / "frames"
+    frames.mkdir()
+    (frames / "left_0001.png").write_bytes(b"")
+    return pitch_dir
+
+
+def test_lazy_session_reads_index_and_loads_payloads_on_demand(tmp_path):
+    session_dir = _make_session(tmp_path, "session-2026-01-19_001")
+
+    session = SessionLoader.load_session(session_dir, lazy=True)
+
+    assert (session_dir / SESSION_INDEX_FILENAME).exists()
+    assert [p.pitch_id for p in session.pitches] == ["pitch-001", "pitch-002"]
+    pitch = session.pitches[0]
+    assert pitch.manifest["measured_speed_mph"] == 81.0
+    assert pitch.manifest["detection_count_left"] == 3
+    assert pitch.manifest["observation_count"] == 2
+    assert pitch.manifest["frame_count"] == 1
+    assert "pitch_notes" not in pitch.manifest
+    assert pitch.original_detections_left is None
+
+    assert pitch.get_detections("left")["detection_count"] == 3
+    assert pitch.original_detections_left is not None
+    assert pitch.get_detections("right") is None
+    assert len(pitch.get_observations()) == 2
+    assert [f.name for f in pitch.get_frame_files()] == ["left_0001.png"]
+    assert pitch.get_manifest()["pitch_notes"] == "x" * 100
+
+
+def test_session_index_is_updated_incrementally(tmp_path):
+    session_dir = _make_session(tmp_path, "session-2026-01-19_001")
+    SessionLoader.load_session(session_dir, lazy=True)
+
+    # Stale entries are only re-read when a pitch directory is added or removed
+    index_path = session_dir / SESSION_INDEX_FILENAME
+    index = json.loads(index_path.read_text())
+    index["pitches"][0]["measured_speed_mph"] = 99.0
+    index_path.write_text(json.dumps(index))
+    _make_pitch(session_dir, 3)
+
+    session = SessionLoader.load_session(session_dir, lazy=True)
+    assert [p.pitch_id for p in session.pitches] == ["pitch-001", "pitch-002", "pitch-003"]
+    assert session.pitches[0].manifest["measured_speed_mph"] == 99.0
+
+    eager = SessionLoader.load_session(session_dir)
+    assert eager.pitches[0].manifest["measured_speed_mph"] == 81.0
+    assert eager.pitches[0].get_detections("left")["detection_count"] == 3
+
+
+def test_library_index_lists_sessions_without_rescanning(tmp_path):
+    _make_session(tmp_path, "session-2026-01-18_001")
+    _make_session(tmp_path, "session-2026-01-19_001")
+    (tmp_path / "not-a-session").mkdir()
+
+    sessions = SessionLoader.get_available_sessions(tmp_path)
+    assert [s.name for s in sessions] == ["session-2026-01-19_001", "session-2026-01-18_001"]
+    assert (tmp_path / LIBRARY_INDEX_FILENAME).exists()
+    assert sessions == SessionLoader.get_available_sessions(tmp_path, use_index=False)
+
+    # While the directory is unchanged the index is trusted as-is
+    index_path = tmp_path / LIBRARY_INDEX_FILENAME
+    index = json.loads(index_path.read_text())
+    index["sessions"]["session-2026-01-18_001"]["session"] = "renamed"
+    with open(index_path, "r+") as f:
+        f.write(json.dumps(index))
+        f.truncate()
+    assert LibraryIndex(tmp_path).entries()["session-2026-01-18_001"]["session"] == "renamed"
+
+    # Adding a session changes the directory mtime and triggers an incremental rescan
+    _make_session(tmp_path, "session-2026-01-20_001")
+    os.utime(tmp_path, ns=(0, tmp_path.stat().st_mtime_ns + 1))
+    entries = LibraryIndex(tmp_path).entries()
+    assert sorted(entries) == [
+        "session-2026-01-18_001", "session-2026-01-19_001", "session-2026-01-20_001"
+    ]
+    assert entries["session-2026-01-18_001"]["session"] == "renamed"
+
+
+def test_update_session_keeps_index_trusted(tmp_path):
+    _make_session(tmp_path, "session-2026-01-18_001")
+    library = LibraryIndex(tmp_path)
+    assert len(library.sessions()) == 1
+
+    session_dir = _make_session(tmp_path, "session-2026-01-19_001", pitch_count=1)
+    SessionLoader.load_session(session_dir, lazy=True)
+    library.update_session(session_dir)
+
+    index = json.loads((tmp_path / LIBRARY_INDEX_FILENAME).read_text())
+    assert index["dir_mtime_ns"] == tmp_path.stat().st_mtime_ns
+    assert index["sessions"]["session-2026-01-19_001"]["pitch_count"] == 1
+    assert [s.name for s in library.sessions()] == ["session-2026-01-19_001", "session-2026-01-18_001"]
+
+
+def _record_session(tmp_path):
+    config = load_config(Path(__file__).resolve().parent.parent / "configs" / "default.yaml")
+    recordings_dir = tmp_path / "recordings"
+    recordings_dir.mkdir()
+    session_recorder = SessionRecorder(config, recordings_dir)
+    session_dir, _ = session_recorder.start_session("bullpen", "p1")
+
+    pitch_recorder = PitchRecorder(config, session_dir, "p1")
+    frame = Frame("left", 7, 70, np.zeros((4, 4), dtype=np.uint8), 4, 4, "GRAY8")
+    pitch_recorder.write_frame_with_detections(
+        "left", frame, [Detection("left", 7, 70, u=12.0, v=34.0, radius_px=3.0, confidence=0.9)]
+    )
+    summary = PitchSummary(
+        pitch_id="p1", t_start_ns=0, t_end_ns=100, is_strike=True, zone_row=1, zone_col=1,
+        run_in=0.0, rise_in=0.0, speed_mph=82.5, rotation_rpm=None, sample_count=1,
+    )
+    pitch_recorder.write_manifest(summary, None)
+    pitch_recorder.close(force=True)
+    session_recorder.stop_session(None, "p1", "bullpen", "session", None)
+    return config, recordings_dir, session_dir
+
+
+def test_recorders_keep_session_and_library_indexes_current(tmp_path):
+    config, recordings_dir, session_dir = _record_session(tmp_path)
+
+    [entry] = load_session_index(session_dir)
+    assert entry["pitch_id"] == "p1"
+    assert entry["measured_speed_mph"] == 82.5
+    assert entry["detection_count_left"] == int(config.recording.save_detections)
+    library = LibraryIndex(recordings_dir).entries()
+    assert library[session_dir.name]["session"] == "bullpen"
+    assert library[session_dir.name]["pitch_count"] == 1
+
+
+def test_recorded_session_is_listed_and_loaded(tmp_path):
+    _, recordings_dir, session_dir = _record_session(tmp_path)
+
+    assert SessionLoader.get_available_sessions(recordings_dir) == [session_dir]
+    assert SessionLoader.get_available_sessions(recordings_dir, use_index=False) == [session_dir]
+    assert SessionLoader.validate_session(session_dir) == (True, "")
+
+    eager = SessionLoader.load_session(session_dir)
+    [pitch] = eager.pitches
+    assert pitch.manifest["measured_speed_mph"] == 82.5
+
+    lazy = SessionLoader.load_session(session_dir, lazy=True)
+    [pitch] = lazy.pitches
+    assert pitch.get_manifest()["measured_speed_mph"] == 82.5
@@ -0,0 +1,122 @@
+"""Tests for the replay camera backend and headless session replay."""
+
+import time
+from pathlib import Path
+
+import cv2
+import numpy as np
+import pytest
+
+from app.pipeline import replay as replay_module
+from app.pipeline.replay import STAGES, SessionReplay, format_replay_report
+from capture import ReplayCamera
+from configs.settings import load_config
+
+NUM_FRAMES = 24
+FRAME_PERIOD_NS = 33_333_333
+T0_NS = 5_000_000_000
+
+
+def _write_session_video(session_dir, label, x_offset, t_offset_ns=0):
+    path = session_dir / f"session_{label}.avi"
+    writer = cv2.VideoWriter(str(path), cv2.VideoWriter_fourcc(*"MJPG"), 30.0, (160, 120))
+    if not writer.isOpened():
+        pytest.skip("MJPG writer not available")
+    for i in range(NUM_FRAMES):
+        image = np.full((120, 160, 3), 20, dtype=np.uint8)
+        cv2.circle(image, (10 + 5 * i + x_offset, 60), 5, (255, 255, 255), -1)
+        writer.write(image)
+    writer.release()
+
+    rows = ["camera_id,frame_index,t_capture_monotonic_ns"]
+    rows += [f"{label},{100 + i},{T0_NS + t_offset_ns + i * FRAME_PERIOD_NS}" for i in range(NUM_FRAMES)]
+    (session_dir / f"session_{label}_timestamps.csv").write_text("\n".join(rows) + "\n")
+    return path
+
+
+@pytest.fixture
+def session_dir(tmp_path):
+    _write_session_video(tmp_path, "left", 0)
+    _write_session_video(tmp_path, "right", 6, t_offset_ns=1_000_000)
+    return tmp_path
+
+
+@pytest.fixture
+def config():
+    return load_config(Path("configs/default.yaml"))
+
+
+def test_replay_camera_streams_original_timestamps(session_dir):
+    camera = ReplayCamera(session_dir / "session_left.avi")
+    camera.open("cam-left")
+    camera.set_mode(0, 0, 0, "GRAY8")
+
+    frames = []
+    while camera.peek_timestamp_ns() is not None:
+        frames.append(camera.read_frame(timeout_ms=100))
+    with pytest.raises(EOFError):
+        camera.read_frame(timeout_ms=100)
+    camera.close()
+
+    assert len(frames) == NUM_FRAMES
+    assert frames[0].camera_id == "cam-left"
+    assert frames[0].image.ndim == 2
+    assert [f.frame_index for f in frames[:3]] == [100, 101, 102]
+    assert frames[5].t_capture_monotonic_ns == T0_NS + 5 * FRAME_PERIOD_NS
+
+
+def test_replay_camera_paces_at_speed_multiple(session_dir):
+    camera = ReplayCamera(session_dir / "session_left.avi", speed=4.0)
+    camera.open("left")
+    started = time.perf_counter()
+    for _ in range(9):
+        camera.read_frame(timeout_ms=100)
+    elapsed = time.perf_counter() - started
+    camera.close()
+
+    # 8 frame periods of recorded time at 4x
+    assert elapsed >= 8 * FRAME_PERIOD_NS / 1e9 / 4.0 * 0.9
+
+
+def test_unthrottled_replay_processes_every_frame(session_dir, config):
+    replay = SessionReplay.from_session_dir(config, session_dir, use_rois=False)
+    report = replay.run()
+
+    assert report.frames == {"left": NUM_FRAMES, "right": NUM_FRAMES}
+    assert report.detected == report.frames
+    assert report.dropped == {"left": 0, "right": 0}
+    assert report.stereo_pairs == NUM_FRAMES
+    assert report.detections["left"] > 0
+    assert report.throughput_fps > 0
+    assert report.media_s == pytest.approx((NUM_FRAMES - 1) * FRAME_PERIOD_NS / 1e9, abs=0.01)
+    assert set(report.stages) == set(STAGES)
+    assert report.stages["detect"].count == 2 * NUM_FRAMES
+    assert report.stages["end_to_end"].count == 2 * NUM_FRAMES
+    assert "Throughput" in format_replay_report(report)
+
+
+def test_replay_honours_max_frames_and_worker_pool(session_dir, config):
+    replay = SessionReplay.from_session_dir(
+        config, session_dir, use_rois=False, threading_mode="worker_pool", worker_count=3
+    )
+    report = replay.run(max_frames=10)
+
+    assert report.frames == {"left": 10, "right": 10}
+    assert report.stereo_pairs == 10
+    assert report.to_dict()["stages"]["decode"]["count"] == 20
+
+
+def test_unpaired_frames_do_not_accumulate(tmp_path, config, monkeypatch):
+    # Right frames are 10 s later than left ones, so no frame ever pairs
+    _write_session_video(tmp_path, "left", 0)
+    _write_session_video(tmp_path, "right", 6, t_offset_ns=10_000_000_000)
+    monkeypatch.setattr(replay_module, "PENDING_FRAMES", 4)
+    replay = SessionReplay.from_session_dir(config, tmp_path, use_rois=False)
+
+    report = replay.run()
+
+    assert report.stereo_pairs == 0
+    assert report.detected == {"left": NUM_FRAMES, "right": NUM_FRAMES}
+    assert {label: len(pending) for label, pending in replay._enqueued_ns.items()} == {"left": 4, "right": 4}
+    assert report.stages["detect"].count == 2 * NUM_FRAMES
+    assert report.stages["end_to_end"].count == 0
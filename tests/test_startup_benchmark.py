@@ -0,0 +1,46 @@
+"""Tests for the startup benchmark and lazily imported subsystems."""
+
+import subprocess
+import sys
+
+from benchmarks.startup import ROOT, _child_env, parse_importtime, summarize_imports
+
+SAMPLE = """\
+import time: self [us] | cumulative | imported package
+import time:       120 |        120 |   _io
+import time:       300 |        900 | encodings
+2026-01-01 12:00:00 | INFO | unrelated log line
+import time:       400 |        400 |     app.leaf
+import time:       600 |       1000 |   app
+import time:       100 |       1100 | app.main
+"""
+
+
+def test_parse_importtime_reads_depth_and_skips_other_lines():
+    records = parse_importtime(SAMPLE)
+
+    assert [record.module for record in records] == ["_io", "encodings", "app.leaf", "app", "app.main"]
+    assert [record.depth for record in records] == [1, 0, 2, 1, 0]
+    assert records[3].self_us == 600 and records[3].cumulative_us == 1000
+
+
+def test_summarize_imports_totals_top_level_and_ranks_by_cumulative():
+    summary = summarize_imports(parse_importtime(SAMPLE), top=2)
+
+    assert summary["total_ms"] == 2.0
+    assert summary["modules"] == 5
+    assert [item["module"] for item in summary["slowest"]] == ["app.main", "app"]
+
+
+def test_main_window_import_defers_heavy_subsystems():
+    deferred = ("scipy.optimize", "ui.export", "calib.plate_plane")
+    script = (
+        "import sys, ui.main_window; "
+        f"print(','.join(name for name in {deferred!r} if name in sys.modules))"
+    )
+    completed = subprocess.run(
+        [sys.executable, "-c", script], cwd=ROOT, env=_child_env(), capture_output=True, text=True, timeout=120
+    )
+
+    assert completed.returncode == 0, completed.stderr[-2000:]
+    assert completed.stdout.strip() == ""
@@ -2,13 +2,15 @@
 
 from __future__ import annotations
 
+import numpy as np
 import pytest
 
+from contracts import StereoObservation
 from metrics.strike_zone import (
     build_strike_zone,
     is_strike,
     StrikeZone,
-    StrikeResult,
+    StrikeZoneEvaluator,
 )
 
 
@@ -242,5 +244,48 @@ def test_softball_vs_baseball():
     assert isinstance(result_softball.is_strike, bool)
 
 
+def _obs(t_ns: int, x: float, y: float, z: float) -> StereoObservation:
+    return StereoObservation(t_ns=t_ns, left=(0.0, 0.0), right=(0.0, 0.0), X=x, Y=y, Z=z, quality=1.0)
+
+
+def test_evaluator_matches_scalar_reference():
+    """Vectorized prism test agrees with a per-point polygon check."""
+    from detect.utils import point_in_polygon
+
+    zone = build_strike_zone(0.0, 17.0, 17.0, 72.0, 0.53, 0.27)
+    evaluator = StrikeZoneEvaluator(zone, ball_radius_in=1.45)
+    xs = np.linspace(-1.5, 1.5, 41)
+    zs = np.linspace(-2.0, 0.8, 41)
+    grid = np.array([(x, 2.5, z) for x in xs for z in zs])
+    hits = evaluator.intersects(grid)
+    for (x, _, z), hit in zip(grid, hits):
+        if point_in_polygon((x, z), zone.polygon_xz):
+            assert hit
+    assert hits.any() and not hits.all()
+
+
+def test_evaluator_window_eviction():
+    """A strike that slides out of the window is no longer reported."""
+    zone = build_strike_zone(0.0, 17.0, 17.0, 72.0, 0.53, 0.27)
+    evaluator = StrikeZoneEvaluator(zone, ball_radius_in=1.45, maxlen=3)
+    evaluator.append(_obs(0, 0.0, 2.5, 0.0))
+    assert evaluator.result().is_strike
+    evaluator.extend([_obs(1, 3.0, 2.5, -5.0), _obs(2, 3.0, 2.5, -6.0)])
+    assert evaluator.result().is_strike
+    evaluator.append(_obs(3, 3.0, 2.5, -7.0))
+    result = evaluator.result()
+    assert not result.is_strike
+    assert result.sample_count == 3
+    assert evaluator.result() is result
+
+
+def test_is_strike_over_observation_list():
+    zone = build_strike_zone(0.0, 17.0, 17.0, 72.0, 0.53, 0.27)
+    observations = [_obs(i, 0.0, 2.5, 1.0 - 0.5 * i) for i in range(4)]
+    result = is_strike(observations, zone, 1.45)
+    assert result.is_strike
+    assert result.sample_count == 4
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
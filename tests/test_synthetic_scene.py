@@ -0,0 +1,75 @@
+"""Tests for the synthetic stereo ball-flight scene generator."""
+
+import numpy as np
+import pytest
+
+from benchmarks.throughput import create_test_frame
+from capture.synthetic_scene import SceneConfig, StereoScene, default_geometry
+from detect.classical_detector import ClassicalDetector
+from stereo.association import StereoMatch
+from stereo.simple_stereo import SimpleStereoMatcher
+
+WIDTH, HEIGHT = 640, 360
+
+
+@pytest.fixture(scope="module")
+def scene():
+    return StereoScene(default_geometry(WIDTH, HEIGHT), SceneConfig(width=WIDTH, height=HEIGHT, frames=40))
+
+
+def test_truth_triangulates_back_to_positions(scene):
+    matcher = SimpleStereoMatcher(scene.geometry)
+    visible = [truth for truth in scene.truth if truth.visible]
+
+    assert len(visible) > 15
+    for truth in visible:
+        obs = matcher.triangulate(
+            StereoMatch(left=truth.left, right=truth.right, epipolar_error_px=0.0, score=1.0)
+        )
+        assert (obs.X, obs.Y, obs.Z) == pytest.approx(truth.position_ft, abs=1e-6)
+    assert len(scene.observations()) == len(visible)
+    # Ball approaches the cameras and grows
+    assert visible[-1].position_ft[2] < visible[0].position_ft[2]
+    assert visible[-1].left.radius_px > visible[0].left.radius_px
+
+
+def test_rendering_is_deterministic_and_textured(scene):
+    pair = scene.render(10)
+    again = StereoScene(scene.geometry, scene.config).render(10)
+
+    assert np.array_equal(pair.left.image, again.left.image)
+    assert pair.left.image.shape == (HEIGHT, WIDTH)
+    assert pair.left.t_capture_monotonic_ns == pair.right.t_capture_monotonic_ns
+    assert pair.left.image.std() > 5.0  # not a flat or blank frame
+    truth = pair.truth.left
+    assert pair.left.image[int(truth.v), int(truth.u)] > 200
+    with pytest.raises(IndexError):
+        scene.render(len(scene))
+
+
+def test_detector_finds_ball_near_ground_truth(scene):
+    detector = ClassicalDetector()
+    errors = []
+    false_positive_frames = 0
+    for pair in scene:
+        detections = detector.detect(pair.left)
+        truth = pair.truth.left
+        if truth is None:
+            false_positive_frames += bool(detections) and pair.index < scene.config.lead_in_frames
+            continue
+        if detections:
+            errors.append(min(np.hypot(d.u - truth.u, d.v - truth.v) for d in detections))
+
+    assert false_positive_frames == 0
+    assert len(errors) > 15
+    # Frame differencing puts the centroid between consecutive ball positions
+    assert np.median(errors) < 10.0
+
+
+def test_benchmark_frames_cycle_the_scene():
+    frame = create_test_frame(WIDTH, HEIGHT, timestamp_ns=123, index=500)
+
+    assert frame.frame_index == 500
+    assert frame.t_capture_monotonic_ns == 123
+    assert frame.image.shape == (HEIGHT, WIDTH)
+    assert frame.pixfmt == "GRAY8"
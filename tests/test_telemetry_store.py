@@ -0,0 +1,127 @@
+"""Tests for columnar pitch telemetry storage."""
+
+import json
+from unittest.mock import Mock
+
+import numpy as np
+import pytest
+
+from app.pipeline.recording.pitch_recorder import PitchRecorder
+from app.pipeline.recording.telemetry_store import (
+    TelemetryTable,
+    detections_path,
+    export_json,
+    observations_path,
+    read_detections,
+    read_observations,
+    read_table,
+    write_table,
+)
+from app.review.session_loader import SessionLoader
+from contracts import Detection, Frame, StereoObservation
+
+
+def _detections(count):
+    return [
+        {
+            "frame_index": 100 + i,
+            "timestamp_ns": 1_000_000 * i,
+            "u_px": 10.5 + i,
+            "v_px": 20.25,
+            "radius_px": 4.0,
+            "confidence": 0.5,
+        }
+        for i in range(count)
+    ]
+
+
+def test_table_round_trip_is_memory_mapped(tmp_path):
+    path = tmp_path / "left_detections.npz"
+    write_table(path, TelemetryTable.from_detections(_detections(50), pitch_id="p1", camera="left"))
+
+    table = read_table(path)
+    assert len(table) == 50
+    assert table.meta == {"pitch_id": "p1", "camera": "left"}
+    assert isinstance(table["frame_index"], np.memmap)
+    assert table["frame_index"].dtype == np.int64
+    np.testing.assert_array_equal(table["frame_index"], np.arange(100, 150))
+    assert table.to_records() == _detections(50)
+
+    json_path = export_json(path)
+    payload = json.loads(json_path.read_text())
+    assert payload["detection_count"] == 50
+    assert payload["camera"] == "left"
+    assert payload["detections"][3] == _detections(50)[3]
+
+
+def test_empty_table_round_trip(tmp_path):
+    path = tmp_path / "empty.npz"
+    write_table(path, TelemetryTable.from_observations([], pitch_id="p1"))
+    table = read_table(path)
+    assert table.kind == "observations"
+    assert len(table) == 0
+    assert table.to_payload() == {"pitch_id": "p1", "observation_count": 0, "observations": []}
+
+
+def test_invalid_table_raises(tmp_path):
+    path = tmp_path / "bad.npz"
+    path.write_bytes(b"not a zip")
+    with pytest.raises(ValueError):
+        read_table(path)
+
+
+@pytest.mark.parametrize("fmt", ["npz", "json"])
+def test_pitch_recorder_exports_readable_telemetry(tmp_path, fmt):
+    config = Mock()
+    config.camera.fps = 30
+    config.recording.pre_roll_ms = 100
+    config.recording.post_roll_ms = 100
+    config.recording.save_detections = True
+    config.recording.save_observations = True
+    config.recording.save_training_frames = False
+    config.recording.frame_save_interval = 5
+    config.recording.telemetry_format = fmt
+
+    recorder = PitchRecorder(config, tmp_path, "pitch-001")
+    frame = Frame(
+        camera_id="left", frame_index=7, t_capture_monotonic_ns=70,
+        image=np.zeros((4, 4), dtype=np.uint8), width=4, height=4, pixfmt="GRAY8",
+    )
+    detection = Detection(
+        camera_id="left", frame_index=7, t_capture_monotonic_ns=70,
+        u=12.0, v=34.0, radius_px=3.0, confidence=0.9,
+    )
+    recorder.write_frame_with_detections("left", frame, [detection])
+    recorder.add_observation(StereoObservation(
+        t_ns=70, left=(12.0, 34.0), right=(10.0, 34.0),
+        X=1.0, Y=2.0, Z=50.0, quality=0.8, confidence=0.9,
+    ))
+    recorder.close()
+
+    pitch_dir = tmp_path / "pitch-001"
+    assert detections_path(pitch_dir, "left", fmt).exists()
+    assert observations_path(pitch_dir, fmt).exists()
+    left = read_detections(pitch_dir, "left")
+    assert left["frame_index"].tolist() == [7]
+    assert left["u"].tolist() == [12.0]
+    assert read_detections(pitch_dir, "right") is None
+    observations = read_observations(pitch_dir)
+    assert observations["Z_ft"].tolist() == [50.0]
+    assert observations.to_records()[0]["right_px"] == [10.0, 34.0]
+
+
+def test_loaded_pitch_reads_recorder_tables(tmp_path):
+    session_dir = tmp_path / "session-2026-01-19_001"
+    pitch_dir = session_dir / "pitch-001"
+    pitch_dir.mkdir(parents=True)
+    (session_dir / "session_manifest.json").write_text("{}")
+    (session_dir / "session_left.avi").write_bytes(b"")
+    (pitch_dir / "pitch_manifest.json").write_text(json.dumps({"pitch_id": "p1"}))
+    write_table(detections_path(pitch_dir, "left"), TelemetryTable.from_detections(_detections(5), camera="left"))
+
+    session = SessionLoader.load_session(session_dir, lazy=True)
+    pitch = session.pitches[0]
+    assert pitch.manifest["detection_count_left"] == 5
+    assert len(pitch.get_detection_table("left")) == 5
+    assert pitch.get_detections("left")["detections"] == _detections(5)
+    assert pitch.get_detection_table("right") is None
@@ -0,0 +1,71 @@
+"""Tests for training report video analysis."""
+
+import json
+from pathlib import Path
+
+import cv2
+import numpy as np
+
+from record.training_report import build_training_report
+
+CONFIG_PATH = Path(__file__).resolve().parents[1] / "configs" / "default.yaml"
+
+
+def _write_video(path, frame_count, brightness):
+    writer = cv2.VideoWriter(str(path), cv2.VideoWriter_fourcc(*"MJPG"), 30.0, (64, 48))
+    for i in range(frame_count):
+        frame = np.full((48, 64, 3), brightness, dtype=np.uint8)
+        cv2.circle(frame, (8 + i * 2, 24), 3, (255, 255, 255), -1)
+        writer.write(frame)
+    writer.release()
+
+
+def _make_session(tmp_path):
+    session_dir = tmp_path / "session"
+    session_dir.mkdir()
+    (session_dir / "session_summary.json").write_text(json.dumps({"session_id": "s1", "pitch_count": 3}))
+    for i, brightness in enumerate((40, 90, 140)):
+        pitch_dir = session_dir / f"s1-pitch-{i + 1:03d}"
+        pitch_dir.mkdir()
+        (pitch_dir / "manifest.json").write_text("{}")
+        _write_video(pitch_dir / "left.avi", 12, brightness)
+        _write_video(pitch_dir / "right.avi", 12, brightness + 10)
+    return session_dir
+
+
+def _report(session_dir, **kwargs):
+    return build_training_report(
+        session_dir,
+        CONFIG_PATH,
+        session_dir / "missing_roi.json",
+        report_id="r1",
+        created_utc="2026-01-19T00:00:00Z",
+        **kwargs,
+    )
+
+
+def test_stride_samples_every_nth_frame(tmp_path):
+    session_dir = _make_session(tmp_path)
+    report = _report(session_dir, stride=3, skip_detection=True, max_workers=1)
+
+    left = report["brightness_stats"]["left"]
+    assert left["frame_count"] == 12  # 4 sampled frames from each of 3 videos
+    assert 40 < left["mean_gray_avg"] < 140
+    assert report["detection_stats"] is None
+    assert [log["message"] for log in report["logs"][1:4]] == [
+        "Analyzing video left.avi"
+    ] * 3
+
+
+def test_parallel_results_match_serial(tmp_path):
+    session_dir = _make_session(tmp_path)
+    serial = _report(session_dir, max_workers=1)
+    parallel = _report(session_dir, max_workers=3)
+    threaded = _report(session_dir, max_workers=3, use_processes=False)
+
+    for report in (parallel, threaded):
+        assert report["brightness_stats"] == serial["brightness_stats"]
+        assert report["detection_stats"] == serial["detection_stats"]
+        assert report["errors"] == serial["errors"]
+        assert report["logs"][:-1] == serial["logs"][:-1]
+    assert serial["detection_stats"]["right"]["frame_count"] == 36
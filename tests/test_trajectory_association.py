@@ -0,0 +1,51 @@
+import numpy as np
+
+from trajectory.association import JointAssociator
+from trajectory.camera_model import CameraModel
+
+
+def _rectified_camera() -> CameraModel:
+    # Fundamental matrix of a rectified pair: epipolar lines are image rows.
+    fundamental = np.array([[0.0, 0.0, 0.0], [0.0, 0.0, -1.0], [0.0, 1.0, 0.0]])
+    return CameraModel(
+        fx=1000.0,
+        fy=1000.0,
+        cx=640.0,
+        cy=360.0,
+        R=np.eye(3),
+        t=np.zeros(3),
+        fundamental_matrix=fundamental,
+    )
+
+
+def test_cost_matrix_matches_per_pair_epipolar_distance() -> None:
+    camera = _rectified_camera()
+    associator = JointAssociator(camera, camera)
+    rng = np.random.default_rng(3)
+    left = [tuple(p) for p in rng.uniform(0, 720, size=(7, 2))]
+    right = [tuple(p) for p in rng.uniform(0, 720, size=(5, 2))]
+    cost = associator.cost_matrix(left, right)
+    for i, l_uv in enumerate(left):
+        for j, r_uv in enumerate(right):
+            expected = camera.epipolar_distance(np.array(l_uv), np.array(r_uv))
+            assert np.isclose(cost[i, j], expected)
+
+
+def test_associate_prunes_and_solves_per_component() -> None:
+    associator = JointAssociator(_rectified_camera(), None)
+    left = [(100.0, 100.0), (300.0, 400.0), (310.0, 405.0), (50.0, 700.0)]
+    right = [(80.0, 402.0), (90.0, 101.0), (85.0, 407.0), (10.0, 10.0)]
+    pairs = associator.associate(7, left, right)
+    matched = {pair.left_uv: pair.right_uv for pair in pairs}
+    assert matched == {
+        (100.0, 100.0): (90.0, 101.0),
+        (300.0, 400.0): (80.0, 402.0),
+        (310.0, 405.0): (85.0, 407.0),
+    }
+    assert all(pair.t_ns == 7 for pair in pairs)
+
+
+def test_associate_without_fundamental_matrix_uses_row_offset() -> None:
+    associator = JointAssociator(None, None)
+    pairs = associator.associate(0, [(10.0, 50.0)], [(5.0, 90.0), (7.0, 60.0)])
+    assert [pair.right_uv for pair in pairs] == [(7.0, 60.0)]
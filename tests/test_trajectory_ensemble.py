@@ -0,0 +1,112 @@
+import threading
+from dataclasses import replace
+
+import numpy as np
+import pytest
+
+from trajectory.ballistic import BallisticFitter
+from trajectory.camera_model import CameraModel
+from trajectory.contracts import FailureCode, TrajectoryFitRequest
+from trajectory.ensemble import EnsembleRunner, is_selectable
+from trajectory.reprojection import ReprojectionFitter
+from trajectory.sim import SimConfig, simulate_ballistic
+
+
+def _camera(offset_x_ft: float) -> CameraModel:
+    # Cameras 10 ft behind the plate, looking down the pitch (+Z)
+    return CameraModel(
+        fx=1000.0,
+        fy=1000.0,
+        cx=640.0,
+        cy=360.0,
+        R=np.eye(3),
+        t=np.array([offset_x_ft, -4.0, 10.0]),
+    )
+
+
+def test_ballistic_fitter_recovers_drag_free_flight() -> None:
+    observations = simulate_ballistic(SimConfig(outlier_prob=0.0, noise_ft=0.01))
+    request = TrajectoryFitRequest(observations=observations, plate_plane_z_ft=0.0)
+    result = BallisticFitter().fit_trajectory(request)
+    assert result.model_name == "ballistic"
+    assert result.diagnostics.rmse_3d_ft < 0.05
+    assert result.plate_crossing_xyz_ft is not None
+    assert result.plate_crossing_xyz_ft[1] == pytest.approx(6.0 - 0.5 * 32.174 * 0.5 ** 2, abs=0.1)
+
+
+def test_ensemble_runner_terminates_early_on_confident_candidate() -> None:
+    observations = simulate_ballistic(SimConfig(outlier_prob=0.0, noise_ft=0.01))[::3]
+    request = TrajectoryFitRequest(observations=observations, plate_plane_z_ft=0.0, realtime=True)
+    with EnsembleRunner(
+        variants=("ballistic", "drag", "radar"),
+        latency_budget_ms=5000.0,
+        confidence_threshold=0.7,
+        max_workers=1,
+    ) as runner:
+        run = runner.run(request)
+    statuses = {cand.name: cand.status for cand in run.candidates}
+    assert statuses == {"ballistic": "completed", "drag": "cancelled", "radar": "skipped"}
+    assert run.early_terminated
+    assert run.selected is not None
+    assert run.selected.model_name == "ballistic"
+    assert run.selected.diagnostics.wall_time_ms == run.timings_ms["ballistic"]
+
+
+def test_ensemble_runner_rejects_unknown_variant() -> None:
+    with pytest.raises(ValueError):
+        EnsembleRunner(variants=("ballistic", "spline"))
+
+
+def test_reprojection_fitter_recovers_plate_crossing_from_pixels() -> None:
+    left, right = _camera(1.0), _camera(-1.0)
+    observations = [
+        replace(
+            obs,
+            left=tuple(left.project(np.array([obs.X, obs.Y, obs.Z]))),
+            right=tuple(right.project(np.array([obs.X, obs.Y, obs.Z]))),
+        )
+        for obs in simulate_ballistic(SimConfig(outlier_prob=0.0, noise_ft=0.0))
+    ]
+    request = TrajectoryFitRequest(
+        observations=observations, plate_plane_z_ft=0.0, camera_left=left, camera_right=right
+    )
+    result = ReprojectionFitter().fit_trajectory(request)
+    assert result.model_name == "reprojection_ekf_rts"
+    assert result.diagnostics.failure_codes == []
+    assert len(result.samples) == len(observations)
+    assert result.plate_crossing_xyz_ft == pytest.approx((0.5, 6.0 - 0.5 * 32.174 * 0.5 ** 2, 0.0), abs=0.05)
+    assert is_selectable(result)
+
+    missing = ReprojectionFitter().fit_trajectory(replace(request, camera_left=None))
+    assert missing.diagnostics.failure_codes == [FailureCode.CAMERA_MODEL_MISSING]
+    assert not is_selectable(missing)
+
+
+def test_ensemble_runner_skips_straggler_and_reports_its_wall_time() -> None:
+    observations = simulate_ballistic(SimConfig(outlier_prob=0.0, noise_ft=0.01))[::3]
+    request = TrajectoryFitRequest(observations=observations, plate_plane_z_ft=0.0)
+    release = threading.Event()
+
+    class StuckFitter:
+        def fit_trajectory(self, request):
+            release.wait(10.0)
+            return BallisticFitter().fit_trajectory(request)
+
+    runner = EnsembleRunner(
+        variants=("ballistic", "drag"), latency_budget_ms=200.0, confidence_threshold=1.1
+    )
+    runner._fitters["drag"] = StuckFitter()
+    try:
+        first = runner.run(request)
+        statuses = {cand.name: cand.status for cand in first.candidates}
+        assert statuses == {"ballistic": "completed", "drag": "timed_out"}
+        assert first.timings_ms["drag"] >= 150.0
+
+        second = runner.run(request)
+        drag = second.candidates[1]
+        assert (drag.status, drag.error) == ("skipped", "previous solve still running")
+        assert second.selected is not None
+        assert second.elapsed_ms < 200.0
+    finally:
+        release.set()
+        runner.close()
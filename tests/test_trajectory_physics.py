@@ -2,6 +2,8 @@ import pytest
 
 from trajectory.contracts import TrajectoryFitRequest
 from trajectory.physics import PhysicsDragFitter
+from trajectory.radar import PhysicsDragRadarFitter
+from trajectory.session import TrajectoryFitSession
 from trajectory.sim import SimConfig, simulate_ballistic
 
 
@@ -14,3 +16,50 @@ def test_physics_fitter_ballistic_accuracy() -> None:
         pytest.skip("scipy not available or fit failed")
     assert result.diagnostics.rmse_3d_ft is not None
     assert result.diagnostics.rmse_3d_ft < 0.5
+
+
+def test_fit_session_keeps_observations_sorted() -> None:
+    observations = simulate_ballistic(SimConfig(outlier_prob=0.0, noise_ft=0.0))[:8]
+    session = TrajectoryFitSession()
+    shuffled = [observations[i] for i in (0, 2, 1, 4, 3, 5, 7, 6)]
+    session.sync(shuffled[:4])
+    session.sync(shuffled)
+    assert [obs.t_ns for obs in session.observations] == [obs.t_ns for obs in observations]
+    assert session.positions()[3].tolist() == [observations[3].X, observations[3].Y, observations[3].Z]
+    version = session.version
+    session.sync(shuffled)
+    assert session.version == version
+
+
+def test_radar_fitter_reuses_shared_base_fit() -> None:
+    observations = simulate_ballistic(SimConfig(outlier_prob=0.0, noise_ft=0.01))[:20]
+    request = TrajectoryFitRequest(
+        observations=observations,
+        plate_plane_z_ft=0.0,
+        realtime=True,
+        radar_speed_mph=80.0,
+        radar_speed_ref="release",
+    )
+    session = TrajectoryFitSession()
+    base = PhysicsDragFitter(session=session).fit_trajectory(request)
+    if not base.samples:
+        pytest.skip("scipy not available or fit failed")
+    radar = PhysicsDragRadarFitter(session=session).fit_trajectory(request)
+    assert session.hits == 1
+    assert radar.samples is base.samples
+    assert radar.diagnostics.radar_residual_mph is not None
+
+
+def test_realtime_fits_warm_start_from_previous_solution() -> None:
+    observations = simulate_ballistic(SimConfig(outlier_prob=0.0, noise_ft=0.01))[:16]
+    fitter = PhysicsDragFitter()
+    fitter.reset(TrajectoryFitRequest(observations=observations[:12], plate_plane_z_ft=0.0, realtime=True))
+    first = fitter.maybe_fit()
+    if first is None or not first.samples:
+        pytest.skip("scipy not available or fit failed")
+    assert fitter.session.warm_start() is not None
+    fitter.add_observations(observations[12:])
+    second = fitter.maybe_fit()
+    assert len(fitter.session) == 16
+    assert second.diagnostics.rmse_3d_ft is not None
+    assert second.diagnostics.rmse_3d_ft < 0.5
@@ -1,6 +1,7 @@
 """Trajectory fitting package."""
 
 from trajectory.association import JointAssociator
+from trajectory.ballistic import BallisticFitter
 from trajectory.camera_model import CameraModel
 from trajectory.confidence import ConfidenceScorer
 from trajectory.contracts import (
@@ -10,14 +11,26 @@ from trajectory.contracts import (
     TrajectoryFitRequest,
     TrajectoryFitResult,
 )
-from trajectory.ensemble import GatingModel, RuleBasedGatingModel, TrajectoryEnsembler
+from trajectory.ensemble import (
+    EnsembleCandidate,
+    EnsembleRunner,
+    EnsembleRunResult,
+    GatingModel,
+    RuleBasedGatingModel,
+    TrajectoryEnsembler,
+)
 from trajectory.physics import PhysicsDragFitter
 from trajectory.radar import PhysicsDragRadarFitter, RadarBiasEstimator
-from trajectory.reprojection import ReprojectionEKF, RTSSmoother
+from trajectory.reprojection import ReprojectionEKF, ReprojectionFitter, RTSSmoother
+from trajectory.session import TrajectoryFitSession
 
 __all__ = [
+    "BallisticFitter",
     "CameraModel",
     "ConfidenceScorer",
+    "EnsembleCandidate",
+    "EnsembleRunner",
+    "EnsembleRunResult",
     "FailureCode",
     "GatingModel",
     "JointAssociator",
@@ -26,10 +39,12 @@ __all__ = [
     "RadarBiasEstimator",
     "ResidualReport",
     "ReprojectionEKF",
+    "ReprojectionFitter",
     "RTSSmoother",
     "RuleBasedGatingModel",
     "TrajectoryDiagnostics",
     "TrajectoryEnsembler",
     "TrajectoryFitRequest",
     "TrajectoryFitResult",
+    "TrajectoryFitSession",
 ]
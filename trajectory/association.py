@@ -3,16 +3,15 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import List, Optional, Tuple
+from typing import Dict, List, Optional, Tuple
 
 import numpy as np
 
 from trajectory.camera_model import CameraModel
 
-try:
-    from scipy.optimize import linear_sum_assignment
-except Exception:  # pragma: no cover
-    linear_sum_assignment = None
+MAX_PAIR_COST_PX = 25.0
+# Cost assigned to pruned pairs inside a component so the solver avoids them.
+_PRUNED_COST = 1e6
 
 
 @dataclass(frozen=True)
@@ -22,6 +21,15 @@ class MatchedPair:
     right_uv: Tuple[float, float]
 
 
+def _linear_sum_assignment():
+    """SciPy's assignment solver, imported on first use to keep scipy.optimize off the startup path."""
+    try:
+        from scipy.optimize import linear_sum_assignment
+    except Exception:  # pragma: no cover
+        return None
+    return linear_sum_assignment
+
+
 class JointAssociator:
     def __init__(self, camera_left: Optional[CameraModel], camera_right: Optional[CameraModel]) -> None:
         self._left = camera_left
@@ -35,26 +43,94 @@ class JointAssociator:
     ) -> List[MatchedPair]:
         if not left_dets or not right_dets:
             return []
-        cost = np.zeros((len(left_dets), len(right_dets)), dtype=float)
-        for i, left in enumerate(left_dets):
-            for j, right in enumerate(right_dets):
-                cost[i, j] = self._pair_cost(np.array(left), np.array(right))
+        cost = self.cost_matrix(left_dets, right_dets)
+        linear_sum_assignment = _linear_sum_assignment()
         if linear_sum_assignment is None:
             return _greedy_match(t_ns, left_dets, right_dets, cost)
-        row_ind, col_ind = linear_sum_assignment(cost)
-        pairs: List[MatchedPair] = []
-        for r, c in zip(row_ind, col_ind):
-            if cost[r, c] > 25.0:
+
+        rows, cols = np.nonzero(cost <= MAX_PAIR_COST_PX)
+        if rows.size == 0:
+            return []
+        matched: List[Tuple[int, int]] = []
+        for comp_rows, comp_cols in _components(rows, cols, cost.shape):
+            if len(comp_rows) == 1 and len(comp_cols) == 1:
+                matched.append((comp_rows[0], comp_cols[0]))
                 continue
-            pairs.append(MatchedPair(t_ns=t_ns, left_uv=left_dets[r], right_uv=right_dets[c]))
-        return pairs
+            sub = cost[np.ix_(comp_rows, comp_cols)]
+            sub = np.where(sub <= MAX_PAIR_COST_PX, sub, _PRUNED_COST)
+            row_ind, col_ind = linear_sum_assignment(sub)
+            for r, c in zip(row_ind, col_ind):
+                if sub[r, c] <= MAX_PAIR_COST_PX:
+                    matched.append((comp_rows[r], comp_cols[c]))
+        matched.sort()
+        return [
+            MatchedPair(t_ns=t_ns, left_uv=left_dets[r], right_uv=right_dets[c])
+            for r, c in matched
+        ]
+
+    def cost_matrix(
+        self,
+        left_dets: List[Tuple[float, float]],
+        right_dets: List[Tuple[float, float]],
+    ) -> np.ndarray:
+        """Epipolar distance (px) for every left/right pair in one expression.
+
+        Falls back to the vertical pixel offset when no fundamental matrix is
+        available, or for degenerate epipolar lines.
+        """
+        left = np.asarray(left_dets, dtype=float).reshape(-1, 2)
+        right = np.asarray(right_dets, dtype=float).reshape(-1, 2)
+        vertical = np.abs(left[:, 1:2] - right[:, 1][np.newaxis, :])
+        fundamental = self._left.fundamental_matrix if self._left is not None else None
+        if fundamental is None:
+            return vertical
+        left_h = np.column_stack([left, np.ones(len(left))])
+        right_h = np.column_stack([right, np.ones(len(right))])
+        lines = left_h @ np.asarray(fundamental, dtype=float).T
+        denom = np.hypot(lines[:, 0], lines[:, 1])
+        numer = np.abs(lines @ right_h.T)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            dist = numer / denom[:, np.newaxis]
+        return np.where((denom == 0)[:, np.newaxis], vertical, dist)
+
+
+def _components(
+    rows: np.ndarray,
+    cols: np.ndarray,
+    shape: Tuple[int, int],
+) -> List[Tuple[List[int], List[int]]]:
+    """Connected components of the bipartite candidate graph (union-find).
+
+    Returns (left indices, right indices) for each component that has at
+    least one candidate edge.
+    """
+    n_left = shape[0]
+    parent = list(range(n_left + shape[1]))
+
+    def find(x: int) -> int:
+        while parent[x] != x:
+            parent[x] = parent[parent[x]]
+            x = parent[x]
+        return x
+
+    edges = list(zip(rows.tolist(), cols.tolist()))
+    for r, c in edges:
+        root_r, root_c = find(r), find(c + n_left)
+        if root_r != root_c:
+            parent[root_r] = root_c
 
-    def _pair_cost(self, left_uv: np.ndarray, right_uv: np.ndarray) -> float:
-        if self._left is not None:
-            dist = self._left.epipolar_distance(left_uv, right_uv)
-            if dist is not None:
-                return float(dist)
-        return float(abs(left_uv[1] - right_uv[1]))
+    grouped: Dict[int, Tuple[List[int], List[int]]] = {}
+    seen_left = set()
+    seen_right = set()
+    for r, c in edges:
+        comp = grouped.setdefault(find(r), ([], []))
+        if r not in seen_left:
+            seen_left.add(r)
+            comp[0].append(r)
+        if c not in seen_right:
+            seen_right.add(c)
+            comp[1].append(c)
+    return list(grouped.values())
 
 
 def _greedy_match(
@@ -74,7 +150,7 @@ def _greedy_match(
             if best is None or cost[i, j] < best:
                 best = cost[i, j]
                 best_j = j
-        if best_j is not None and best is not None and best < 25.0:
+        if best_j is not None and best is not None and best < MAX_PAIR_COST_PX:
             used_right.add(best_j)
             pairs.append(MatchedPair(t_ns=t_ns, left_uv=left_dets[i], right_uv=right_dets[best_j]))
     return pairs
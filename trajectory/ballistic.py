@@ -0,0 +1,131 @@
+"""Closed-form ballistic (gravity only, no drag) trajectory fitter."""
+
+from __future__ import annotations
+
+from typing import List, Optional
+
+import numpy as np
+
+from contracts import StereoObservation, TrackSample
+from trajectory.base import TrajectoryFitterBase
+from trajectory.confidence import ConfidenceScorer
+from trajectory.contracts import (
+    FailureCode,
+    TrajectoryDiagnostics,
+    TrajectoryFitRequest,
+    TrajectoryFitResult,
+)
+from trajectory.physics import (
+    GRAVITY_FT_S2,
+    _build_residual_reports,
+    _find_plate_crossing,
+    _inlier_ratio,
+    _is_monotonic_z,
+    _rmse,
+)
+
+
+class BallisticFitter(TrajectoryFitterBase):
+    """Linear least-squares fit of a drag-free parabola.
+
+    Cheap enough to run on every realtime update and a useful fallback when the
+    drag optimizer does not converge.
+    """
+
+    def __init__(self) -> None:
+        super().__init__()
+        self._scorer = ConfidenceScorer()
+
+    def maybe_fit(self) -> Optional[TrajectoryFitResult]:
+        if self._request is None or len(self._buffer) < 3:
+            return None
+        return self._fit(self._request, self._buffer)
+
+    def finalize_fit(self) -> TrajectoryFitResult:
+        if self._request is None:
+            raise RuntimeError("No request set.")
+        return self._fit(self._request, self._buffer)
+
+    def fit_trajectory(self, request: TrajectoryFitRequest) -> TrajectoryFitResult:
+        return self._fit(request, request.observations)
+
+    def _fit(
+        self,
+        request: TrajectoryFitRequest,
+        observations: List[StereoObservation],
+    ) -> TrajectoryFitResult:
+        if len(observations) < 3:
+            diagnostics = TrajectoryDiagnostics(failure_codes=[FailureCode.INSUFFICIENT_POINTS])
+            return TrajectoryFitResult(
+                model_name="ballistic",
+                samples=[],
+                plate_crossing_xyz_ft=None,
+                plate_crossing_t_ns=None,
+                expected_plate_error_ft=None,
+                confidence=0.0,
+                diagnostics=diagnostics,
+            )
+
+        obs_sorted = sorted(observations, key=lambda obs: obs.t_ns)
+        t0_ns = obs_sorted[0].t_ns
+        times_s = np.array([(obs.t_ns - t0_ns) / 1e9 for obs in obs_sorted])
+        positions = np.array([[obs.X, obs.Y, obs.Z] for obs in obs_sorted])
+        max_gap_ms = float(np.max(np.diff(times_s)) * 1000.0)
+
+        # Gravity is known, so every axis is linear in (p0, v0).
+        gravity = np.zeros_like(positions)
+        gravity[:, 1] = 0.5 * GRAVITY_FT_S2 * times_s * times_s
+        design = np.column_stack([np.ones_like(times_s), times_s])
+        coeffs, _, _, singular = np.linalg.lstsq(design, positions - gravity, rcond=None)
+        p0 = coeffs[0]
+        v0 = coeffs[1]
+
+        samples: List[TrackSample] = []
+        for t in times_s:
+            pos = p0 + v0 * t
+            vel = v0.copy()
+            pos[1] += 0.5 * GRAVITY_FT_S2 * t * t
+            vel[1] += GRAVITY_FT_S2 * t
+            samples.append(
+                TrackSample(
+                    t_ns=int(t0_ns + t * 1e9),
+                    X=float(pos[0]),
+                    Y=float(pos[1]),
+                    Z=float(pos[2]),
+                    Vx=float(vel[0]),
+                    Vy=float(vel[1]),
+                    Vz=float(vel[2]),
+                )
+            )
+
+        failure_codes: List[FailureCode] = []
+        plate_crossing = _find_plate_crossing(samples, request.plate_plane_z_ft)
+        if plate_crossing is None:
+            failure_codes.append(FailureCode.NO_PLATE_CROSSING)
+        if not _is_monotonic_z(samples):
+            failure_codes.append(FailureCode.NON_MONOTONIC_Z)
+
+        residuals = _build_residual_reports(samples, obs_sorted)
+        rmse = _rmse([res.residual_3d_ft for res in residuals])
+        condition_number = float(singular[0] / singular[-1]) if singular[-1] > 0 else None
+        diagnostics = TrajectoryDiagnostics(
+            rmse_3d_ft=rmse,
+            inlier_ratio=_inlier_ratio(residuals),
+            condition_number=condition_number,
+            max_gap_ms=max_gap_ms,
+            failure_codes=failure_codes,
+        )
+        expected_error = self._scorer.expected_plate_error_ft(
+            residual_scale=rmse,
+            plate_crossing=plate_crossing,
+        )
+        return TrajectoryFitResult(
+            model_name="ballistic",
+            samples=samples,
+            plate_crossing_xyz_ft=plate_crossing[0] if plate_crossing else None,
+            plate_crossing_t_ns=plate_crossing[1] if plate_crossing else None,
+            expected_plate_error_ft=expected_error,
+            confidence=self._scorer.confidence_from_error(expected_error),
+            diagnostics=diagnostics,
+            residuals=residuals,
+        )
@@ -42,6 +42,7 @@ class TrajectoryDiagnostics:
     max_gap_ms: Optional[float] = None
     radar_residual_mph: Optional[float] = None
     radar_inlier_probability: Optional[float] = None
+    wall_time_ms: Optional[float] = None
     failure_codes: List[FailureCode] = field(default_factory=list)
     notes: List[str] = field(default_factory=list)
 
@@ -56,6 +57,7 @@ class TrajectoryDiagnostics:
             "max_gap_ms": self.max_gap_ms,
             "radar_residual_mph": self.radar_residual_mph,
             "radar_inlier_probability": self.radar_inlier_probability,
+            "wall_time_ms": self.wall_time_ms,
             "failure_codes": [code.value for code in self.failure_codes],
             "notes": list(self.notes),
         }
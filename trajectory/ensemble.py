@@ -2,9 +2,26 @@
 
 from __future__ import annotations
 
-from typing import Dict, List, Optional
+import time
+from concurrent.futures import (
+    FIRST_COMPLETED,
+    Executor,
+    Future,
+    ProcessPoolExecutor,
+    ThreadPoolExecutor,
+    wait,
+)
+from dataclasses import dataclass, field, replace
+from typing import Dict, List, Optional, Sequence, Tuple
 
-from trajectory.contracts import FailureCode, TrajectoryFitResult
+from trajectory.ballistic import BallisticFitter
+from trajectory.contracts import FailureCode, TrajectoryFitRequest, TrajectoryFitResult
+from trajectory.physics import PhysicsDragFitter
+from trajectory.radar import PhysicsDragRadarFitter, RadarBiasEstimator
+from trajectory.reprojection import ReprojectionFitter
+from trajectory.session import TrajectoryFitSession
+
+DEFAULT_VARIANTS = ("ballistic", "drag", "radar", "reprojection")
 
 
 class GatingModel:
@@ -21,12 +38,21 @@ class RuleBasedGatingModel(GatingModel):
         return base + penalty
 
 
+def is_selectable(result: TrajectoryFitResult) -> bool:
+    """Whether a fit is usable as an ensemble answer (crosses the plate, monotonic Z)."""
+    if result.plate_crossing_xyz_ft is None:
+        return False
+    if FailureCode.NON_MONOTONIC_Z in result.diagnostics.failure_codes:
+        return False
+    return True
+
+
 class TrajectoryEnsembler:
     def __init__(self, gating_model: Optional[GatingModel] = None) -> None:
         self._gating_model = gating_model or RuleBasedGatingModel()
 
     def select(self, candidates: List[TrajectoryFitResult]) -> Optional[TrajectoryFitResult]:
-        guarded = [cand for cand in candidates if self._guard(cand)]
+        guarded = [cand for cand in candidates if is_selectable(cand)]
         if not guarded:
             return None
         scored = sorted(guarded, key=self._score)
@@ -37,10 +63,196 @@ class TrajectoryEnsembler:
             return result.expected_plate_error_ft
         return self._gating_model.predict_expected_error(result.diagnostics.to_dict())
 
-    @staticmethod
-    def _guard(result: TrajectoryFitResult) -> bool:
-        if result.plate_crossing_xyz_ft is None:
-            return False
-        if FailureCode.NON_MONOTONIC_Z in result.diagnostics.failure_codes:
-            return False
-        return True
+
+@dataclass(frozen=True)
+class EnsembleCandidate:
+    name: str
+    status: str  # "completed", "failed", "skipped", "cancelled" or "timed_out"
+    result: Optional[TrajectoryFitResult] = None
+    wall_time_ms: Optional[float] = None
+    error: Optional[str] = None
+
+
+@dataclass(frozen=True)
+class EnsembleRunResult:
+    selected: Optional[TrajectoryFitResult]
+    candidates: List[EnsembleCandidate] = field(default_factory=list)
+    elapsed_ms: float = 0.0
+    early_terminated: bool = False
+
+    @property
+    def timings_ms(self) -> Dict[str, Optional[float]]:
+        return {cand.name: cand.wall_time_ms for cand in self.candidates}
+
+
+class EnsembleRunner:
+    """Run several trajectory fitters concurrently within a latency budget.
+
+    Candidates are submitted to a thread (or process) pool. The runner returns
+    as soon as one guarded result reaches ``confidence_threshold`` or the
+    budget expires; candidates that have not started are cancelled and those
+    still running are abandoned. Each completed candidate's wall time is
+    written into its ``diagnostics.wall_time_ms``; abandoned and timed-out
+    candidates report the time they had been running when the run returned.
+
+    An abandoned solve keeps running in its worker, so a variant whose
+    previous solve is still in flight is skipped rather than queued behind
+    it. In thread mode each fitter owns its ``TrajectoryFitSession`` (warm
+    start and memoized results), so a straggler only holds its own session's
+    lock. Process mode trades the warm start (and radar bias persistence)
+    for freedom from the GIL.
+    """
+
+    def __init__(
+        self,
+        variants: Sequence[str] = DEFAULT_VARIANTS,
+        ensembler: Optional[TrajectoryEnsembler] = None,
+        latency_budget_ms: float = 500.0,
+        confidence_threshold: float = 0.75,
+        use_processes: bool = False,
+        max_workers: Optional[int] = None,
+        bias_estimator: Optional[RadarBiasEstimator] = None,
+    ) -> None:
+        unknown = [name for name in variants if name not in DEFAULT_VARIANTS]
+        if unknown:
+            raise ValueError(f"Unknown ensemble variants: {unknown}")
+        self._variants = tuple(variants)
+        self._ensembler = ensembler or TrajectoryEnsembler()
+        self._latency_budget_ms = latency_budget_ms
+        self._confidence_threshold = confidence_threshold
+        self._use_processes = use_processes
+        self._max_workers = max_workers or len(self._variants)
+        self._executor: Optional[Executor] = None
+        self._in_flight: Dict[str, Future] = {}
+        self._fitters = {
+            "ballistic": BallisticFitter(),
+            "drag": PhysicsDragFitter(session=TrajectoryFitSession()),
+            "radar": PhysicsDragRadarFitter(bias_estimator, session=TrajectoryFitSession()),
+            "reprojection": ReprojectionFitter(),
+        }
+
+    def __enter__(self) -> "EnsembleRunner":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def close(self) -> None:
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+        self._in_flight.clear()
+
+    def run(self, request: TrajectoryFitRequest) -> EnsembleRunResult:
+        start = time.perf_counter()
+        deadline = start + self._latency_budget_ms / 1000.0
+        executor = self._get_executor()
+
+        candidates: Dict[str, EnsembleCandidate] = {}
+        pending: Dict[Future, str] = {}
+        submitted: Dict[str, float] = {}
+        for name in self._variants:
+            skip_reason = _skip_reason(name, request)
+            previous = self._in_flight.get(name)
+            if skip_reason is None and previous is not None and not previous.done():
+                skip_reason = "previous solve still running"
+            if skip_reason is not None:
+                candidates[name] = EnsembleCandidate(name=name, status="skipped", error=skip_reason)
+                continue
+            submitted[name] = time.perf_counter()
+            if self._use_processes:
+                future = executor.submit(_run_variant, name, request)
+            else:
+                future = executor.submit(_timed_fit, self._fitters[name], request)
+            self._in_flight[name] = future
+            pending[future] = name
+
+        early_terminated = False
+        while pending:
+            remaining = deadline - time.perf_counter()
+            if remaining <= 0:
+                break
+            done, _ = wait(list(pending), timeout=remaining, return_when=FIRST_COMPLETED)
+            for future in done:
+                name = pending.pop(future)
+                candidate = _collect(name, future)
+                candidates[name] = candidate
+                if (
+                    candidate.result is not None
+                    and candidate.result.confidence >= self._confidence_threshold
+                    and is_selectable(candidate.result)
+                ):
+                    early_terminated = True
+            if early_terminated:
+                break
+
+        now = time.perf_counter()
+        for future, name in pending.items():
+            if future.cancel():
+                candidates[name] = EnsembleCandidate(name=name, status="cancelled")
+                continue
+            # Still running (abandoned) or finished too late to be collected
+            candidates[name] = EnsembleCandidate(
+                name=name,
+                status="cancelled" if early_terminated else "timed_out",
+                wall_time_ms=(now - submitted[name]) * 1000.0,
+            )
+
+        ordered = [candidates[name] for name in self._variants]
+        results = [cand.result for cand in ordered if cand.result is not None]
+        return EnsembleRunResult(
+            selected=self._ensembler.select(results),
+            candidates=ordered,
+            elapsed_ms=(time.perf_counter() - start) * 1000.0,
+            early_terminated=early_terminated,
+        )
+
+    def _get_executor(self) -> Executor:
+        if self._executor is None:
+            if self._use_processes:
+                self._executor = ProcessPoolExecutor(max_workers=self._max_workers)
+            else:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self._max_workers,
+                    thread_name_prefix="TrajectoryEnsemble",
+                )
+        return self._executor
+
+
+def _skip_reason(name: str, request: TrajectoryFitRequest) -> Optional[str]:
+    if name == "radar" and request.radar_speed_mph is None:
+        return "no radar speed"
+    if name == "reprojection" and (request.camera_left is None or request.camera_right is None):
+        return FailureCode.CAMERA_MODEL_MISSING.value
+    return None
+
+
+def _timed_fit(fitter, request: TrajectoryFitRequest) -> Tuple[TrajectoryFitResult, float]:
+    start = time.perf_counter()
+    result = fitter.fit_trajectory(request)
+    return result, (time.perf_counter() - start) * 1000.0
+
+
+def _run_variant(name: str, request: TrajectoryFitRequest) -> Tuple[TrajectoryFitResult, float]:
+    """Process-pool entry point; fitters are built in the worker."""
+    factories = {
+        "ballistic": BallisticFitter,
+        "drag": PhysicsDragFitter,
+        "radar": PhysicsDragRadarFitter,
+        "reprojection": ReprojectionFitter,
+    }
+    return _timed_fit(factories[name](), request)
+
+
+def _collect(name: str, future: Future) -> EnsembleCandidate:
+    try:
+        result, wall_time_ms = future.result()
+    except Exception as exc:  # noqa: BLE001 - one bad fitter must not sink the ensemble
+        return EnsembleCandidate(name=name, status="failed", error=str(exc))
+    diagnostics = replace(result.diagnostics, wall_time_ms=wall_time_ms)
+    return EnsembleCandidate(
+        name=name,
+        status="completed",
+        result=replace(result, diagnostics=diagnostics),
+        wall_time_ms=wall_time_ms,
+    )
@@ -16,20 +16,31 @@ from trajectory.contracts import (
     TrajectoryFitRequest,
     TrajectoryFitResult,
 )
+from trajectory.session import TrajectoryFitSession
 
-try:
-    from scipy.optimize import least_squares
-except Exception:  # pragma: no cover - handled at runtime
-    least_squares = None
+GRAVITY_FT_S2 = -32.174
+_GRAVITY_VEC = np.array([0.0, GRAVITY_FT_S2, 0.0])
 
 
-GRAVITY_FT_S2 = -32.174
+def _least_squares():
+    """SciPy's solver, imported on first fit to keep scipy.optimize off the startup path."""
+    try:
+        from scipy.optimize import least_squares
+    except Exception:  # pragma: no cover - handled at runtime
+        return None
+    return least_squares
 
 
 class PhysicsDragFitter(TrajectoryFitterBase):
-    def __init__(self) -> None:
+    def __init__(self, session: Optional[TrajectoryFitSession] = None) -> None:
         super().__init__()
         self._scorer = ConfidenceScorer()
+        self._session = session if session is not None else TrajectoryFitSession()
+
+    @property
+    def session(self) -> TrajectoryFitSession:
+        """Fit session; share it between fitters to reuse the base fit."""
+        return self._session
 
     def maybe_fit(self) -> Optional[TrajectoryFitResult]:
         if self._request is None or len(self._buffer) < 6:
@@ -62,6 +73,7 @@ class PhysicsDragFitter(TrajectoryFitterBase):
                 confidence=0.0,
                 diagnostics=diagnostics,
             )
+        least_squares = _least_squares()
         if least_squares is None:
             diagnostics.failure_codes.append(FailureCode.OPT_DID_NOT_CONVERGE)
             diagnostics.notes.append("scipy unavailable")
@@ -75,19 +87,33 @@ class PhysicsDragFitter(TrajectoryFitterBase):
                 diagnostics=diagnostics,
             )
 
-        obs_sorted = sorted(observations, key=lambda obs: obs.t_ns)
-        times_s = np.array([(obs.t_ns - obs_sorted[0].t_ns) / 1e9 for obs in obs_sorted])
-        positions = np.array([[obs.X, obs.Y, obs.Z] for obs in obs_sorted])
+        session = self._session
+        with session.lock:
+            session.sync(observations)
+            max_iter = 20 if realtime else request.max_iter
+            key = session.fit_key(request, max_iter)
+            cached = session.lookup(key)
+            if cached is not None:
+                return cached
+            fit, params = self._solve(least_squares, request, session, max_iter, diagnostics)
+            session.store(key, fit, params)
+            return fit
+
+    def _solve(
+        self,
+        least_squares,
+        request: TrajectoryFitRequest,
+        session: TrajectoryFitSession,
+        max_iter: int,
+        diagnostics: TrajectoryDiagnostics,
+    ) -> Tuple[TrajectoryFitResult, np.ndarray]:
+        obs_sorted = session.observations
+        times_s = session.times_s()
+        positions = session.positions()
         max_gap_ms = float(np.max(np.diff(times_s)) * 1000.0) if len(times_s) > 1 else 0.0
 
-        seed_state = _seed_state(times_s, positions)
         k0 = request.drag_k0
         dt_seed = (request.fiducial_time_offset_ns or 0) / 1e9
-        params0 = np.array(
-            [seed_state[0], seed_state[1], seed_state[2], seed_state[3], seed_state[4], seed_state[5], k0, dt_seed],
-            dtype=float,
-        )
-
         bounds = (
             np.array(
                 [-100.0, -10.0, -10.0, -200.0, -200.0, -400.0, 0.0, -request.time_offset_bounds_ms / 1000.0],
@@ -99,7 +125,16 @@ class PhysicsDragFitter(TrajectoryFitterBase):
             ),
         )
 
-        max_iter = 20 if realtime else request.max_iter
+        params0 = session.warm_start()
+        if params0 is None:
+            seed_state = _seed_state(times_s, positions)
+            params0 = np.array(
+                [seed_state[0], seed_state[1], seed_state[2], seed_state[3], seed_state[4], seed_state[5], k0, dt_seed],
+                dtype=float,
+            )
+        else:
+            params0 = np.clip(params0, bounds[0], bounds[1])
+
         result = least_squares(
             lambda params: _residuals(
                 params=params,
@@ -155,7 +190,7 @@ class PhysicsDragFitter(TrajectoryFitterBase):
         )
         confidence = self._scorer.confidence_from_error(expected_error)
 
-        return TrajectoryFitResult(
+        fit = TrajectoryFitResult(
             model_name="physics_drag",
             samples=samples,
             plate_crossing_xyz_ft=plate_crossing[0] if plate_crossing else None,
@@ -165,6 +200,7 @@ class PhysicsDragFitter(TrajectoryFitterBase):
             diagnostics=diagnostics,
             residuals=residuals,
         )
+        return fit, params
 
 
 def _seed_state(times_s: np.ndarray, positions: np.ndarray) -> np.ndarray:
@@ -193,29 +229,43 @@ def _residuals(
     state = params[:6]
     k = params[6]
     dt = params[7]
-    residuals = []
-    for t, pos in zip(times_s, positions):
-        predicted = _propagate(state, t + dt, k, wind)
-        residuals.extend(predicted[:3] - pos)
-    residuals.append((k - k0) / max(sigma_k, 1e-6))
-    residuals.append((dt - dt0) / max(sigma_dt, 1e-6))
-    return np.array(residuals, dtype=float)
+    predicted = propagate_states(state, times_s + dt, k, wind)
+    residuals = np.empty(3 * len(times_s) + 2, dtype=float)
+    residuals[:-2] = (predicted[:, :3] - positions).ravel()
+    residuals[-2] = (k - k0) / max(sigma_k, 1e-6)
+    residuals[-1] = (dt - dt0) / max(sigma_dt, 1e-6)
+    return residuals
 
 
-def _propagate(
+def propagate_states(
     state: np.ndarray,
-    t_s: float,
+    times_s: np.ndarray,
     k: float,
     wind: Optional[Tuple[float, float, float]],
 ) -> np.ndarray:
-    dt = max(t_s, 0.0)
-    steps = max(1, int(dt / 0.002))
-    h = dt / steps
+    """Propagate ``state`` (X, Y, Z, Vx, Vy, Vz) to each of the sorted ``times_s``.
+
+    ``times_s`` are seconds after ``state``; the result has one row per time.
+
+    Each segment between consecutive times is integrated with RK4 steps of at
+    most 4 ms (nominally 2 ms), so the cost is linear in the trajectory
+    duration rather than in duration times observation count.
+    """
+    out = np.empty((len(times_s), 6), dtype=float)
     x = state.copy()
     wind_vec = np.array(wind, dtype=float) if wind else np.zeros(3, dtype=float)
-    for _ in range(steps):
-        x = _rk4_step(x, h, k, wind_vec)
-    return x
+    t_prev = 0.0
+    for i, t_s in enumerate(times_s):
+        t_s = max(float(t_s), 0.0)
+        span = t_s - t_prev
+        if span > 0.0:
+            steps = max(1, int(span / 0.002))
+            h = span / steps
+            for _ in range(steps):
+                x = _rk4_step(x, h, k, wind_vec)
+            t_prev = t_s
+        out[i] = x
+    return out
 
 
 def _rk4_step(state: np.ndarray, h: float, k: float, wind: np.ndarray) -> np.ndarray:
@@ -225,7 +275,7 @@ def _rk4_step(state: np.ndarray, h: float, k: float, wind: np.ndarray) -> np.nda
         rel = vel - wind
         speed = np.linalg.norm(rel)
         drag = -k * speed * rel
-        accel = np.array([0.0, GRAVITY_FT_S2, 0.0]) + drag
+        accel = _GRAVITY_VEC + drag
         return np.concatenate([vel, accel])
 
     k1 = dynamics(state)
@@ -245,10 +295,10 @@ def _integrate_trajectory(
     k = params[6]
     dt_offset = params[7]
     samples: List[TrackSample] = []
-    for t in times_s:
+    propagated = propagate_states(state, times_s + dt_offset, k, wind)
+    for t, predicted in zip(times_s, propagated):
         t_s = t + dt_offset
         t_ns = int(t0_ns + t_s * 1e9)
-        predicted = _propagate(state, t_s, k, wind)
         samples.append(
             TrackSample(
                 t_ns=t_ns,
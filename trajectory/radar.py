@@ -9,6 +9,7 @@ import numpy as np
 
 from trajectory.contracts import FailureCode, TrajectoryDiagnostics, TrajectoryFitRequest, TrajectoryFitResult
 from trajectory.physics import PhysicsDragFitter, _find_plate_crossing
+from trajectory.session import TrajectoryFitSession
 
 
 @dataclass
@@ -23,8 +24,12 @@ class RadarBiasEstimator:
 
 
 class PhysicsDragRadarFitter(PhysicsDragFitter):
-    def __init__(self, bias_estimator: Optional[RadarBiasEstimator] = None) -> None:
-        super().__init__()
+    def __init__(
+        self,
+        bias_estimator: Optional[RadarBiasEstimator] = None,
+        session: Optional[TrajectoryFitSession] = None,
+    ) -> None:
+        super().__init__(session=session)
         self._bias = bias_estimator or RadarBiasEstimator()
 
     def fit_trajectory(self, request: TrajectoryFitRequest) -> TrajectoryFitResult:
@@ -7,7 +7,18 @@ from typing import List, Optional, Tuple
 
 import numpy as np
 
+from contracts import StereoObservation, TrackSample
+from trajectory.base import TrajectoryFitterBase
 from trajectory.camera_model import CameraModel
+from trajectory.confidence import ConfidenceScorer
+from trajectory.contracts import (
+    FailureCode,
+    ResidualReport,
+    TrajectoryDiagnostics,
+    TrajectoryFitRequest,
+    TrajectoryFitResult,
+)
+from trajectory.physics import _find_plate_crossing, _is_monotonic_z, _rmse
 
 
 @dataclass
@@ -31,12 +42,17 @@ class ReprojectionEKF:
         self._meas_var = meas_var_px
         self._states: List[EKFState] = []
 
-    def run(self, matches: List[Tuple[int, Tuple[float, float], Tuple[float, float]]]) -> List[EKFState]:
+    def run(
+        self,
+        matches: List[Tuple[int, Tuple[float, float], Tuple[float, float]]],
+        x0: Optional[np.ndarray] = None,
+    ) -> List[EKFState]:
         self._states = []
         if not matches:
             return []
         t0, left_uv, right_uv = matches[0]
-        x0 = np.array([0.0, 5.0, 50.0, 0.0, 0.0, 0.0], dtype=float)
+        if x0 is None:
+            x0 = np.array([0.0, 5.0, 50.0, 0.0, 0.0, 0.0], dtype=float)
         P0 = np.eye(6) * 10.0
         state = EKFState(t_ns=t0, x=x0, P=P0)
         self._states.append(state)
@@ -79,6 +95,144 @@ class RTSSmoother:
         return smoothed
 
 
+class ReprojectionFitter(TrajectoryFitterBase):
+    """EKF over left/right pixel measurements followed by an RTS smoother."""
+
+    def __init__(self, process_var: float = 0.5, meas_var_px: float = 2.0) -> None:
+        super().__init__()
+        self._process_var = process_var
+        self._meas_var_px = meas_var_px
+        self._scorer = ConfidenceScorer()
+
+    def maybe_fit(self) -> Optional[TrajectoryFitResult]:
+        if self._request is None or len(self._buffer) < 6:
+            return None
+        return self._fit(self._request, self._buffer)
+
+    def finalize_fit(self) -> TrajectoryFitResult:
+        if self._request is None:
+            raise RuntimeError("No request set.")
+        return self._fit(self._request, self._buffer)
+
+    def fit_trajectory(self, request: TrajectoryFitRequest) -> TrajectoryFitResult:
+        return self._fit(request, request.observations)
+
+    def _fit(
+        self,
+        request: TrajectoryFitRequest,
+        observations: List[StereoObservation],
+    ) -> TrajectoryFitResult:
+        failure_codes: List[FailureCode] = []
+        if request.camera_left is None or request.camera_right is None:
+            failure_codes.append(FailureCode.CAMERA_MODEL_MISSING)
+        if len(observations) < 4:
+            failure_codes.append(FailureCode.INSUFFICIENT_POINTS)
+        if failure_codes:
+            return _empty_result(failure_codes)
+
+        obs_sorted = sorted(observations, key=lambda obs: obs.t_ns)
+        matches = [(obs.t_ns, obs.left, obs.right) for obs in obs_sorted]
+        x0 = _seed_from_observations(obs_sorted)
+        ekf = ReprojectionEKF(
+            request.camera_left,
+            request.camera_right,
+            process_var=self._process_var,
+            meas_var_px=self._meas_var_px,
+        )
+        try:
+            states = RTSSmoother().smooth(ekf.run(matches, x0=x0))
+        except np.linalg.LinAlgError:
+            return _empty_result([FailureCode.REPROJECTION_FAILED])
+
+        samples = [
+            TrackSample(
+                t_ns=state.t_ns,
+                X=float(state.x[0]),
+                Y=float(state.x[1]),
+                Z=float(state.x[2]),
+                Vx=float(state.x[3]),
+                Vy=float(state.x[4]),
+                Vz=float(state.x[5]),
+            )
+            for state in states
+        ]
+
+        plate_crossing = _find_plate_crossing(samples, request.plate_plane_z_ft)
+        if plate_crossing is None:
+            failure_codes.append(FailureCode.NO_PLATE_CROSSING)
+        if not _is_monotonic_z(samples):
+            failure_codes.append(FailureCode.NON_MONOTONIC_Z)
+
+        residuals: List[ResidualReport] = []
+        for state, obs in zip(states, obs_sorted):
+            z_pred, _ = _project_measurement(request.camera_left, request.camera_right, state.x[:3])
+            z = np.array([obs.left[0], obs.left[1], obs.right[0], obs.right[1]], dtype=float)
+            residual_px = float(np.linalg.norm(z - z_pred))
+            residual_ft = float(np.linalg.norm(state.x[:3] - np.array([obs.X, obs.Y, obs.Z])))
+            normalized = residual_px / max(self._meas_var_px, 1e-6)
+            residuals.append(
+                ResidualReport(
+                    t_ns=obs.t_ns,
+                    residual_3d_ft=residual_ft,
+                    residual_px=residual_px,
+                    normalized_residual=normalized,
+                    inlier=normalized < 3.0,
+                )
+            )
+
+        rmse_3d = _rmse([res.residual_3d_ft for res in residuals])
+        diagnostics = TrajectoryDiagnostics(
+            rmse_3d_ft=rmse_3d,
+            rmse_px=_rmse([res.residual_px for res in residuals]),
+            inlier_ratio=sum(1 for res in residuals if res.inlier) / len(residuals),
+            max_gap_ms=float(max(b.t_ns - a.t_ns for a, b in zip(obs_sorted, obs_sorted[1:])) / 1e6),
+            failure_codes=failure_codes,
+        )
+        expected_error = self._scorer.expected_plate_error_ft(
+            residual_scale=rmse_3d,
+            plate_crossing=plate_crossing,
+        )
+        return TrajectoryFitResult(
+            model_name="reprojection_ekf_rts",
+            samples=samples,
+            plate_crossing_xyz_ft=plate_crossing[0] if plate_crossing else None,
+            plate_crossing_t_ns=plate_crossing[1] if plate_crossing else None,
+            expected_plate_error_ft=expected_error,
+            confidence=self._scorer.confidence_from_error(expected_error),
+            diagnostics=diagnostics,
+            residuals=residuals,
+        )
+
+
+def _seed_from_observations(observations: List[StereoObservation]) -> np.ndarray:
+    first = observations[0]
+    last = observations[-1]
+    span_s = max((last.t_ns - first.t_ns) / 1e9, 1e-6)
+    return np.array(
+        [
+            first.X,
+            first.Y,
+            first.Z,
+            (last.X - first.X) / span_s,
+            (last.Y - first.Y) / span_s,
+            (last.Z - first.Z) / span_s,
+        ],
+        dtype=float,
+    )
+
+
+def _empty_result(failure_codes: List[FailureCode]) -> TrajectoryFitResult:
+    return TrajectoryFitResult(
+        model_name="reprojection_ekf_rts",
+        samples=[],
+        plate_crossing_xyz_ft=None,
+        plate_crossing_t_ns=None,
+        expected_plate_error_ft=None,
+        confidence=0.0,
+        diagnostics=TrajectoryDiagnostics(failure_codes=failure_codes),
+    )
+
+
 def _predict_state(x: np.ndarray, dt: float) -> Tuple[np.ndarray, np.ndarray]:
     F = np.eye(6)
     for i in range(3):
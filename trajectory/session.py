@@ -0,0 +1,159 @@
+"""Incremental fit session shared by realtime and final trajectory passes."""
+
+from __future__ import annotations
+
+import threading
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from contracts import StereoObservation
+from trajectory.contracts import TrajectoryFitRequest, TrajectoryFitResult
+
+FitKey = Tuple[object, ...]
+
+
+class TrajectoryFitSession:
+    """Caches sorted observation arrays, the last solution and fit results.
+
+    Observations are appended incrementally (out-of-order samples are inserted
+    in place), the previous optimizer solution is kept as a warm start for the
+    next solve, and results are memoized per observation-set version so that a
+    repeated fit of an unchanged set (for example the radar-constrained variant
+    after the base drag fit) returns immediately.
+    """
+
+    _INITIAL_CAPACITY = 64
+
+    def __init__(self) -> None:
+        self.lock = threading.RLock()
+        self.reset()
+
+    def reset(self) -> None:
+        """Drop all observations, the warm start and memoized results."""
+        with self.lock:
+            self._observations: List[StereoObservation] = []
+            self._t_ns = np.empty(self._INITIAL_CAPACITY, dtype=np.int64)
+            self._xyz = np.empty((self._INITIAL_CAPACITY, 3), dtype=float)
+            self._count = 0
+            self._version = 0
+            self._source_count = 0
+            self._source_first: Optional[StereoObservation] = None
+            self._source_last: Optional[StereoObservation] = None
+            self._warm_params: Optional[np.ndarray] = None
+            self._warm_t0_ns: Optional[int] = None
+            self._results: Dict[FitKey, TrajectoryFitResult] = {}
+            self.hits = 0
+            self.misses = 0
+
+    @property
+    def version(self) -> int:
+        return self._version
+
+    def __len__(self) -> int:
+        return self._count
+
+    @property
+    def observations(self) -> List[StereoObservation]:
+        """Observations sorted by timestamp."""
+        return self._observations
+
+    @property
+    def t0_ns(self) -> Optional[int]:
+        return int(self._t_ns[0]) if self._count else None
+
+    def times_s(self) -> np.ndarray:
+        """Observation times in seconds relative to the first observation."""
+        t_ns = self._t_ns[: self._count]
+        return (t_ns - t_ns[0]) / 1e9
+
+    def positions(self) -> np.ndarray:
+        return self._xyz[: self._count]
+
+    def sync(self, observations: Sequence[StereoObservation]) -> None:
+        """Bring the session in line with ``observations``.
+
+        A sequence that extends the previously synced one only appends the new
+        tail; anything else resets the session.
+        """
+        with self.lock:
+            count = self._source_count
+            if (
+                count
+                and len(observations) >= count
+                and observations[0] is self._source_first
+                and observations[count - 1] is self._source_last
+            ):
+                new = observations[count:]
+            else:
+                if count or self._count:
+                    self.reset()
+                new = observations
+            for obs in new:
+                self._insert(obs)
+            self._source_count = len(observations)
+            self._source_first = observations[0] if observations else None
+            self._source_last = observations[-1] if observations else None
+
+    def add_observation(self, obs: StereoObservation) -> None:
+        with self.lock:
+            self._insert(obs)
+            self._source_count = 0
+            self._source_first = None
+            self._source_last = None
+
+    def warm_start(self) -> Optional[np.ndarray]:
+        """Previous solution, if it refers to the current time origin."""
+        if self._warm_params is None or self._warm_t0_ns != self.t0_ns:
+            return None
+        return self._warm_params.copy()
+
+    def lookup(self, key: FitKey) -> Optional[TrajectoryFitResult]:
+        result = self._results.get(key)
+        if result is None:
+            self.misses += 1
+        else:
+            self.hits += 1
+        return result
+
+    def store(self, key: FitKey, result: TrajectoryFitResult, params: Optional[np.ndarray]) -> None:
+        self._results[key] = result
+        if params is not None:
+            self._warm_params = np.array(params, dtype=float)
+            self._warm_t0_ns = self.t0_ns
+
+    def fit_key(self, request: TrajectoryFitRequest, max_iter: int) -> FitKey:
+        """Key of everything the base physics fit depends on."""
+        return (
+            self._version,
+            max_iter,
+            request.plate_plane_z_ft,
+            request.fiducial_time_offset_ns,
+            request.time_offset_bounds_ms,
+            request.drag_k0,
+            request.drag_sigma,
+            request.time_offset_sigma_ms,
+            request.wind_ft_s,
+        )
+
+    def _insert(self, obs: StereoObservation) -> None:
+        if self._count == len(self._t_ns):
+            capacity = 2 * len(self._t_ns)
+            t_ns = np.empty(capacity, dtype=np.int64)
+            xyz = np.empty((capacity, 3), dtype=float)
+            t_ns[: self._count] = self._t_ns[: self._count]
+            xyz[: self._count] = self._xyz[: self._count]
+            self._t_ns, self._xyz = t_ns, xyz
+        n = self._count
+        if n == 0 or obs.t_ns >= self._t_ns[n - 1]:
+            idx = n
+        else:
+            idx = int(np.searchsorted(self._t_ns[:n], obs.t_ns, side="right"))
+            self._t_ns[idx + 1 : n + 1] = self._t_ns[idx:n].copy()
+            self._xyz[idx + 1 : n + 1] = self._xyz[idx:n].copy()
+        self._t_ns[idx] = obs.t_ns
+        self._xyz[idx] = (obs.X, obs.Y, obs.Z)
+        self._observations.insert(idx, obs)
+        self._count = n + 1
+        self._version += 1
+        self._results.clear()
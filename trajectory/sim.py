@@ -8,6 +8,7 @@ from typing import List, Optional, Tuple
 import numpy as np
 
 from contracts import StereoObservation
+from trajectory.physics import propagate_states
 
 
 @dataclass(frozen=True)
@@ -53,3 +54,33 @@ def simulate_ballistic(config: SimConfig) -> List[StereoObservation]:
             )
         )
     return observations
+
+
+@dataclass(frozen=True)
+class FlightConfig:
+    """Initial state of a simulated pitch in the left camera frame (feet, ft/s).
+
+    ``drag_k`` is the quadratic drag coefficient used by the physics fitter
+    (acceleration ``-k * |v| * v``); about 0.002 /ft for a regulation baseball.
+    """
+    release_ft: Tuple[float, float, float] = (0.3, 0.5, 55.0)
+    velocity_ft_s: Tuple[float, float, float] = (-0.6, 3.5, -125.0)
+    drag_k: float = 0.002
+    wind_ft_s: Optional[Tuple[float, float, float]] = None
+
+
+def simulate_flight(config: FlightConfig, times_s: np.ndarray) -> np.ndarray:
+    """Noise-free ball positions under gravity and drag.
+
+    Args:
+        config: Release state and drag
+        times_s: Sorted times after release (seconds)
+
+    Returns:
+        Array of shape (len(times_s), 3) with X, Y, Z in feet
+    """
+    state = np.array([*config.release_ft, *config.velocity_ft_s], dtype=float)
+    times_s = np.asarray(times_s, dtype=float)
+    if len(times_s) == 0:
+        return np.zeros((0, 3), dtype=float)
+    return propagate_states(state, times_s, config.drag_k, config.wind_ft_s)[:, :3]
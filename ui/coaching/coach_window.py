@@ -53,7 +53,11 @@ class CoachWindow(QtWidgets.QMainWindow):
         self._config = load_config(config_path)
 
         # Initialize Qt-safe pipeline service (handles thread-safe callbacks)
-        self._service = QtPipelineService(backend=backend, parent=self)
+        self._service = QtPipelineService(
+            backend=backend,
+            parent=self,
+            engine_process=self._config.ui.engine_process,
+        )
 
         # Session state
         self._session_active = False
@@ -770,6 +774,7 @@ class CoachWindow(QtWidgets.QMainWindow):
                 self._service.stop_capture()
         except Exception:
             pass
+        self._service.close()
 
         event.accept()
 
@@ -44,7 +44,7 @@ class DetectorSettingsDialog(QtWidgets.QDialog):
             blob_thresh: Blob threshold
             min_area: Minimum blob area filter
             min_circ: Minimum circularity filter
-            threading_mode: Threading mode (per_camera or worker_pool)
+            threading_mode: Threading mode (per_camera, worker_pool or process_per_camera)
             worker_count: Number of worker threads
             detector_type: Detector type (classical or ml)
             model_path: Path to ONNX model file
@@ -131,8 +131,9 @@ class DetectorSettingsDialog(QtWidgets.QDialog):
         self._threading = QtWidgets.QComboBox()
         self._threading.addItem("Per-camera threads", "per_camera")
         self._threading.addItem("Worker pool", "worker_pool")
+        self._threading.addItem("Per-camera processes", "process_per_camera")
         self._threading.setCurrentIndex(
-            0 if threading_mode == "per_camera" else 1
+            max(0, self._threading.findData(threading_mode))
         )
 
         self._workers = QtWidgets.QSpinBox()
@@ -294,10 +294,13 @@ def export_training_report(
     )
     if not path:
         return
+    # Threads rather than processes: worker processes would re-launch the
+    # frozen GUI executable on Windows
     payload = build_training_report(
         session_dir=session_dir,
         config_path=config_path,
         roi_path=roi_path,
+        use_processes=False,
         source={
             "app": "PitchTracker",
             "rig_id": None,
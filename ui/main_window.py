@@ -16,9 +16,10 @@ import numpy as np
 import yaml
 from PySide6 import QtCore, QtGui, QtWidgets
 
+from app.ipc import EngineClient
 from app.services.orchestrator import PipelineOrchestrator
-from calib.plate_plane import estimate_and_write
 from configs.app_state import load_state, save_state
+from configs.config_cache import get_config_cache
 from configs.lane_io import load_lane_rois, save_lane_rois
 from configs.location_profiles import apply_profile, list_profiles, load_profile, save_profile
 from configs.pitchers import add_pitcher, load_pitchers
@@ -46,8 +47,7 @@ from ui.dialogs import (
     StartupDialog,
     StrikeZoneSettingsDialog,
 )
-from ui.drawing import frame_to_pixmap
-from ui.export import save_session_export, upload_session
+from ui.drawing import FOCUS_FAIR_SCORE, FOCUS_GOOD_SCORE, frame_to_pixmap
 from ui.geometry import (
     Overlay,
     Rect,
@@ -56,6 +56,7 @@ from ui.geometry import (
     rect_to_polygon,
     roi_overlays,
 )
+from ui.preview_compositor import PreviewCompositor, PreviewRequest
 from ui.widgets import PlateMapWidget, RoiLabel
 
 # System hardening imports
@@ -67,11 +68,15 @@ from app.validation import ConfigValidator
 from app.config import ResourceLimits, set_resource_limits
 from app.ui.error_notification import ErrorNotificationWidget, ErrorNotificationBridge
 from log_config.logger import get_logger
+from telemetry.profiler import get_profiler, start_from_env
 
 logger = get_logger(__name__)
 
 
 class MainWindow(QtWidgets.QMainWindow):
+    # Emitted from config cache listeners, which run on the loading thread
+    config_reloaded = QtCore.Signal(object)
+
     def __init__(self, backend: str, config_path: Path) -> None:
         super().__init__()
 
@@ -87,17 +92,31 @@ class MainWindow(QtWidgets.QMainWindow):
         # Validate configuration before loading (Phase 4)
         self._validate_config_at_startup(self._config_path_value)
 
-        # Load configuration
+        # Load configuration, then follow changes to it: the config cache
+        # notifies us when the file is reloaded (by us, a dialog or the
+        # file watcher) instead of every caller re-reading it
         self._config = load_config(self._config_path_value)
+        self.config_reloaded.connect(self._apply_reloaded_config)
+        get_config_cache().subscribe(self._on_config_changed)
+        self._config_watcher = QtCore.QFileSystemWatcher([str(self._config_path_value)], self)
+        self._config_watcher.fileChanged.connect(self._on_config_file_changed)
 
         # Initialize system hardening (Phase 2-4)
         self._init_error_handling()
         self._init_resource_monitoring()
         self._init_resource_limits()
 
-        self._service = PipelineOrchestrator(backend=backend)
+        if self._config.ui.engine_process:
+            # Capture/detection in a separate process; previews via shared memory
+            self._service = EngineClient(backend=backend)
+        else:
+            self._service = PipelineOrchestrator(backend=backend)
         self._timer = QtCore.QTimer(self)
         self._timer.timeout.connect(self._update_preview)
+        self._compositor = PreviewCompositor(self)
+        self._compositor.frame_ready.connect(self._on_preview_ready, QtCore.Qt.QueuedConnection)
+        self._compositor.focus_ready.connect(self._on_focus_ready, QtCore.Qt.QueuedConnection)
+        self._compositor.start()
         self._roi_path = Path("rois/shared_rois.json")
         self._lane_path = Path("rois/shared_lane_rois.json")
         self._lane_rect: Optional[Rect] = None
@@ -343,6 +362,8 @@ class MainWindow(QtWidgets.QMainWindow):
         container.setLayout(layout)
         self.setCentralWidget(container)
         self._build_menu()
+        if start_from_env():
+            self._profiler_action.setChecked(True)
 
         self._start_button.clicked.connect(self._start_capture)
         self._stop_button.clicked.connect(self._stop_capture)
@@ -511,10 +532,15 @@ class MainWindow(QtWidgets.QMainWindow):
         self._service.set_manual_speed_mph(speed)
 
     def _stop_recording(self) -> None:
+        # Imported on first use to keep the report builder and urllib off startup
+        from ui.export import save_session_export, upload_session
+
         bundle = self._service.stop_recording()
         summary = self._service.get_session_summary()
         self._status_label.setText(f"Recorded pitches: {summary.pitch_count}")
         session_dir = self._service.get_session_dir()
+        if get_profiler().running and session_dir is not None:
+            self._save_profile()
         dialog = SessionSummaryDialog(
             self,
             summary,
@@ -714,7 +740,7 @@ class MainWindow(QtWidgets.QMainWindow):
         data["camera"]["fps"] = 30
         data["ui"]["refresh_hz"] = 10
         config_path.write_text(yaml.safe_dump(data, sort_keys=False))
-        self._config = load_config(config_path)
+        get_config_cache().refresh()
         self._load_detector_defaults()
         self._status_label.setText("Low performance mode applied.")
 
@@ -1010,40 +1036,37 @@ class MainWindow(QtWidgets.QMainWindow):
                 self._fiducial_error = error
             fiducials = self._fiducial_detections
 
-        # Compute focus scores for both cameras (will be used in health panel and overlay)
-        from detect.utils import compute_focus_score
-        focus_left = compute_focus_score(left_frame.image)
-        focus_right = compute_focus_score(right_frame.image)
-
-        # Show focus overlay when target overlay is active (during calibration)
-        focus_overlay_left = focus_left if self._show_target_overlay else None
-        focus_overlay_right = focus_right if self._show_target_overlay else None
-
-        self._left_view.setPixmap(
-            frame_to_pixmap(
-                left_frame.image,
-                overlays_left,
-                left_dets,
-                left_gated.get("lane", []),
-                left_gated.get("plate", []),
+        # Resize, overlays and focus scoring run on the compositor thread;
+        # focus overlay is shown while the target overlay is active (calibration)
+        self._compositor.submit(
+            PreviewRequest(
+                camera="left",
+                image=left_frame.image,
+                target_size=(self._left_view.width(), self._left_view.height()),
+                overlays=overlays_left,
+                detections=left_dets,
+                lane_detections=left_gated.get("lane", []),
+                plate_detections=left_gated.get("plate", []),
                 plate_rect=self._plate_rect,
                 zone=zone,
                 checkerboard=checkerboard,
                 fiducials=fiducials,
-                focus_score=focus_overlay_left,
+                show_focus=self._show_target_overlay,
             )
         )
         if self._right_view.isVisible():
-            self._right_view.setPixmap(
-                frame_to_pixmap(
-                    right_frame.image,
-                    overlays_right,
-                    right_dets,
-                    right_gated.get("lane", []),
-                    right_gated.get("plate", []),
+            self._compositor.submit(
+                PreviewRequest(
+                    camera="right",
+                    image=right_frame.image,
+                    target_size=(self._right_view.width(), self._right_view.height()),
+                    overlays=overlays_right,
+                    detections=right_dets,
+                    lane_detections=right_gated.get("lane", []),
+                    plate_detections=right_gated.get("plate", []),
                     plate_rect=self._plate_rect,
                     zone=zone,
-                    focus_score=focus_overlay_right,
+                    show_focus=self._show_target_overlay,
                 )
             )
         self._update_plate_map()
@@ -1067,34 +1090,6 @@ class MainWindow(QtWidgets.QMainWindow):
                 )
             )
 
-            # Update focus quality tracking (scores already computed above)
-            # Track peak values
-            if focus_left > self._focus_peak_left:
-                self._focus_peak_left = focus_left
-            if focus_right > self._focus_peak_right:
-                self._focus_peak_right = focus_right
-
-            # Color code based on focus quality (empirical thresholds)
-            # Good: >200 (green), Fair: 100-200 (yellow), Poor: <100 (red)
-            def focus_color(score: float) -> str:
-                if score >= 200:
-                    return "#2ecc71"  # Green
-                elif score >= 100:
-                    return "#f39c12"  # Yellow/Orange
-                else:
-                    return "#e74c3c"  # Red
-
-            self._focus_left.setText(f"L Focus: {focus_left:.0f} (peak: {self._focus_peak_left:.0f})")
-            self._focus_left.setStyleSheet(
-                f"QLabel {{ background-color: {focus_color(focus_left)}; color: white; "
-                f"padding: 4px; border: 1px solid #ccc; font-weight: bold; }}"
-            )
-
-            self._focus_right.setText(f"R Focus: {focus_right:.0f} (peak: {self._focus_peak_right:.0f})")
-            self._focus_right.setStyleSheet(
-                f"QLabel {{ background-color: {focus_color(focus_right)}; color: white; "
-                f"padding: 4px; border: 1px solid #ccc; font-weight: bold; }}"
-            )
 
             zone_label = "-"
             if strike.zone_row is not None and strike.zone_col is not None:
@@ -1112,6 +1107,46 @@ class MainWindow(QtWidgets.QMainWindow):
                 )
             )
 
+    def _on_config_file_changed(self, path: str) -> None:
+        # Editors that save by replacing the file drop it from the watch list
+        if path not in self._config_watcher.files() and Path(path).exists():
+            self._config_watcher.addPath(path)
+        get_config_cache().refresh()
+
+    def _on_config_changed(self, path: Path, config) -> None:
+        if path == self._config_path_value.resolve():
+            self.config_reloaded.emit(config)
+
+    def _apply_reloaded_config(self, config) -> None:
+        self._config = config
+        self._update_calib_summary()
+
+    def _on_preview_ready(self, camera: str, image: QtGui.QImage) -> None:
+        view = self._left_view if camera == "left" else self._right_view
+        view.setPixmap(QtGui.QPixmap.fromImage(image))
+
+    def _on_focus_ready(self, camera: str, score: float) -> None:
+        # Color code based on focus quality (scores from the reduced frame)
+        # Good (green), Fair (yellow), Poor (red)
+        if score >= FOCUS_GOOD_SCORE:
+            color = "#2ecc71"  # Green
+        elif score >= FOCUS_FAIR_SCORE:
+            color = "#f39c12"  # Yellow/Orange
+        else:
+            color = "#e74c3c"  # Red
+
+        if camera == "left":
+            self._focus_peak_left = max(self._focus_peak_left, score)
+            label, prefix, peak = self._focus_left, "L", self._focus_peak_left
+        else:
+            self._focus_peak_right = max(self._focus_peak_right, score)
+            label, prefix, peak = self._focus_right, "R", self._focus_peak_right
+        label.setText(f"{prefix} Focus: {score:.0f} (peak: {peak:.0f})")
+        label.setStyleSheet(
+            f"QLabel {{ background-color: {color}; color: white; "
+            f"padding: 4px; border: 1px solid #ccc; font-weight: bold; }}"
+        )
+
     def _start_replay(self) -> None:
         path, _ = QtWidgets.QFileDialog.getOpenFileName(
             self,
@@ -1579,6 +1614,39 @@ class MainWindow(QtWidgets.QMainWindow):
         if enabled:
             self._status_label.setText("Production mode.")
 
+    def _set_profiling(self, enabled: bool) -> None:
+        """Start the sampling profiler, or stop it and write the profile."""
+        profiler = get_profiler()
+        if enabled:
+            profiler.start()
+            self._status_label.setText(f"Sampling profiler running ({profiler.hz:.0f} Hz).")
+            return
+        profiler.stop()
+        paths = self._save_profile()
+        if paths:
+            self._status_label.setText(f"Profile saved: {paths[-1]}")
+
+    def _stop_profiler_on_exit(self) -> None:
+        # Runs on a cleanup worker thread: no widget access
+        profiler = get_profiler()
+        if profiler.running:
+            profiler.stop()
+            self._save_profile()
+
+    def _save_profile(self) -> list[Path]:
+        """Write collected samples to the session directory (or recording dir)."""
+        profiler = get_profiler()
+        if not profiler.stats()["samples"]:
+            return []
+        directory = self._service.get_session_dir() or Path(self._config.recording.output_dir)
+        try:
+            paths = profiler.save(directory)
+        except OSError as exc:
+            logger.warning(f"Failed to write profile to {directory}: {exc}")
+            return []
+        logger.info(f"Sampling profile written to {directory}")
+        return paths
+
     def _set_target_mode(self, enabled: bool) -> None:
         self._target_mode = enabled
         if enabled:
@@ -1682,6 +1750,12 @@ class MainWindow(QtWidgets.QMainWindow):
         cue_card_action.triggered.connect(self._cue_card_test)
         reset_game_action.triggered.connect(self._reset_tic_tac_toe_game)
         target_mode_action.toggled.connect(self._set_target_mode)
+        tools_menu.addSeparator()
+        self._profiler_action = QtGui.QAction("Sampling Profiler", self)
+        self._profiler_action.setCheckable(True)
+        self._profiler_action.setChecked(False)
+        self._profiler_action.toggled.connect(self._set_profiling)
+        tools_menu.addAction(self._profiler_action)
 
         review_menu = menu_bar.addMenu("Review")
         replay_action = review_menu.addAction("Replay")
@@ -1789,8 +1863,7 @@ class MainWindow(QtWidgets.QMainWindow):
         dialog = QuickCalibrateDialog(self, self._config_path())
         dialog.exec()
         if dialog.updated:
-            self._config = load_config(self._config_path())
-            self._update_calib_summary()
+            get_config_cache().refresh()
             if dialog.updates:
                 baseline = dialog.updates.get("baseline_ft")
                 focal = dialog.updates.get("focal_length_px")
@@ -1809,11 +1882,13 @@ class MainWindow(QtWidgets.QMainWindow):
             return
         left_path, right_path = dialog.values()
         try:
+            from calib.plate_plane import estimate_and_write
+
             plate_z = estimate_and_write(Path(left_path), Path(right_path), self._config_path())
         except Exception as exc:  # noqa: BLE001 - show errors
             QtWidgets.QMessageBox.critical(self, "Plate Plane Calibrate", str(exc))
             return
-        self._config = load_config(self._config_path())
+        get_config_cache().refresh()
         self._status_label.setText(
             f"Plate plane updated (Z={plate_z:.3f} ft). Restart capture."
         )
@@ -2123,6 +2198,20 @@ class MainWindow(QtWidgets.QMainWindow):
             critical=False
         )
 
+        self._cleanup_manager.register_cleanup(
+            "stop_preview_compositor",
+            self._compositor.stop,
+            timeout=2.0,
+            critical=False
+        )
+
+        self._cleanup_manager.register_cleanup(
+            "stop_profiler",
+            self._stop_profiler_on_exit,
+            timeout=2.0,
+            critical=False
+        )
+
         self._cleanup_manager.register_cleanup(
             "stop_recovery",
             lambda: self._recovery_manager.stop(),
@@ -2130,6 +2219,21 @@ class MainWindow(QtWidgets.QMainWindow):
             critical=False
         )
 
+        self._cleanup_manager.register_cleanup(
+            "unsubscribe_config",
+            lambda: get_config_cache().unsubscribe(self._on_config_changed),
+            timeout=1.0,
+            critical=False
+        )
+
+        if isinstance(self._service, EngineClient):
+            self._cleanup_manager.register_cleanup(
+                "stop_engine",
+                self._service.close,
+                timeout=20.0,
+                critical=False
+            )
+
         logger.info("Cleanup tasks registered")
 
     def closeEvent(self, event: QtGui.QCloseEvent) -> None:
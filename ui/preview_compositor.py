@@ -0,0 +1,165 @@
+"""Preview compositor that renders camera previews off the GUI thread."""
+
+from __future__ import annotations
+
+import threading
+import time
+from dataclasses import dataclass
+from typing import Dict, Optional
+
+import cv2
+import numpy as np
+from PySide6 import QtCore, QtGui
+
+from detect.fiducials import FiducialDetection
+from detect.utils import compute_focus_score
+from log_config.logger import get_logger
+from ui.drawing import render_preview
+from ui.geometry import Overlay, Rect
+
+logger = get_logger(__name__)
+
+# Focus is scored on a fixed-width reduction so scores depend on neither the
+# capture resolution nor the window size (variance of Laplacian changes with
+# scale). ui.drawing.FOCUS_GOOD_SCORE/FOCUS_FAIR_SCORE are on this scale.
+FOCUS_WIDTH = 640
+
+
+@dataclass
+class PreviewRequest:
+    """Everything needed to render one camera preview."""
+
+    camera: str
+    image: np.ndarray
+    target_size: tuple[int, int]
+    overlays: list[Overlay] | None = None
+    detections: list | None = None
+    lane_detections: list | None = None
+    plate_detections: list | None = None
+    plate_rect: Optional[Rect] = None
+    zone: tuple[int, int] | None = None
+    trail: list[tuple[int, int]] | None = None
+    checkerboard: list[tuple[float, float]] | None = None
+    fiducials: list[FiducialDetection] | None = None
+    show_focus: bool = False
+
+
+def reduced_focus_score(image: np.ndarray, width: int = FOCUS_WIDTH) -> float:
+    """Focus score (variance of Laplacian) on an image reduced to ``width``.
+
+    Args:
+        image: Grayscale or BGR image
+        width: Width to downscale to (images already narrower are used as-is)
+
+    Returns:
+        Focus quality score
+    """
+    height, image_width = image.shape[:2]
+    if image_width > width:
+        size = (width, max(1, round(height * width / image_width)))
+        image = cv2.resize(image, size, interpolation=cv2.INTER_AREA)
+    return compute_focus_score(image)
+
+
+class PreviewCompositor(QtCore.QObject):
+    """Renders previews on a worker thread and hands QImages to the GUI.
+
+    The GUI thread only gathers overlay state and calls submit(); the
+    resize, overlay painting and focus scoring happen on the worker. Only
+    the newest request per camera is kept, so a slow render drops stale
+    frames instead of queueing them. Focus is re-scored on a FOCUS_WIDTH
+    reduction of the frame at most every ``focus_interval_s`` per camera.
+
+    Signals:
+        frame_ready(camera, QImage): Rendered preview
+        focus_ready(camera, score): New focus score
+    """
+
+    frame_ready = QtCore.Signal(str, QtGui.QImage)
+    focus_ready = QtCore.Signal(str, float)
+
+    def __init__(
+        self,
+        parent: Optional[QtCore.QObject] = None,
+        focus_interval_s: float = 0.5,
+    ) -> None:
+        super().__init__(parent)
+        self._focus_interval_ns = int(focus_interval_s * 1e9)
+        self._focus: Dict[str, float] = {}
+        self._focus_due_ns: Dict[str, int] = {}
+        self._pending: Dict[str, PreviewRequest] = {}
+        self._condition = threading.Condition()
+        self._running = False
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self) -> None:
+        """Start the render thread (no-op if running)."""
+        with self._condition:
+            if self._running:
+                return
+            self._running = True
+        self._thread = threading.Thread(target=self._run, name="PreviewCompositor", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        """Stop the render thread and drop pending requests."""
+        with self._condition:
+            self._running = False
+            self._pending.clear()
+            self._condition.notify_all()
+        if self._thread is not None:
+            self._thread.join(timeout=1.0)
+            self._thread = None
+
+    def submit(self, request: PreviewRequest) -> None:
+        """Queue a preview, replacing any not-yet-rendered one for that camera."""
+        with self._condition:
+            self._pending[request.camera] = request
+            self._condition.notify()
+
+    def focus_score(self, camera: str) -> Optional[float]:
+        """Most recent focus score for a camera, if any."""
+        return self._focus.get(camera)
+
+    def compose(self, request: PreviewRequest) -> QtGui.QImage:
+        """Render one request (and re-score focus if due) on the calling thread."""
+        now_ns = time.monotonic_ns()
+        if now_ns >= self._focus_due_ns.get(request.camera, 0):
+            score = reduced_focus_score(request.image)
+            self._focus[request.camera] = score
+            self._focus_due_ns[request.camera] = now_ns + self._focus_interval_ns
+            self.focus_ready.emit(request.camera, score)
+        return render_preview(
+            request.image,
+            request.target_size,
+            request.overlays,
+            request.detections,
+            request.lane_detections,
+            request.plate_detections,
+            plate_rect=request.plate_rect,
+            zone=request.zone,
+            trail=request.trail,
+            checkerboard=request.checkerboard,
+            fiducials=request.fiducials,
+            focus_score=self._focus.get(request.camera) if request.show_focus else None,
+        )
+
+    def _run(self) -> None:
+        while True:
+            with self._condition:
+                while self._running and not self._pending:
+                    self._condition.wait()
+                if not self._running:
+                    return
+                requests = list(self._pending.values())
+                self._pending.clear()
+            for request in requests:
+                try:
+                    image = self.compose(request)
+                except Exception as exc:  # keep the render thread alive
+                    logger.warning(f"Preview render failed for {request.camera}: {exc}")
+                    continue
+                self.frame_ready.emit(request.camera, image)
+
+
+__all__ = ["FOCUS_WIDTH", "PreviewCompositor", "PreviewRequest", "reduced_focus_score"]